@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from typing import Any
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config, pool
@@ -11,6 +12,9 @@ from alembic import context
 
 from app.database import Base, get_database_url
 from app.models import AuditLog, EnrollmentApplication  # noqa: F401
+from app.models.audit import AUDIT_DEFAULT_PARTITION
+from app.models.enrollment import ENROLLMENT_SEARCH_FTS
+from app.services.audit import PARTITION_PATTERN
 
 config = context.config
 
@@ -22,11 +26,44 @@ config.set_main_option("sqlalchemy.url", os.getenv("DATABASE_URL", get_database_
 target_metadata = Base.metadata
 
 
+def include_object(
+    object_: Any,
+    name: str | None,
+    type_: str,
+    reflected: bool,
+    compare_to: Any,
+) -> bool:
+    """Skip objects autogenerate cannot compare.
+
+    audit_log partitions are created at runtime, the SQLite FTS5 search
+    table and its shadow tables come from DDL events, and indexes limited
+    to another dialect with ``ddl_if`` never exist on this one.
+    """
+
+    if type_ == "table" and reflected and compare_to is None:
+        return (
+            name != AUDIT_DEFAULT_PARTITION
+            and not PARTITION_PATTERN.match(name or "")
+            and not (name or "").startswith(ENROLLMENT_SEARCH_FTS)
+        )
+    if type_ == "index" and not reflected:
+        ddl_if = getattr(object_, "_ddl_if", None)
+        if ddl_if is not None and ddl_if.dialect is not None:
+            return ddl_if.dialect == context.get_context().dialect.name
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in offline mode."""
 
     url = config.get_main_option("sqlalchemy.url")
-    context.configure(url=url, target_metadata=target_metadata, literal_binds=True, dialect_opts={"paramstyle": "named"})
+    context.configure(
+        url=url,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -42,7 +79,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
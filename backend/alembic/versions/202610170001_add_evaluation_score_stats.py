@@ -0,0 +1,50 @@
+"""Add running rating moments for incremental result maintenance.
+
+Revision ID: 202610170001
+Revises: d15023b50184
+Create Date: 2026-10-17 00:01:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from backend.app.models.types import GUID
+
+revision = "202610170001"
+down_revision = "d15023b50184"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "evaluation_score_stats",
+        sa.Column("id", GUID(), primary_key=True, nullable=False),
+        sa.Column("cycle_id", GUID(), sa.ForeignKey("evaluation_cycle.id"), nullable=False),
+        sa.Column("evaluee_id", GUID(), nullable=False),
+        sa.Column(
+            "evaluator_role",
+            sa.Enum("SELF", "PEER", "SUPERVISOR", "CEO", "PC_HEAD", name="evaluatorrole", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("rating_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("score_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("score_sum_sq", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("weighted_score_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("weight_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("score_min", sa.Float(), nullable=True),
+        sa.Column("score_max", sa.Float(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.UniqueConstraint(
+            "cycle_id",
+            "evaluee_id",
+            "evaluator_role",
+            name="uq_evaluation_score_stats_cycle_evaluee_role",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("evaluation_score_stats")
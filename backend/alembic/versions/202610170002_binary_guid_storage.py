@@ -0,0 +1,79 @@
+"""Convert CHAR(36) GUID columns to 16-byte BLOBs when binary storage is enabled.
+
+Only runs on SQLite with ``GUID_STORAGE=binary``; PostgreSQL keeps its
+native UUID type and character storage needs no change. Values are
+rewritten in place by a SQL function registered on the migration
+connection, so no rows travel through Python one at a time, and the
+tables are then recreated with ``BLOB`` columns.
+
+Revision ID: 202610170002
+Revises: 202610170001
+Create Date: 2026-10-17 00:02:00.000000
+"""
+
+from __future__ import annotations
+
+import uuid
+
+import sqlalchemy as sa
+from alembic import op
+
+from backend.app.models.types import binary_guid_storage
+
+revision = "202610170002"
+down_revision = "202610170001"
+branch_labels = None
+depends_on = None
+
+GUID_COLUMNS: dict[str, tuple[str, ...]] = {
+    "audit_log": ("id", "actor_id", "entity_id"),
+    "eligibility_tracking": ("id", "employee_id"),
+    "enrollment_application": ("id",),
+    "eoy_candidate": ("id", "employee_id"),
+    "evaluation_cycle": ("id", "created_by"),
+    "fairness_metric": ("id", "resolved_by"),
+    "nomination": ("id", "nominee_id", "nominator_id"),
+    "award": ("id", "recipient_id", "nomination_id"),
+    "evaluation": ("id", "cycle_id", "evaluee_id", "evaluator_id"),
+    "evaluation_result": ("id", "cycle_id", "evaluee_id"),
+    "evaluation_score_stats": ("id", "cycle_id", "evaluee_id"),
+    "vote": ("id", "nomination_id", "voter_id"),
+    "evaluation_rating": ("id", "evaluation_id", "cycle_id", "evaluator_id", "evaluee_id"),
+}
+
+
+def _guid_to_blob(value: object) -> object:
+    return uuid.UUID(value).bytes if isinstance(value, str) else value
+
+
+def _blob_to_guid(value: object) -> object:
+    return str(uuid.UUID(bytes=bytes(value))) if isinstance(value, bytes) else value
+
+
+def _convert(to_binary: bool) -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite" or not binary_guid_storage():
+        return
+
+    function = "ese_guid_to_blob" if to_binary else "ese_blob_to_guid"
+    converter = _guid_to_blob if to_binary else _blob_to_guid
+    bind.connection.driver_connection.create_function(function, 1, converter, deterministic=True)
+
+    source_type: sa.types.TypeEngine = sa.CHAR(36) if to_binary else sa.LargeBinary(16)
+    target_type: sa.types.TypeEngine = sa.LargeBinary(16) if to_binary else sa.CHAR(36)
+    for table, columns in GUID_COLUMNS.items():
+        # Rewrite values before the table copy: SQLite keeps BLOBs in TEXT
+        # columns and vice versa, and the copy's CAST is then a no-op.
+        assignments = ", ".join(f"{column} = {function}({column})" for column in columns)
+        op.execute(f"UPDATE {table} SET {assignments}")  # noqa: S608
+        with op.batch_alter_table(table, recreate="always") as batch:
+            for column in columns:
+                batch.alter_column(column, existing_type=source_type, type_=target_type)
+
+
+def upgrade() -> None:
+    _convert(to_binary=True)
+
+
+def downgrade() -> None:
+    _convert(to_binary=False)
@@ -0,0 +1,120 @@
+"""Add composite and partial indexes matching the hot query shapes.
+
+Single-column indexes on ``cycle_id`` and ``voter_id`` are replaced by
+composites that lead with the same column, so lookups on the prefix keep
+an index while each write maintains one fewer B-tree. Unique indexes
+enforce one assignment per evaluator and evaluee per cycle, one result
+per evaluee per cycle and one vote per voter per category per period;
+the upgrade stops with a clear error if existing rows violate them.
+
+On PostgreSQL the indexes are built ``CONCURRENTLY`` so writes are not
+blocked while large tables are indexed.
+
+Revision ID: 202610170003
+Revises: 202610170002
+Create Date: 2026-10-17 00:03:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "202610170003"
+down_revision = "202610170002"
+branch_labels = None
+depends_on = None
+
+OPEN_EVALUATION = "status IN ('NOT_STARTED', 'IN_PROGRESS')"
+VOTING_NOMINATION = "status = 'VOTING'"
+
+# (name, table, columns, unique, partial predicate)
+INDEXES: tuple[tuple[str, str, tuple[str, ...], bool, str | None], ...] = (
+    ("uq_evaluation_cycle_evaluator_evaluee", "evaluation", ("cycle_id", "evaluator_id", "evaluee_id"), True, None),
+    ("ix_evaluation_cycle_evaluator_status", "evaluation", ("cycle_id", "evaluator_id", "status"), False, None),
+    ("ix_evaluation_open_due_date", "evaluation", ("due_date",), False, OPEN_EVALUATION),
+    (
+        "ix_evaluation_rating_cycle_evaluee_role",
+        "evaluation_rating",
+        ("cycle_id", "evaluee_id", "evaluator_role"),
+        False,
+        None,
+    ),
+    ("uq_evaluation_result_cycle_evaluee", "evaluation_result", ("cycle_id", "evaluee_id"), True, None),
+    (
+        "ix_nomination_period_category_status",
+        "nomination",
+        ("nomination_period", "category", "status"),
+        False,
+        None,
+    ),
+    (
+        "ix_nomination_voting_leaderboard",
+        "nomination",
+        ("nomination_period", "category", "votes_count"),
+        False,
+        VOTING_NOMINATION,
+    ),
+    ("uq_vote_voter_period_category", "vote", ("voter_id", "nomination_period", "category"), True, None),
+)
+
+# Superseded by a composite index with the same leading column.
+REDUNDANT_INDEXES: tuple[tuple[str, str, str], ...] = (
+    ("ix_evaluation_cycle_id", "evaluation", "cycle_id"),
+    ("ix_evaluation_rating_cycle_id", "evaluation_rating", "cycle_id"),
+    ("ix_evaluation_result_cycle_id", "evaluation_result", "cycle_id"),
+    ("ix_vote_voter_id", "vote", "voter_id"),
+)
+
+
+def _check_unique(table: str, columns: tuple[str, ...]) -> None:
+    column_list = ", ".join(columns)
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                f"SELECT COUNT(*) FROM (SELECT {column_list} FROM {table} "  # noqa: S608
+                f"GROUP BY {column_list} HAVING COUNT(*) > 1) AS duplicate_keys",
+            ),
+        )
+        .scalar_one()
+    )
+    if duplicates:
+        raise RuntimeError(
+            f"{table} has {duplicates} duplicate ({column_list}) keys; "
+            "resolve them before applying revision 202610170003",
+        )
+
+
+def _index_options(predicate: str | None, concurrently: bool) -> dict[str, Any]:
+    options: dict[str, Any] = {}
+    if predicate is not None:
+        options["sqlite_where"] = sa.text(predicate)
+        options["postgresql_where"] = sa.text(predicate)
+    if concurrently:
+        options["postgresql_concurrently"] = True
+    return options
+
+
+def upgrade() -> None:
+    concurrently = op.get_bind().dialect.name == "postgresql"
+    for _name, table, columns, unique, _predicate in INDEXES:
+        if unique:
+            _check_unique(table, columns)
+
+    with op.get_context().autocommit_block():
+        for name, table, columns, unique, predicate in INDEXES:
+            op.create_index(name, table, list(columns), unique=unique, **_index_options(predicate, concurrently))
+        for name, table, _column in REDUNDANT_INDEXES:
+            op.drop_index(name, table_name=table, **_index_options(None, concurrently))
+
+
+def downgrade() -> None:
+    concurrently = op.get_bind().dialect.name == "postgresql"
+    with op.get_context().autocommit_block():
+        for name, table, column in REDUNDANT_INDEXES:
+            op.create_index(name, table, [column], unique=False, **_index_options(None, concurrently))
+        for name, table, _columns, _unique, _predicate in reversed(INDEXES):
+            op.drop_index(name, table_name=table, **_index_options(None, concurrently))
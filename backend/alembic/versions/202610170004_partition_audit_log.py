@@ -0,0 +1,144 @@
+"""Partition audit_log by month and index entity and correlation lookups.
+
+PostgreSQL: ``audit_log`` becomes ``PARTITION BY RANGE (created_at)`` with
+``(id, created_at)`` as primary key, a ``DEFAULT`` partition and monthly
+partitions from the oldest existing row through two months ahead.
+SQLite: ``audit_log`` is rebuilt with the same key and indexes and stays
+the catch-all next to the ``audit_log_YYYY_MM`` period tables created by
+``app.services.audit``. Existing rows are copied with one
+``INSERT ... SELECT``. The partition helpers are frozen copies so later
+changes to the service do not alter this revision.
+
+Revision ID: 202610170004
+Revises: 202610170003
+Create Date: 2026-10-17 00:04:00.000000
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+from alembic import op
+
+from backend.app.models.types import GUID
+
+revision = "202610170004"
+down_revision = "202610170003"
+branch_labels = None
+depends_on = None
+
+COLUMNS = (
+    "id, created_at, actor_id, actor_role, entity_type, entity_id, action, "
+    "summary, before, after, correlation_id, ip_address"
+)
+MONTHS_AHEAD = 2
+PERIOD_TABLE = re.compile(r"^audit_log_(\d{4})_(\d{2})$")
+
+
+def _columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", GUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("actor_id", GUID(), nullable=False),
+        sa.Column("actor_role", sa.String(length=64), nullable=False),
+        sa.Column("entity_type", sa.String(length=128), nullable=False),
+        sa.Column("entity_id", GUID(), nullable=False),
+        sa.Column("action", sa.String(length=64), nullable=False),
+        sa.Column("summary", sa.String(length=512), nullable=False),
+        sa.Column("before", sa.JSON(), nullable=True),
+        sa.Column("after", sa.JSON(), nullable=True),
+        sa.Column("correlation_id", sa.String(length=128), nullable=True),
+        sa.Column("ip_address", sa.String(length=64), nullable=True),
+    ]
+
+
+def _month_start(moment: datetime) -> datetime:
+    moment = moment.astimezone(UTC) if moment.tzinfo else moment.replace(tzinfo=UTC)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month(start: datetime) -> datetime:
+    if start.month == 12:
+        return start.replace(year=start.year + 1, month=1)
+    return start.replace(month=start.month + 1)
+
+
+def _months_between(start: datetime, end: datetime) -> int:
+    return (end.year - start.year) * 12 + end.month - start.month
+
+
+def _create_partitions(start: datetime, months: int) -> None:
+    # The new parent is still empty, so nothing needs moving out of the
+    # default partition before each month is attached.
+    month = start
+    for _ in range(months):
+        end = _next_month(month)
+        op.execute(
+            f"CREATE TABLE audit_log_{month.year:04d}_{month.month:02d} PARTITION OF audit_log "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        month = end
+
+
+def _period_tables(bind: sa.engine.Connection) -> list[str]:
+    return sorted(name for name in sa.inspect(bind).get_table_names() if PERIOD_TABLE.match(name))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    postgres = bind.dialect.name == "postgresql"
+
+    op.rename_table("audit_log", "audit_log_legacy")
+    if postgres:
+        op.execute("ALTER INDEX audit_log_pkey RENAME TO audit_log_legacy_pkey")
+
+    op.create_table(
+        "audit_log",
+        *_columns(),
+        sa.PrimaryKeyConstraint("id", "created_at", name="audit_log_pkey"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.create_index(
+        "ix_audit_log_entity_created",
+        "audit_log",
+        ["entity_type", "entity_id", "created_at"],
+    )
+    op.create_index(
+        "ix_audit_log_correlation_id",
+        "audit_log",
+        ["correlation_id"],
+        sqlite_where=sa.text("correlation_id IS NOT NULL"),
+        postgresql_where=sa.text("correlation_id IS NOT NULL"),
+    )
+
+    if postgres:
+        op.execute("CREATE TABLE audit_log_default PARTITION OF audit_log DEFAULT")
+        now = _month_start(datetime.now(UTC))
+        oldest = bind.execute(sa.text("SELECT MIN(created_at) FROM audit_log_legacy")).scalar()
+        start = min(_month_start(oldest), now) if oldest is not None else now
+        _create_partitions(start, _months_between(start, now) + MONTHS_AHEAD + 1)
+
+    op.execute(f"INSERT INTO audit_log ({COLUMNS}) SELECT {COLUMNS} FROM audit_log_legacy")  # noqa: S608
+    op.drop_table("audit_log_legacy")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    postgres = bind.dialect.name == "postgresql"
+    period_tables = [] if postgres else _period_tables(bind)
+
+    op.drop_index("ix_audit_log_correlation_id", table_name="audit_log")
+    op.drop_index("ix_audit_log_entity_created", table_name="audit_log")
+    op.rename_table("audit_log", "audit_log_partitioned")
+    if postgres:
+        op.execute("ALTER INDEX audit_log_pkey RENAME TO audit_log_partitioned_pkey")
+
+    op.create_table("audit_log", *_columns(), sa.PrimaryKeyConstraint("id", name="audit_log_pkey"))
+    for source in ("audit_log_partitioned", *period_tables):
+        op.execute(f"INSERT INTO audit_log ({COLUMNS}) SELECT {COLUMNS} FROM {source}")  # noqa: S608
+    for table in period_tables:
+        op.drop_table(table)
+    op.drop_table("audit_log_partitioned")
+
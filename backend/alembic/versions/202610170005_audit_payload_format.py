@@ -0,0 +1,47 @@
+"""Record how each audit row's before/after payload is encoded.
+
+Existing rows hold full snapshots and default to ``full``. On PostgreSQL
+the column is added to the partitioned parent and inherited by every
+partition; on SQLite each ``audit_log_YYYY_MM`` period table is altered
+as well.
+
+Revision ID: 202610170005
+Revises: 202610170004
+Create Date: 2026-10-17 00:05:00.000000
+"""
+
+from __future__ import annotations
+
+import re
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "202610170005"
+down_revision = "202610170004"
+branch_labels = None
+depends_on = None
+
+PERIOD_TABLE = re.compile(r"^audit_log_(\d{4})_(\d{2})$")
+
+
+def _tables() -> list[str]:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        return ["audit_log"]
+    period_tables = (name for name in sa.inspect(bind).get_table_names() if PERIOD_TABLE.match(name))
+    return ["audit_log", *sorted(period_tables)]
+
+
+def upgrade() -> None:
+    for table in _tables():
+        op.add_column(
+            table,
+            sa.Column("payload_format", sa.String(length=16), nullable=False, server_default="full"),
+        )
+
+
+def downgrade() -> None:
+    for table in _tables():
+        with op.batch_alter_table(table) as batch:
+            batch.drop_column("payload_format")
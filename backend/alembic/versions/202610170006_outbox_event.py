@@ -0,0 +1,48 @@
+"""Add the transactional outbox for domain events.
+
+Revision ID: 202610170006
+Revises: 202610170005
+Create Date: 2026-10-17 00:06:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from backend.app.models.types import GUID
+
+revision = "202610170006"
+down_revision = "202610170005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox_event",
+        sa.Column("id", GUID(), primary_key=True, nullable=False),
+        sa.Column("event_type", sa.String(length=128), nullable=False),
+        sa.Column("aggregate_type", sa.String(length=128), nullable=False),
+        sa.Column("aggregate_id", GUID(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("actor_id", GUID(), nullable=True),
+        sa.Column("correlation_id", sa.String(length=128), nullable=True),
+        sa.Column("causation_id", sa.String(length=128), nullable=True),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("dispatched_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_error", sa.String(length=512), nullable=True),
+    )
+    op.create_index(
+        "ix_outbox_event_pending",
+        "outbox_event",
+        ["occurred_at"],
+        sqlite_where=sa.text("dispatched_at IS NULL"),
+        postgresql_where=sa.text("dispatched_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbox_event_pending", table_name="outbox_event")
+    op.drop_table("outbox_event")
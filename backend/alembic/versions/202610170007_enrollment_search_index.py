@@ -0,0 +1,97 @@
+"""Index enrollment applications for registrar search.
+
+Adds the generated ``search_text`` column, the keyset and lowercase
+lookup indexes, and the trigram index over ``search_text``: ``pg_trgm``
+GIN on PostgreSQL, an FTS5 table kept in step by triggers on SQLite.
+SQLite cannot add a stored generated column in place, so the table is
+rebuilt there. The expression and DDL are frozen copies of those in
+``app.models.enrollment`` as of this revision.
+
+Revision ID: 202610170007
+Revises: 202610170006
+Create Date: 2026-10-17 00:07:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "202610170007"
+down_revision = "202610170006"
+branch_labels = None
+depends_on = None
+
+SEARCH_TEXT_SQL = (
+    "lower(guardian_email) || ' ' || "
+    "replace(replace(replace(replace(replace("
+    "guardian_phone, '+', ''), ' ', ''), '-', ''), '(', ''), ')', '') || ' ' || "
+    "lower(student_first_name) || ' ' || lower(student_last_name)"
+)
+SEARCH_FTS = "enrollment_application_fts"
+SQLITE_SEARCH_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_FTS} "
+    "USING fts5(search_text, application_id UNINDEXED, tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS {SEARCH_FTS}_ai "
+    "AFTER INSERT ON enrollment_application BEGIN "
+    f"INSERT INTO {SEARCH_FTS} (rowid, search_text, application_id) "
+    "VALUES (new.rowid, new.search_text, new.id); END",
+    f"CREATE TRIGGER IF NOT EXISTS {SEARCH_FTS}_ad "
+    "AFTER DELETE ON enrollment_application BEGIN "
+    f"DELETE FROM {SEARCH_FTS} WHERE rowid = old.rowid; END",
+    f"CREATE TRIGGER IF NOT EXISTS {SEARCH_FTS}_au "
+    "AFTER UPDATE OF guardian_email, guardian_phone, student_first_name, "
+    "student_last_name ON enrollment_application BEGIN "
+    f"DELETE FROM {SEARCH_FTS} WHERE rowid = old.rowid; "
+    f"INSERT INTO {SEARCH_FTS} (rowid, search_text, application_id) "
+    "VALUES (new.rowid, new.search_text, new.id); END",
+)
+
+INDEXES = (
+    ("ix_enrollment_application_submitted", ["submitted_at", "id"]),
+    ("ix_enrollment_application_status_submitted", ["status", "submitted_at", "id"]),
+    ("ix_enrollment_application_email_lower", [sa.text("lower(guardian_email)")]),
+    ("ix_enrollment_application_last_name_lower", [sa.text("lower(student_last_name)")]),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    search_text = sa.Column("search_text", sa.String(length=1024), sa.Computed(SEARCH_TEXT_SQL, persisted=True))
+    if bind.dialect.name == "sqlite":
+        with op.batch_alter_table("enrollment_application", recreate="always") as batch:
+            batch.add_column(search_text)
+    else:
+        op.add_column("enrollment_application", search_text)
+
+    for name, columns in INDEXES:
+        op.create_index(name, "enrollment_application", columns)
+
+    if bind.dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "ix_enrollment_application_search_trgm",
+            "enrollment_application",
+            ["search_text"],
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        )
+    elif bind.dialect.name == "sqlite":
+        for statement in SQLITE_SEARCH_DDL:
+            op.execute(statement)
+        op.execute(
+            f"INSERT INTO {SEARCH_FTS} (rowid, search_text, application_id) "  # noqa: S608
+            "SELECT rowid, search_text, id FROM enrollment_application"
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.drop_index("ix_enrollment_application_search_trgm", table_name="enrollment_application")
+    elif bind.dialect.name == "sqlite":
+        op.execute(f"DROP TABLE IF EXISTS {SEARCH_FTS}")
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name="enrollment_application")
+    with op.batch_alter_table("enrollment_application") as batch:
+        batch.drop_column("search_text")
@@ -0,0 +1,62 @@
+"""Add the precomputed nomination eligibility index.
+
+Revision ID: 202610170008
+Revises: 202610170007
+Create Date: 2026-10-17 00:08:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from backend.app.models.types import GUID
+
+revision = "202610170008"
+down_revision = "202610170007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "nomination_eligibility",
+        sa.Column("id", GUID(), primary_key=True, nullable=False),
+        sa.Column("nomination_period", sa.String(length=7), nullable=False),
+        sa.Column("employee_id", GUID(), nullable=False),
+        sa.Column("employee_name", sa.String(length=256), nullable=True),
+        sa.Column("department", sa.String(length=128), nullable=True),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("ineligible", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("ineligibility_reason", sa.Text(), nullable=True),
+        sa.Column(
+            "active_categories",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "uq_nomination_eligibility_employee_period",
+        "nomination_eligibility",
+        ["employee_id", "nomination_period"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_nomination_eligibility_period_department",
+        "nomination_eligibility",
+        ["nomination_period", "department"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_nomination_eligibility_period_department",
+        table_name="nomination_eligibility",
+    )
+    op.drop_index(
+        "uq_nomination_eligibility_employee_period",
+        table_name="nomination_eligibility",
+    )
+    op.drop_table("nomination_eligibility")
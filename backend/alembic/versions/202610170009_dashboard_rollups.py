@@ -0,0 +1,110 @@
+"""Add the dashboard rollup tables.
+
+Revision ID: 202610170009
+Revises: 202610170008
+Create Date: 2026-10-17 00:09:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+from backend.app.models.types import GUID
+
+revision = "202610170009"
+down_revision = "202610170008"
+branch_labels = None
+depends_on = None
+
+NOMINATION_CATEGORIES = (
+    "TEACHING_EXCELLENCE",
+    "INNOVATION",
+    "TEAMWORK",
+    "LEADERSHIP",
+    "SERVICE_EXCELLENCE",
+    "STUDENT_ADVOCACY",
+)
+# The type already exists on PostgreSQL; reuse it rather than create it.
+NOMINATION_CATEGORY = sa.Enum(
+    *NOMINATION_CATEGORIES,
+    name="nominationcategory",
+).with_variant(
+    postgresql.ENUM(
+        *NOMINATION_CATEGORIES,
+        name="nominationcategory",
+        create_type=False,
+    ),
+    "postgresql",
+)
+
+
+def _counts(*names: str) -> list[sa.Column]:
+    return [
+        sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+        for name in names
+    ]
+
+
+def _timestamps() -> list[sa.Column]:
+    return [
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cycle_progress_rollup",
+        sa.Column("id", GUID(), primary_key=True, nullable=False),
+        sa.Column(
+            "cycle_id",
+            GUID(),
+            sa.ForeignKey("evaluation_cycle.id"),
+            nullable=False,
+        ),
+        sa.Column("department", sa.String(length=128), nullable=False),
+        *_counts("total", "not_started", "in_progress", "submitted", "late"),
+        *_timestamps(),
+    )
+    op.create_index(
+        "uq_cycle_progress_rollup_cycle_department",
+        "cycle_progress_rollup",
+        ["cycle_id", "department"],
+        unique=True,
+    )
+    op.create_table(
+        "nomination_rollup",
+        sa.Column("id", GUID(), primary_key=True, nullable=False),
+        sa.Column("nomination_period", sa.String(length=7), nullable=False),
+        sa.Column("category", NOMINATION_CATEGORY, nullable=False),
+        *_counts(
+            "nominations",
+            "pending",
+            "voting",
+            "selected",
+            "rejected",
+            "votes",
+        ),
+        *_timestamps(),
+    )
+    op.create_index(
+        "uq_nomination_rollup_period_category",
+        "nomination_rollup",
+        ["nomination_period", "category"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "uq_nomination_rollup_period_category",
+        table_name="nomination_rollup",
+    )
+    op.drop_table("nomination_rollup")
+    op.drop_index(
+        "uq_cycle_progress_rollup_cycle_department",
+        table_name="cycle_progress_rollup",
+    )
+    op.drop_table("cycle_progress_rollup")
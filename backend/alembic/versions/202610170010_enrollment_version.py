@@ -0,0 +1,29 @@
+"""Add the optimistic-locking version to enrollment applications.
+
+Existing applications start at version 1.
+
+Revision ID: 202610170010
+Revises: 202610170009
+Create Date: 2026-10-17 00:10:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "202610170010"
+down_revision = "202610170009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "enrollment_application",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("enrollment_application", "version")
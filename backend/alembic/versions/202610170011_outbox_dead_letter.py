@@ -0,0 +1,27 @@
+"""Dead-letter outbox events that keep failing to publish.
+
+Revision ID: 202610170011
+Revises: 202610170010
+Create Date: 2026-10-17 00:11:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "202610170011"
+down_revision = "202610170010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "outbox_event",
+        sa.Column("dead_lettered_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("outbox_event", "dead_lettered_at")
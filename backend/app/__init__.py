@@ -1,5 +1,14 @@
 """ESE backend application package."""
 
-from .database import Base, engine, get_session_maker
+from typing import Any
 
-__all__ = ["Base", "engine", "get_session_maker"]
+from .database import Base, get_engine, get_session_maker
+
+__all__ = ["Base", "engine", "get_engine", "get_session_maker"]
+
+
+def __getattr__(name: str) -> Any:
+    # The engine is built lazily on first access; see ``app.database``.
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
+import logging
 import os
-from collections.abc import Generator
-from contextlib import contextmanager
+import threading
+import time
+import weakref
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy import Engine, create_engine, event, make_url
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
 
 
 class Base(DeclarativeBase):
@@ -15,6 +28,12 @@ class Base(DeclarativeBase):
 
 
 DEFAULT_DATABASE_URL = "sqlite:///./app.db"
+DEFAULT_POOL_PROFILE = "api"
+
+# docs/PERFORMANCE_BUDGET.md caps the database at 40 concurrent connections and
+# asks pools to stay below 75% of that, so a single process may hold up to 30.
+MAX_DATABASE_CONNECTIONS = 40
+POOL_HEADROOM_RATIO = 0.75
 
 
 def get_database_url() -> str:
@@ -23,22 +42,430 @@ def get_database_url() -> str:
     return os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL)
 
 
-engine = create_engine(get_database_url(), echo=False, future=True)
+def get_async_database_url(url: str | None = None) -> str:
+    """Translate a sync database URL to its async driver equivalent."""
+
+    parsed = make_url(url or get_database_url())
+    if parsed.get_backend_name() == "postgresql":
+        parsed = parsed.set(drivername="postgresql+psycopg")
+    elif parsed.get_backend_name() == "sqlite":
+        parsed = parsed.set(drivername="sqlite+aiosqlite")
+    return parsed.render_as_string(hide_password=False)
+
+
+@dataclass(frozen=True, slots=True)
+class PoolProfile:
+    """Connection pool sizing and connection-level limits for an engine."""
+
+    pool_size: int = 10
+    max_overflow: int = 5
+    pool_timeout: float = 10.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_timeout_ms: int | None = None
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of connections the pool may hold at once."""
+        return self.pool_size + self.max_overflow
+
+
+POOL_PROFILES: dict[str, PoolProfile] = {
+    # Request handlers: 20 + 10 = 30 connections, 75% of the 40 allowed.
+    "api": PoolProfile(
+        pool_size=20,
+        max_overflow=10,
+        pool_timeout=5.0,
+        statement_timeout_ms=5_000,
+    ),
+    # Background jobs run fewer, longer statements within the 2-minute budget.
+    "worker": PoolProfile(
+        pool_size=4,
+        max_overflow=2,
+        pool_timeout=30.0,
+        statement_timeout_ms=120_000,
+    ),
+    "test": PoolProfile(pool_size=2, max_overflow=0, pool_pre_ping=False),
+}
+
+_PROFILE_OVERRIDES: dict[str, tuple[str, Any]] = {
+    "DATABASE_POOL_SIZE": ("pool_size", int),
+    "DATABASE_MAX_OVERFLOW": ("max_overflow", int),
+    "DATABASE_POOL_TIMEOUT": ("pool_timeout", float),
+    "DATABASE_POOL_RECYCLE": ("pool_recycle", int),
+    "DATABASE_POOL_PRE_PING": ("pool_pre_ping", lambda v: v.lower() in {"1", "true"}),
+    "DATABASE_STATEMENT_TIMEOUT_MS": ("statement_timeout_ms", int),
+}
+
+
+def get_pool_profile(name: str | None = None) -> PoolProfile:
+    """Resolve a named pool profile and apply ``DATABASE_*`` overrides."""
+
+    profile_name = name or os.environ.get("DATABASE_POOL_PROFILE", DEFAULT_POOL_PROFILE)
+    try:
+        profile = POOL_PROFILES[profile_name]
+    except KeyError as exc:
+        raise ValueError(f"Unknown database pool profile: {profile_name}") from exc
+
+    overrides = {
+        field: parse(os.environ[variable])
+        for variable, (field, parse) in _PROFILE_OVERRIDES.items()
+        if variable in os.environ
+    }
+    profile = replace(profile, **overrides)
+    if profile.capacity > MAX_DATABASE_CONNECTIONS * POOL_HEADROOM_RATIO:
+        logger.warning(
+            "Pool profile %s allows %d connections, above the %d%% headroom target",
+            profile_name,
+            profile.capacity,
+            int(POOL_HEADROOM_RATIO * 100),
+        )
+    return profile
+
+
+class PoolMetrics:
+    """Thread-safe counters describing connection pool pressure."""
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.connects = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def record_checkout(self) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def record_checkin(self) -> None:
+        with self._lock:
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    @property
+    def saturation(self) -> float:
+        """Share of pool capacity currently checked out."""
+        return self.checked_out / self.capacity if self.capacity else 0.0
+
+    @property
+    def headroom_exceeded(self) -> bool:
+        return self.saturation > POOL_HEADROOM_RATIO
+
+    def snapshot(self) -> dict[str, float | int]:
+        """Return a point-in-time copy suitable for a metrics exporter."""
+        with self._lock:
+            return {
+                "capacity": self.capacity,
+                "checkouts": self.checkouts,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "connects": self.connects,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+                "saturation": (
+                    self.checked_out / self.capacity if self.capacity else 0.0
+                ),
+            }
+
+
+class _MeteredPoolMixin:
+    """Time how long callers wait for a pooled connection."""
+
+    metrics: PoolMetrics | None = None
+
+    def _do_get(self) -> Any:
+        if self.metrics is None:
+            return super()._do_get()  # type: ignore[misc]
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()  # type: ignore[misc]
+        except sa_exc.TimeoutError:
+            self.metrics.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        self.metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self) -> Any:
+        pool = super().recreate()  # type: ignore[misc]
+        pool.metrics = self.metrics
+        return pool
+
+
+class MeteredQueuePool(_MeteredPoolMixin, QueuePool):
+    """``QueuePool`` that reports checkout wait time to ``PoolMetrics``."""
+
+
+class MeteredAsyncQueuePool(_MeteredPoolMixin, AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` that reports wait time to ``PoolMetrics``."""
+
+
+def engine_options(
+    url: str,
+    profile: PoolProfile,
+    is_async: bool = False,
+) -> dict[str, Any]:
+    """Build ``create_engine`` keyword arguments for a URL and pool profile."""
+
+    backend = make_url(url).get_backend_name()
+    options: dict[str, Any] = {"echo": False}
+    if backend == "sqlite":
+        # SQLite pools are per-file and cheap; sizing and timeouts do not apply.
+        return options
+
+    options.update(
+        poolclass=MeteredAsyncQueuePool if is_async else MeteredQueuePool,
+        pool_size=profile.pool_size,
+        max_overflow=profile.max_overflow,
+        pool_timeout=profile.pool_timeout,
+        pool_recycle=profile.pool_recycle,
+        pool_pre_ping=profile.pool_pre_ping,
+    )
+    if backend == "postgresql" and profile.statement_timeout_ms is not None:
+        options["connect_args"] = {
+            "options": f"-c statement_timeout={profile.statement_timeout_ms}",
+        }
+    return options
+
+
+_pool_metrics: weakref.WeakKeyDictionary[Engine, PoolMetrics] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def attach_pool_metrics(engine: Engine, capacity: int) -> PoolMetrics:
+    """Register pool event listeners that feed a new ``PoolMetrics``."""
+
+    metrics = PoolMetrics(capacity)
+    if isinstance(engine.pool, _MeteredPoolMixin):
+        engine.pool.metrics = metrics
+
+    event.listen(engine, "connect", lambda *_: metrics.record_connect())
+    event.listen(engine, "checkout", lambda *_: metrics.record_checkout())
+    event.listen(engine, "checkin", lambda *_: metrics.record_checkin())
+    return metrics
+
+
+def attach_guid_storage_check(engine: Engine) -> None:
+    """Refuse SQLite databases whose stored GUIDs disagree with ``GUID_STORAGE``.
+
+    Runs once per engine, on its first connection, and again after a refusal.
+    """
+
+    if engine.dialect.name != "sqlite":
+        return
 
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    def check(dbapi_connection: Any, connection_record: Any) -> None:
+        from .services.guid_storage import check_guid_storage
 
+        check_guid_storage(dbapi_connection)
 
-def get_session_maker() -> sessionmaker[Base]:
+    event.listen(engine, "first_connect", check)
+
+
+def query_metrics_enabled() -> bool:
+    """Whether ``DATABASE_QUERY_METRICS`` asks for SQL instrumentation."""
+
+    return os.getenv("DATABASE_QUERY_METRICS", "").lower() in {"1", "true"}
+
+
+def build_engine(url: str | None = None, profile: PoolProfile | None = None) -> Engine:
+    """Create a sync engine configured with a pool profile and metrics."""
+
+    url = url or get_database_url()
+    profile = profile or get_pool_profile()
+    built = create_engine(url, future=True, **engine_options(url, profile))
+    _pool_metrics[built] = attach_pool_metrics(built, profile.capacity)
+    attach_guid_storage_check(built)
+    if query_metrics_enabled():
+        from .instrumentation import instrument_engine
+
+        instrument_engine(built)
+    return built
+
+
+def build_async_engine(
+    url: str | None = None,
+    profile: PoolProfile | None = None,
+) -> AsyncEngine:
+    """Create an async engine configured with a pool profile and metrics."""
+
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    url = get_async_database_url(url)
+    profile = profile or get_pool_profile()
+    built = create_async_engine(url, **engine_options(url, profile, is_async=True))
+    _pool_metrics[built.sync_engine] = attach_pool_metrics(
+        built.sync_engine,
+        profile.capacity,
+    )
+    attach_guid_storage_check(built.sync_engine)
+    if query_metrics_enabled():
+        from .instrumentation import instrument_engine
+
+        instrument_engine(built.sync_engine)
+    return built
+
+
+def get_pool_metrics(bound: Engine | AsyncEngine) -> PoolMetrics:
+    """Return the ``PoolMetrics`` attached to an engine by ``build_engine``."""
+
+    engine: Any = bound
+    sync_engine: Engine = getattr(engine, "sync_engine", engine)
+    return _pool_metrics[sync_engine]
+
+
+class EngineRegistry:
+    """Lazily built engines and session factories keyed by database URL.
+
+    Nothing connects until the first lookup, so importing models, running
+    Alembic or forking worker processes never opens a connection. Tests can
+    point ``DATABASE_URL`` elsewhere and call ``reset`` between sessions.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._engines: dict[str, Engine] = {}
+        self._session_makers: dict[str, sessionmaker[Session]] = {}
+        self._async_engines: dict[str, AsyncEngine] = {}
+        self._async_session_makers: dict[str, async_sessionmaker[AsyncSession]] = {}
+
+    def engine(self, url: str | None = None) -> Engine:
+        url = url or get_database_url()
+        with self._lock:
+            if url not in self._engines:
+                self._engines[url] = build_engine(url)
+            return self._engines[url]
+
+    def session_maker(self, url: str | None = None) -> sessionmaker[Session]:
+        url = url or get_database_url()
+        with self._lock:
+            if url not in self._session_makers:
+                self._session_makers[url] = sessionmaker(
+                    bind=self.engine(url),
+                    autoflush=False,
+                    autocommit=False,
+                    future=True,
+                )
+            return self._session_makers[url]
+
+    def async_engine(self, url: str | None = None) -> AsyncEngine:
+        url = url or get_database_url()
+        with self._lock:
+            if url not in self._async_engines:
+                self._async_engines[url] = build_async_engine(url)
+            return self._async_engines[url]
+
+    def async_session_maker(
+        self,
+        url: str | None = None,
+    ) -> async_sessionmaker[AsyncSession]:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        url = url or get_database_url()
+        with self._lock:
+            if url not in self._async_session_makers:
+                self._async_session_makers[url] = async_sessionmaker(
+                    bind=self.async_engine(url),
+                    autoflush=False,
+                    expire_on_commit=False,
+                )
+            return self._async_session_makers[url]
+
+    def urls(self) -> list[str]:
+        with self._lock:
+            return sorted(self._engines.keys() | self._async_engines.keys())
+
+    def reset(self) -> None:
+        """Dispose every engine and forget all cached factories."""
+        with self._lock:
+            for built in self._engines.values():
+                built.dispose()
+            for async_built in self._async_engines.values():
+                # Async pools cannot be awaited here; drop connections unclosed.
+                async_built.sync_engine.dispose(close=False)
+            self._engines.clear()
+            self._session_makers.clear()
+            self._async_engines.clear()
+            self._async_session_makers.clear()
+
+    def release_after_fork(self) -> None:
+        """Drop pooled connections inherited from a parent process."""
+        for built in list(self._engines.values()):
+            built.dispose(close=False)
+        for async_built in list(self._async_engines.values()):
+            async_built.sync_engine.dispose(close=False)
+
+
+registry = EngineRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=registry.release_after_fork)
+
+
+def get_engine(url: str | None = None) -> Engine:
+    """Return the engine for ``url`` (default ``DATABASE_URL``), built lazily."""
+
+    return registry.engine(url)
+
+
+def get_session_maker(url: str | None = None) -> sessionmaker[Session]:
     """Expose the configured session factory for dependency injection."""
 
-    return SessionLocal
+    return registry.session_maker(url)
+
+
+def get_async_engine(url: str | None = None) -> AsyncEngine:
+    """Return the async engine for ``url``, creating it on first use."""
+
+    return registry.async_engine(url)
+
+
+def get_async_session_maker(
+    url: str | None = None,
+) -> async_sessionmaker[AsyncSession]:
+    """Expose the async session factory for dependency injection."""
+
+    return registry.async_session_maker(url)
+
+
+def reset_engines() -> None:
+    """Dispose all cached engines, e.g. between test sessions."""
+
+    registry.reset()
+
+
+def __getattr__(name: str) -> Any:
+    # ``engine`` and ``SessionLocal`` used to be import-time globals; resolve
+    # them on access so existing imports keep working without eager setup.
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_maker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @contextmanager
-def session_scope() -> Generator:
+def session_scope() -> Generator[Session, None, None]:
     """Provide a transactional scope for database operations."""
 
-    session = SessionLocal()
+    session = get_session_maker()()
     try:
         yield session
         session.commit()
@@ -47,3 +474,16 @@ def session_scope() -> Generator:
         raise
     finally:
         session.close()
+
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncGenerator[AsyncSession, None]:
+    """Provide a transactional scope on the async engine."""
+
+    async with get_async_session_maker()() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
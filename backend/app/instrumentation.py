@@ -0,0 +1,419 @@
+"""SQL statement metrics, N+1 detection and a slow-query log.
+
+``instrument_engine`` hooks ``before_cursor_execute`` and
+``after_cursor_execute`` on an engine. Every statement is timed into a
+latency histogram keyed by its normalised text (literals, ``IN`` lists and
+multi-row ``VALUES`` collapsed), so a query shape is one series however
+its parameters vary. Statements run while ``correlation_scope`` is active
+carry a trailing ``/* correlation_id='...' */`` comment, which shows up in
+``pg_stat_activity`` and the server's slow log.
+
+The same ``SELECT`` repeated ``n_plus_one_threshold`` times in one
+``Session`` is reported once as an N+1 (usually a lazy load in a loop).
+Statements slower than ``slow_query_ms`` are logged, and ``SELECT``s get
+their plan captured with ``EXPLAIN`` (``EXPLAIN QUERY PLAN`` on SQLite) at
+most once per ``explain_interval`` seconds per shape. Nothing re-runs the
+query: plans are estimated, never ``ANALYZE``d.
+
+Findings go to the ``app.instrumentation`` logger and to any exporters;
+``MemoryExporter`` collects them for tests. ``build_engine`` instruments
+engines when ``DATABASE_QUERY_METRICS`` is set; ``benchmarks/
+bench_query_instrumentation.py`` holds the overhead to 2%.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Protocol
+
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.orm import Session, SessionTransaction
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in milliseconds, aligned with the 300 ms API P95 budget.
+HISTOGRAM_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000)
+DEFAULT_SLOW_QUERY_MS = 100.0
+DEFAULT_N_PLUS_ONE_THRESHOLD = 10
+DEFAULT_EXPLAIN_INTERVAL = 300.0
+# Shapes beyond this share one series, so ad-hoc SQL cannot grow memory.
+MAX_STATEMENTS = 2_000
+OVERFLOW_STATEMENT = "<other>"
+
+_correlation_id: ContextVar[str | None] = ContextVar("correlation_id", default=None)
+_UNSAFE_ID = re.compile(r"[^A-Za-z0-9_.:-]")
+_EXPLAIN_PREFIX = {"sqlite": "EXPLAIN QUERY PLAN ", "postgresql": "EXPLAIN "}
+
+_COMMENT = re.compile(r"/\*.*?\*/|--[^\n]*", re.DOTALL)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|:\w+|\$\d+)"
+_PLACEHOLDER_LIST = re.compile(
+    rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})+\s*\)",
+)
+_VALUES_ROWS = re.compile(r"(VALUES\s*\([^()]*\))(?:\s*,\s*\([^()]*\))+", re.I)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def current_correlation_id() -> str | None:
+    return _correlation_id.get()
+
+
+@contextmanager
+def correlation_scope(correlation_id: str | None) -> Iterator[str | None]:
+    """Tag statements run inside the block with ``correlation_id``.
+
+    Characters outside ``[A-Za-z0-9_.:-]`` are dropped so the id cannot
+    close the SQL comment it is written into.
+    """
+
+    safe = _UNSAFE_ID.sub("", correlation_id)[:64] if correlation_id else None
+    token = _correlation_id.set(safe)
+    try:
+        yield safe
+    finally:
+        _correlation_id.reset(token)
+
+
+@lru_cache(maxsize=4_096)
+def normalise_statement(statement: str) -> str:
+    """Collapse ``statement`` to its shape: one series per query pattern."""
+
+    shape = _COMMENT.sub(" ", statement)
+    shape = _STRING.sub("?", shape)
+    shape = _NUMBER.sub("?", shape)
+    shape = _PLACEHOLDER_LIST.sub("(?)", shape)
+    shape = _VALUES_ROWS.sub(r"\1", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+@dataclass(frozen=True, slots=True)
+class QueryEvent:
+    statement: str
+    duration_ms: float
+    correlation_id: str | None
+    executemany: bool
+
+
+@dataclass(frozen=True, slots=True)
+class SlowQuery:
+    statement: str
+    sql: str
+    duration_ms: float
+    correlation_id: str | None
+    plan: list[str] | None
+
+
+@dataclass(frozen=True, slots=True)
+class NPlusOne:
+    statement: str
+    executions: int
+    correlation_id: str | None
+
+
+class QueryExporter(Protocol):
+    """Destination for instrumentation findings."""
+
+    def export_query(self, event: QueryEvent) -> None: ...
+
+    def export_slow_query(self, event: SlowQuery) -> None: ...
+
+    def export_n_plus_one(self, event: NPlusOne) -> None: ...
+
+
+class MemoryExporter:
+    """Keeps every finding in lists, for tests."""
+
+    def __init__(self) -> None:
+        self.queries: list[QueryEvent] = []
+        self.slow_queries: list[SlowQuery] = []
+        self.n_plus_one: list[NPlusOne] = []
+
+    def export_query(self, event: QueryEvent) -> None:
+        self.queries.append(event)
+
+    def export_slow_query(self, event: SlowQuery) -> None:
+        self.slow_queries.append(event)
+
+    def export_n_plus_one(self, event: NPlusOne) -> None:
+        self.n_plus_one.append(event)
+
+    def clear(self) -> None:
+        self.queries.clear()
+        self.slow_queries.clear()
+        self.n_plus_one.clear()
+
+
+@dataclass(slots=True)
+class StatementHistogram:
+    """Cumulative latency histogram for one statement shape."""
+
+    buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(HISTOGRAM_BUCKETS_MS) + 1),
+    )
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def observe(self, duration_ms: float) -> None:
+        self.buckets[bisect_left(HISTOGRAM_BUCKETS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the ``fraction`` quantile."""
+
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bound, hits in zip(
+            (*HISTOGRAM_BUCKETS_MS, self.max_ms),
+            self.buckets,
+            strict=True,
+        ):
+            seen += hits
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "p95_ms": self.percentile(0.95),
+            "buckets": dict(
+                zip((*HISTOGRAM_BUCKETS_MS, "+Inf"), self.buckets, strict=True),
+            ),
+        }
+
+
+class QueryInstrumentation:
+    """Cursor-level listeners feeding histograms, N+1 and slow-query checks."""
+
+    def __init__(
+        self,
+        slow_query_ms: float = DEFAULT_SLOW_QUERY_MS,
+        n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD,
+        explain: bool = True,
+        explain_interval: float = DEFAULT_EXPLAIN_INTERVAL,
+        tag_statements: bool = True,
+        exporters: Sequence[QueryExporter] = (),
+    ) -> None:
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.explain = explain
+        self.explain_interval = explain_interval
+        self.tag_statements = tag_statements
+        self.exporters = list(exporters)
+        self.histograms: dict[str, StatementHistogram] = {}
+        self._lock = threading.Lock()
+        self._explained: dict[str, float] = {}
+        # Statement counts of the session each connection belongs to.
+        self._sessions: weakref.WeakKeyDictionary[Connection, Counter[str]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def attach(self, engine: Engine) -> QueryInstrumentation:
+        event.listen(engine, "before_cursor_execute", self._before, retval=True)
+        event.listen(engine, "after_cursor_execute", self._after)
+        _instrumented[engine] = self
+        return self
+
+    def detach(self, engine: Engine) -> None:
+        event.remove(engine, "before_cursor_execute", self._before)
+        event.remove(engine, "after_cursor_execute", self._after)
+        _instrumented.pop(engine, None)
+
+    def track_session(self, session: Session, connection: Connection) -> None:
+        self._sessions[connection] = session.info.setdefault(
+            "query_counts",
+            Counter(),
+        )
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Histogram copies by statement shape, busiest first."""
+
+        with self._lock:
+            ranked = sorted(
+                self.histograms.items(),
+                key=lambda item: item[1].total_ms,
+                reverse=True,
+            )
+            return {shape: histogram.snapshot() for shape, histogram in ranked}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms.clear()
+            self._explained.clear()
+
+    def _before(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> tuple[str, Any]:
+        context._query_statement = statement
+        correlation_id = _correlation_id.get()
+        if correlation_id and self.tag_statements:
+            statement = f"{statement} /* correlation_id='{correlation_id}' */"
+        context._query_started = time.perf_counter()
+        return statement, parameters
+
+    def _after(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        duration_ms = (time.perf_counter() - context._query_started) * 1000
+        shape = normalise_statement(context._query_statement)
+        with self._lock:
+            histogram = self.histograms.get(shape)
+            if histogram is None:
+                if len(self.histograms) >= MAX_STATEMENTS:
+                    shape = OVERFLOW_STATEMENT
+                histogram = self.histograms.setdefault(shape, StatementHistogram())
+            histogram.observe(duration_ms)
+
+        if self.exporters:
+            query = QueryEvent(shape, duration_ms, _correlation_id.get(), executemany)
+            for exporter in self.exporters:
+                exporter.export_query(query)
+
+        counts = self._sessions.get(conn)
+        if counts is not None and not executemany and shape[:6] == "SELECT":
+            counts[shape] += 1
+            if counts[shape] == self.n_plus_one_threshold:
+                self._report_n_plus_one(shape, counts[shape])
+
+        if duration_ms >= self.slow_query_ms:
+            self._report_slow(conn, statement, parameters, shape, duration_ms)
+
+    def _report_n_plus_one(self, shape: str, executions: int) -> None:
+        finding = NPlusOne(shape, executions, _correlation_id.get())
+        logger.warning(
+            "Possible N+1: statement ran %d times in one session "
+            "(correlation_id=%s): %s",
+            executions,
+            finding.correlation_id,
+            shape,
+        )
+        for exporter in self.exporters:
+            exporter.export_n_plus_one(finding)
+
+    def _report_slow(
+        self,
+        conn: Connection,
+        statement: str,
+        parameters: Any,
+        shape: str,
+        duration_ms: float,
+    ) -> None:
+        plan = None
+        now = time.monotonic()
+        if self.explain and shape.startswith(("SELECT", "WITH")):
+            with self._lock:
+                last = self._explained.get(shape)
+                due = last is None or now - last >= self.explain_interval
+                if due:
+                    self._explained[shape] = now
+            if due:
+                plan = explain(conn, statement, parameters)
+        finding = SlowQuery(
+            shape,
+            statement,
+            duration_ms,
+            _correlation_id.get(),
+            plan,
+        )
+        logger.warning(
+            "Slow query: %.1f ms (correlation_id=%s): %s%s",
+            duration_ms,
+            finding.correlation_id,
+            shape,
+            "".join(f"\n  {line}" for line in plan or ()),
+        )
+        for exporter in self.exporters:
+            exporter.export_slow_query(finding)
+
+
+def explain(conn: Connection, statement: str, parameters: Any) -> list[str] | None:
+    """The estimated plan of an already executed statement, one line per row.
+
+    Runs on a separate DBAPI cursor of the same connection, so it sees the
+    same transaction. Returns ``None`` on dialects without a known
+    ``EXPLAIN`` form or when the plan cannot be produced.
+    """
+
+    prefix = _EXPLAIN_PREFIX.get(conn.dialect.name)
+    if prefix is None:
+        return None
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        return [str(row[-1]) for row in cursor.fetchall()]
+    except Exception:
+        logger.debug("EXPLAIN failed for %s", statement, exc_info=True)
+        return None
+    finally:
+        cursor.close()
+
+
+_instrumented: weakref.WeakKeyDictionary[Engine, QueryInstrumentation] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@event.listens_for(Session, "after_begin")
+def _track_session(
+    session: Session,
+    transaction: SessionTransaction,
+    connection: Connection,
+) -> None:
+    instrumentation = _instrumented.get(connection.engine)
+    if instrumentation is not None:
+        instrumentation.track_session(session, connection)
+
+
+def instrument_engine(
+    engine: Engine,
+    exporters: Sequence[QueryExporter] = (),
+    **options: Any,
+) -> QueryInstrumentation:
+    """Attach a new ``QueryInstrumentation`` to ``engine``.
+
+    ``DATABASE_SLOW_QUERY_MS`` overrides the slow-query threshold unless
+    ``slow_query_ms`` is passed.
+    """
+
+    if "DATABASE_SLOW_QUERY_MS" in os.environ:
+        options.setdefault("slow_query_ms", float(os.environ["DATABASE_SLOW_QUERY_MS"]))
+    return QueryInstrumentation(exporters=exporters, **options).attach(engine)
+
+
+def get_query_instrumentation(engine: Engine) -> QueryInstrumentation | None:
+    """The instrumentation attached to ``engine``, if any."""
+
+    return _instrumented.get(getattr(engine, "sync_engine", engine))
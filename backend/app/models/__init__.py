@@ -1,7 +1,12 @@
 """ORM models for the ESE backend."""
 
 from .audit import AuditLog
-from .enrollment import EnrollmentApplication, EnrollmentStatus
+from .enrollment import (
+    ENROLLMENT_TRANSITIONS,
+    EnrollmentApplication,
+    EnrollmentStatus,
+    InvalidTransitionError,
+)
 from .evaluation import (
     EOYCandidate,
     Evaluation,
@@ -9,10 +14,12 @@ from .evaluation import (
     EvaluationCycleStatus,
     EvaluationRating,
     EvaluationResult,
+    EvaluationScoreStats,
     EvaluationStatus,
     EvaluatorRole,
     StaffType,
 )
+from .outbox import OutboxEvent, stage_event
 from .recognition import (
     Award,
     AwardType,
@@ -20,14 +27,18 @@ from .recognition import (
     FairnessMetric,
     Nomination,
     NominationCategory,
+    NominationEligibility,
     NominationStatus,
     Vote,
 )
+from .rollup import CycleProgressRollup, NominationRollup
 
 __all__ = [
+    "ENROLLMENT_TRANSITIONS",
     "AuditLog",
     "Award",
     "AwardType",
+    "CycleProgressRollup",
     "EOYCandidate",
     "EligibilityTracking",
     "EnrollmentApplication",
@@ -37,12 +48,18 @@ __all__ = [
     "EvaluationCycleStatus",
     "EvaluationRating",
     "EvaluationResult",
+    "EvaluationScoreStats",
     "EvaluationStatus",
     "EvaluatorRole",
     "FairnessMetric",
+    "InvalidTransitionError",
     "Nomination",
     "NominationCategory",
+    "NominationEligibility",
+    "NominationRollup",
     "NominationStatus",
+    "OutboxEvent",
     "StaffType",
     "Vote",
+    "stage_event",
 ]
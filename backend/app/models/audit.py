@@ -5,30 +5,61 @@ from __future__ import annotations
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import JSON, Column, DateTime, String
+from sqlalchemy import DDL, JSON, Column, DateTime, Index, String, event, text
 
 from ..database import Base
 from .types import GUID
 
+AUDIT_DEFAULT_PARTITION = "audit_log_default"
+
 
 class AuditLog(Base):
-    """Persisted audit events tracking state changes."""
+    """Persisted audit events tracking state changes.
+
+    On PostgreSQL the table is range-partitioned by ``created_at`` month, so
+    ``created_at`` is part of the primary key; rows outside every monthly
+    partition land in ``audit_log_default``. SQLite keeps ``audit_log`` as
+    the catch-all and adds one table per month (see ``app.services.audit``).
+    """
 
     __tablename__ = "audit_log"
+    __table_args__ = (
+        Index("ix_audit_log_entity_created", "entity_type", "entity_id", "created_at"),
+        Index(
+            "ix_audit_log_correlation_id",
+            "correlation_id",
+            sqlite_where=text("correlation_id IS NOT NULL"),
+            postgresql_where=text("correlation_id IS NOT NULL"),
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id: Column[uuid.UUID] = Column(GUID(), primary_key=True, default=uuid.uuid4)
     created_at = Column(
         DateTime(timezone=True),
+        primary_key=True,
         default=lambda: datetime.now(UTC),
         nullable=False,
     )
-    actor_id = Column(GUID(), nullable=False)
+    actor_id: Column[uuid.UUID] = Column(GUID(), nullable=False)
     actor_role = Column(String(64), nullable=False)
     entity_type = Column(String(128), nullable=False)
-    entity_id = Column(GUID(), nullable=False)
+    entity_id: Column[uuid.UUID] = Column(GUID(), nullable=False)
     action = Column(String(64), nullable=False)
     summary = Column(String(512), nullable=False)
     before = Column(JSON, nullable=True)
     after = Column(JSON, nullable=True)
+    # How to read before/after; see app.services.audit_diff.
+    payload_format = Column(String(16), default="full", nullable=False)
     correlation_id = Column(String(128), nullable=True)
     ip_address = Column(String(64), nullable=True)
+
+
+event.listen(
+    AuditLog.__table__,
+    "after_create",
+    DDL(  # type: ignore[no-untyped-call]
+        f"CREATE TABLE IF NOT EXISTS {AUDIT_DEFAULT_PARTITION} "
+        "PARTITION OF audit_log DEFAULT",
+    ).execute_if(dialect="postgresql"),
+)
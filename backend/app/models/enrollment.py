@@ -5,10 +5,24 @@ from __future__ import annotations
 import uuid
 from datetime import UTC, datetime
 from enum import Enum as PyEnum
+from typing import Any
 
-from sqlalchemy import JSON, Column, DateTime, Enum, String
+from sqlalchemy import (
+    DDL,
+    JSON,
+    Column,
+    Computed,
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    String,
+    event,
+    text,
+)
 
 from ..database import Base
+from .outbox import stage_event
 from .types import GUID
 
 
@@ -22,10 +36,130 @@ class EnrollmentStatus(str, PyEnum):  # type: ignore[misc]
     PROVISIONED = "provisioned"
 
 
+# Statuses each status may move to; REJECTED and PROVISIONED are final.
+ENROLLMENT_TRANSITIONS: dict[EnrollmentStatus, frozenset[EnrollmentStatus]] = {
+    EnrollmentStatus.SUBMITTED: frozenset(
+        {
+            EnrollmentStatus.IN_REVIEW,
+            EnrollmentStatus.APPROVED,
+            EnrollmentStatus.REJECTED,
+        },
+    ),
+    EnrollmentStatus.IN_REVIEW: frozenset(
+        {EnrollmentStatus.APPROVED, EnrollmentStatus.REJECTED},
+    ),
+    EnrollmentStatus.APPROVED: frozenset({EnrollmentStatus.PROVISIONED}),
+    EnrollmentStatus.REJECTED: frozenset(),
+    EnrollmentStatus.PROVISIONED: frozenset(),
+}
+
+
+class InvalidTransitionError(ValueError):
+    """Raised when an application cannot move from its status to another."""
+
+
+def transition_sources(target: EnrollmentStatus) -> frozenset[EnrollmentStatus]:
+    """Statuses an application may be in to move to ``target``."""
+
+    return frozenset(
+        source
+        for source, targets in ENROLLMENT_TRANSITIONS.items()
+        if target in targets
+    )
+
+
+def approved_payload(
+    application_id: uuid.UUID,
+    approved_by: uuid.UUID | None,
+    approved_at: datetime,
+    notes: str | None,
+) -> dict[str, Any]:
+    """``enrollment.approved`` event payload."""
+
+    return {
+        "application_id": str(application_id),
+        "approved_by": str(approved_by) if approved_by else None,
+        "approved_at": approved_at.isoformat(),
+        "notes": notes,
+    }
+
+
+def provisioned_payload(
+    application_id: uuid.UUID,
+    student_code: str,
+    provisioned_at: datetime,
+) -> dict[str, Any]:
+    """``enrollment.provisioned`` event payload."""
+
+    return {
+        "application_id": str(application_id),
+        "student_code": student_code,
+        "provisioned_at": provisioned_at.isoformat(),
+    }
+
+
+# Lowercased email, phone digits and lowercased student names, space separated;
+# registrar search matches substrings of this (see app.services.enrollment_search).
+SEARCH_TEXT_SQL = (
+    "lower(guardian_email) || ' ' || "
+    "replace(replace(replace(replace(replace("
+    "guardian_phone, '+', ''), ' ', ''), '-', ''), '(', ''), ')', '') || ' ' || "
+    "lower(student_first_name) || ' ' || lower(student_last_name)"
+)
+ENROLLMENT_SEARCH_FTS = "enrollment_application_fts"
+
+# SQLite keeps a trigram FTS5 index over search_text in step through triggers.
+# FTS rows share the application's rowid, which VACUUM may renumber; rebuild
+# with app.services.enrollment_search.rebuild_search_index afterwards.
+SQLITE_SEARCH_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {ENROLLMENT_SEARCH_FTS} "
+    "USING fts5(search_text, application_id UNINDEXED, tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS {ENROLLMENT_SEARCH_FTS}_ai "  # noqa: S608
+    "AFTER INSERT ON enrollment_application BEGIN "
+    f"INSERT INTO {ENROLLMENT_SEARCH_FTS} (rowid, search_text, application_id) "
+    "VALUES (new.rowid, new.search_text, new.id); END",
+    f"CREATE TRIGGER IF NOT EXISTS {ENROLLMENT_SEARCH_FTS}_ad "  # noqa: S608
+    "AFTER DELETE ON enrollment_application BEGIN "
+    f"DELETE FROM {ENROLLMENT_SEARCH_FTS} WHERE rowid = old.rowid; END",
+    f"CREATE TRIGGER IF NOT EXISTS {ENROLLMENT_SEARCH_FTS}_au "  # noqa: S608
+    "AFTER UPDATE OF guardian_email, guardian_phone, student_first_name, "
+    "student_last_name ON enrollment_application BEGIN "
+    f"DELETE FROM {ENROLLMENT_SEARCH_FTS} WHERE rowid = old.rowid; "
+    f"INSERT INTO {ENROLLMENT_SEARCH_FTS} (rowid, search_text, application_id) "
+    "VALUES (new.rowid, new.search_text, new.id); END",
+)
+
+
 class EnrollmentApplication(Base):
-    """Intake form capturing student onboarding information."""
+    """Intake form capturing student onboarding information.
+
+    ``version`` is the optimistic lock: ORM flushes update ``WHERE version``
+    matches and raise ``StaleDataError`` when another writer got there
+    first. ``app.services.enrollment_lifecycle`` applies the same check to
+    batch transitions.
+    """
 
     __tablename__ = "enrollment_application"
+    __table_args__ = (
+        Index("ix_enrollment_application_submitted", "submitted_at", "id"),
+        Index(
+            "ix_enrollment_application_status_submitted",
+            "status",
+            "submitted_at",
+            "id",
+        ),
+        Index("ix_enrollment_application_email_lower", text("lower(guardian_email)")),
+        Index(
+            "ix_enrollment_application_last_name_lower",
+            text("lower(student_last_name)"),
+        ),
+        Index(
+            "ix_enrollment_application_search_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     guardian_email = Column(String(255), nullable=False)
@@ -50,22 +184,86 @@ class EnrollmentApplication(Base):
     notes = Column(String(1024), nullable=True)
     correlation_id = Column(String(128), nullable=True)
     assigned_student_code = Column(String(64), nullable=True, unique=True)
+    search_text = Column(String(1024), Computed(SEARCH_TEXT_SQL, persisted=True))
+    version = Column(Integer, default=1, server_default="1", nullable=False)
+
+    __mapper_args__ = {"version_id_col": version}  # noqa: RUF012
+
+    def _transition(self, target: EnrollmentStatus) -> None:
+        # Transient applications have no status until the default applies.
+        current = EnrollmentStatus(self.status or EnrollmentStatus.SUBMITTED)
+        if target not in ENROLLMENT_TRANSITIONS[current]:
+            raise InvalidTransitionError(
+                f"application {self.id} cannot move from {current.name} "
+                f"to {target.name}",
+            )
 
     def mark_reviewed(self, when: datetime | None = None) -> None:
         """Record when the application entered manual review."""
 
+        self._transition(EnrollmentStatus.IN_REVIEW)
         self.reviewed_at = when or datetime.now(UTC)
         self.status = EnrollmentStatus.IN_REVIEW
 
-    def mark_approved(self, when: datetime | None = None) -> None:
-        """Record approval of the application."""
+    def mark_rejected(self, when: datetime | None = None) -> None:
+        """Record the rejection; a rejection is also a review."""
 
-        self.approved_at = when or datetime.now(UTC)
+        self._transition(EnrollmentStatus.REJECTED)
+        self.reviewed_at = self.reviewed_at or when or datetime.now(UTC)
+        self.status = EnrollmentStatus.REJECTED
+
+    def mark_approved(
+        self,
+        when: datetime | None = None,
+        approved_by: uuid.UUID | None = None,
+    ) -> None:
+        """Record approval of the application and stage ``enrollment.approved``."""
+
+        self._transition(EnrollmentStatus.APPROVED)
+        approved_at = when or datetime.now(UTC)
+        stage_event(
+            self,
+            "enrollment.approved",
+            approved_payload(self.id, approved_by, approved_at, self.notes),
+            actor_id=approved_by,
+            occurred_at=approved_at,
+        )
+        self.approved_at = approved_at
         self.status = EnrollmentStatus.APPROVED
 
     def mark_provisioned(self, student_code: str, when: datetime | None = None) -> None:
-        """Record provisioning details for the approved student."""
+        """Record provisioning details and stage ``enrollment.provisioned``."""
 
-        self.provisioned_at = when or datetime.now(UTC)
+        self._transition(EnrollmentStatus.PROVISIONED)
+        provisioned_at = when or datetime.now(UTC)
+        stage_event(
+            self,
+            "enrollment.provisioned",
+            provisioned_payload(self.id, student_code, provisioned_at),
+            occurred_at=provisioned_at,
+        )
+        self.provisioned_at = provisioned_at
         self.assigned_student_code = student_code
         self.status = EnrollmentStatus.PROVISIONED
+
+
+def _ddl(statement: str, dialect: str) -> DDL:
+    return DDL(statement).execute_if(dialect=dialect)  # type: ignore[no-untyped-call]
+
+
+event.listen(
+    EnrollmentApplication.__table__,
+    "before_create",
+    _ddl("CREATE EXTENSION IF NOT EXISTS pg_trgm", "postgresql"),
+)
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(
+        EnrollmentApplication.__table__,
+        "after_create",
+        _ddl(statement, "sqlite"),
+    )
+event.listen(
+    EnrollmentApplication.__table__,
+    "before_drop",
+    _ddl(f"DROP TABLE IF EXISTS {ENROLLMENT_SEARCH_FTS}", "sqlite"),
+)
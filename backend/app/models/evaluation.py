@@ -5,6 +5,7 @@ from __future__ import annotations
 import uuid
 from datetime import UTC, datetime
 from enum import Enum as PyEnum
+from typing import Any
 
 from sqlalchemy import (
     JSON,
@@ -13,11 +14,16 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    UniqueConstraint,
+    inspect,
+    text,
 )
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql.elements import ColumnElement
 
 from ..database import Base
 from .types import GUID
@@ -101,21 +107,55 @@ class EvaluationCycle(Base):
         self.status = EvaluationCycleStatus.ARCHIVED
 
     def update_completion_count(self, increment: int = 1) -> None:
-        """Update the count of completed evaluations."""
-        self.completed_evaluations += increment
+        """Update the count of completed evaluations.
+
+        Persistent cycles are incremented with ``SET completed_evaluations =
+        completed_evaluations + :increment`` on flush so concurrent
+        submissions never lose updates; the attribute reloads afterwards.
+        """
+        current: Any = self.__dict__.get("completed_evaluations")
+        if not inspect(self).persistent:
+            current = current or 0
+        elif not isinstance(current, ColumnElement):
+            current = EvaluationCycle.completed_evaluations
+        self.completed_evaluations = current + increment
 
 
 class Evaluation(Base):
     """Individual evaluation assignments linking evaluator to evaluee."""
 
     __tablename__ = "evaluation"
+    __table_args__ = (
+        # One assignment per evaluator and evaluee in a cycle; also serves
+        # ``cycle_id``-only lookups through its leading column.
+        Index(
+            "uq_evaluation_cycle_evaluator_evaluee",
+            "cycle_id",
+            "evaluator_id",
+            "evaluee_id",
+            unique=True,
+        ),
+        # Evaluator dashboards: "my assignments in this cycle by status".
+        Index(
+            "ix_evaluation_cycle_evaluator_status",
+            "cycle_id",
+            "evaluator_id",
+            "status",
+        ),
+        # Deadline sweeps only ever scan assignments that are still open.
+        Index(
+            "ix_evaluation_open_due_date",
+            "due_date",
+            sqlite_where=text("status IN ('NOT_STARTED', 'IN_PROGRESS')"),
+            postgresql_where=text("status IN ('NOT_STARTED', 'IN_PROGRESS')"),
+        ),
+    )
 
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     cycle_id = Column(
         GUID(),
         ForeignKey("evaluation_cycle.id"),
         nullable=False,
-        index=True,
     )
     evaluee_id = Column(GUID(), nullable=False, index=True)
     evaluee_name = Column(String(256), nullable=False)
@@ -160,6 +200,15 @@ class EvaluationRating(Base):
     """Individual evaluator's ratings and feedback for an evaluee."""
 
     __tablename__ = "evaluation_rating"
+    __table_args__ = (
+        # Per-evaluee aggregation within a cycle, grouped by evaluator role.
+        Index(
+            "ix_evaluation_rating_cycle_evaluee_role",
+            "cycle_id",
+            "evaluee_id",
+            "evaluator_role",
+        ),
+    )
 
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     evaluation_id = Column(
@@ -172,7 +221,6 @@ class EvaluationRating(Base):
         GUID(),
         ForeignKey("evaluation_cycle.id"),
         nullable=False,
-        index=True,
     )
     evaluator_id = Column(GUID(), nullable=False, index=True)
     evaluator_role = Column(Enum(EvaluatorRole), nullable=False)
@@ -221,13 +269,20 @@ class EvaluationResult(Base):
     """Aggregated evaluation results for an evaluee in a cycle."""
 
     __tablename__ = "evaluation_result"
+    __table_args__ = (
+        Index(
+            "uq_evaluation_result_cycle_evaluee",
+            "cycle_id",
+            "evaluee_id",
+            unique=True,
+        ),
+    )
 
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     cycle_id = Column(
         GUID(),
         ForeignKey("evaluation_cycle.id"),
         nullable=False,
-        index=True,
     )
     evaluee_id = Column(GUID(), nullable=False, index=True)
     evaluee_name = Column(String(256), nullable=False)
@@ -279,6 +334,45 @@ class EvaluationResult(Base):
         self.released_at = datetime.now(UTC)
 
 
+class EvaluationScoreStats(Base):
+    """Running rating moments per evaluee and evaluator role within a cycle."""
+
+    __tablename__ = "evaluation_score_stats"
+    __table_args__ = (
+        UniqueConstraint(
+            "cycle_id",
+            "evaluee_id",
+            "evaluator_role",
+            name="uq_evaluation_score_stats_cycle_evaluee_role",
+        ),
+    )
+
+    id: Column[uuid.UUID] = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    cycle_id: Column[uuid.UUID] = Column(
+        GUID(),
+        ForeignKey("evaluation_cycle.id"),
+        nullable=False,
+    )
+    evaluee_id: Column[uuid.UUID] = Column(GUID(), nullable=False)
+    evaluator_role: Column[EvaluatorRole] = Column(
+        Enum(EvaluatorRole),
+        nullable=False,
+    )
+    rating_count = Column(Integer, default=0, nullable=False)
+    score_sum = Column(Float, default=0.0, nullable=False)
+    score_sum_sq = Column(Float, default=0.0, nullable=False)
+    weighted_score_sum = Column(Float, default=0.0, nullable=False)
+    weight_sum = Column(Float, default=0.0, nullable=False)
+    score_min = Column(Float, nullable=True)
+    score_max = Column(Float, nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+        onupdate=lambda: datetime.now(UTC),
+    )
+
+
 class EOYCandidate(Base):
     """Employee of the Year candidate tracking and scoring."""
 
@@ -0,0 +1,98 @@
+"""Transactional outbox for domain events."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, event, text
+from sqlalchemy.orm import Session
+
+from ..database import Base
+from .types import GUID
+
+_PENDING_EVENTS = "_pending_outbox_events"
+
+
+class OutboxEvent(Base):
+    """Domain event committed with the state change that caused it.
+
+    Rows are inserted in the same transaction as the aggregate update and
+    published later by ``app.services.outbox.OutboxDispatcher``; ``id`` is
+    the event's ``event_id`` and stays the same across redeliveries. An
+    event that keeps failing is dead-lettered (``dead_lettered_at``) and
+    no longer claimed.
+    """
+
+    __tablename__ = "outbox_event"
+    __table_args__ = (
+        Index(
+            "ix_outbox_event_pending",
+            "occurred_at",
+            sqlite_where=text("dispatched_at IS NULL"),
+            postgresql_where=text("dispatched_at IS NULL"),
+        ),
+    )
+
+    id: Column[uuid.UUID] = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    event_type = Column(String(128), nullable=False)
+    aggregate_type = Column(String(128), nullable=False)
+    aggregate_id: Column[uuid.UUID] = Column(GUID(), nullable=False)
+    payload = Column(JSON, nullable=False)
+    actor_id: Column[uuid.UUID] = Column(GUID(), nullable=True)
+    correlation_id = Column(String(128), nullable=True)
+    causation_id = Column(String(128), nullable=True)
+    occurred_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+    dispatched_at = Column(DateTime(timezone=True), nullable=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(String(512), nullable=True)
+    dead_lettered_at = Column(DateTime(timezone=True), nullable=True)
+
+
+def stage_event(
+    aggregate: Any,
+    event_type: str,
+    payload: dict[str, Any],
+    *,
+    actor_id: uuid.UUID | None = None,
+    correlation_id: str | None = None,
+    causation_id: str | None = None,
+    occurred_at: datetime | None = None,
+) -> OutboxEvent:
+    """Queue an outbox row to be inserted when ``aggregate`` is next flushed.
+
+    The row joins the aggregate's session at flush time, so it commits or
+    rolls back together with the state change. Stage before assigning the
+    new state: reading an expired instance afterwards reloads it and
+    discards the pending assignments.
+    """
+
+    if aggregate.id is None:
+        aggregate.id = uuid.uuid4()
+    outbox_event = OutboxEvent(
+        id=uuid.uuid4(),
+        event_type=event_type,
+        aggregate_type=aggregate.__tablename__,
+        aggregate_id=aggregate.id,
+        payload=payload,
+        actor_id=actor_id,
+        correlation_id=correlation_id or getattr(aggregate, "correlation_id", None),
+        causation_id=causation_id,
+        occurred_at=occurred_at or datetime.now(UTC),
+        attempts=0,
+    )
+    vars(aggregate).setdefault(_PENDING_EVENTS, []).append(outbox_event)
+    return outbox_event
+
+
+@event.listens_for(Session, "before_flush")
+def _add_staged_events(session: Session, flush_context: Any, instances: Any) -> None:
+    for instance in (*session.new, *session.dirty):
+        staged = vars(instance).pop(_PENDING_EVENTS, None)
+        if staged:
+            session.add_all(staged)
@@ -5,9 +5,23 @@ from __future__ import annotations
 import uuid
 from datetime import UTC, datetime
 from enum import Enum as PyEnum
-
-from sqlalchemy import JSON, Column, DateTime, Enum, ForeignKey, Integer, String, Text
+from typing import Any
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    inspect,
+    text,
+)
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql.elements import ColumnElement
 
 from ..database import Base
 from .types import GUID
@@ -45,6 +59,23 @@ class Nomination(Base):
     """Employee of the Month nomination records."""
 
     __tablename__ = "nomination"
+    __table_args__ = (
+        Index(
+            "ix_nomination_period_category_status",
+            "nomination_period",
+            "category",
+            "status",
+        ),
+        # Live leaderboards rank only nominations that are open for voting.
+        Index(
+            "ix_nomination_voting_leaderboard",
+            "nomination_period",
+            "category",
+            "votes_count",
+            sqlite_where=text("status = 'VOTING'"),
+            postgresql_where=text("status = 'VOTING'"),
+        ),
+    )
 
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     nominee_id = Column(GUID(), nullable=False, index=True)
@@ -84,14 +115,34 @@ class Nomination(Base):
         self.status = NominationStatus.REJECTED
 
     def increment_vote(self) -> None:
-        """Increment the vote count for this nomination."""
-        self.votes_count += 1
+        """Increment the vote count for this nomination.
+
+        Persistent nominations are incremented with ``SET votes_count =
+        votes_count + 1`` on flush so concurrent voters never lose updates;
+        the attribute reloads afterwards.
+        """
+        current: Any = self.__dict__.get("votes_count")
+        if not inspect(self).persistent:
+            current = current or 0
+        elif not isinstance(current, ColumnElement):
+            current = Nomination.votes_count
+        self.votes_count = current + 1
 
 
 class Vote(Base):
     """Voting records for EOM nominations."""
 
     __tablename__ = "vote"
+    __table_args__ = (
+        # One vote per voter per category per period.
+        Index(
+            "uq_vote_voter_period_category",
+            "voter_id",
+            "nomination_period",
+            "category",
+            unique=True,
+        ),
+    )
 
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     nomination_id = Column(
@@ -100,7 +151,7 @@ class Vote(Base):
         nullable=False,
         index=True,
     )
-    voter_id = Column(GUID(), nullable=False, index=True)
+    voter_id: Column[uuid.UUID] = Column(GUID(), nullable=False)
     voter_role = Column(String(64), nullable=False)
     category = Column(Enum(NominationCategory), nullable=False)
     nomination_period = Column(String(7), nullable=False)  # Format: YYYY-MM
@@ -209,6 +260,46 @@ class EligibilityTracking(Base):
         self.updated_at = datetime.now(UTC)
 
 
+class NominationEligibility(Base):
+    """Precomputed nomination eligibility of one employee for one period.
+
+    Maintained by ``app.services.eligibility`` from ``EligibilityTracking``,
+    ``Nomination`` and ``Award`` writes so nomination checks are a single
+    indexed lookup.
+    """
+
+    __tablename__ = "nomination_eligibility"
+    __table_args__ = (
+        Index(
+            "uq_nomination_eligibility_employee_period",
+            "employee_id",
+            "nomination_period",
+            unique=True,
+        ),
+        Index(
+            "ix_nomination_eligibility_period_department",
+            "nomination_period",
+            "department",
+        ),
+    )
+
+    id: Column[uuid.UUID] = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    nomination_period = Column(String(7), nullable=False)  # Format: YYYY-MM
+    employee_id: Column[uuid.UUID] = Column(GUID(), nullable=False)
+    employee_name = Column(String(256), nullable=True)
+    department = Column(String(128), nullable=True)
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+    ineligible = Column(Integer, default=0, nullable=False)  # Boolean flag
+    ineligibility_reason = Column(Text, nullable=True)
+    # Bit per NominationCategory (declaration order) with an active nomination.
+    active_categories = Column(Integer, default=0, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+
 class FairnessMetric(Base):
     """Track fairness and bias metrics for the recognition system."""
 
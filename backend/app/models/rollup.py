@@ -0,0 +1,101 @@
+"""Summary tables behind the progress and recognition dashboards."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, String
+
+from ..database import Base
+from .recognition import NominationCategory
+from .types import GUID
+
+
+class CycleProgressRollup(Base):
+    """Assignment counts by status for one department in one cycle.
+
+    Flushed ``Evaluation`` changes are applied as deltas by
+    ``app.services.rollups``, which bumps ``updated_at``; ``refreshed_at``
+    is when the counts were last recomputed from the base table.
+    """
+
+    __tablename__ = "cycle_progress_rollup"
+    __table_args__ = (
+        Index(
+            "uq_cycle_progress_rollup_cycle_department",
+            "cycle_id",
+            "department",
+            unique=True,
+        ),
+    )
+
+    id: Column[uuid.UUID] = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    cycle_id: Column[uuid.UUID] = Column(
+        GUID(),
+        ForeignKey("evaluation_cycle.id"),
+        nullable=False,
+    )
+    department = Column(String(128), nullable=False)
+    total = Column(Integer, default=0, nullable=False)
+    not_started = Column(Integer, default=0, nullable=False)
+    in_progress = Column(Integer, default=0, nullable=False)
+    submitted = Column(Integer, default=0, nullable=False)
+    late = Column(Integer, default=0, nullable=False)
+    refreshed_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    @property
+    def completion_percentage(self) -> float:
+        submitted: int = self.submitted  # type: ignore[assignment]
+        total: int = self.total  # type: ignore[assignment]
+        return submitted / total * 100 if total else 0.0
+
+
+class NominationRollup(Base):
+    """Nomination and vote counts for one category in one period.
+
+    Maintained like ``CycleProgressRollup`` from ``Nomination`` and
+    ``Vote`` writes.
+    """
+
+    __tablename__ = "nomination_rollup"
+    __table_args__ = (
+        Index(
+            "uq_nomination_rollup_period_category",
+            "nomination_period",
+            "category",
+            unique=True,
+        ),
+    )
+
+    id: Column[uuid.UUID] = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    nomination_period = Column(String(7), nullable=False)  # Format: YYYY-MM
+    category: Column[NominationCategory] = Column(
+        Enum(NominationCategory),
+        nullable=False,
+    )
+    nominations = Column(Integer, default=0, nullable=False)
+    pending = Column(Integer, default=0, nullable=False)
+    voting = Column(Integer, default=0, nullable=False)
+    selected = Column(Integer, default=0, nullable=False)
+    rejected = Column(Integer, default=0, nullable=False)
+    votes = Column(Integer, default=0, nullable=False)
+    refreshed_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
@@ -2,36 +2,143 @@
 
 from __future__ import annotations
 
+import os
 import uuid
 from typing import Any
 
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Dialect
 from sqlalchemy.sql.type_api import TypeEngine
-from sqlalchemy.types import CHAR, TypeDecorator
+from sqlalchemy.types import BINARY, CHAR, LargeBinary, TypeDecorator
+
+GUID_STORAGE_ENV = "GUID_STORAGE"
+GUID_STORAGE_CHAR = "char"
+GUID_STORAGE_BINARY = "binary"
+
+
+def binary_guid_storage() -> bool:
+    """Whether non-PostgreSQL backends store GUIDs as 16 raw bytes.
+
+    Opt in with ``GUID_STORAGE=binary``. Existing databases must first be
+    converted with ``scripts/convert_guid_storage.py``; engines refuse to open
+    a SQLite database stored the other way.
+    """
+
+    storage = os.getenv(GUID_STORAGE_ENV, GUID_STORAGE_CHAR).lower()
+    if storage not in {GUID_STORAGE_CHAR, GUID_STORAGE_BINARY}:
+        raise ValueError(f"Unsupported {GUID_STORAGE_ENV} value: {storage}")
+    return storage == GUID_STORAGE_BINARY
+
+
+def _as_uuid(value: Any) -> uuid.UUID:
+    return value if type(value) is uuid.UUID else uuid.UUID(str(value))
 
 
 class GUID(TypeDecorator[uuid.UUID]):
-    """Platform-independent GUID/UUID type."""
+    """Platform-independent GUID/UUID type.
+
+    PostgreSQL uses its native ``UUID``. Other backends store ``CHAR(36)``
+    by default or, when ``binary`` is enabled (explicitly or through
+    ``GUID_STORAGE=binary``), a 16-byte ``BINARY``/``BLOB`` that halves key
+    and index size.
+    """
 
     impl = CHAR
     cache_ok = True
 
-    def load_dialect_impl(self, dialect: Any) -> TypeEngine[Any]:  # type: ignore[override]
+    def __init__(self, binary: bool | None = None) -> None:
+        super().__init__()
+        self.binary = binary
+
+    def _storage(self, dialect: Dialect) -> str:
         if dialect.name == "postgresql":
+            return "native"
+        binary = binary_guid_storage() if self.binary is None else self.binary
+        return GUID_STORAGE_BINARY if binary else GUID_STORAGE_CHAR
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        storage = self._storage(dialect)
+        if storage == "native":
             return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        if storage == GUID_STORAGE_BINARY:
+            if dialect.name == "sqlite":
+                return dialect.type_descriptor(LargeBinary(16))
+            return dialect.type_descriptor(BINARY(16))
         return dialect.type_descriptor(CHAR(36))
 
+    def bind_processor(self, dialect: Any) -> Any:
+        # Bypass TypeDecorator's generic wrapper: each storage mode gets a
+        # dedicated closure with a ``type() is`` fast path for UUID values.
+        storage = self._storage(dialect)
+        uuid_type = uuid.UUID
+
+        if storage == "native":
+
+            def process_native(value: Any) -> Any:
+                if value is None or type(value) is uuid_type:
+                    return value
+                return _as_uuid(value)
+
+            return process_native
+
+        if storage == GUID_STORAGE_BINARY:
+
+            def process_binary(value: Any) -> Any:
+                if value is None:
+                    return None
+                if type(value) is uuid_type:
+                    return value.bytes
+                if isinstance(value, bytes) and len(value) == 16:
+                    return value
+                return _as_uuid(value).bytes
+
+            return process_binary
+
+        def process_char(value: Any) -> Any:
+            if value is None:
+                return None
+            if type(value) is uuid_type:
+                return str(value)
+            return str(_as_uuid(value))
+
+        return process_char
+
+    def result_processor(self, dialect: Any, coltype: Any) -> Any:
+        storage = self._storage(dialect)
+        uuid_type = uuid.UUID
+
+        if storage == "native":
+
+            def process_native(value: Any) -> Any:
+                if value is None or type(value) is uuid_type:
+                    return value
+                return _as_uuid(value)
+
+            return process_native
+
+        if storage == GUID_STORAGE_BINARY:
+
+            def process_binary(value: Any) -> Any:
+                if value is None:
+                    return None
+                if type(value) is bytes:
+                    return uuid_type(bytes=value)
+                if isinstance(value, bytes | bytearray | memoryview):
+                    return uuid_type(bytes=bytes(value))
+                # Rows not yet converted from CHAR(36) still read correctly.
+                return _as_uuid(value)
+
+            return process_binary
+
+        def process_char(value: Any) -> Any:
+            if value is None or type(value) is uuid_type:
+                return value
+            return uuid_type(value) if type(value) is str else _as_uuid(value)
+
+        return process_char
+
     def process_bind_param(self, value: Any, dialect: Any) -> Any:
-        if value is None:
-            return value
-        if isinstance(value, uuid.UUID):
-            return value if dialect.name == "postgresql" else str(value)
-        coerced = uuid.UUID(str(value))
-        return coerced if dialect.name == "postgresql" else str(coerced)
+        return self.bind_processor(dialect)(value)
 
     def process_result_value(self, value: Any, dialect: Any) -> Any:
-        if value is None:
-            return value
-        if isinstance(value, uuid.UUID):
-            return value
-        return uuid.UUID(str(value))
+        return self.result_processor(dialect, None)(value)
@@ -0,0 +1,182 @@
+"""Service layer workflows operating on the ORM models."""
+
+from .aggregation import AggregationReport, RatingStats, aggregate_cycle
+from .assignments import (
+    AssignmentPolicy,
+    AssignmentReport,
+    Leadership,
+    StaffMember,
+    assign_cycle,
+    generate_assignments,
+)
+from .audit import (
+    AuditWriter,
+    audit_trail,
+    ensure_audit_partitions,
+    get_audit_writer,
+)
+from .audit_archive import (
+    ArchiveManifest,
+    AuditArchive,
+    archive_audit_partitions,
+    entity_history,
+)
+from .cache import RecordCache, SharedCache, TTLCache, get_record_cache
+from .deadlines import SweepReport, run_deadline_sweeper, sweep_overdue
+from .eligibility import (
+    EligibilityDecision,
+    build_eligibility_index,
+    check_nomination,
+    department_eligibility,
+)
+from .enrollment_lifecycle import (
+    StaleApplicationError,
+    TransitionConflict,
+    TransitionReport,
+    transition_application,
+    transition_applications,
+)
+from .enrollment_search import search_applications
+from .eoy import EOYScoringReport, score_year
+from .exports import (
+    audit_log_statement,
+    cycle_results_statement,
+    export_csv,
+    export_ndjson,
+    iter_csv,
+    iter_ndjson,
+)
+from .fairness import FairnessReport, compute_fairness
+from .guid_storage import GuidStorageError, check_guid_storage, convert_guid_storage
+from .incremental import ReconciliationReport, reconcile_cycle, record_rating
+from .ingestion import IngestionReport, ingest_ratings
+from .listings import (
+    LOADING_PROFILES,
+    LoadingProfile,
+    list_awards,
+    list_nominations,
+    list_ratings,
+    list_results,
+    list_votes,
+    with_profile,
+)
+from .outbox import (
+    DispatcherStats,
+    EventSink,
+    FileSink,
+    MemorySink,
+    OutboxDispatcher,
+    outbox_backlog,
+)
+from .pagination import Page, keyset_page
+from .rollups import (
+    RollupCheckReport,
+    RollupView,
+    check_rollups,
+    cycle_progress,
+    nomination_summary,
+    nomination_votes,
+    refresh_rollups,
+    run_rollup_refresher,
+)
+from .seeding import (
+    SeedPlan,
+    SeedReport,
+    build_staff,
+    generate_enrollments,
+    seed_database,
+)
+from .voting import (
+    DuplicateVoteError,
+    VoteReconciliationReport,
+    cast_vote,
+    reconcile_votes,
+)
+
+__all__ = [
+    "LOADING_PROFILES",
+    "AggregationReport",
+    "ArchiveManifest",
+    "AssignmentPolicy",
+    "AssignmentReport",
+    "AuditArchive",
+    "AuditWriter",
+    "DispatcherStats",
+    "DuplicateVoteError",
+    "EOYScoringReport",
+    "EligibilityDecision",
+    "EventSink",
+    "FairnessReport",
+    "FileSink",
+    "GuidStorageError",
+    "IngestionReport",
+    "Leadership",
+    "LoadingProfile",
+    "MemorySink",
+    "OutboxDispatcher",
+    "Page",
+    "RatingStats",
+    "ReconciliationReport",
+    "RecordCache",
+    "RollupCheckReport",
+    "RollupView",
+    "SeedPlan",
+    "SeedReport",
+    "SharedCache",
+    "StaffMember",
+    "StaleApplicationError",
+    "SweepReport",
+    "TTLCache",
+    "TransitionConflict",
+    "TransitionReport",
+    "VoteReconciliationReport",
+    "aggregate_cycle",
+    "archive_audit_partitions",
+    "assign_cycle",
+    "audit_log_statement",
+    "audit_trail",
+    "build_eligibility_index",
+    "build_staff",
+    "cast_vote",
+    "check_guid_storage",
+    "check_nomination",
+    "check_rollups",
+    "compute_fairness",
+    "convert_guid_storage",
+    "cycle_progress",
+    "cycle_results_statement",
+    "department_eligibility",
+    "ensure_audit_partitions",
+    "entity_history",
+    "export_csv",
+    "export_ndjson",
+    "generate_assignments",
+    "generate_enrollments",
+    "get_audit_writer",
+    "get_record_cache",
+    "ingest_ratings",
+    "iter_csv",
+    "iter_ndjson",
+    "keyset_page",
+    "list_awards",
+    "list_nominations",
+    "list_ratings",
+    "list_results",
+    "list_votes",
+    "nomination_summary",
+    "nomination_votes",
+    "outbox_backlog",
+    "reconcile_cycle",
+    "reconcile_votes",
+    "record_rating",
+    "refresh_rollups",
+    "run_deadline_sweeper",
+    "run_rollup_refresher",
+    "score_year",
+    "search_applications",
+    "seed_database",
+    "sweep_overdue",
+    "transition_application",
+    "transition_applications",
+    "with_profile",
+]
@@ -0,0 +1,285 @@
+"""Set-based aggregation of evaluation ratings into per-evaluee results."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from ..models.evaluation import (
+    Evaluation,
+    EvaluationRating,
+    EvaluationResult,
+    EvaluatorRole,
+)
+
+# Score spread (max - min) across evaluators above which a result is flagged.
+HIGH_VARIANCE_SPREAD = 3.0
+
+ROLE_SCORE_COLUMNS: dict[EvaluatorRole, str] = {
+    EvaluatorRole.SELF: "self_score",
+    EvaluatorRole.PEER: "peer_scores_avg",
+    EvaluatorRole.SUPERVISOR: "supervisor_score",
+    EvaluatorRole.CEO: "ceo_score",
+    EvaluatorRole.PC_HEAD: "pc_head_score",
+}
+
+
+@dataclass(slots=True)
+class RatingStats:
+    """Running moments of the ratings one evaluee received from one role."""
+
+    count: int = 0
+    total: float = 0.0
+    total_sq: float = 0.0
+    weighted_total: float = 0.0
+    weight_total: float = 0.0
+    minimum: float | None = None
+    maximum: float | None = None
+
+    def add(self, score: float, weight: float) -> None:
+        """Fold a single rating into the running moments."""
+        self.count += 1
+        self.total += score
+        self.total_sq += score * score
+        self.weighted_total += score * weight
+        self.weight_total += weight
+        self.minimum = score if self.minimum is None else min(self.minimum, score)
+        self.maximum = score if self.maximum is None else max(self.maximum, score)
+
+    @property
+    def mean(self) -> float | None:
+        """Unweighted mean of the folded scores."""
+        return self.total / self.count if self.count else None
+
+
+@dataclass(frozen=True, slots=True)
+class EvalueeInfo:
+    """Denormalised evaluee details and the number of expected ratings."""
+
+    name: str
+    department: str
+    staff_type: Any
+    expected_ratings: int
+
+
+@dataclass(frozen=True, slots=True)
+class AggregationReport:
+    """Outcome of aggregating one evaluation cycle."""
+
+    cycle_id: uuid.UUID
+    inserted: int
+    updated: int
+    skipped: int
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated
+
+
+def summarise(stats_by_role: Mapping[EvaluatorRole, RatingStats]) -> dict[str, Any]:
+    """Reduce per-role moments to the score columns of ``EvaluationResult``."""
+
+    values: dict[str, Any] = {
+        column: (stats_by_role[role].mean if role in stats_by_role else None)
+        for role, column in ROLE_SCORE_COLUMNS.items()
+    }
+
+    count = sum(stats.count for stats in stats_by_role.values())
+    total = sum(stats.total for stats in stats_by_role.values())
+    total_sq = sum(stats.total_sq for stats in stats_by_role.values())
+    weighted_total = sum(stats.weighted_total for stats in stats_by_role.values())
+    weight_total = sum(stats.weight_total for stats in stats_by_role.values())
+    minima = [s.minimum for s in stats_by_role.values() if s.minimum is not None]
+    maxima = [s.maximum for s in stats_by_role.values() if s.maximum is not None]
+
+    if not count:
+        values.update(
+            final_score=0.0,
+            received_ratings=0,
+            score_variance=None,
+            has_high_variance=0,
+        )
+        return values
+
+    mean = total / count
+    final_score = weighted_total / weight_total if weight_total > 0 else mean
+    spread = max(maxima) - min(minima)
+    # Sample variance, Σ(score - mean)² / (n - 1), as the fairness metrics use.
+    variance = (
+        max((total_sq - count * mean * mean) / (count - 1), 0.0) if count > 1 else None
+    )
+    values.update(
+        final_score=final_score,
+        received_ratings=count,
+        score_variance=variance,
+        has_high_variance=1 if spread > HIGH_VARIANCE_SPREAD else 0,
+    )
+    return values
+
+
+def completion_percentage(received: int, expected: int) -> float:
+    """Share of expected ratings received, capped at 100%."""
+
+    if expected <= 0:
+        return 100.0 if received else 0.0
+    return min(received / expected * 100, 100.0)
+
+
+def load_rating_stats(
+    session: Session,
+    cycle_id: uuid.UUID,
+    evaluee_id: uuid.UUID | None = None,
+) -> dict[uuid.UUID, dict[EvaluatorRole, RatingStats]]:
+    """Compute per-role moments for a cycle with one grouped statement."""
+
+    score: ColumnElement[float] = EvaluationRating.average_score
+    weight: ColumnElement[float] = EvaluationRating.weight
+    stmt: Select[*tuple[Any, ...]] = (
+        select(
+            EvaluationRating.evaluee_id,
+            EvaluationRating.evaluator_role,
+            func.count(),
+            func.sum(score),
+            func.sum(score * score),
+            func.sum(score * weight),
+            func.sum(weight),
+            func.min(score),
+            func.max(score),
+        )
+        .where(EvaluationRating.cycle_id == cycle_id)
+        .group_by(EvaluationRating.evaluee_id, EvaluationRating.evaluator_role)
+    )
+    if evaluee_id is not None:
+        stmt = stmt.where(EvaluationRating.evaluee_id == evaluee_id)
+
+    grouped: dict[uuid.UUID, dict[EvaluatorRole, RatingStats]] = {}
+    for row in session.execute(stmt):
+        grouped.setdefault(row[0], {})[row[1]] = RatingStats(
+            count=row[2],
+            total=float(row[3]),
+            total_sq=float(row[4]),
+            weighted_total=float(row[5]),
+            weight_total=float(row[6]),
+            minimum=float(row[7]),
+            maximum=float(row[8]),
+        )
+    return grouped
+
+
+def load_evaluees(
+    session: Session,
+    cycle_id: uuid.UUID,
+    evaluee_id: uuid.UUID | None = None,
+) -> dict[uuid.UUID, EvalueeInfo]:
+    """Collect evaluee details and expected rating counts from assignments."""
+
+    stmt: Select[*tuple[Any, ...]] = (
+        select(
+            Evaluation.evaluee_id,
+            func.count(),
+            func.max(Evaluation.evaluee_name),
+            func.max(Evaluation.evaluee_department),
+            func.max(Evaluation.evaluee_staff_type),
+        )
+        .where(Evaluation.cycle_id == cycle_id)
+        .group_by(Evaluation.evaluee_id)
+    )
+    if evaluee_id is not None:
+        stmt = stmt.where(Evaluation.evaluee_id == evaluee_id)
+    return {
+        row[0]: EvalueeInfo(
+            name=row[2],
+            department=row[3],
+            staff_type=row[4],
+            expected_ratings=row[1],
+        )
+        for row in session.execute(stmt)
+    }
+
+
+def aggregate_cycle(
+    session: Session,
+    cycle_id: uuid.UUID,
+    calculated_at: datetime | None = None,
+) -> AggregationReport:
+    """Rebuild every ``EvaluationResult`` of a cycle from its ratings.
+
+    Ratings and assignments are reduced with grouped statements and the
+    results are written back with one bulk insert and one bulk update keyed
+    by primary key. Evaluees with ratings but no assignment are skipped
+    because their name and department cannot be resolved; existing results
+    left without ratings are reset to the empty summary. The caller owns
+    the transaction.
+    """
+
+    calculated_at = calculated_at or datetime.now(UTC)
+    stats = load_rating_stats(session, cycle_id)
+    evaluees = load_evaluees(session, cycle_id)
+    existing: dict[uuid.UUID, uuid.UUID] = dict(
+        session.execute(
+            select(EvaluationResult.evaluee_id, EvaluationResult.id).where(
+                EvaluationResult.cycle_id == cycle_id,
+            ),
+        ).all(),
+    )
+
+    inserts: list[dict[str, Any]] = []
+    updates: list[dict[str, Any]] = []
+    skipped = 0
+    for evaluee_id, stats_by_role in stats.items():
+        info = evaluees.get(evaluee_id)
+        if info is None:
+            skipped += 1
+            continue
+
+        values = summarise(stats_by_role)
+        values.update(
+            total_expected_ratings=info.expected_ratings,
+            completion_percentage=completion_percentage(
+                values["received_ratings"],
+                info.expected_ratings,
+            ),
+            calculated_at=calculated_at,
+        )
+        result_id = existing.get(evaluee_id)
+        if result_id is not None:
+            updates.append({"id": result_id, **values})
+        else:
+            inserts.append(
+                {
+                    "id": uuid.uuid4(),
+                    "cycle_id": cycle_id,
+                    "evaluee_id": evaluee_id,
+                    "evaluee_name": info.name,
+                    "evaluee_department": info.department,
+                    "evaluee_staff_type": info.staff_type,
+                    **values,
+                },
+            )
+
+    # Results whose ratings were all removed go back to the empty summary.
+    for evaluee_id in existing.keys() - stats.keys():
+        values = summarise({})
+        values.update(completion_percentage=0.0, calculated_at=calculated_at)
+        info = evaluees.get(evaluee_id)
+        if info is not None:
+            values["total_expected_ratings"] = info.expected_ratings
+        updates.append({"id": existing[evaluee_id], **values})
+
+    if inserts:
+        session.execute(insert(EvaluationResult), inserts)
+    if updates:
+        session.execute(update(EvaluationResult), updates)
+
+    return AggregationReport(
+        cycle_id=cycle_id,
+        inserted=len(inserts),
+        updated=len(updates),
+        skipped=skipped,
+    )
@@ -0,0 +1,260 @@
+"""Bulk generation of a cycle's evaluator-evaluee matrix.
+
+Mirrors the frontend rules in ``src/lib/evaluations.ts`` and
+``src/lib/authorization.ts``: every evaluee rates themself and is rated
+by the CEO and the P&C head; staff are also rated by their supervisor
+(the academic supervisor for ``Teacher`` departments, the administrative
+manager for ``Assistant`` and ``Nurse`` departments) and by up to two
+peers from the same subject group (first word of the department).
+
+Staff are grouped once, so building the matrix is O(n log n) rather than
+a scan of all staff per evaluee. Peers come from a seeded ring: each
+group is shuffled by a hash of the seed, cycle and staff id, and every
+member rates the next ``peers_per_evaluee`` members, so the matrix is
+reproducible and each peer carries the same review load.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import uuid
+from collections import Counter, defaultdict
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from ..models.evaluation import Evaluation, EvaluationCycle, EvaluatorRole, StaffType
+from .rollups import refresh_cycle_progress
+
+DEFAULT_BATCH_SIZE = 5_000
+STAFF_ROLE = "staff"
+
+
+@dataclass(frozen=True, slots=True)
+class StaffMember:
+    """One person on the staff list, as in ``src/data/staff-data.ts``."""
+
+    id: uuid.UUID
+    name: str
+    department: str
+    role: str = STAFF_ROLE  # "admin", "manager" or "staff"
+    staff_type: StaffType | None = None
+
+    @property
+    def evaluee_staff_type(self) -> StaffType:
+        if self.staff_type is not None:
+            return self.staff_type
+        if "Teacher" in self.department:
+            return StaffType.ACADEMIC
+        return StaffType.ADMINISTRATIVE
+
+    @property
+    def peer_group(self) -> str:
+        return self.department.split(" ")[0]
+
+
+@dataclass(frozen=True, slots=True)
+class Leadership:
+    """Evaluators that rate across departments."""
+
+    ceo: StaffMember
+    pc_head: StaffMember
+    academic_supervisor: StaffMember | None = None
+    administrative_manager: StaffMember | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class AssignmentPolicy:
+    """Per-role weights (fractions, as stored on ``Evaluation.weight``)."""
+
+    self_weight: float = 0.05
+    peer_weight: float = 0.10
+    academic_supervisor_weight: float = 0.40
+    administrative_manager_weight: float = 0.35
+    ceo_weight: float = 0.15
+    pc_head_weight: float = 0.25
+    peers_per_evaluee: int = 2
+    seed: str = ""
+
+
+DEFAULT_POLICY = AssignmentPolicy()
+
+
+@dataclass(frozen=True, slots=True)
+class AssignmentReport:
+    """Outcome of ``assign_cycle``."""
+
+    cycle_id: uuid.UUID
+    evaluees: int
+    evaluations: int
+    by_role: dict[EvaluatorRole, int] = field(default_factory=dict)
+
+
+def _ring_order(
+    members: list[StaffMember],
+    cycle_id: uuid.UUID,
+    seed: str,
+) -> list[StaffMember]:
+    def key(member: StaffMember) -> bytes:
+        return hashlib.blake2b(
+            f"{seed}:{cycle_id}:{member.id}".encode(),
+            digest_size=8,
+        ).digest()
+
+    return sorted(members, key=key)
+
+
+def peer_assignments(
+    staff: Sequence[StaffMember],
+    cycle_id: uuid.UUID,
+    policy: AssignmentPolicy = DEFAULT_POLICY,
+) -> dict[uuid.UUID, list[StaffMember]]:
+    """Peers rating each staff evaluee, keyed by evaluee id."""
+
+    groups: dict[str, list[StaffMember]] = defaultdict(list)
+    for member in staff:
+        if member.role == STAFF_ROLE:
+            groups[member.peer_group].append(member)
+
+    peers: dict[uuid.UUID, list[StaffMember]] = {}
+    for members in groups.values():
+        ring = _ring_order(members, cycle_id, policy.seed)
+        count = min(policy.peers_per_evaluee, len(ring) - 1)
+        for position, member in enumerate(ring):
+            peers[member.id] = [
+                ring[(position + offset) % len(ring)] for offset in range(1, count + 1)
+            ]
+    return peers
+
+
+def _raters(
+    member: StaffMember,
+    leadership: Leadership,
+    peers: list[StaffMember],
+    policy: AssignmentPolicy,
+) -> Iterator[tuple[StaffMember, EvaluatorRole, float]]:
+    yield member, EvaluatorRole.SELF, policy.self_weight
+    if member.role == STAFF_ROLE:
+        department = member.department
+        if "Teacher" in department and leadership.academic_supervisor:
+            yield (
+                leadership.academic_supervisor,
+                EvaluatorRole.SUPERVISOR,
+                policy.academic_supervisor_weight,
+            )
+        if (
+            "Assistant" in department or "Nurse" in department
+        ) and leadership.administrative_manager:
+            yield (
+                leadership.administrative_manager,
+                EvaluatorRole.SUPERVISOR,
+                policy.administrative_manager_weight,
+            )
+        for peer in peers:
+            yield peer, EvaluatorRole.PEER, policy.peer_weight
+    yield leadership.ceo, EvaluatorRole.CEO, policy.ceo_weight
+    yield leadership.pc_head, EvaluatorRole.PC_HEAD, policy.pc_head_weight
+
+
+def generate_assignments(
+    cycle_id: uuid.UUID,
+    staff: Sequence[StaffMember],
+    leadership: Leadership,
+    due_date: datetime,
+    policy: AssignmentPolicy = DEFAULT_POLICY,
+) -> Iterator[dict[str, Any]]:
+    """``Evaluation`` insert parameters for every evaluee in ``staff``.
+
+    An evaluator never rates the same evaluee twice and never rates
+    themself except in the ``SELF`` role.
+    """
+
+    peers = peer_assignments(staff, cycle_id, policy)
+    for member in staff:
+        seen: set[uuid.UUID] = set()
+        for rater, role, weight in _raters(
+            member,
+            leadership,
+            peers.get(member.id, []),
+            policy,
+        ):
+            rates_self = rater.id == member.id
+            if rater.id in seen or rates_self != (role == EvaluatorRole.SELF):
+                continue
+            seen.add(rater.id)
+            yield {
+                "id": uuid.uuid4(),
+                "cycle_id": cycle_id,
+                "evaluee_id": member.id,
+                "evaluee_name": member.name,
+                "evaluee_department": member.department,
+                "evaluee_staff_type": member.evaluee_staff_type,
+                "evaluator_id": rater.id,
+                "evaluator_name": rater.name,
+                "evaluator_role": role,
+                "weight": weight,
+                "due_date": due_date,
+            }
+
+
+def assign_cycle(
+    session: Session,
+    cycle: EvaluationCycle,
+    staff: Sequence[StaffMember],
+    leadership: Leadership,
+    due_date: datetime | None = None,
+    policy: AssignmentPolicy = DEFAULT_POLICY,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    activate: bool = True,
+) -> AssignmentReport:
+    """Insert the cycle's full assignment matrix and set ``total_evaluations``.
+
+    Rows go in with batched bulk inserts, then the cycle's progress rollup
+    is computed; the cycle is activated unless ``activate`` is false. The
+    caller owns the transaction, so a failure part way leaves nothing
+    behind once it rolls back.
+    """
+
+    # The classic Column attributes read as ``Column`` to mypy.
+    target: Any = cycle
+    existing = session.scalar(
+        select(func.count())
+        .select_from(Evaluation)
+        .where(Evaluation.cycle_id == target.id),
+    )
+    if existing:
+        raise ValueError(f"Cycle {target.id} already has {existing} assignments")
+
+    by_role: Counter[EvaluatorRole] = Counter()
+    batch: list[dict[str, Any]] = []
+    for row in generate_assignments(
+        target.id,
+        staff,
+        leadership,
+        due_date or target.end_date,
+        policy,
+    ):
+        by_role[row["evaluator_role"]] += 1
+        batch.append(row)
+        if len(batch) >= batch_size:
+            session.execute(insert(Evaluation), batch)
+            batch = []
+    if batch:
+        session.execute(insert(Evaluation), batch)
+    refresh_cycle_progress(session.connection(), target.id)
+
+    total = sum(by_role.values())
+    target.total_evaluations = total
+    if activate:
+        target.activate()
+    session.flush()
+    return AssignmentReport(
+        cycle_id=target.id,
+        evaluees=len(staff),
+        evaluations=total,
+        by_role=dict(by_role),
+    )
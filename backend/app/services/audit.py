@@ -0,0 +1,425 @@
+"""Monthly ``audit_log`` partitions and a buffered background audit writer.
+
+PostgreSQL range-partitions ``audit_log`` by ``created_at`` month; rows
+without a matching partition fall into ``audit_log_default``. SQLite has
+no declarative partitioning, so each month gets its own
+``audit_log_YYYY_MM`` table with the same columns and indexes, and
+``audit_log`` itself is the catch-all for rows written through the ORM.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import (
+    Connection,
+    Engine,
+    Index,
+    MetaData,
+    Row,
+    Table,
+    insert,
+    inspect,
+    literal_column,
+    select,
+    text,
+    union_all,
+)
+from sqlalchemy.orm import Session
+
+from ..database import get_engine
+from ..models.audit import AUDIT_DEFAULT_PARTITION, AuditLog
+from .audit_diff import AUDIT_PAYLOAD_FULL, DEFAULT_SNAPSHOT_EVERY, encode_change
+
+logger = logging.getLogger(__name__)
+
+PARTITION_PATTERN = re.compile(r"^audit_log_(\d{4})_(\d{2})$")
+DEFAULT_MONTHS_AHEAD = 2
+
+_audit_table: Table = AuditLog.__table__  # type: ignore[assignment]
+_period_metadata = MetaData()
+
+
+def month_start(moment: datetime) -> datetime:
+    """First instant of ``moment``'s month in UTC."""
+
+    moment = moment.astimezone(UTC) if moment.tzinfo else moment.replace(tzinfo=UTC)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def next_month(start: datetime) -> datetime:
+    if start.month == 12:
+        return start.replace(year=start.year + 1, month=1)
+    return start.replace(month=start.month + 1)
+
+
+def partition_name(moment: datetime) -> str:
+    start = month_start(moment)
+    return f"audit_log_{start.year:04d}_{start.month:02d}"
+
+
+def period_table(name: str) -> Table:
+    """SQLite per-month table mirroring ``audit_log`` and its indexes."""
+
+    table = _period_metadata.tables.get(name)
+    if table is not None:
+        return table
+    return Table(
+        name,
+        _period_metadata,
+        *(column._copy() for column in _audit_table.columns),
+        Index(f"ix_{name}_entity_created", "entity_type", "entity_id", "created_at"),
+        Index(
+            f"ix_{name}_correlation_id",
+            "correlation_id",
+            sqlite_where=text("correlation_id IS NOT NULL"),
+        ),
+    )
+
+
+def list_partitions(connection: Connection) -> list[str]:
+    """Monthly partitions (or SQLite period tables), oldest first."""
+
+    if connection.dialect.name == "postgresql":
+        names: Iterable[str] = connection.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "WHERE parent.relname = :parent",
+            ),
+            {"parent": _audit_table.name},
+        ).scalars()
+    else:
+        names = inspect(connection).get_table_names()
+    return sorted(name for name in names if PARTITION_PATTERN.match(name))
+
+
+def _attach_postgres_partition(
+    connection: Connection,
+    name: str,
+    start: datetime,
+) -> None:
+    # Build the partition detached, move any rows the default partition
+    # already caught for this month, then attach; PostgreSQL refuses to
+    # create a partition whose range overlaps rows held by the default.
+    end = next_month(start)
+    bounds = {"lower": start, "upper": end}
+    connection.execute(
+        text(
+            f"CREATE TABLE {name} "
+            f"(LIKE {_audit_table.name} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+        ),
+    )
+    connection.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {AUDIT_DEFAULT_PARTITION} "  # noqa: S608
+            "WHERE created_at >= :lower AND created_at < :upper RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved",
+        ),
+        bounds,
+    )
+    connection.execute(
+        text(
+            f"ALTER TABLE {_audit_table.name} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')",
+        ),
+    )
+
+
+def ensure_audit_partitions(
+    connection: Connection,
+    start: datetime | None = None,
+    months_ahead: int = DEFAULT_MONTHS_AHEAD,
+) -> list[str]:
+    """Create the partitions for ``start``'s month and ``months_ahead`` more.
+
+    Meant to run from a scheduled job so inserts never wait on DDL.
+    Returns the names of the partitions that were created.
+    """
+
+    existing = set(list_partitions(connection))
+    month = month_start(start or datetime.now(UTC))
+    created: list[str] = []
+    for _ in range(months_ahead + 1):
+        name = partition_name(month)
+        if name not in existing:
+            if connection.dialect.name == "postgresql":
+                _attach_postgres_partition(connection, name, month)
+            else:
+                period_table(name).create(connection, checkfirst=True)
+            created.append(name)
+        month = next_month(month)
+    return created
+
+
+def audit_trail(
+    session: Session,
+    entity_type: str,
+    entity_id: uuid.UUID,
+) -> list[Row[Any]]:
+    """Audit rows for one entity, oldest first, across every partition."""
+
+    def for_table(table: Table) -> Any:
+        return select(*table.columns).where(
+            table.c.entity_type == entity_type,
+            table.c.entity_id == entity_id,
+        )
+
+    connection = session.connection()
+    if connection.dialect.name == "postgresql":
+        stmt = for_table(_audit_table).order_by(_audit_table.c.created_at)
+        return list(session.execute(stmt))
+
+    tables = [
+        _audit_table,
+        *(period_table(name) for name in list_partitions(connection)),
+    ]
+    combined = union_all(*(for_table(table) for table in tables)).subquery()
+    return list(
+        session.execute(select(combined).order_by(literal_column("created_at"))),
+    )
+
+
+@dataclass(slots=True)
+class AuditWriterStats:
+    """Counters for a running ``AuditWriter``."""
+
+    queued: int = 0
+    written: int = 0
+    batches: int = 0
+    failed: int = 0
+
+
+_STOP = object()
+
+
+class AuditWriter:
+    """Collect audit events in memory and insert them in batches on a thread.
+
+    ``record`` only builds the row and enqueues it, keeping inserts off the
+    request path. The worker writes a batch once ``batch_size`` events are
+    waiting or ``flush_interval`` seconds after the first one arrived. The
+    queue is bounded by ``max_queue``; when the database falls that far
+    behind, ``record`` blocks rather than dropping audit events.
+
+    ``record_change`` stores a JSON Patch instead of both snapshots and a
+    full snapshot every ``snapshot_every`` changes per entity, and always
+    for the first change of an entity this process sees.
+    """
+
+    def __init__(
+        self,
+        engine: Engine | None = None,
+        batch_size: int = 500,
+        flush_interval: float = 0.05,
+        max_queue: int = 10_000,
+        max_retries: int = 3,
+        snapshot_every: int = DEFAULT_SNAPSHOT_EVERY,
+        tracked_entities: int = 100_000,
+    ) -> None:
+        self._engine = engine
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.stats = AuditWriterStats()
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue)
+        self._thread: threading.Thread | None = None
+        self._period_tables: set[str] = set()
+        self.snapshot_every = snapshot_every
+        self._tracked_entities = tracked_entities
+        self._since_snapshot: OrderedDict[tuple[str, uuid.UUID], int] = OrderedDict()
+        self._snapshot_lock = threading.Lock()
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            self._engine = get_engine()
+        return self._engine
+
+    def start(self) -> AuditWriter:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run,
+                name="audit-writer",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def record(
+        self,
+        *,
+        actor_id: uuid.UUID,
+        actor_role: str,
+        entity_type: str,
+        entity_id: uuid.UUID,
+        action: str,
+        summary: str,
+        before: Any = None,
+        after: Any = None,
+        correlation_id: str | None = None,
+        ip_address: str | None = None,
+        created_at: datetime | None = None,
+        payload_format: str = AUDIT_PAYLOAD_FULL,
+    ) -> uuid.UUID:
+        """Enqueue one audit event and return its id."""
+
+        event_id = uuid.uuid4()
+        self._queue.put(
+            {
+                "id": event_id,
+                "created_at": created_at or datetime.now(UTC),
+                "actor_id": actor_id,
+                "actor_role": actor_role,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "action": action,
+                "summary": summary,
+                "before": before,
+                "after": after,
+                "payload_format": payload_format,
+                "correlation_id": correlation_id,
+                "ip_address": ip_address,
+            },
+        )
+        self.stats.queued += 1
+        return event_id
+
+    def record_change(
+        self,
+        *,
+        entity_type: str,
+        entity_id: uuid.UUID,
+        before: Any,
+        after: Any,
+        **fields: Any,
+    ) -> uuid.UUID:
+        """Enqueue a state change in compact form (see ``audit_diff``)."""
+
+        key = (entity_type, entity_id)
+        with self._snapshot_lock:
+            since = self._since_snapshot.pop(key, None)
+            count = 0 if since is None else since + 1
+            snapshot = before is None or since is None or count >= self.snapshot_every
+            self._since_snapshot[key] = 0 if snapshot else count
+            if len(self._since_snapshot) > self._tracked_entities:
+                self._since_snapshot.popitem(last=False)
+        before, after, payload_format = encode_change(before, after, snapshot)
+        return self.record(
+            entity_type=entity_type,
+            entity_id=entity_id,
+            before=before,
+            after=after,
+            payload_format=payload_format,
+            **fields,
+        )
+
+    def flush(self) -> None:
+        """Block until every event recorded so far has been handled."""
+
+        self.start()
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write pending events and stop the worker thread."""
+
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> AuditWriter:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            batch: list[dict[str, Any]] = []
+            if item is _STOP:
+                stopping = True
+            else:
+                batch.append(item)
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    try:
+                        item = self._queue.get(timeout=max(remaining, 0))
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+            if batch:
+                self._write_with_retry(batch)
+            for _ in range(len(batch) + (1 if stopping else 0)):
+                self._queue.task_done()
+
+    def _write_with_retry(self, rows: list[dict[str, Any]]) -> None:
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                self._write(rows)
+            except Exception:
+                if attempt == self.max_retries:
+                    self.stats.failed += len(rows)
+                    logger.exception(
+                        "Dropping %d audit events after retries",
+                        len(rows),
+                    )
+                    return
+                time.sleep(0.05 * 2**attempt)
+            else:
+                self.stats.written += len(rows)
+                self.stats.batches += 1
+                return
+
+    def _write(self, rows: list[dict[str, Any]]) -> None:
+        with self.engine.begin() as connection:
+            if connection.dialect.name != "sqlite":
+                connection.execute(insert(_audit_table), rows)
+                return
+            for name, group in _group_by_period(rows).items():
+                table = period_table(name)
+                if name not in self._period_tables:
+                    table.create(connection, checkfirst=True)
+                    self._period_tables.add(name)
+                connection.execute(insert(table), group)
+
+
+def _group_by_period(rows: Iterable[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    grouped: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for row in rows:
+        grouped[partition_name(row["created_at"])].append(row)
+    return grouped
+
+
+_writer: AuditWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_audit_writer() -> AuditWriter:
+    """Process-wide writer on the default engine, started on first use."""
+
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = AuditWriter().start()
+            atexit.register(_writer.close)
+        return _writer
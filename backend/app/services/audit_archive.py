@@ -0,0 +1,282 @@
+"""Cold-tier archival of old ``audit_log`` partitions to compressed JSONL.
+
+Each archived month becomes two files in the archive directory:
+
+``audit_log_YYYY_MM.jsonl.zst`` (or ``.jsonl.gz``)
+    Rows sorted by ``(entity_type, entity_id, created_at)`` as JSON lines,
+    split into independently compressed frames of ``rows_per_frame`` rows.
+``audit_log_YYYY_MM.index.json``
+    Frame offsets and, for every entity, the frames holding its rows, so
+    an entity lookup decompresses only those frames.
+
+zstd is used when the optional ``zstandard`` package is installed and
+gzip otherwise.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import uuid
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Connection, select, text
+from sqlalchemy.orm import Session
+
+from ..models.audit import AuditLog
+from .audit import (
+    PARTITION_PATTERN,
+    audit_trail,
+    list_partitions,
+    month_start,
+    next_month,
+    period_table,
+)
+from .audit_diff import replay
+
+DEFAULT_ROWS_PER_FRAME = 1_000
+DEFAULT_RETENTION_MONTHS = 12
+INDEX_SUFFIX = ".index.json"
+UUID_FIELDS = ("id", "actor_id", "entity_id")
+
+Codec = tuple[str, Callable[[bytes], bytes], Callable[[bytes], bytes]]
+
+
+def _codec(name: str | None = None) -> Codec:
+    if name in (None, "zstd"):
+        try:
+            import zstandard
+        except ImportError:
+            if name == "zstd":
+                raise
+        else:
+            return (
+                "zstd",
+                zstandard.ZstdCompressor(level=10).compress,
+                zstandard.ZstdDecompressor().decompress,
+            )
+    return "gzip", gzip.compress, gzip.decompress
+
+
+def _suffix(codec: str) -> str:
+    return ".jsonl.zst" if codec == "zstd" else ".jsonl.gz"
+
+
+def _entity_key(entity_type: str, entity_id: uuid.UUID | str) -> str:
+    return f"{entity_type}:{entity_id}"
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        moment = value if value.tzinfo else value.replace(tzinfo=UTC)
+        return moment.isoformat()
+    raise TypeError(f"Cannot archive {type(value).__name__} values")
+
+
+def _decode_row(line: bytes) -> dict[str, Any]:
+    row: dict[str, Any] = json.loads(line)
+    for name in UUID_FIELDS:
+        row[name] = uuid.UUID(row[name])
+    row["created_at"] = datetime.fromisoformat(row["created_at"])
+    return row
+
+
+@dataclass(frozen=True, slots=True)
+class ArchiveManifest:
+    """What was written for one archived partition."""
+
+    partition: str
+    path: Path
+    index_path: Path
+    codec: str
+    rows: int
+    frames: int
+    compressed_bytes: int
+
+
+def _write_durably(path: Path, payload: bytes) -> None:
+    temporary = path.with_name(f".{path.name}.tmp")
+    with temporary.open("wb") as handle:
+        handle.write(payload)
+        handle.flush()
+        os.fsync(handle.fileno())
+    temporary.replace(path)
+
+
+def archive_partition(
+    connection: Connection,
+    name: str,
+    directory: Path,
+    rows_per_frame: int = DEFAULT_ROWS_PER_FRAME,
+    codec: str | None = None,
+) -> ArchiveManifest:
+    """Write one partition to compressed JSONL plus its entity index."""
+
+    codec_name, compress, _ = _codec(codec)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{name}{_suffix(codec_name)}"
+    table = period_table(name)
+    stmt = select(*table.columns).order_by(
+        table.c.entity_type,
+        table.c.entity_id,
+        table.c.created_at,
+    )
+
+    frames: list[list[int]] = []
+    entities: dict[str, list[int]] = {}
+    rows = 0
+    offset = 0
+    temporary = path.with_name(f".{path.name}.tmp")
+    with temporary.open("wb") as handle:
+        result = connection.execution_options(stream_results=True).execute(stmt)
+        for chunk in result.mappings().partitions(rows_per_frame):
+            frame_number = len(frames)
+            lines = []
+            for row in chunk:
+                lines.append(json.dumps(dict(row), default=_json_default))
+                frame_list = entities.setdefault(
+                    _entity_key(row["entity_type"], row["entity_id"]),
+                    [],
+                )
+                if not frame_list or frame_list[-1] != frame_number:
+                    frame_list.append(frame_number)
+            payload = compress(("\n".join(lines) + "\n").encode())
+            handle.write(payload)
+            frames.append([offset, len(payload)])
+            offset += len(payload)
+            rows += len(chunk)
+        handle.flush()
+        os.fsync(handle.fileno())
+    temporary.replace(path)
+
+    index_path = directory / f"{name}{INDEX_SUFFIX}"
+    index = {
+        "partition": name,
+        "file": path.name,
+        "codec": codec_name,
+        "rows": rows,
+        "frames": frames,
+        "entities": entities,
+    }
+    _write_durably(index_path, json.dumps(index).encode())
+    return ArchiveManifest(
+        partition=name,
+        path=path,
+        index_path=index_path,
+        codec=codec_name,
+        rows=rows,
+        frames=len(frames),
+        compressed_bytes=offset,
+    )
+
+
+def _drop_partition(connection: Connection, name: str) -> None:
+    if connection.dialect.name == "postgresql":
+        connection.execute(
+            text(f"ALTER TABLE {AuditLog.__tablename__} DETACH PARTITION {name}"),
+        )
+    connection.execute(text(f"DROP TABLE {name}"))
+
+
+def archive_audit_partitions(
+    connection: Connection,
+    directory: Path,
+    older_than_months: int = DEFAULT_RETENTION_MONTHS,
+    now: datetime | None = None,
+    rows_per_frame: int = DEFAULT_ROWS_PER_FRAME,
+    codec: str | None = None,
+) -> list[ArchiveManifest]:
+    """Move monthly partitions older than ``older_than_months`` to ``directory``.
+
+    A partition is dropped only after its data and index files have been
+    fsynced. Rows in the catch-all table (``audit_log`` on SQLite,
+    ``audit_log_default`` on PostgreSQL) are left in place.
+    """
+
+    current = month_start(now or datetime.now(UTC))
+    months = current.year * 12 + current.month - 1 - older_than_months
+    cutoff = current.replace(year=months // 12, month=months % 12 + 1)
+
+    manifests = []
+    for name in list_partitions(connection):
+        match = PARTITION_PATTERN.match(name)
+        if match is None:
+            continue
+        if next_month(datetime(int(match[1]), int(match[2]), 1, tzinfo=UTC)) > cutoff:
+            continue
+        manifests.append(
+            archive_partition(connection, name, directory, rows_per_frame, codec),
+        )
+        _drop_partition(connection, name)
+    return manifests
+
+
+class AuditArchive:
+    """Read archived audit partitions from a directory."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def indexes(self) -> list[dict[str, Any]]:
+        return [
+            json.loads(path.read_bytes())
+            for path in sorted(self.directory.glob(f"audit_log_*{INDEX_SUFFIX}"))
+        ]
+
+    def _frames(self, index: Mapping[str, Any], numbers: list[int]) -> Iterator[bytes]:
+        _, _, decompress = _codec(index["codec"])
+        with (self.directory / index["file"]).open("rb") as handle:
+            for number in numbers:
+                offset, length = index["frames"][number]
+                handle.seek(offset)
+                yield from decompress(handle.read(length)).splitlines()
+
+    def rows(self) -> Iterator[dict[str, Any]]:
+        """Every archived row, partition by partition."""
+
+        for index in self.indexes():
+            for line in self._frames(index, list(range(len(index["frames"])))):
+                yield _decode_row(line)
+
+    def entity_rows(
+        self,
+        entity_type: str,
+        entity_id: uuid.UUID,
+    ) -> list[dict[str, Any]]:
+        """One entity's archived rows in ``created_at`` order."""
+
+        key = _entity_key(entity_type, entity_id)
+        rows = []
+        for index in self.indexes():
+            numbers = index["entities"].get(key)
+            if not numbers:
+                continue
+            for line in self._frames(index, numbers):
+                row = _decode_row(line)
+                if row["entity_type"] == entity_type and row["entity_id"] == entity_id:
+                    rows.append(row)
+        return sorted(rows, key=lambda row: row["created_at"])
+
+
+def entity_history(
+    session: Session,
+    entity_type: str,
+    entity_id: uuid.UUID,
+    archive: AuditArchive | None = None,
+) -> list[tuple[dict[str, Any], Any]]:
+    """Archived and live audit rows for one entity with the rebuilt state."""
+
+    rows = archive.entity_rows(entity_type, entity_id) if archive else []
+    for row in audit_trail(session, entity_type, entity_id):
+        fields = dict(row._mapping)
+        if fields["created_at"].tzinfo is None:
+            fields["created_at"] = fields["created_at"].replace(tzinfo=UTC)
+        rows.append(fields)
+    return replay(rows)
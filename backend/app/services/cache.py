@@ -0,0 +1,404 @@
+"""Read-through cache for released results and granted awards.
+
+Released ``EvaluationResult`` rows and granted ``Award`` rows are read far
+more often than they are written, mostly by the results and recognition
+dashboards. ``RecordCache`` serves them from an in-process ``TTLCache``
+(bounded LRU with per-entry expiry) backed by an optional ``SharedCache``
+tier such as Redis, and falls through to the database on a miss.
+
+Entries are invalidated from session events: every flushed change to an
+``EvaluationResult`` or ``Award`` instance drops its key, and bulk
+``insert``/``update``/``delete`` statements run through a ``Session`` drop
+the whole namespace. Keys are dropped again after the transaction
+commits, and a load racing with an invalidation is never stored, so a
+reader in this process cannot see a value older than the last commit.
+Writes made on a bare ``Connection`` bypass the session and are only
+picked up when the entry expires; other processes' local tiers likewise
+rely on ``ttl``. Empty lookups (a result not released yet, no awards
+granted) are kept for only ``negative_ttl``, so a release or grant in
+another process shows up within seconds rather than minutes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Protocol
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from ..models.evaluation import EvaluationResult
+from ..models.recognition import Award, AwardType
+
+DEFAULT_MAXSIZE = 4_096
+DEFAULT_TTL_SECONDS = 300.0
+NEGATIVE_TTL_SECONDS = 5.0
+SHARED_TTL_SECONDS = 3_600.0
+
+RESULT_NAMESPACE = "evaluation_result"
+AWARD_NAMESPACE = "award"
+
+_PENDING_KEYS = "record_cache_pending_keys"
+_MISSING = object()
+_caches: weakref.WeakSet[RecordCache] = weakref.WeakSet()
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Counters for one cache tier."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLCache:
+    """Thread-safe LRU holding at most ``maxsize`` entries for ``ttl`` seconds."""
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                self.stats.expirations += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        with self._lock:
+            expires = self._clock() + (self.ttl if ttl is None else ttl)
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def delete(self, keys: Iterable[Hashable]) -> None:
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self.stats.invalidations += 1
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if str(key).startswith(prefix)]:
+                del self._entries[key]
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SharedCache(Protocol):
+    """Cross-process tier, e.g. a thin Redis adapter.
+
+    Values are plain dicts and lists of column values; adapters choose
+    their own serialisation.
+    """
+
+    def get(self, key: str) -> Any | None: ...
+
+    def set(self, key: str, value: Any, ttl: float) -> None: ...
+
+    def delete(self, keys: Iterable[str]) -> None: ...
+
+    def delete_prefix(self, prefix: str) -> None: ...
+
+
+def result_key(cycle_id: Any, evaluee_id: Any) -> str:
+    return f"{RESULT_NAMESPACE}:{cycle_id}:{evaluee_id}"
+
+
+def award_key(award_period: str, award_type: AwardType) -> str:
+    return f"{AWARD_NAMESPACE}:{award_period}:{award_type.name}"
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType(value)
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class RecordCache:
+    """Two-tier read-through cache keyed by ``(cycle_id, evaluee_id)`` and
+    ``(award_period, award_type)``.
+
+    Lookups return read-only column snapshots, not ORM instances, so one
+    entry can be shared between sessions and threads. Empty lookups stay in
+    the local tier for ``negative_ttl`` seconds only; ``0`` does not keep
+    them at all.
+    """
+
+    def __init__(
+        self,
+        local: TTLCache | None = None,
+        shared: SharedCache | None = None,
+        shared_ttl: float = SHARED_TTL_SECONDS,
+        negative_ttl: float = NEGATIVE_TTL_SECONDS,
+    ) -> None:
+        self.local = local if local is not None else TTLCache()
+        self.shared = shared
+        self.shared_ttl = shared_ttl
+        self.negative_ttl = negative_ttl
+        self.shared_stats = CacheStats()
+        self._loading: dict[str, object] = {}
+        self._lock = threading.Lock()
+        _caches.add(self)
+
+    def released_result(
+        self,
+        session: Session,
+        cycle_id: Any,
+        evaluee_id: Any,
+    ) -> MappingProxyType[str, Any] | None:
+        """The evaluee's result once released, otherwise ``None``."""
+
+        table = EvaluationResult.__table__
+
+        def load() -> dict[str, Any] | None:
+            row = (
+                session.execute(
+                    select(*table.columns).where(
+                        table.c.cycle_id == cycle_id,
+                        table.c.evaluee_id == evaluee_id,
+                        table.c.released_at.is_not(None),
+                    ),
+                )
+                .mappings()
+                .first()
+            )
+            return dict(row) if row is not None else None
+
+        result: MappingProxyType[str, Any] | None = self._read(
+            session,
+            result_key(cycle_id, evaluee_id),
+            load,
+        )
+        return result
+
+    def awards(
+        self,
+        session: Session,
+        award_period: str,
+        award_type: AwardType,
+    ) -> tuple[MappingProxyType[str, Any], ...]:
+        """Awards of one type granted for ``award_period``, oldest first."""
+
+        table = Award.__table__
+
+        def load() -> list[dict[str, Any]]:
+            rows = session.execute(
+                select(*table.columns)
+                .where(
+                    table.c.award_period == award_period,
+                    table.c.award_type == award_type,
+                )
+                .order_by(table.c.granted_at, table.c.id),
+            ).mappings()
+            return [dict(row) for row in rows]
+
+        awards: tuple[MappingProxyType[str, Any], ...] = self._read(
+            session,
+            award_key(award_period, award_type),
+            load,
+        )
+        return awards
+
+    def _read(self, session: Session, key: str, load: Callable[[], Any]) -> Any:
+        if _writes_pending(session, key):
+            # The session's own uncommitted write: read it, but neither
+            # serve the committed entry nor share the uncommitted value.
+            return _freeze(load())
+
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        token = object()
+        with self._lock:
+            self._loading[key] = token
+        loaded = _MISSING
+        if self.shared is not None:
+            loaded = self.shared.get(key)
+            if loaded is None:
+                self.shared_stats.misses += 1
+                loaded = _MISSING
+            else:
+                self.shared_stats.hits += 1
+        from_database = loaded is _MISSING
+        if from_database:
+            loaded = load()
+            if _writes_pending(session, key):
+                # ``load`` autoflushed a write to this key.
+                self.invalidate([key])
+                return _freeze(loaded)
+        value = _freeze(loaded)
+        if from_database and self.shared is not None and loaded is not None:
+            self.shared.set(key, loaded, self.shared_ttl)
+
+        with self._lock:
+            # An invalidation while loading removed the token; the value may
+            # predate that write, so hand it out without keeping it.
+            stale = self._loading.get(key) is not token
+            if not stale:
+                del self._loading[key]
+                if loaded:
+                    self.local.set(key, value)
+                elif self.negative_ttl > 0:
+                    self.local.set(key, value, self.negative_ttl)
+        if stale and from_database and self.shared is not None:
+            self.shared.delete([key])
+        return value
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        with self._lock:
+            for key in keys:
+                self._loading.pop(key, None)
+        self.local.delete(keys)
+        if self.shared is not None:
+            self.shared.delete(keys)
+
+    def invalidate_namespace(self, namespace: str) -> None:
+        prefix = f"{namespace}:"
+        with self._lock:
+            for key in [key for key in self._loading if key.startswith(prefix)]:
+                del self._loading[key]
+        self.local.delete_prefix(prefix)
+        if self.shared is not None:
+            self.shared.delete_prefix(prefix)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._loading.clear()
+        self.local.clear()
+
+
+_default: RecordCache | None = None
+_default_lock = threading.Lock()
+
+
+def get_record_cache() -> RecordCache:
+    """Process-wide cache with an in-process tier only."""
+
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = RecordCache()
+        return _default
+
+
+def _writes_pending(session: Session, key: str) -> bool:
+    keys, namespaces = session.info.get(_PENDING_KEYS, ((), ()))
+    return key in keys or key.split(":", 1)[0] in namespaces
+
+
+def _history_values(instance: Any, name: str) -> set[Any]:
+    history = inspect(instance).attrs[name].history
+    return {*history.added, *history.unchanged, *history.deleted} - {None}
+
+
+def _instance_keys(instance: Any) -> set[str]:
+    if isinstance(instance, EvaluationResult):
+        return {
+            result_key(cycle_id, evaluee_id)
+            for cycle_id in _history_values(instance, "cycle_id")
+            for evaluee_id in _history_values(instance, "evaluee_id")
+        }
+    if isinstance(instance, Award):
+        return {
+            award_key(period, award_type)
+            for period in _history_values(instance, "award_period")
+            for award_type in _history_values(instance, "award_type")
+        }
+    return set()
+
+
+def _invalidate(keys: set[str], namespaces: set[str]) -> None:
+    for cache in list(_caches):
+        for namespace in namespaces:
+            cache.invalidate_namespace(namespace)
+        if keys:
+            cache.invalidate(keys)
+
+
+def _pending(session: Session) -> tuple[set[str], set[str]]:
+    pending: tuple[set[str], set[str]] = session.info.setdefault(
+        _PENDING_KEYS,
+        (set(), set()),
+    )
+    return pending
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed(session: Session, flush_context: Any) -> None:
+    keys: set[str] = set()
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        keys |= _instance_keys(instance)
+    if keys:
+        _pending(session)[0].update(keys)
+        _invalidate(keys, set())
+
+
+_NAMESPACES = {
+    EvaluationResult.__tablename__: RESULT_NAMESPACE,
+    Award.__tablename__: AWARD_NAMESPACE,
+}
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_bulk(state: ORMExecuteState) -> None:
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    table = getattr(state.statement, "table", None)
+    namespace = _NAMESPACES.get(getattr(table, "name", ""))
+    if namespace is not None:
+        _pending(state.session)[1].add(namespace)
+        _invalidate(set(), {namespace})
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_pending(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEYS, None)
+    if pending is not None:
+        _invalidate(*pending)
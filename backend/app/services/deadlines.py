@@ -0,0 +1,169 @@
+"""Set-based sweep of overdue evaluation assignments.
+
+``sweep_overdue`` flips every ``NOT_STARTED``/``IN_PROGRESS`` evaluation
+whose ``due_date`` has passed to ``LATE`` with chunked ``UPDATE ...
+RETURNING`` statements. Each chunk commits on its own together with one
+``evaluation.marked_late`` outbox event per cycle it touched, listing the
+ids, so a sweep over thousands of assignments writes a handful of events
+rather than one per row.
+
+Chunks are claimed oldest ``due_date`` first straight from the partial
+index ``ix_evaluation_open_due_date``; the status filter is written as a
+literal so both planners can prove the index predicate. Filtering by
+cycle as well would steer the planner to the cycle index and a sort, so
+rows are grouped by cycle from ``RETURNING`` instead. On PostgreSQL each
+chunk is claimed with ``FOR UPDATE SKIP LOCKED``, so several workers can
+sweep at once without waiting on, or double-reporting, each other's rows.
+SQLite serialises writers anyway. The touched departments' progress
+rollups are recomputed in the same transaction.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from sqlalchemy import (
+    ColumnElement,
+    Engine,
+    Table,
+    TextClause,
+    insert,
+    select,
+    text,
+    update,
+)
+
+from ..database import get_engine
+from ..models.evaluation import Evaluation, EvaluationStatus
+from ..models.outbox import OutboxEvent
+from .rollups import refresh_cycle_progress
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1_000
+DEFAULT_INTERVAL_SECONDS = 300.0
+LATE_EVENT = "evaluation.marked_late"
+
+_evaluation: Table = Evaluation.__table__  # type: ignore[assignment]
+# Must match the predicate of ix_evaluation_open_due_date verbatim.
+_OPEN = text("status IN ('NOT_STARTED', 'IN_PROGRESS')")
+
+
+@dataclass(slots=True)
+class SweepReport:
+    """Assignments marked late by one ``sweep_overdue`` call."""
+
+    swept_at: datetime
+    marked_late: int = 0
+    batches: int = 0
+    by_cycle: dict[uuid.UUID, int] = field(default_factory=dict)
+
+
+def _overdue(now: datetime) -> tuple[ColumnElement[bool] | TextClause, ...]:
+    return (_OPEN, _evaluation.c.due_date < now)
+
+
+def sweep_overdue(
+    engine: Engine | None = None,
+    now: datetime | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> SweepReport:
+    """Mark every overdue open assignment ``LATE`` and return the counts."""
+
+    engine = engine or get_engine()
+    now = now or datetime.now(UTC)
+    report = SweepReport(swept_at=now)
+    while True:
+        by_cycle = _sweep_batch(engine, now, batch_size)
+        marked = sum(by_cycle.values())
+        if not marked:
+            break
+        report.marked_late += marked
+        report.batches += 1
+        for cycle_id, count in by_cycle.items():
+            report.by_cycle[cycle_id] = report.by_cycle.get(cycle_id, 0) + count
+        if marked < batch_size:
+            break
+    return report
+
+
+def _sweep_batch(
+    engine: Engine,
+    now: datetime,
+    batch_size: int,
+) -> dict[uuid.UUID, int]:
+    claim = (
+        select(_evaluation.c.id)
+        .where(*_overdue(now))
+        .order_by(_evaluation.c.due_date)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    mark = (
+        update(_evaluation)
+        .where(_evaluation.c.id.in_(claim.scalar_subquery()), *_overdue(now))
+        .values(status=EvaluationStatus.LATE)
+        .returning(
+            _evaluation.c.cycle_id,
+            _evaluation.c.id,
+            _evaluation.c.evaluee_department,
+        )
+    )
+    with engine.begin() as connection:
+        by_cycle: dict[uuid.UUID, list[uuid.UUID]] = defaultdict(list)
+        departments: dict[uuid.UUID, set[str]] = defaultdict(set)
+        for cycle_id, evaluation_id, department in connection.execute(mark):
+            by_cycle[cycle_id].append(evaluation_id)
+            departments[cycle_id].add(department)
+        for cycle_id, touched in departments.items():
+            refresh_cycle_progress(connection, cycle_id, touched, now)
+        if by_cycle:
+            connection.execute(
+                insert(OutboxEvent),
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "event_type": LATE_EVENT,
+                        "aggregate_type": "evaluation_cycle",
+                        "aggregate_id": cycle_id,
+                        "payload": {
+                            "cycle_id": str(cycle_id),
+                            "evaluation_ids": sorted(str(value) for value in ids),
+                            "count": len(ids),
+                            "due_before": now.isoformat(),
+                        },
+                        "occurred_at": now,
+                        "attempts": 0,
+                    }
+                    for cycle_id, ids in by_cycle.items()
+                ],
+            )
+    return {cycle_id: len(ids) for cycle_id, ids in by_cycle.items()}
+
+
+def run_deadline_sweeper(
+    stop: threading.Event,
+    engine: Engine | None = None,
+    interval: float = DEFAULT_INTERVAL_SECONDS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> None:
+    """Sweep every ``interval`` seconds until ``stop`` is set."""
+
+    while not stop.is_set():
+        try:
+            report = sweep_overdue(engine, batch_size=batch_size)
+        except Exception:
+            logger.exception("Deadline sweep failed")
+        else:
+            if report.marked_late:
+                logger.info(
+                    "Marked %d evaluations late in %d batches",
+                    report.marked_late,
+                    report.batches,
+                )
+        stop.wait(interval)
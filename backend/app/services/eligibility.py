@@ -0,0 +1,391 @@
+"""Precomputed nomination eligibility.
+
+``nomination_eligibility`` holds one row per employee and nomination
+period with everything the nomination policy reads: the rotation lock
+(the latest of ``EligibilityTracking.rotation_lock_until``, the last
+award plus ``ROTATION_DAYS`` and the last nomination from an earlier
+period plus ``ROTATION_DAYS``), the ineligibility flag and a bitmask of
+categories with an active nomination. Like the frontend policy, earlier
+nominations lock whatever their status; nominations for the period itself
+are covered by the duplicate check instead. Checking a nomination, or a whole
+department, is then one indexed read instead of several queries per
+person.
+
+Rows are kept current from session events: flushing an
+``EligibilityTracking`` change (``update_after_award``, ``set_ineligible``,
+``set_eligible``), a new ``Award`` or a nomination's status, category or
+period change recomputes the affected rows in the same transaction.
+Writes issued as bulk statements bypass those events; run
+``build_eligibility_index`` for the period afterwards.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import (
+    Connection,
+    Result,
+    Table,
+    delete,
+    event,
+    func,
+    insert,
+    inspect,
+    select,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models.evaluation import EvaluationCycle, EvaluationResult
+from ..models.recognition import (
+    Award,
+    EligibilityTracking,
+    Nomination,
+    NominationCategory,
+    NominationEligibility,
+    NominationStatus,
+)
+
+ROTATION_DAYS = 90
+BATCH_SIZE = 1_000
+
+DUPLICATE = "duplicate"
+ROTATION_LOCK = "rotation_lock"
+INELIGIBLE = "ineligible"
+
+_index: Table = NominationEligibility.__table__  # type: ignore[assignment]
+_nominations: Table = Nomination.__table__  # type: ignore[assignment]
+_CATEGORY_BITS = {
+    category: 1 << position for position, category in enumerate(NominationCategory)
+}
+_TRACKING_FIELDS = ("rotation_lock_until", "ineligible", "ineligibility_reason")
+_NOMINATION_FIELDS = (
+    "nominee_id",
+    "nomination_period",
+    "category",
+    "status",
+    "submitted_at",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class EligibilityDecision:
+    """Whether an employee may be nominated, and why not."""
+
+    employee_id: uuid.UUID
+    employee_name: str | None
+    department: str | None
+    violations: tuple[str, ...]
+    locked_until: datetime | None
+    reason: str | None
+
+    @property
+    def eligible(self) -> bool:
+        return not self.violations
+
+
+def _aware(moment: datetime) -> datetime:
+    return moment if moment.tzinfo else moment.replace(tzinfo=UTC)
+
+
+def _latest(*moments: datetime | None) -> datetime | None:
+    present = [_aware(moment) for moment in moments if moment is not None]
+    return max(present, default=None)
+
+
+def _decide(
+    row: Mapping[Any, Any],
+    category: NominationCategory | None,
+    now: datetime,
+) -> EligibilityDecision:
+    violations: list[str] = []
+    if category is not None and row["active_categories"] & _CATEGORY_BITS[category]:
+        violations.append(DUPLICATE)
+    locked_until = _latest(row["locked_until"])
+    if locked_until is not None and locked_until > now:
+        violations.append(ROTATION_LOCK)
+    if row["ineligible"]:
+        violations.append(INELIGIBLE)
+    return EligibilityDecision(
+        employee_id=row["employee_id"],
+        employee_name=row["employee_name"],
+        department=row["department"],
+        violations=tuple(violations),
+        locked_until=locked_until,
+        reason=row["ineligibility_reason"],
+    )
+
+
+def _compute(
+    connection: Connection,
+    period: str,
+    employee_ids: Iterable[uuid.UUID] | None = None,
+) -> list[dict[str, Any]]:
+    # One query per source table, for a single employee or a whole period.
+    wanted = list(employee_ids) if employee_ids is not None else None
+
+    def only(column: Any) -> list[Any]:
+        return [] if wanted is None else [column.in_(wanted)]
+
+    rows: dict[uuid.UUID, dict[str, Any]] = {}
+
+    def row(employee_id: uuid.UUID) -> dict[str, Any]:
+        return rows.setdefault(
+            employee_id,
+            {
+                "employee_id": employee_id,
+                "employee_name": None,
+                "department": None,
+                "locked_until": None,
+                "ineligible": 0,
+                "ineligibility_reason": None,
+                "active_categories": 0,
+            },
+        )
+
+    awards: Result[*tuple[Any, ...]] = connection.execute(
+        select(
+            Award.recipient_id,
+            Award.recipient_name,
+            Award.department,
+            Award.granted_at,
+        )
+        .where(*only(Award.recipient_id))
+        .order_by(Award.granted_at),
+    )
+    for employee_id, name, department, granted_at in awards:
+        values = row(employee_id)
+        values.update(employee_name=name, department=department)
+        values["locked_until"] = _latest(
+            values["locked_until"],
+            _aware(granted_at) + timedelta(days=ROTATION_DAYS),
+        )
+
+    earlier: Result[*tuple[Any, ...]] = connection.execute(
+        select(
+            Nomination.nominee_id,
+            func.max(Nomination.nominee_name),
+            func.max(Nomination.nominee_department),
+            func.max(Nomination.submitted_at),
+        )
+        .where(
+            _nominations.c.nomination_period < period,
+            *only(Nomination.nominee_id),
+        )
+        .group_by(Nomination.nominee_id),
+    )
+    for employee_id, name, department, submitted_at in earlier:
+        values = row(employee_id)
+        values["employee_name"] = values["employee_name"] or name
+        values["department"] = values["department"] or department
+        values["locked_until"] = _latest(
+            values["locked_until"],
+            _aware(submitted_at) + timedelta(days=ROTATION_DAYS),
+        )
+
+    roster: Result[*tuple[Any, ...]] = connection.execute(
+        select(
+            EvaluationResult.evaluee_id,
+            EvaluationResult.evaluee_name,
+            EvaluationResult.evaluee_department,
+        )
+        .join(EvaluationCycle, EvaluationCycle.id == EvaluationResult.cycle_id)
+        .where(
+            EvaluationCycle.cycle_period == period,
+            *only(EvaluationResult.evaluee_id),
+        ),
+    )
+    for employee_id, name, department in roster:
+        row(employee_id).update(employee_name=name, department=department)
+
+    tracking: Result[*tuple[Any, ...]] = connection.execute(
+        select(
+            EligibilityTracking.employee_id,
+            EligibilityTracking.employee_name,
+            EligibilityTracking.rotation_lock_until,
+            EligibilityTracking.ineligible,
+            EligibilityTracking.ineligibility_reason,
+        )
+        .where(*only(EligibilityTracking.employee_id))
+        .order_by(EligibilityTracking.updated_at),
+    )
+    for employee_id, name, lock_until, ineligible, reason in tracking:
+        values = row(employee_id)
+        values["employee_name"] = values["employee_name"] or name
+        values["locked_until"] = _latest(values["locked_until"], lock_until)
+        values["ineligible"] = 1 if ineligible else 0
+        values["ineligibility_reason"] = reason
+
+    nominations: Result[*tuple[Any, ...]] = connection.execute(
+        select(
+            Nomination.nominee_id,
+            Nomination.nominee_name,
+            Nomination.nominee_department,
+            Nomination.category,
+        ).where(
+            Nomination.nomination_period == period,
+            Nomination.status != NominationStatus.REJECTED,
+            *only(Nomination.nominee_id),
+        ),
+    )
+    for employee_id, name, department, category in nominations:
+        values = row(employee_id)
+        values.update(employee_name=name, department=department)
+        values["active_categories"] |= _CATEGORY_BITS[category]
+
+    if wanted is not None:
+        for employee_id in wanted:
+            row(employee_id)
+    return list(rows.values())
+
+
+def build_eligibility_index(
+    session: Session,
+    period: str,
+    batch_size: int = BATCH_SIZE,
+) -> int:
+    """Recompute every row of ``period`` and return how many were written.
+
+    The period's roster is everyone with a result in that month's
+    evaluation cycle, a nomination for the period or an earlier one, an
+    award or an eligibility tracking row.
+    """
+
+    connection = session.connection()
+    now = datetime.now(UTC)
+    rows = [
+        {**values, "id": uuid.uuid4(), "nomination_period": period, "updated_at": now}
+        for values in _compute(connection, period)
+    ]
+    connection.execute(delete(_index).where(_index.c.nomination_period == period))
+    for start in range(0, len(rows), batch_size):
+        connection.execute(insert(_index), rows[start : start + batch_size])
+    return len(rows)
+
+
+def refresh_eligibility(
+    connection: Connection,
+    period: str,
+    employee_id: uuid.UUID,
+) -> dict[str, Any]:
+    """Recompute and store one employee's row for ``period``."""
+
+    (values,) = _compute(connection, period, [employee_id])
+    values["updated_at"] = datetime.now(UTC)
+    key = (
+        _index.c.employee_id == employee_id,
+        _index.c.nomination_period == period,
+    )
+    changes = {name: value for name, value in values.items() if name != "employee_id"}
+    if connection.execute(update(_index).where(*key).values(**changes)).rowcount:
+        return values
+    try:
+        with connection.begin_nested():
+            connection.execute(
+                insert(_index).values(
+                    id=uuid.uuid4(),
+                    nomination_period=period,
+                    **values,
+                ),
+            )
+    except IntegrityError:
+        # A concurrent writer created the row first; overwrite it instead.
+        connection.execute(update(_index).where(*key).values(**changes))
+    return values
+
+
+def check_nomination(
+    session: Session,
+    period: str,
+    employee_id: uuid.UUID,
+    category: NominationCategory | None = None,
+    now: datetime | None = None,
+) -> EligibilityDecision:
+    """Eligibility of one nominee, computing the index row on first use."""
+
+    connection = session.connection()
+    row: Mapping[Any, Any] | None = (
+        connection.execute(
+            select(_index).where(
+                _index.c.employee_id == employee_id,
+                _index.c.nomination_period == period,
+            ),
+        )
+        .mappings()
+        .first()
+    )
+    if row is None:
+        row = refresh_eligibility(connection, period, employee_id)
+    return _decide(row, category, now or datetime.now(UTC))
+
+
+def department_eligibility(
+    session: Session,
+    period: str,
+    department: str,
+    category: NominationCategory | None = None,
+    now: datetime | None = None,
+) -> dict[uuid.UUID, EligibilityDecision]:
+    """Eligibility of everyone indexed for ``department`` in ``period``."""
+
+    rows = session.execute(
+        select(_index).where(
+            _index.c.nomination_period == period,
+            _index.c.department == department,
+        ),
+    ).mappings()
+    now = now or datetime.now(UTC)
+    return {row["employee_id"]: _decide(row, category, now) for row in rows}
+
+
+def _changed(instance: Any, fields: Iterable[str]) -> bool:
+    state = inspect(instance)
+    return any(state.attrs[name].history.has_changes() for name in fields)
+
+
+def _values(instance: Any, name: str) -> set[Any]:
+    history = inspect(instance).attrs[name].history
+    return {*history.added, *history.unchanged, *history.deleted} - {None}
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_flushed(session: Session, flush_context: Any) -> None:
+    employees: set[uuid.UUID] = set()
+    keys: set[tuple[str, uuid.UUID]] = set()
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, EligibilityTracking):
+            if instance in session.new or _changed(instance, _TRACKING_FIELDS):
+                employees |= _values(instance, "employee_id")
+        elif isinstance(instance, Award):
+            employees |= _values(instance, "recipient_id")
+        elif isinstance(instance, Nomination) and (
+            instance in session.new
+            or instance in session.deleted
+            or _changed(instance, _NOMINATION_FIELDS)
+        ):
+            keys.update(
+                (period, nominee_id)
+                for period in _values(instance, "nomination_period")
+                for nominee_id in _values(instance, "nominee_id")
+            )
+            # Later periods' rotation locks depend on it as well.
+            employees |= _values(instance, "nominee_id")
+    if not employees and not keys:
+        return
+
+    connection = session.connection()
+    if employees:
+        indexed = connection.execute(
+            select(_index.c.nomination_period, _index.c.employee_id).where(
+                _index.c.employee_id.in_(employees),
+            ),
+        )
+        keys.update((period, employee_id) for period, employee_id in indexed)
+    for period, employee_id in sorted(keys, key=str):
+        refresh_eligibility(connection, period, employee_id)
@@ -0,0 +1,409 @@
+"""Enrollment lifecycle transitions for one application or a whole intake.
+
+``transition_applications`` moves a batch of applications to one status
+with a single guarded ``UPDATE`` per chunk:
+
+    UPDATE enrollment_application
+    SET status = :target, version = version + 1, approved_at = :when
+    WHERE (id, version) IN (...) AND status IN (:allowed sources)
+    RETURNING id, version
+
+A row that another registrar changed since it was read no longer matches
+its ``(id, version)`` pair and is reported as a conflict instead of being
+overwritten, so approving 500 applications takes a handful of statements
+and every row gets an outcome. Callers that showed the registrar a
+version pass it in and also catch changes made before the request.
+
+Outbox events (``enrollment.approved``, ``enrollment.provisioned``) are
+inserted in bulk in the same transaction. Audit entries are handed to the
+``AuditWriter`` only once that transaction commits, which writes them in
+batches; a rollback discards them. The caller owns the transaction.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import Table, case, event, func, insert, select, tuple_, update
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.orm.util import identity_key
+
+from ..models.enrollment import (
+    EnrollmentApplication,
+    EnrollmentStatus,
+    InvalidTransitionError,
+    approved_payload,
+    provisioned_payload,
+    transition_sources,
+)
+from ..models.outbox import OutboxEvent
+from .audit import AuditWriter, get_audit_writer
+
+DEFAULT_CHUNK_SIZE = 500
+CONFLICT_NOT_FOUND = "not_found"
+CONFLICT_INVALID_STATE = "invalid_state"
+CONFLICT_STALE = "stale_version"
+
+# Timestamp column each target status stamps. A rejection is also a review,
+# so it keeps a review time recorded earlier, as ``mark_rejected`` does.
+TRANSITION_TIMESTAMPS = {
+    EnrollmentStatus.IN_REVIEW: "reviewed_at",
+    EnrollmentStatus.APPROVED: "approved_at",
+    EnrollmentStatus.REJECTED: "reviewed_at",
+    EnrollmentStatus.PROVISIONED: "provisioned_at",
+}
+
+_applications: Table = EnrollmentApplication.__table__  # type: ignore[assignment]
+_PENDING_AUDIT = "pending_enrollment_audit"
+
+
+class StaleApplicationError(ValueError):
+    """Raised when an application changed since the caller read it."""
+
+
+@dataclass(frozen=True, slots=True)
+class TransitionConflict:
+    """Why one application was left unchanged, and what it held instead."""
+
+    reason: str
+    status: EnrollmentStatus | None = None
+    version: int | None = None
+
+
+@dataclass(slots=True)
+class TransitionReport:
+    """Per-application outcome of one ``transition_applications`` call."""
+
+    target: EnrollmentStatus
+    applied: dict[uuid.UUID, int] = field(default_factory=dict)
+    conflicts: dict[uuid.UUID, TransitionConflict] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.conflicts
+
+
+def _expectations(
+    applications: Mapping[uuid.UUID, int | None] | Iterable[uuid.UUID],
+) -> dict[uuid.UUID, int | None]:
+    if isinstance(applications, Mapping):
+        return dict(applications)
+    return dict.fromkeys(applications)
+
+
+def transition_applications(
+    session: Session,
+    target: EnrollmentStatus,
+    applications: Mapping[uuid.UUID, int | None] | Iterable[uuid.UUID],
+    *,
+    actor_id: uuid.UUID,
+    actor_role: str = "registrar",
+    when: datetime | None = None,
+    notes: str | None = None,
+    student_codes: Mapping[uuid.UUID, str] | None = None,
+    audit: AuditWriter | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> TransitionReport:
+    """Move ``applications`` to ``target``, reporting every row's outcome.
+
+    ``applications`` is either ids or a mapping of id to the version the
+    caller last saw (``None`` to accept whatever is current). Provisioning
+    needs a ``student_codes`` entry per application.
+    """
+
+    when = when or datetime.now(UTC)
+    expected = _expectations(applications)
+    if target is EnrollmentStatus.PROVISIONED:
+        missing = [key for key in expected if key not in (student_codes or {})]
+        if missing:
+            raise ValueError(f"no student code for {len(missing)} application(s)")
+    sources = transition_sources(target)
+    report = TransitionReport(target)
+    ids = list(expected)
+    for offset in range(0, len(ids), chunk_size):
+        _transition_chunk(
+            session,
+            report,
+            sources,
+            {key: expected[key] for key in ids[offset : offset + chunk_size]},
+            actor_id=actor_id,
+            actor_role=actor_role,
+            when=when,
+            notes=notes,
+            student_codes=student_codes or {},
+            audit=audit,
+        )
+    return report
+
+
+def _transition_chunk(
+    session: Session,
+    report: TransitionReport,
+    sources: frozenset[EnrollmentStatus],
+    expected: dict[uuid.UUID, int | None],
+    *,
+    actor_id: uuid.UUID,
+    actor_role: str,
+    when: datetime,
+    notes: str | None,
+    student_codes: Mapping[uuid.UUID, str],
+    audit: AuditWriter | None,
+) -> None:
+    target = report.target
+    current = {
+        row.id: row
+        for row in session.execute(
+            select(
+                _applications.c.id,
+                _applications.c.status,
+                _applications.c.version,
+                _applications.c.notes,
+                _applications.c.reviewed_at,
+                _applications.c.correlation_id,
+            ).where(_applications.c.id.in_(list(expected))),
+        )
+    }
+
+    candidates: dict[uuid.UUID, int] = {}
+    for application_id, version in expected.items():
+        row = current.get(application_id)
+        if row is None:
+            report.conflicts[application_id] = TransitionConflict(CONFLICT_NOT_FOUND)
+        elif row.status not in sources:
+            report.conflicts[application_id] = TransitionConflict(
+                CONFLICT_INVALID_STATE,
+                row.status,
+                row.version,
+            )
+        elif version is not None and version != row.version:
+            report.conflicts[application_id] = TransitionConflict(
+                CONFLICT_STALE,
+                row.status,
+                row.version,
+            )
+        else:
+            candidates[application_id] = row.version
+    if not candidates:
+        return
+
+    stamp = TRANSITION_TIMESTAMPS[target]
+    values: dict[str, Any] = {
+        "status": target,
+        "version": _applications.c.version + 1,
+        stamp: when,
+    }
+    if target is EnrollmentStatus.REJECTED:
+        values[stamp] = func.coalesce(_applications.c.reviewed_at, when)
+    if notes is not None:
+        values["notes"] = notes
+    if target is EnrollmentStatus.PROVISIONED:
+        values["assigned_student_code"] = case(
+            *((_applications.c.id == key, student_codes[key]) for key in candidates),
+        )
+    applied: dict[uuid.UUID, int] = dict(
+        session.execute(
+            update(_applications)
+            .where(
+                tuple_(_applications.c.id, _applications.c.version).in_(
+                    list(candidates.items()),
+                ),
+                _applications.c.status.in_(sources),
+            )
+            .values(values)
+            .returning(_applications.c.id, _applications.c.version),
+        ).all(),
+    )
+    for application_id, version in candidates.items():
+        if application_id not in applied:
+            # Changed between the read and the update.
+            report.conflicts[application_id] = TransitionConflict(
+                CONFLICT_STALE,
+                version=version,
+            )
+    report.applied.update(applied)
+    if not applied:
+        return
+
+    for application_id in applied:
+        instance = session.identity_map.get(
+            identity_key(EnrollmentApplication, application_id),
+        )
+        if instance is not None:
+            session.expire(instance)
+    _stage_events(
+        session,
+        target,
+        applied,
+        current,
+        actor_id,
+        when,
+        notes,
+        student_codes,
+    )
+    _stage_audit(
+        session,
+        audit,
+        [
+            {
+                "actor_id": actor_id,
+                "actor_role": actor_role,
+                "entity_type": EnrollmentApplication.__tablename__,
+                "entity_id": application_id,
+                "action": f"enrollment.{target.value}",
+                "summary": f"Enrollment application {target.value}",
+                "before": {
+                    "status": current[application_id].status.value,
+                    "version": version - 1,
+                    "notes": current[application_id].notes,
+                },
+                "after": {
+                    "status": target.value,
+                    "version": version,
+                    stamp: _stamped(target, when, current[application_id]),
+                    "notes": _notes(notes, current[application_id]),
+                },
+                "correlation_id": current[application_id].correlation_id,
+                "created_at": when,
+            }
+            for application_id, version in applied.items()
+        ],
+    )
+
+
+def _stamped(target: EnrollmentStatus, when: datetime, row: Any) -> str:
+    # The timestamp the UPDATE left on the row.
+    reviewed_at: datetime | None = row.reviewed_at
+    if target is EnrollmentStatus.REJECTED and reviewed_at is not None:
+        return reviewed_at.isoformat()
+    return when.isoformat()
+
+
+def _notes(notes: str | None, row: Any) -> str | None:
+    # The notes the UPDATE left on the row, as mark_approved would emit.
+    return notes if notes is not None else row.notes
+
+
+def _stage_events(
+    session: Session,
+    target: EnrollmentStatus,
+    applied: Mapping[uuid.UUID, int],
+    current: Mapping[uuid.UUID, Any],
+    actor_id: uuid.UUID,
+    when: datetime,
+    notes: str | None,
+    student_codes: Mapping[uuid.UUID, str],
+) -> None:
+    if target is EnrollmentStatus.APPROVED:
+        event_type = "enrollment.approved"
+    elif target is EnrollmentStatus.PROVISIONED:
+        event_type = "enrollment.provisioned"
+    else:
+        return
+    rows = []
+    for application_id in applied:
+        payload = (
+            approved_payload(
+                application_id,
+                actor_id,
+                when,
+                _notes(notes, current[application_id]),
+            )
+            if target is EnrollmentStatus.APPROVED
+            else provisioned_payload(
+                application_id,
+                student_codes[application_id],
+                when,
+            )
+        )
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "event_type": event_type,
+                "aggregate_type": EnrollmentApplication.__tablename__,
+                "aggregate_id": application_id,
+                "payload": payload,
+                "actor_id": actor_id if target is EnrollmentStatus.APPROVED else None,
+                "correlation_id": current[application_id].correlation_id,
+                "occurred_at": when,
+                "attempts": 0,
+            },
+        )
+    session.execute(insert(OutboxEvent), rows)
+
+
+def _stage_audit(
+    session: Session,
+    audit: AuditWriter | None,
+    entries: list[dict[str, Any]],
+) -> None:
+    transaction = session.get_nested_transaction() or session.get_transaction()
+    session.info.setdefault(_PENDING_AUDIT, []).append((transaction, audit, entries))
+
+
+def _within(transaction: Any, ancestor: SessionTransaction) -> bool:
+    while transaction is not None:
+        if transaction is ancestor:
+            return True
+        transaction = transaction.parent
+    return False
+
+
+@event.listens_for(Session, "after_commit")
+def _write_audit(session: Session) -> None:
+    if session.in_nested_transaction():
+        # A released savepoint; its entries wait for the outer commit.
+        return
+    for _, audit, entries in session.info.pop(_PENDING_AUDIT, ()):
+        writer = audit or get_audit_writer()
+        for entry in entries:
+            writer.record_change(**entry)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_audit(session: Session, previous_transaction: SessionTransaction) -> None:
+    # Drop entries staged inside the transaction (or savepoint) rolled back.
+    pending = session.info.get(_PENDING_AUDIT)
+    if pending:
+        pending[:] = [
+            item for item in pending if not _within(item[0], previous_transaction)
+        ]
+
+
+def transition_application(
+    session: Session,
+    application_id: uuid.UUID,
+    target: EnrollmentStatus,
+    expected_version: int | None = None,
+    **options: Any,
+) -> int:
+    """Move one application to ``target`` and return its new version.
+
+    Raises ``ValueError`` when it does not exist, ``InvalidTransitionError``
+    when its status cannot move to ``target`` and ``StaleApplicationError``
+    when it no longer has ``expected_version``.
+    """
+
+    report = transition_applications(
+        session,
+        target,
+        {application_id: expected_version},
+        **options,
+    )
+    conflict = report.conflicts.get(application_id)
+    if conflict is None:
+        return report.applied[application_id]
+    if conflict.reason == CONFLICT_NOT_FOUND:
+        raise ValueError(f"enrollment application {application_id} does not exist")
+    if conflict.reason == CONFLICT_INVALID_STATE:
+        raise InvalidTransitionError(
+            f"application {application_id} cannot move from "
+            f"{conflict.status.name} to {target.name}",  # type: ignore[union-attr]
+        )
+    raise StaleApplicationError(
+        f"application {application_id} is at version {conflict.version}, "
+        f"expected {expected_version}",
+    )
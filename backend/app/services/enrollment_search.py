@@ -0,0 +1,176 @@
+"""Registrar search over enrollment applications.
+
+Queries match against ``EnrollmentApplication.search_text``, a generated
+column holding the lowercased guardian email, the guardian phone digits
+and the lowercased student names:
+
+* a query containing ``@`` is an email prefix lookup on
+  ``ix_enrollment_application_email_lower``;
+* terms of three or more characters are substring matches through the
+  trigram index (``pg_trgm`` GIN on PostgreSQL, FTS5 on SQLite), so
+  partial names and phone fragments work. On SQLite the newest
+  ``SCAN_WINDOW`` rows are tried first, which answers common terms
+  without sorting every FTS hit. Keep planner statistics current
+  (``ANALYZE``/``PRAGMA optimize``) so rarer terms are driven from FTS
+  rather than from the status index;
+* shorter queries fall back to a student last-name prefix.
+
+Results are newest first and paginated by keyset on
+``(submitted_at, id)``, so deep pages cost the same as the first.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Collection
+from typing import Any
+
+from sqlalchemy import (
+    Connection,
+    and_,
+    column,
+    func,
+    literal_column,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.sql import Select
+
+from ..models.enrollment import (
+    ENROLLMENT_SEARCH_FTS,
+    EnrollmentApplication,
+    EnrollmentStatus,
+)
+from .pagination import Page, check_limit, keyset_filter, keyset_order, to_page
+
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 200
+TRIGRAM_LENGTH = 3
+SCAN_WINDOW = 5_000
+
+_fts = table(ENROLLMENT_SEARCH_FTS, column("application_id"))
+_PHONE_QUERY = re.compile(r"^[+\d\s().-]+$")
+_PHONE_PUNCTUATION = re.compile(r"[^\d]")
+
+
+def search_terms(query: str) -> list[str]:
+    """Normalise a query the way ``search_text`` is normalised."""
+
+    query = query.strip().lower()
+    if _PHONE_QUERY.match(query):
+        return [_PHONE_PUNCTUATION.sub("", query)]
+    return query.split()
+
+
+def _like_escape(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _prefix(expression: Any, prefix: str) -> Any:
+    # A range rather than LIKE so SQLite can use the expression index.
+    return and_(expression >= prefix, expression < prefix + "\U0010ffff")
+
+
+def _contains_all(search_text: Any, terms: list[str]) -> Any:
+    return and_(
+        *(search_text.like(f"%{_like_escape(term)}%", escape="\\") for term in terms),
+    )
+
+
+def _fts_match(terms: list[str]) -> Any:
+    expression = " AND ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+    return EnrollmentApplication.id.in_(
+        select(_fts.c.application_id).where(
+            literal_column(ENROLLMENT_SEARCH_FTS).op("MATCH")(expression),
+        ),
+    )
+
+
+def _keyset(entity: Any) -> tuple[Any, Any]:
+    return entity.submitted_at, entity.id
+
+
+def search_applications(
+    session: Session,
+    query: str | None = None,
+    statuses: Collection[EnrollmentStatus] | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> Page:
+    """Applications matching ``query`` and ``statuses``, newest first."""
+
+    check_limit(limit, MAX_PAGE_SIZE)
+    stmt = select(EnrollmentApplication)
+    if statuses:
+        stmt = stmt.where(EnrollmentApplication.status.in_(statuses))
+    if cursor:
+        stmt = stmt.where(keyset_filter(_keyset(EnrollmentApplication), cursor))
+
+    query = (query or "").strip().lower()
+    terms = [term for term in search_terms(query) if len(term) >= TRIGRAM_LENGTH]
+    items: list[EnrollmentApplication] | None = None
+    if "@" in query:
+        stmt = stmt.where(
+            _prefix(func.lower(EnrollmentApplication.guardian_email), query),
+        )
+    elif query and not terms:
+        stmt = stmt.where(
+            _prefix(func.lower(EnrollmentApplication.student_last_name), query),
+        )
+    elif terms and session.get_bind().dialect.name == "sqlite":
+        items = _probe_newest(session, stmt, terms, limit)
+        if items is None:
+            stmt = stmt.where(_fts_match(terms))
+    elif terms:
+        stmt = stmt.where(_contains_all(EnrollmentApplication.search_text, terms))
+
+    if items is None:
+        stmt = stmt.order_by(*keyset_order(_keyset(EnrollmentApplication)))
+        items = list(session.scalars(stmt.limit(limit + 1)))
+    return to_page(items, limit, _keyset(EnrollmentApplication))
+
+
+def _probe_newest(
+    session: Session,
+    stmt: Select[Any],
+    terms: list[str],
+    limit: int,
+) -> list[EnrollmentApplication] | None:
+    # Common terms (a popular surname) match too many rows to fetch from
+    # FTS and sort, but fill a page within the newest few thousand rows.
+    # Scan that window in index order first and fall back to FTS only
+    # when it does not fill the page.
+    window = aliased(
+        EnrollmentApplication,
+        stmt.order_by(*keyset_order(_keyset(EnrollmentApplication)))
+        .limit(SCAN_WINDOW)
+        .subquery(),
+    )
+    probe = (
+        select(window)
+        .where(_contains_all(window.search_text, terms))
+        .order_by(*keyset_order(_keyset(window)))
+        .limit(limit + 1)
+    )
+    items = list(session.scalars(probe))
+    return items if len(items) > limit else None
+
+
+def rebuild_search_index(connection: Connection) -> None:
+    """Repopulate the SQLite FTS5 index from ``enrollment_application``.
+
+    Needed after ``VACUUM``, which may renumber the rowids the FTS rows are
+    keyed on. PostgreSQL's trigram index needs no upkeep.
+    """
+
+    if connection.dialect.name != "sqlite":
+        return
+    connection.execute(text(f"DELETE FROM {ENROLLMENT_SEARCH_FTS}"))  # noqa: S608
+    connection.execute(
+        text(
+            f"INSERT INTO {ENROLLMENT_SEARCH_FTS} (rowid, search_text, application_id) "  # noqa: S608
+            "SELECT rowid, search_text, id FROM enrollment_application",
+        ),
+    )
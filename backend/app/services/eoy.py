@@ -0,0 +1,212 @@
+"""Batch eligibility, scoring and ranking of Employee of the Year candidates."""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from ..models.evaluation import EOYCandidate, EvaluationCycle, EvaluationResult
+from ..models.recognition import Award, AwardType
+
+# Eligibility thresholds and weights; EOYCandidate.check_eligibility and
+# EOYCandidate.calculate_eoy_score are the reference implementation.
+MIN_EOM_WINS = 2
+MIN_AVG_MRE_SCORE = 8.5
+MIN_ATTENDANCE_RATE = 95.0
+MIN_TENURE_MONTHS = 12
+MAX_COUNTED_EOM_WINS = 12
+
+CANDIDATE_COLUMNS = (
+    "id",
+    "employee_id",
+    "eom_wins_count",
+    "avg_mre_score",
+    "attendance_rate",
+    "tenure_months",
+    "has_disciplinary_actions",
+    "ceo_vote_score",
+    "pc_head_vote_score",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class EOYScoringReport:
+    """Outcome of scoring one year's candidates."""
+
+    year: int
+    scored: int
+    eligible: int
+    ranked: list[uuid.UUID]
+
+
+def eoy_score(
+    eom_wins_count: int,
+    avg_mre_score: float,
+    attendance_rate: float,
+    ceo_vote_score: float | None,
+    pc_head_vote_score: float | None,
+) -> float:
+    """Weighted EOY score, evaluated in the same order as the model method."""
+
+    eom_component = min(eom_wins_count, MAX_COUNTED_EOM_WINS) / 12 * 30
+    mre_component = avg_mre_score / 10 * 50
+    attendance_component = attendance_rate / 100 * 10
+    leadership_avg = 0.0
+    if ceo_vote_score and pc_head_vote_score:
+        leadership_avg = (ceo_vote_score + pc_head_vote_score) / 2
+    leadership_component = leadership_avg / 10 * 10
+    return eom_component + mre_component + attendance_component + leadership_component
+
+
+def meets_minimum_criteria(
+    eom_wins_count: int,
+    avg_mre_score: float,
+    attendance_rate: float,
+    tenure_months: int,
+    has_disciplinary_actions: int,
+) -> bool:
+    return (
+        eom_wins_count >= MIN_EOM_WINS
+        and avg_mre_score >= MIN_AVG_MRE_SCORE
+        and attendance_rate >= MIN_ATTENDANCE_RATE
+        and tenure_months >= MIN_TENURE_MONTHS
+        and has_disciplinary_actions == 0
+    )
+
+
+def competition_ranks(scores: dict[uuid.UUID, float]) -> dict[uuid.UUID, int]:
+    """Rank by descending score; equal scores share a rank (1, 2, 2, 4)."""
+
+    ordered = sorted(scores.items(), key=lambda item: (-item[1], str(item[0])))
+    ranks: dict[uuid.UUID, int] = {}
+    previous: float | None = None
+    rank = 0
+    for position, (candidate_id, score) in enumerate(ordered, start=1):
+        if score != previous:
+            rank = position
+            previous = score
+        ranks[candidate_id] = rank
+    return ranks
+
+
+def _candidate_inputs(session: Session, year: int, refresh_inputs: bool) -> list[Any]:
+    columns = [getattr(EOYCandidate, name) for name in CANDIDATE_COLUMNS]
+    if not refresh_inputs:
+        return list(session.execute(select(*columns).where(EOYCandidate.year == year)))
+
+    period = f"{year}-%"
+    wins = (
+        select(Award.recipient_id, func.count().label("wins"))
+        .where(
+            Award.award_type == AwardType.EMPLOYEE_OF_MONTH,
+            Award.award_period.like(period),
+        )
+        .group_by(Award.recipient_id)
+        .subquery()
+    )
+    mre = (
+        select(
+            EvaluationResult.evaluee_id,
+            func.avg(EvaluationResult.final_score).label("avg_mre"),
+        )
+        .join(EvaluationCycle, EvaluationCycle.id == EvaluationResult.cycle_id)
+        .where(
+            EvaluationCycle.cycle_period.like(period),
+            EvaluationResult.released_at.is_not(None),
+            EvaluationResult.received_ratings > 0,
+        )
+        .group_by(EvaluationResult.evaluee_id)
+        .subquery()
+    )
+    stmt = (
+        select(
+            *columns[:2],
+            func.coalesce(wins.c.wins, 0),
+            func.coalesce(mre.c.avg_mre, EOYCandidate.avg_mre_score),
+            *columns[4:],
+        )
+        .outerjoin(wins, wins.c.recipient_id == EOYCandidate.employee_id)
+        .outerjoin(mre, mre.c.evaluee_id == EOYCandidate.employee_id)
+        .where(EOYCandidate.year == year)
+    )
+    return list(session.execute(stmt))
+
+
+def score_year(
+    session: Session,
+    year: int,
+    refresh_inputs: bool = True,
+    scored_at: datetime | None = None,
+) -> EOYScoringReport:
+    """Compute eligibility, ``eoy_score`` and ``rank`` for a whole year.
+
+    With ``refresh_inputs`` the EOM win count is recounted from ``Award``
+    and the average MRE score is re-averaged from the year's released
+    ``EvaluationResult.final_score`` values that have ratings behind them
+    (a result reset after its ratings were withdrawn scores 0.0 and does
+    not count). Employees without such results keep the stored average.
+    Attendance, tenure and leadership votes
+    come from the candidate rows. Everything is read in one query and
+    written back with one bulk update keyed by primary key. Only eligible
+    candidates are ranked; the rest get ``rank = NULL``.
+    """
+
+    scored_at = scored_at or datetime.now(UTC)
+    rows: list[dict[str, Any]] = []
+    eligible_scores: dict[uuid.UUID, float] = {}
+    for (
+        candidate_id,
+        _employee_id,
+        eom_wins_count,
+        avg_mre_score,
+        attendance_rate,
+        tenure_months,
+        has_disciplinary_actions,
+        ceo_vote_score,
+        pc_head_vote_score,
+    ) in _candidate_inputs(session, year, refresh_inputs):
+        eligible = meets_minimum_criteria(
+            eom_wins_count,
+            avg_mre_score,
+            attendance_rate,
+            tenure_months,
+            has_disciplinary_actions,
+        )
+        score = eoy_score(
+            eom_wins_count,
+            avg_mre_score,
+            attendance_rate,
+            ceo_vote_score,
+            pc_head_vote_score,
+        )
+        if eligible:
+            eligible_scores[candidate_id] = score
+        rows.append(
+            {
+                "id": candidate_id,
+                "eom_wins_count": eom_wins_count,
+                "avg_mre_score": avg_mre_score,
+                "meets_minimum_criteria": 1 if eligible else 0,
+                "eoy_score": score,
+                "rank": None,
+                "updated_at": scored_at,
+            },
+        )
+
+    ranks = competition_ranks(eligible_scores)
+    for row in rows:
+        row["rank"] = ranks.get(row["id"])
+    if rows:
+        session.execute(update(EOYCandidate), rows)
+
+    return EOYScoringReport(
+        year=year,
+        scored=len(rows),
+        eligible=len(eligible_scores),
+        ranked=sorted(ranks, key=ranks.__getitem__),
+    )
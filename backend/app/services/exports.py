@@ -0,0 +1,184 @@
+"""Constant-memory CSV and NDJSON exports.
+
+Rows are fetched with ``yield_per`` (a server-side cursor on PostgreSQL)
+and formatted one chunk at a time, so exporting a full cycle's results
+or the whole audit log holds at most ``chunk_size`` rows in memory. The
+``iter_*`` generators suit streaming HTTP responses; ``export_*`` write
+to an open text file and return the row count.
+
+Statements should select columns (``export_statement``) rather than ORM
+entities, which skips identity-map bookkeeping, and should not carry an
+``ORDER BY`` unless an index provides it, since a sort has to see every
+row before returning the first.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import uuid
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+from enum import Enum
+from typing import Any, TextIO
+
+from sqlalchemy import Connection, select, union_all
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from ..models.audit import AuditLog
+from ..models.evaluation import EvaluationResult
+from .audit import list_partitions, period_table
+
+EXPORT_CHUNK_SIZE = 1_000
+
+
+def export_statement(model: Any) -> Select[Any]:
+    """Select every column of ``model``'s table, keyed by column name."""
+
+    return select(*model.__table__.columns)
+
+
+def cycle_results_statement(cycle_id: uuid.UUID) -> Select[Any]:
+    """Every ``EvaluationResult`` of one cycle."""
+
+    table = EvaluationResult.__table__
+    return export_statement(EvaluationResult).where(table.c.cycle_id == cycle_id)
+
+
+def audit_log_statement(
+    connection: Connection,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> Any:
+    """Audit rows with ``start <= created_at < end`` across all partitions."""
+
+    def for_table(table: Any) -> Select[Any]:
+        stmt = select(*table.columns)
+        if start is not None:
+            stmt = stmt.where(table.c.created_at >= start)
+        if end is not None:
+            stmt = stmt.where(table.c.created_at < end)
+        return stmt
+
+    statement = for_table(AuditLog.__table__)
+    if connection.dialect.name == "postgresql":
+        return statement
+    periods = [for_table(period_table(name)) for name in list_partitions(connection)]
+    return union_all(statement, *periods) if periods else statement
+
+
+def _cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, dict | list):
+        return json.dumps(value, default=_json_default)
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Cannot export {type(value).__name__} values")
+
+
+def _chunks(
+    bind: Session | Connection,
+    stmt: Any,
+    chunk_size: int,
+) -> tuple[list[str], Iterator[Sequence[Any]]]:
+    result = bind.execute(stmt.execution_options(yield_per=chunk_size))
+    return list(result.keys()), result.partitions()
+
+
+def _csv(
+    bind: Session | Connection,
+    stmt: Any,
+    chunk_size: int,
+) -> Iterator[tuple[int, str]]:
+    columns, chunks = _chunks(bind, stmt, chunk_size)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for chunk in chunks:
+        writer.writerows([_cell(value) for value in row] for row in chunk)
+        yield len(chunk), buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield 0, buffer.getvalue()
+
+
+def _ndjson(
+    bind: Session | Connection,
+    stmt: Any,
+    chunk_size: int,
+) -> Iterator[tuple[int, str]]:
+    columns, chunks = _chunks(bind, stmt, chunk_size)
+    for chunk in chunks:
+        lines = (
+            json.dumps(dict(zip(columns, row, strict=True)), default=_json_default)
+            for row in chunk
+        )
+        yield len(chunk), "".join(line + "\n" for line in lines)
+
+
+def iter_csv(
+    bind: Session | Connection,
+    stmt: Any,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """CSV text, header first, one string per chunk of rows."""
+
+    for _, text in _csv(bind, stmt, chunk_size):
+        yield text
+
+
+def iter_ndjson(
+    bind: Session | Connection,
+    stmt: Any,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """One JSON object per line, one string per chunk of rows."""
+
+    for _, text in _ndjson(bind, stmt, chunk_size):
+        yield text
+
+
+def _write(chunks: Iterator[tuple[int, str]], destination: TextIO) -> int:
+    written = 0
+    for rows, text in chunks:
+        destination.write(text)
+        written += rows
+    return written
+
+
+def export_csv(
+    bind: Session | Connection,
+    stmt: Any,
+    destination: TextIO,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> int:
+    """Write ``stmt``'s rows as CSV and return how many were written."""
+
+    return _write(_csv(bind, stmt, chunk_size), destination)
+
+
+def export_ndjson(
+    bind: Session | Connection,
+    stmt: Any,
+    destination: TextIO,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> int:
+    """Write ``stmt``'s rows as NDJSON and return how many were written."""
+
+    return _write(_ndjson(bind, stmt, chunk_size), destination)
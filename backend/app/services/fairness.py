@@ -0,0 +1,491 @@
+"""Batch computation of the recognition fairness metrics.
+
+Every metric is one grouped query over all requested periods, so a year
+of awards, nominations and ratings costs a handful of scans rather than
+a Python loop per row. Each ``(metric_type, period)`` pair is written to
+a single ``FairnessMetric`` row, updated in place on recomputation.
+
+Thresholds follow ``docs/RECOGNITION_OPERATIONS.md``: a department
+holding more than 40/50/60% of the wins in the trailing quarter raises a
+warning/alert/critical level, and an evaluee whose ratings have a
+standard deviation of 2.5 or more needs investigation. Variance is
+compared against the squared thresholds, so no ``sqrt`` is needed on
+SQLite.
+
+Each row stores a fingerprint of its inputs (row count, newest
+timestamp and a checksum per period). ``compute_fairness(...,
+incremental=True)`` recomputes only the pairs whose fingerprint moved.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import and_, case, func, literal, select
+from sqlalchemy.orm import Session
+
+from ..models.evaluation import EvaluationCycle, EvaluationRating, EvaluationResult
+from ..models.recognition import Award, FairnessMetric, Nomination
+
+AWARD_DISTRIBUTION = "award_department_distribution"
+NOMINATION_DISTRIBUTION = "nomination_department_distribution"
+RATER_VARIANCE = "rater_variance"
+HIGH_VARIANCE_SHARE = "high_variance_share"
+METRIC_TYPES = (
+    AWARD_DISTRIBUTION,
+    NOMINATION_DISTRIBUTION,
+    RATER_VARIANCE,
+    HIGH_VARIANCE_SHARE,
+)
+
+INFO = "info"
+WARNING = "warning"
+ALERT = "alert"
+CRITICAL = "critical"
+
+# Share of wins held by one department over the trailing quarter.
+DEPARTMENT_SHARE_LEVELS = ((0.60, CRITICAL), (0.50, ALERT), (0.40, WARNING))
+DISTRIBUTION_WINDOW_MONTHS = 3
+MIN_DISTRIBUTION_SAMPLE = 5
+# Rater spread per evaluee, as standard deviations.
+MODERATE_SIGMA = 1.5
+HIGH_SIGMA = 2.5
+OUTLIER_SIGMAS = 2.0
+HIGH_SIGMA_CRITICAL_SHARE = 0.05
+MAX_LISTED_EVALUEES = 20
+# Share of EvaluationResult rows flagged ``has_high_variance``.
+HIGH_VARIANCE_SHARE_LEVELS = ((0.20, CRITICAL), (0.10, WARNING))
+
+_award = Award.__table__
+_nomination = Nomination.__table__
+_rating = EvaluationRating.__table__
+_result = EvaluationResult.__table__
+_cycle = EvaluationCycle.__table__
+
+Fingerprint = list[Any]
+
+
+@dataclass(slots=True)
+class FairnessReport:
+    """Outcome of one ``compute_fairness`` call."""
+
+    computed: dict[str, list[str]] = field(default_factory=dict)
+    alerts: int = 0
+
+    @property
+    def written(self) -> int:
+        return sum(len(periods) for periods in self.computed.values())
+
+
+def months_back(period: str, count: int) -> list[str]:
+    """``period`` and the ``count - 1`` months before it, oldest first."""
+
+    year, month = (int(part) for part in period.split("-"))
+    months = []
+    for _ in range(count):
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+    return months[::-1]
+
+
+def _level(value: float, levels: tuple[tuple[float, str], ...]) -> str:
+    for threshold, level in levels:
+        if value > threshold:
+            return level
+    return INFO
+
+
+def _fingerprint(count: int, latest: Any, checksum: Any = 0) -> Fingerprint:
+    return [count, str(latest) if latest is not None else None, round(checksum or 0, 6)]
+
+
+_EMPTY = _fingerprint(0, None)
+
+
+def _source_fingerprints(
+    session: Session,
+    periods: list[str] | None,
+) -> dict[str, dict[str, Fingerprint]]:
+    """Per-source, per-period fingerprints from four grouped scans."""
+
+    def grouped(statement: Any, period_column: Any) -> dict[str, Fingerprint]:
+        if periods is not None:
+            statement = statement.where(period_column.in_(periods))
+        rows = session.execute(statement.group_by(period_column))
+        return {row[0]: _fingerprint(*row[1:]) for row in rows}
+
+    award_statement = select(
+        _award.c.award_period,
+        func.count(),
+        func.max(_award.c.granted_at),
+    )
+    if periods is not None:
+        # The award distribution reads a trailing window of months.
+        award_statement = award_statement.where(
+            _award.c.award_period.in_(
+                {
+                    month
+                    for period in periods
+                    for month in months_back(period, DISTRIBUTION_WINDOW_MONTHS)
+                },
+            ),
+        )
+    award_months = {
+        row[0]: _fingerprint(*row[1:])
+        for row in session.execute(award_statement.group_by(_award.c.award_period))
+    }
+    cycle_period = _cycle.c.cycle_period
+    return {
+        AWARD_DISTRIBUTION: award_months,
+        NOMINATION_DISTRIBUTION: grouped(
+            select(
+                _nomination.c.nomination_period,
+                func.count(),
+                func.max(_nomination.c.submitted_at),
+                func.count(func.distinct(_nomination.c.nominee_department)),
+            ),
+            _nomination.c.nomination_period,
+        ),
+        RATER_VARIANCE: grouped(
+            select(
+                cycle_period,
+                func.count(),
+                func.max(_rating.c.submitted_at),
+                func.sum(_rating.c.average_score),
+            ).join(_cycle, _cycle.c.id == _rating.c.cycle_id),
+            cycle_period,
+        ),
+        HIGH_VARIANCE_SHARE: grouped(
+            select(
+                cycle_period,
+                func.count(),
+                func.max(_result.c.calculated_at),
+                func.sum(_result.c.has_high_variance),
+            ).join(_cycle, _cycle.c.id == _result.c.cycle_id),
+            cycle_period,
+        ),
+    }
+
+
+def _inputs(
+    metric_type: str,
+    period: str,
+    fingerprints: dict[str, dict[str, Fingerprint]],
+) -> list[Fingerprint]:
+    source = fingerprints[metric_type]
+    if metric_type == AWARD_DISTRIBUTION:
+        months = months_back(period, DISTRIBUTION_WINDOW_MONTHS)
+        return [source.get(month, _EMPTY) for month in months]
+    return [source.get(period, _EMPTY)]
+
+
+def _distribution(
+    counts: dict[str, int],
+    label: str,
+    window: list[str],
+) -> tuple[dict[str, Any], str, str | None]:
+    total = sum(counts.values())
+    data: dict[str, Any] = {
+        "window": window,
+        "total": total,
+        "counts": dict(sorted(counts.items())),
+        "shares": {
+            department: round(count / total, 4)
+            for department, count in sorted(counts.items())
+        },
+        "top_department": None,
+        "top_share": 0.0,
+    }
+    if not total:
+        return data, INFO, None
+    department, count = max(counts.items(), key=lambda item: (item[1], item[0]))
+    share = count / total
+    data["top_department"] = department
+    data["top_share"] = round(share, 4)
+    if total < MIN_DISTRIBUTION_SAMPLE:
+        return data, INFO, None
+    level = _level(share, DEPARTMENT_SHARE_LEVELS)
+    if level == INFO:
+        return data, level, None
+    span = window[0] if len(window) == 1 else f"{window[0]}..{window[-1]}"
+    message = f"{department} holds {share:.0%} of {label} in {span} ({count}/{total})"
+    return data, level, message
+
+
+def _award_distribution(
+    session: Session,
+    periods: list[str],
+) -> dict[str, tuple[dict[str, Any], str, str | None]]:
+    windows = {
+        period: months_back(period, DISTRIBUTION_WINDOW_MONTHS) for period in periods
+    }
+    months = {month for window in windows.values() for month in window}
+    by_month: dict[str, dict[str, int]] = defaultdict(dict)
+    for month, department, count in session.execute(
+        select(_award.c.award_period, _award.c.department, func.count())
+        .where(_award.c.award_period.in_(months))
+        .group_by(_award.c.award_period, _award.c.department),
+    ):
+        by_month[month][department] = count
+
+    computed = {}
+    for period, window in windows.items():
+        counts: dict[str, int] = defaultdict(int)
+        for month in window:
+            for department, count in by_month[month].items():
+                counts[department] += count
+        computed[period] = _distribution(counts, "awards", window)
+    return computed
+
+
+def _nomination_distribution(
+    session: Session,
+    periods: list[str],
+) -> dict[str, tuple[dict[str, Any], str, str | None]]:
+    by_period: dict[str, dict[str, int]] = defaultdict(dict)
+    for period, department, count in session.execute(
+        select(
+            _nomination.c.nomination_period,
+            _nomination.c.nominee_department,
+            func.count(),
+        )
+        .where(_nomination.c.nomination_period.in_(periods))
+        .group_by(_nomination.c.nomination_period, _nomination.c.nominee_department),
+    ):
+        by_period[period][department] = count
+    return {
+        period: _distribution(by_period[period], "nominations", [period])
+        for period in periods
+    }
+
+
+def _rater_variance(
+    session: Session,
+    periods: list[str],
+) -> dict[str, tuple[dict[str, Any], str, str | None]]:
+    score = _rating.c.average_score
+    count = func.count()
+    per_evaluee = (
+        select(
+            _cycle.c.cycle_period.label("period"),
+            _rating.c.cycle_id,
+            _rating.c.evaluee_id,
+            count.label("ratings"),
+            func.avg(score).label("mean"),
+            (
+                (func.sum(score * score) - func.sum(score) * func.sum(score) / count)
+                / (count - 1)
+            ).label("variance"),
+        )
+        .join(_cycle, _cycle.c.id == _rating.c.cycle_id)
+        .where(_cycle.c.cycle_period.in_(periods))
+        .group_by(_cycle.c.cycle_period, _rating.c.cycle_id, _rating.c.evaluee_id)
+        .having(count > 1)
+        .subquery()
+    )
+    variance = per_evaluee.c.variance
+    moderate = and_(variance >= MODERATE_SIGMA**2, variance < HIGH_SIGMA**2)
+    summary = session.execute(
+        select(
+            per_evaluee.c.period,
+            func.count(),
+            func.sum(case((moderate, 1), else_=0)),
+            func.sum(case((variance >= HIGH_SIGMA**2, 1), else_=0)),
+            func.max(variance),
+        ).group_by(per_evaluee.c.period),
+    )
+    outliers: dict[str, int] = dict(
+        session.execute(
+            select(per_evaluee.c.period, func.count())
+            .select_from(_rating)
+            .join(
+                per_evaluee,
+                and_(
+                    per_evaluee.c.cycle_id == _rating.c.cycle_id,
+                    per_evaluee.c.evaluee_id == _rating.c.evaluee_id,
+                ),
+            )
+            .where(
+                variance > 0,
+                (score - per_evaluee.c.mean) * (score - per_evaluee.c.mean)
+                > literal(OUTLIER_SIGMAS**2) * variance,
+            )
+            .group_by(per_evaluee.c.period),
+        ).all(),
+    )
+    flagged: dict[str, list[str]] = defaultdict(list)
+    for period, evaluee_id in session.execute(
+        select(per_evaluee.c.period, per_evaluee.c.evaluee_id)
+        .where(variance >= HIGH_SIGMA**2)
+        .order_by(per_evaluee.c.period, variance.desc()),
+    ):
+        if len(flagged[period]) < MAX_LISTED_EVALUEES:
+            flagged[period].append(str(evaluee_id))
+
+    computed: dict[str, tuple[dict[str, Any], str, str | None]] = {}
+    for period, evaluees, moderate_count, high_count, max_variance in summary:
+        high_count = high_count or 0
+        data = {
+            "evaluees": evaluees,
+            "moderate": moderate_count or 0,
+            "high": high_count,
+            "outlier_ratings": outliers.get(period, 0),
+            "max_sigma": round(math.sqrt(max(max_variance or 0.0, 0.0)), 4),
+            "high_evaluee_ids": flagged[period],
+        }
+        level, message = INFO, None
+        if high_count:
+            share = high_count / evaluees
+            level = CRITICAL if share >= HIGH_SIGMA_CRITICAL_SHARE else WARNING
+            message = (
+                f"{high_count} of {evaluees} evaluees in {period} have a rater "
+                f"standard deviation of {HIGH_SIGMA} or more"
+            )
+        computed[period] = (data, level, message)
+
+    empty = {
+        "evaluees": 0,
+        "moderate": 0,
+        "high": 0,
+        "outlier_ratings": 0,
+        "max_sigma": 0.0,
+        "high_evaluee_ids": [],
+    }
+    for period in periods:
+        computed.setdefault(period, (dict(empty), INFO, None))
+    return computed
+
+
+def _high_variance_share(
+    session: Session,
+    periods: list[str],
+) -> dict[str, tuple[dict[str, Any], str, str | None]]:
+    totals = {
+        period: (results, flagged or 0)
+        for period, results, flagged in session.execute(
+            select(
+                _cycle.c.cycle_period,
+                func.count(),
+                func.sum(_result.c.has_high_variance),
+            )
+            .join(_cycle, _cycle.c.id == _result.c.cycle_id)
+            .where(_cycle.c.cycle_period.in_(periods))
+            .group_by(_cycle.c.cycle_period),
+        )
+    }
+    computed = {}
+    for period in periods:
+        results, flagged = totals.get(period, (0, 0))
+        share = flagged / results if results else 0.0
+        level = _level(share, HIGH_VARIANCE_SHARE_LEVELS)
+        message = None
+        if level != INFO:
+            message = (
+                f"{share:.0%} of results in {period} have high variance "
+                f"({flagged}/{results})"
+            )
+        data = {"results": results, "high_variance": flagged, "share": round(share, 4)}
+        computed[period] = (data, level, message)
+    return computed
+
+
+_COMPUTE = {
+    AWARD_DISTRIBUTION: _award_distribution,
+    NOMINATION_DISTRIBUTION: _nomination_distribution,
+    RATER_VARIANCE: _rater_variance,
+    HIGH_VARIANCE_SHARE: _high_variance_share,
+}
+
+
+def _stored_inputs(metric: Any) -> Any:
+    if metric is None:
+        return None
+    return (metric.metadata_ or {}).get("inputs")
+
+
+def compute_fairness(
+    session: Session,
+    periods: Iterable[str] | None = None,
+    incremental: bool = False,
+    now: datetime | None = None,
+) -> FairnessReport:
+    """Compute and store every fairness metric for ``periods``.
+
+    Without ``periods`` every period with awards, nominations, ratings
+    or results is covered. With ``incremental`` only metrics whose
+    inputs changed since they were last stored are recomputed. A row
+    whose ``alert_level`` changes is reopened. The caller commits.
+    """
+
+    now = now or datetime.now(UTC)
+    requested = sorted(set(periods)) if periods is not None else None
+    fingerprints = _source_fingerprints(session, requested)
+    if requested is None:
+        # Yearly award periods ("YYYY") have no monthly metrics.
+        requested = sorted(
+            {
+                period
+                for source in fingerprints.values()
+                for period in source
+                if len(period) == len("YYYY-MM")
+            },
+        )
+    report = FairnessReport()
+    if not requested:
+        return report
+
+    existing: dict[tuple[str, str], FairnessMetric] = {}
+    for stored in session.scalars(
+        select(FairnessMetric)
+        .where(
+            FairnessMetric.metric_type.in_(METRIC_TYPES),
+            FairnessMetric.period.in_(requested),
+        )
+        .order_by(FairnessMetric.created_at),
+    ):
+        existing[(stored.metric_type, stored.period)] = stored
+
+    for metric_type in METRIC_TYPES:
+        inputs = {
+            period: _inputs(metric_type, period, fingerprints) for period in requested
+        }
+        stale = [
+            period
+            for period in requested
+            if not incremental
+            or _stored_inputs(existing.get((metric_type, period))) != inputs[period]
+        ]
+        if not stale:
+            continue
+        for period, (data, level, message) in _COMPUTE[metric_type](
+            session,
+            stale,
+        ).items():
+            metadata = {"inputs": inputs[period], "computed_at": now.isoformat()}
+            metric: Any = existing.get((metric_type, period))
+            if metric is None:
+                metric = FairnessMetric(
+                    metric_type=metric_type,
+                    period=period,
+                    resolved=0,
+                    created_at=now,
+                )
+                session.add(metric)
+            elif metric.alert_level != level:
+                metric.resolved = 0
+                metric.resolved_at = None
+                metric.resolved_by = None
+            metric.metric_data = data
+            metric.alert_level = level
+            metric.alert_message = message
+            metric.metadata_ = metadata
+            if level != INFO:
+                report.alerts += 1
+        report.computed[metric_type] = stale
+    session.flush()
+    return report
@@ -0,0 +1,152 @@
+"""Switch SQLite GUID storage between ``CHAR(36)`` text and 16-byte BLOBs.
+
+``GUID`` binds and reads values according to ``GUID_STORAGE`` alone, so the
+stored data has to match it. Revision ``202610170002`` converts only when
+the variable is set while that revision runs, and only the tables that
+existed then. ``convert_guid_storage`` rewrites every GUID column of the
+current schema, audit period tables included, and is safe to re-run after
+an interruption. ``check_guid_storage`` runs on an engine's first SQLite
+connection, so a database stored in the other format refuses to open
+instead of silently missing every lookup.
+
+Values are rewritten in place with one ``UPDATE`` per table in a single
+transaction. Declared column types are left as they are, since SQLite keeps
+either form in either column. Recreating the tables would also drop the
+enrollment search triggers. The search index copies application ids, so it
+is rebuilt afterwards.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any
+
+from sqlalchemy import Engine
+
+from ..database import Base
+from ..models.enrollment import ENROLLMENT_SEARCH_FTS
+from ..models.types import (
+    GUID,
+    GUID_STORAGE_BINARY,
+    GUID_STORAGE_CHAR,
+    GUID_STORAGE_ENV,
+    binary_guid_storage,
+)
+from .audit import PARTITION_PATTERN, period_table
+from .enrollment_search import rebuild_search_index
+
+CONVERT_COMMAND = "backend/scripts/convert_guid_storage.py"
+
+_SQLITE_TYPES = {"text": GUID_STORAGE_CHAR, "blob": GUID_STORAGE_BINARY}
+
+
+class GuidStorageError(RuntimeError):
+    """Raised when stored GUIDs do not match ``GUID_STORAGE``."""
+
+
+def _rows(dbapi_connection: Any, statement: str) -> list[Any]:
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(statement)
+        return list(cursor.fetchall())
+    finally:
+        cursor.close()
+
+
+def _table_names(dbapi_connection: Any) -> list[str]:
+    return [
+        name
+        for (name,) in _rows(
+            dbapi_connection,
+            "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name",
+        )
+    ]
+
+
+def guid_columns(dbapi_connection: Any) -> dict[str, tuple[str, ...]]:
+    """GUID columns of every existing table, audit period tables included."""
+
+    columns: dict[str, tuple[str, ...]] = {}
+    for name in _table_names(dbapi_connection):
+        table = Base.metadata.tables.get(name)
+        if table is None and PARTITION_PATTERN.match(name):
+            table = period_table(name)
+        if table is None:
+            continue
+        guids = tuple(
+            column.name for column in table.columns if isinstance(column.type, GUID)
+        )
+        if guids:
+            columns[name] = guids
+    return columns
+
+
+def stored_guid_storage(dbapi_connection: Any) -> set[str]:
+    """Storage formats found by sampling one GUID per table."""
+
+    found: set[str] = set()
+    for table, columns in guid_columns(dbapi_connection).items():
+        for (kind,) in _rows(
+            dbapi_connection,
+            f"SELECT typeof({columns[0]}) FROM {table} "  # noqa: S608
+            f"WHERE {columns[0]} IS NOT NULL LIMIT 1",
+        ):
+            found.add(_SQLITE_TYPES.get(kind, kind))
+    return found
+
+
+def check_guid_storage(dbapi_connection: Any) -> None:
+    """Refuse a SQLite database whose GUIDs disagree with ``GUID_STORAGE``."""
+
+    expected = GUID_STORAGE_BINARY if binary_guid_storage() else GUID_STORAGE_CHAR
+    stored = stored_guid_storage(dbapi_connection)
+    if stored - {expected}:
+        raise GuidStorageError(
+            f"database stores GUIDs as {', '.join(sorted(stored))} but "
+            f"{GUID_STORAGE_ENV}={expected}; run {CONVERT_COMMAND} first",
+        )
+
+
+def _guid_to_blob(value: object) -> object:
+    return uuid.UUID(value).bytes if isinstance(value, str) else value
+
+
+def _blob_to_guid(value: object) -> object:
+    return str(uuid.UUID(bytes=bytes(value))) if isinstance(value, bytes) else value
+
+
+def convert_guid_storage(engine: Engine, binary: bool) -> dict[str, int]:
+    """Rewrite every stored GUID as BLOB or text; return rows changed per table.
+
+    Only rows still in the other format are touched, so a second run after
+    an interruption finishes the job.
+    """
+
+    if engine.dialect.name != "sqlite":
+        raise ValueError("GUID storage conversion only applies to SQLite")
+    function = "ese_guid_to_blob" if binary else "ese_blob_to_guid"
+    source = "text" if binary else "blob"
+    converted: dict[str, int] = {}
+    with engine.begin() as connection:
+        dbapi_connection: Any = connection.connection.driver_connection
+        dbapi_connection.create_function(
+            function,
+            1,
+            _guid_to_blob if binary else _blob_to_guid,
+            deterministic=True,
+        )
+        tables = guid_columns(dbapi_connection)
+        for table, columns in tables.items():
+            assignments = ", ".join(
+                f"{column} = {function}({column})" for column in columns
+            )
+            pending = " OR ".join(
+                f"typeof({column}) = '{source}'" for column in columns
+            )
+            result = connection.exec_driver_sql(
+                f"UPDATE {table} SET {assignments} WHERE {pending}",  # noqa: S608
+            )
+            converted[table] = result.rowcount
+        if ENROLLMENT_SEARCH_FTS in _table_names(dbapi_connection):
+            rebuild_search_index(connection)
+    return converted
@@ -0,0 +1,362 @@
+"""Incremental maintenance of evaluation results as ratings are submitted."""
+
+from __future__ import annotations
+
+import math
+import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, NamedTuple
+
+from sqlalchemy import Row, Table, case, delete, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from ..models.evaluation import (
+    EvaluationCycle,
+    EvaluationRating,
+    EvaluationResult,
+    EvaluationScoreStats,
+    EvaluatorRole,
+)
+from .aggregation import (
+    ROLE_SCORE_COLUMNS,
+    RatingStats,
+    aggregate_cycle,
+    completion_percentage,
+    load_evaluees,
+    load_rating_stats,
+    summarise,
+)
+
+RESULT_COLUMNS = (
+    *ROLE_SCORE_COLUMNS.values(),
+    "final_score",
+    "received_ratings",
+    "score_variance",
+    "has_high_variance",
+)
+
+_stats: Table = EvaluationScoreStats.__table__  # type: ignore[assignment]
+_results: Table = EvaluationResult.__table__  # type: ignore[assignment]
+
+
+class _RatingKey(NamedTuple):
+    cycle_id: uuid.UUID
+    evaluee_id: uuid.UUID
+    evaluator_role: EvaluatorRole
+
+
+@dataclass(frozen=True, slots=True)
+class ReconciliationReport:
+    """Differences between incremental state and a from-scratch rebuild."""
+
+    cycle_id: uuid.UUID
+    checked: int
+    stale_stats: list[tuple[uuid.UUID, EvaluatorRole]] = field(default_factory=list)
+    stale_results: list[uuid.UUID] = field(default_factory=list)
+    completed_evaluations_drift: int = 0
+    repaired: bool = False
+
+    @property
+    def consistent(self) -> bool:
+        return (
+            not self.stale_stats
+            and not self.stale_results
+            and self.completed_evaluations_drift == 0
+        )
+
+
+def _stats_from_row(row: Mapping[Any, Any]) -> RatingStats:
+    return RatingStats(
+        count=row["rating_count"],
+        total=row["score_sum"],
+        total_sq=row["score_sum_sq"],
+        weighted_total=row["weighted_score_sum"],
+        weight_total=row["weight_sum"],
+        minimum=row["score_min"],
+        maximum=row["score_max"],
+    )
+
+
+def _close(left: Any, right: Any) -> bool:
+    if left is None or right is None:
+        return left is right
+    return math.isclose(left, right, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def _stats_match(left: RatingStats, right: RatingStats) -> bool:
+    return left.count == right.count and all(
+        _close(getattr(left, name), getattr(right, name))
+        for name in (
+            "total",
+            "total_sq",
+            "weighted_total",
+            "weight_total",
+            "minimum",
+            "maximum",
+        )
+    )
+
+
+def _upsert(session: Session, table: Table) -> Any:
+    # INSERT ... ON CONFLICT, which both supported backends spell the same.
+    if session.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
+
+
+def _bump_stats(
+    session: Session,
+    rating: _RatingKey,
+    score: float,
+    weight: float,
+) -> None:
+    """Fold one rating into its stats row with a single atomic upsert."""
+
+    session.execute(
+        _upsert(session, _stats)
+        .values(
+            id=uuid.uuid4(),
+            cycle_id=rating.cycle_id,
+            evaluee_id=rating.evaluee_id,
+            evaluator_role=rating.evaluator_role,
+            rating_count=1,
+            score_sum=score,
+            score_sum_sq=score * score,
+            weighted_score_sum=score * weight,
+            weight_sum=weight,
+            score_min=score,
+            score_max=score,
+            updated_at=datetime.now(UTC),
+        )
+        .on_conflict_do_update(
+            index_elements=["cycle_id", "evaluee_id", "evaluator_role"],
+            set_={
+                "rating_count": _stats.c.rating_count + 1,
+                "score_sum": _stats.c.score_sum + score,
+                "score_sum_sq": _stats.c.score_sum_sq + score * score,
+                "weighted_score_sum": _stats.c.weighted_score_sum + score * weight,
+                "weight_sum": _stats.c.weight_sum + weight,
+                "score_min": case(
+                    (
+                        _stats.c.score_min.is_(None) | (_stats.c.score_min > score),
+                        score,
+                    ),
+                    else_=_stats.c.score_min,
+                ),
+                "score_max": case(
+                    (
+                        _stats.c.score_max.is_(None) | (_stats.c.score_max < score),
+                        score,
+                    ),
+                    else_=_stats.c.score_max,
+                ),
+                "updated_at": datetime.now(UTC),
+            },
+        ),
+    )
+
+
+def _load_stats(
+    session: Session,
+    cycle_id: uuid.UUID,
+    evaluee_id: uuid.UUID | None = None,
+) -> dict[uuid.UUID, dict[EvaluatorRole, RatingStats]]:
+    stmt = select(_stats).where(_stats.c.cycle_id == cycle_id)
+    if evaluee_id is not None:
+        stmt = stmt.where(_stats.c.evaluee_id == evaluee_id)
+
+    grouped: dict[uuid.UUID, dict[EvaluatorRole, RatingStats]] = {}
+    for row in session.execute(stmt).mappings():
+        by_role = grouped.setdefault(row["evaluee_id"], {})
+        by_role[row["evaluator_role"]] = _stats_from_row(row)
+    return grouped
+
+
+def _rating_key(rating: Any) -> _RatingKey:
+    return _RatingKey(rating.cycle_id, rating.evaluee_id, rating.evaluator_role)
+
+
+def _lock_result(session: Session, rating: _RatingKey) -> Row[Any, Any] | None:
+    return session.execute(
+        select(_results.c.id, _results.c.total_expected_ratings)
+        .where(
+            _results.c.cycle_id == rating.cycle_id,
+            _results.c.evaluee_id == rating.evaluee_id,
+        )
+        .with_for_update(),
+    ).first()
+
+
+def record_rating(session: Session, rating: EvaluationRating) -> EvaluationResult:
+    """Apply a newly submitted rating to the evaluee's result in O(1).
+
+    The evaluee's result row is locked first so concurrent submissions for
+    the same person serialise; a first rating inserts an empty result with
+    ``ON CONFLICT DO NOTHING`` and then locks whichever row won. The role's
+    running moments are bumped with one upsert and the result is
+    recomputed from at most one stats row per role. The cycle's completion
+    counter is incremented in SQL through
+    ``EvaluationCycle.update_completion_count``. The caller owns the
+    transaction.
+    """
+
+    session.add(rating)
+    session.flush()
+    key = _rating_key(rating)
+    now = datetime.now(UTC)
+
+    locked = _lock_result(session, key)
+    if locked is None:
+        info = load_evaluees(session, key.cycle_id, key.evaluee_id).get(key.evaluee_id)
+        if info is None:
+            raise ValueError(
+                f"Evaluee {key.evaluee_id} has no assignment in cycle {key.cycle_id}",
+            )
+        session.execute(
+            _upsert(session, _results)
+            .values(
+                id=uuid.uuid4(),
+                cycle_id=key.cycle_id,
+                evaluee_id=key.evaluee_id,
+                evaluee_name=info.name,
+                evaluee_department=info.department,
+                evaluee_staff_type=info.staff_type,
+                total_expected_ratings=info.expected_ratings,
+                completion_percentage=0.0,
+                calculated_at=now,
+                **summarise({}),
+            )
+            .on_conflict_do_nothing(index_elements=["cycle_id", "evaluee_id"]),
+        )
+        locked = _lock_result(session, key)
+        assert locked is not None
+    result_id: uuid.UUID = locked[0]
+    expected: int = locked[1]
+
+    _bump_stats(session, key, float(rating.average_score), float(rating.weight))
+    stats_by_role = _load_stats(session, key.cycle_id, key.evaluee_id).get(
+        key.evaluee_id,
+        {},
+    )
+    values = summarise(stats_by_role)
+    values["calculated_at"] = now
+    values["completion_percentage"] = completion_percentage(
+        values["received_ratings"],
+        expected,
+    )
+    session.execute(
+        update(_results).where(_results.c.id == result_id).values(**values),
+    )
+
+    cycle = session.get(EvaluationCycle, key.cycle_id)
+    if cycle is not None:
+        cycle.update_completion_count()
+
+    result = session.get(EvaluationResult, result_id, populate_existing=True)
+    assert result is not None
+    return result
+
+
+def reconcile_cycle(
+    session: Session,
+    cycle_id: uuid.UUID,
+    repair: bool = False,
+) -> ReconciliationReport:
+    """Compare incremental state for a cycle against a full rebuild.
+
+    With ``repair`` the stats rows are replaced by the rebuilt moments, the
+    results are re-aggregated and the completion counter is reset to the
+    number of ratings.
+    """
+
+    rebuilt = load_rating_stats(session, cycle_id)
+    stored = _load_stats(session, cycle_id)
+
+    stale_stats: list[tuple[uuid.UUID, EvaluatorRole]] = []
+    for evaluee_id in rebuilt.keys() | stored.keys():
+        expected_roles = rebuilt.get(evaluee_id, {})
+        stored_roles = stored.get(evaluee_id, {})
+        for role in expected_roles.keys() | stored_roles.keys():
+            left = expected_roles.get(role)
+            right = stored_roles.get(role)
+            if left is None or right is None or not _stats_match(left, right):
+                stale_stats.append((evaluee_id, role))
+
+    stale_results: list[uuid.UUID] = []
+    result_columns = [getattr(EvaluationResult, column) for column in RESULT_COLUMNS]
+    results = session.execute(
+        select(EvaluationResult.evaluee_id, *result_columns).where(
+            EvaluationResult.cycle_id == cycle_id,
+        ),
+    ).all()
+    seen: set[uuid.UUID] = set()
+    for row in results:
+        evaluee_id, *actual = row
+        seen.add(evaluee_id)
+        expected = summarise(rebuilt.get(evaluee_id, {}))
+        if not all(
+            _close(value, expected[column])
+            for column, value in zip(RESULT_COLUMNS, actual, strict=True)
+        ):
+            stale_results.append(evaluee_id)
+    stale_results.extend(evaluee_id for evaluee_id in rebuilt if evaluee_id not in seen)
+
+    rating_count = session.scalar(
+        select(func.count()).where(EvaluationRating.cycle_id == cycle_id),
+    )
+    completed = session.scalar(
+        select(EvaluationCycle.completed_evaluations).where(
+            EvaluationCycle.id == cycle_id,
+        ),
+    )
+    drift = (completed or 0) - (rating_count or 0)
+
+    report = ReconciliationReport(
+        cycle_id=cycle_id,
+        checked=len(rebuilt),
+        stale_stats=stale_stats,
+        stale_results=stale_results,
+        completed_evaluations_drift=drift,
+    )
+    if not repair or report.consistent:
+        return report
+
+    session.execute(
+        delete(EvaluationScoreStats).where(EvaluationScoreStats.cycle_id == cycle_id),
+    )
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "cycle_id": cycle_id,
+            "evaluee_id": evaluee_id,
+            "evaluator_role": role,
+            "rating_count": stats.count,
+            "score_sum": stats.total,
+            "score_sum_sq": stats.total_sq,
+            "weighted_score_sum": stats.weighted_total,
+            "weight_sum": stats.weight_total,
+            "score_min": stats.minimum,
+            "score_max": stats.maximum,
+        }
+        for evaluee_id, stats_by_role in rebuilt.items()
+        for role, stats in stats_by_role.items()
+    ]
+    if rows:
+        session.execute(insert(EvaluationScoreStats), rows)
+    aggregate_cycle(session, cycle_id)
+    session.execute(
+        update(EvaluationCycle)
+        .where(EvaluationCycle.id == cycle_id)
+        .values(completed_evaluations=rating_count or 0),
+    )
+    return ReconciliationReport(
+        cycle_id=cycle_id,
+        checked=report.checked,
+        stale_stats=stale_stats,
+        stale_results=stale_results,
+        completed_evaluations_drift=drift,
+        repaired=True,
+    )
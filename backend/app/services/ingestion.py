@@ -0,0 +1,299 @@
+"""Bulk ingestion of evaluation ratings from spreadsheets and API uploads."""
+
+from __future__ import annotations
+
+import math
+import time
+import uuid
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from itertools import islice
+from typing import Any
+
+from sqlalchemy import Select, Table, insert, select
+from sqlalchemy.orm import Session
+
+from ..models.evaluation import Evaluation, EvaluationRating, EvaluatorRole, StaffType
+
+DEFAULT_BATCH_SIZE = 5_000
+MAX_REPORTED_ERRORS = 1_000
+MIN_SCORE = 1.0
+MAX_SCORE = 10.0
+
+ACADEMIC_CRITERIA = (
+    "teaching_effectiveness",
+    "student_engagement",
+    "curriculum_implementation",
+    "classroom_management",
+)
+ADMINISTRATIVE_CRITERIA = (
+    "task_management",
+    "policy_adherence",
+    "interdepartmental_communication",
+    "service_quality",
+)
+COMMON_CRITERIA = (
+    "collaboration",
+    "innovation",
+    "attendance",
+    "professional_development",
+)
+STAFF_CRITERIA: dict[StaffType, tuple[str, ...]] = {
+    StaffType.ACADEMIC: ACADEMIC_CRITERIA,
+    StaffType.ADMINISTRATIVE: ADMINISTRATIVE_CRITERIA,
+}
+TEXT_FIELDS = ("strengths", "improvements", "comments")
+ASSIGNMENT_FIELDS = (
+    "cycle_id",
+    "evaluator_id",
+    "evaluator_role",
+    "evaluee_id",
+    "weight",
+)
+
+# Column order shared by the COPY and executemany writers.
+INGEST_COLUMNS = (
+    "id",
+    "evaluation_id",
+    *ASSIGNMENT_FIELDS,
+    *ACADEMIC_CRITERIA,
+    *ADMINISTRATIVE_CRITERIA,
+    *COMMON_CRITERIA,
+    "average_score",
+    *TEXT_FIELDS,
+    "submitted_at",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class IngestionError:
+    """A rejected input record and the reason it was rejected."""
+
+    index: int
+    message: str
+
+
+@dataclass(slots=True)
+class IngestionReport:
+    """Running totals for one ingestion run."""
+
+    accepted: int = 0
+    rejected: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+    errors: list[IngestionError] = field(default_factory=list)
+    cycle_ids: set[uuid.UUID] = field(default_factory=set)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.accepted / self.seconds if self.seconds else 0.0
+
+    def reject(self, index: int, message: str) -> None:
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(IngestionError(index=index, message=message))
+
+
+@dataclass(frozen=True, slots=True)
+class _Assignment:
+    cycle_id: uuid.UUID
+    evaluator_id: uuid.UUID
+    evaluator_role: EvaluatorRole
+    evaluee_id: uuid.UUID
+    weight: float
+    staff_type: StaffType
+
+
+def _batches(
+    records: Iterable[Mapping[str, Any]],
+    size: int,
+) -> Iterator[list[tuple[int, Mapping[str, Any]]]]:
+    iterator = enumerate(records)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _as_uuid(value: Any) -> uuid.UUID:
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
+
+def _score(record: Mapping[str, Any], name: str) -> float | None:
+    value = record.get(name)
+    if value is None or value == "":
+        return None
+    score = float(value)
+    if math.isnan(score) or not MIN_SCORE <= score <= MAX_SCORE:
+        raise ValueError(f"{name} must be between {MIN_SCORE:g} and {MAX_SCORE:g}")
+    return score
+
+
+def _load_assignments(
+    session: Session,
+    evaluation_ids: Iterable[uuid.UUID],
+) -> dict[uuid.UUID, _Assignment]:
+    stmt: Select[*tuple[Any, ...]] = select(
+        Evaluation.id,
+        Evaluation.cycle_id,
+        Evaluation.evaluator_id,
+        Evaluation.evaluator_role,
+        Evaluation.evaluee_id,
+        Evaluation.weight,
+        Evaluation.evaluee_staff_type,
+    ).where(Evaluation.id.in_(list(evaluation_ids)))
+    return {row[0]: _Assignment(*row[1:]) for row in session.execute(stmt)}
+
+
+def _load_rated(
+    session: Session,
+    evaluation_ids: Iterable[uuid.UUID],
+) -> set[uuid.UUID]:
+    return set(
+        session.scalars(
+            select(EvaluationRating.evaluation_id)
+            .where(EvaluationRating.evaluation_id.in_(list(evaluation_ids)))
+            .distinct(),
+        ),
+    )
+
+
+def validate_record(
+    record: Mapping[str, Any],
+    assignment: _Assignment,
+    submitted_at: datetime,
+) -> dict[str, Any]:
+    """Check a record against its assignment and build the row to insert.
+
+    Assignment fields in the record are optional but must agree with the
+    ``Evaluation`` row. The evaluee's ``StaffType`` decides which
+    role-specific criteria are required; the other set must be empty.
+    """
+
+    row: dict[str, Any] = {"id": uuid.uuid4(), "submitted_at": submitted_at}
+    for name in ASSIGNMENT_FIELDS:
+        expected = getattr(assignment, name)
+        supplied = record.get(name)
+        if supplied is not None:
+            if name == "weight":
+                matches = math.isclose(float(supplied), expected)
+            elif name == "evaluator_role":
+                matches = EvaluatorRole(supplied) is expected
+            else:
+                matches = _as_uuid(supplied) == expected
+            if not matches:
+                raise ValueError(f"{name} does not match the evaluation assignment")
+        row[name] = expected
+
+    required = STAFF_CRITERIA[assignment.staff_type] + COMMON_CRITERIA
+    scores: list[float] = []
+    for name in required:
+        score = _score(record, name)
+        if score is None:
+            raise ValueError(
+                f"{name} is required for {assignment.staff_type.value} staff",
+            )
+        row[name] = score
+        scores.append(score)
+    for staff_type, criteria in STAFF_CRITERIA.items():
+        if staff_type is assignment.staff_type:
+            continue
+        for name in criteria:
+            if _score(record, name) is not None:
+                raise ValueError(
+                    f"{name} does not apply to {assignment.staff_type.value} staff",
+                )
+            row[name] = None
+
+    row["average_score"] = sum(scores) / len(scores)
+    for name in TEXT_FIELDS:
+        value = record.get(name)
+        row[name] = str(value) if value not in (None, "") else None
+    return row
+
+
+def _write_copy(session: Session, rows: list[dict[str, Any]]) -> None:
+    """Stream rows into PostgreSQL with ``COPY ... FROM STDIN``."""
+
+    driver_connection: Any = session.connection().connection.driver_connection
+    columns = ", ".join(INGEST_COLUMNS)
+    statement = f"COPY {EvaluationRating.__tablename__} ({columns}) FROM STDIN"
+    with driver_connection.cursor() as cursor, cursor.copy(statement) as copy:
+        for row in rows:
+            copy.write_row(
+                tuple(
+                    row[name].name if name == "evaluator_role" else row[name]
+                    for name in INGEST_COLUMNS
+                ),
+            )
+
+
+def _write_executemany(session: Session, rows: list[dict[str, Any]]) -> None:
+    ratings: Table = EvaluationRating.__table__  # type: ignore[assignment]
+    session.execute(insert(ratings), rows)
+
+
+def ingest_ratings(
+    session: Session,
+    records: Iterable[Mapping[str, Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    use_copy: bool | None = None,
+) -> IngestionReport:
+    """Validate and insert rating records in bounded batches.
+
+    ``records`` may be any iterable, including a lazily parsed file; at most
+    ``batch_size`` records are held in memory at a time. Each batch resolves
+    its assignments with one query and is written with ``COPY`` on
+    PostgreSQL or a single ``executemany`` insert elsewhere. Invalid records
+    are reported and skipped, as are second ratings for an evaluation,
+    whether repeated in the input or already stored; earlier batches are
+    written in the same transaction, so the stored check also catches
+    repeats across batches. The caller owns the transaction and should run
+    ``aggregate_cycle`` for ``report.cycle_ids`` afterwards.
+    """
+
+    if use_copy is None:
+        use_copy = session.get_bind().dialect.name == "postgresql"
+    write = _write_copy if use_copy else _write_executemany
+
+    report = IngestionReport()
+    started = time.perf_counter()
+    submitted_at = datetime.now(UTC)
+    for batch in _batches(records, batch_size):
+        evaluation_ids: dict[int, uuid.UUID] = {}
+        for index, record in batch:
+            try:
+                evaluation_ids[index] = _as_uuid(record["evaluation_id"])
+            except (KeyError, TypeError, ValueError):
+                report.reject(index, "evaluation_id is missing or not a UUID")
+        assignments = _load_assignments(session, set(evaluation_ids.values()))
+        rated = _load_rated(session, set(evaluation_ids.values()))
+
+        rows: list[dict[str, Any]] = []
+        for index, record in batch:
+            evaluation_id = evaluation_ids.get(index)
+            if evaluation_id is None:
+                continue
+            assignment = assignments.get(evaluation_id)
+            if assignment is None:
+                report.reject(index, f"evaluation {evaluation_id} does not exist")
+                continue
+            if evaluation_id in rated:
+                report.reject(index, f"evaluation {evaluation_id} is already rated")
+                continue
+            try:
+                row = validate_record(record, assignment, submitted_at)
+            except (TypeError, ValueError) as exc:
+                report.reject(index, str(exc))
+                continue
+            row["evaluation_id"] = evaluation_id
+            rows.append(row)
+            rated.add(evaluation_id)
+            report.cycle_ids.add(assignment.cycle_id)
+
+        if rows:
+            write(session, rows)
+        report.accepted += len(rows)
+        report.batches += 1
+
+    report.seconds = time.perf_counter() - started
+    return report
@@ -0,0 +1,164 @@
+"""List queries with named relationship loading profiles.
+
+Every relationship on the evaluation and recognition models is a lazy
+many-to-one, so touching ``rating.evaluation`` inside a loop issues one
+``SELECT`` per row. A ``LoadingProfile`` names the eager strategy for a use
+case: ``joinedload`` where each row has its own target (a rating's
+evaluation, an award's nomination), ``selectinload`` where many rows share
+a few targets (the cycle), and ``raiseload("*")`` on everything else so a
+relationship the profile did not plan for fails loudly instead of
+querying. The ``list_*`` functions page with ``keyset_page`` and always
+run a fixed number of statements, whatever the page size.
+"""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlalchemy.sql import Select
+
+from ..models.evaluation import Evaluation, EvaluationRating, EvaluationResult
+from ..models.recognition import (
+    Award,
+    Nomination,
+    NominationCategory,
+    NominationStatus,
+    Vote,
+)
+from .pagination import DEFAULT_PAGE_SIZE, Page, keyset_page
+
+
+@dataclass(frozen=True, slots=True)
+class LoadingProfile:
+    """Loader options for one entity in one use case."""
+
+    entity: type[Any]
+    options: tuple[ORMOption, ...]
+
+    def apply(self, stmt: Select[Any]) -> Select[Any]:
+        return stmt.options(*self.options)
+
+
+LOADING_PROFILES: dict[str, LoadingProfile] = {
+    "evaluation.bare": LoadingProfile(Evaluation, (raiseload("*"),)),
+    "evaluation.with_cycle": LoadingProfile(
+        Evaluation,
+        (selectinload(Evaluation.cycle), raiseload("*")),
+    ),
+    "rating.bare": LoadingProfile(EvaluationRating, (raiseload("*"),)),
+    # Each rating has its own evaluation; the whole page shares one cycle.
+    "rating.with_evaluation": LoadingProfile(
+        EvaluationRating,
+        (
+            joinedload(EvaluationRating.evaluation).raiseload("*"),
+            selectinload(EvaluationRating.cycle),
+            raiseload("*"),
+        ),
+    ),
+    "result.bare": LoadingProfile(EvaluationResult, (raiseload("*"),)),
+    "result.with_cycle": LoadingProfile(
+        EvaluationResult,
+        (selectinload(EvaluationResult.cycle), raiseload("*")),
+    ),
+    "nomination.bare": LoadingProfile(Nomination, (raiseload("*"),)),
+    "vote.with_nomination": LoadingProfile(
+        Vote,
+        (selectinload(Vote.nomination), raiseload("*")),
+    ),
+    "award.with_nomination": LoadingProfile(
+        Award,
+        (joinedload(Award.nomination), raiseload("*")),
+    ),
+}
+
+
+def get_loading_profile(name: str) -> LoadingProfile:
+    try:
+        return LOADING_PROFILES[name]
+    except KeyError as exc:
+        raise ValueError(f"Unknown loading profile: {name}") from exc
+
+
+def with_profile(stmt: Select[Any], name: str) -> Select[Any]:
+    """Apply the named profile to a statement selecting its entity."""
+
+    profile = get_loading_profile(name)
+    entity = stmt.column_descriptions[0]["entity"]
+    if entity is not profile.entity:
+        raise ValueError(f"Loading profile {name} loads {profile.entity.__name__}")
+    return profile.apply(stmt)
+
+
+def list_ratings(
+    session: Session,
+    cycle_id: uuid.UUID,
+    evaluee_id: uuid.UUID | None = None,
+    profile: str = "rating.with_evaluation",
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> Page:
+    stmt = select(EvaluationRating).where(EvaluationRating.cycle_id == cycle_id)
+    if evaluee_id is not None:
+        stmt = stmt.where(EvaluationRating.evaluee_id == evaluee_id)
+    return keyset_page(session, with_profile(stmt, profile), limit, cursor)
+
+
+def list_results(
+    session: Session,
+    cycle_id: uuid.UUID,
+    department: str | None = None,
+    profile: str = "result.with_cycle",
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> Page:
+    stmt = select(EvaluationResult).where(EvaluationResult.cycle_id == cycle_id)
+    if department is not None:
+        stmt = stmt.where(EvaluationResult.evaluee_department == department)
+    return keyset_page(session, with_profile(stmt, profile), limit, cursor)
+
+
+def list_nominations(
+    session: Session,
+    period: str,
+    category: NominationCategory | None = None,
+    status: NominationStatus | None = None,
+    profile: str = "nomination.bare",
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> Page:
+    stmt = select(Nomination).where(Nomination.nomination_period == period)
+    if category is not None:
+        stmt = stmt.where(Nomination.category == category)
+    if status is not None:
+        stmt = stmt.where(Nomination.status == status)
+    return keyset_page(session, with_profile(stmt, profile), limit, cursor)
+
+
+def list_votes(
+    session: Session,
+    period: str,
+    voter_id: uuid.UUID | None = None,
+    profile: str = "vote.with_nomination",
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> Page:
+    stmt = select(Vote).where(Vote.nomination_period == period)
+    if voter_id is not None:
+        stmt = stmt.where(Vote.voter_id == voter_id)
+    return keyset_page(session, with_profile(stmt, profile), limit, cursor)
+
+
+def list_awards(
+    session: Session,
+    period: str,
+    profile: str = "award.with_nomination",
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> Page:
+    stmt = select(Award).where(Award.award_period == period)
+    return keyset_page(session, with_profile(stmt, profile), limit, cursor)
@@ -0,0 +1,400 @@
+"""Publishing staged outbox events to a stream sink.
+
+``OutboxDispatcher`` claims pending ``outbox_event`` rows in batches
+(``FOR UPDATE SKIP LOCKED`` on PostgreSQL, so several dispatchers can run
+side by side), hands them to an ``EventSink`` wrapped in the envelope from
+``docs/DOMAIN_EVENTS.md`` and marks them dispatched in the same
+transaction. Delivery is at least once: a crash between ``publish`` and
+the commit redelivers the batch with the same ``event_id`` values, which
+the bundled sinks drop.
+
+A slow sink is the backpressure signal: ``publish`` awaits instead of
+buffering, so undelivered events stay in the table rather than in memory.
+
+When a batch fails, its events are retried one at a time so a single
+event the sink rejects cannot hold back the queue behind it. An event
+that fails ``max_attempts`` times is dead-lettered: it keeps its row,
+``last_error`` and ``attempts``, but is no longer claimed or counted as
+backlog. Sinks remember a bounded window of recent ``event_id`` values,
+enough to drop the redeliveries a crash or a retried batch causes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from sqlalchemy import Table, func, select, update
+from sqlalchemy.orm import Session
+
+from ..database import get_async_engine
+from ..models.outbox import OutboxEvent
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import RowMapping
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = "v1"
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_MAX_ATTEMPTS = 10
+DEFAULT_DEDUPE_WINDOW = 10_000
+LAG_BUDGET_SECONDS = 5.0
+
+_outbox: Table = OutboxEvent.__table__  # type: ignore[assignment]
+
+
+class EventSink(Protocol):
+    """Destination stream for dispatched events."""
+
+    async def publish(self, envelopes: Sequence[dict[str, Any]]) -> None: ...
+
+
+def _aware(moment: datetime) -> datetime:
+    return moment if moment.tzinfo else moment.replace(tzinfo=UTC)
+
+
+def envelope(row: Mapping[Any, Any]) -> dict[str, Any]:
+    """Wrap one ``outbox_event`` row in the domain event envelope."""
+
+    return {
+        "event_type": row["event_type"],
+        "event": {
+            **row["payload"],
+            "event_id": str(row["id"]),
+            "causation_id": row["causation_id"],
+            "correlation_id": row["correlation_id"],
+            "occurred_at": _aware(row["occurred_at"]).isoformat(),
+            "actor_id": str(row["actor_id"]) if row["actor_id"] else None,
+        },
+        "metadata": {
+            "schema_version": SCHEMA_VERSION,
+            "replay": row["attempts"] > 0,
+            "attempt": row["attempts"] + 1,
+        },
+    }
+
+
+class _RecentIds:
+    """The last ``size`` event ids a sink delivered, oldest evicted first."""
+
+    def __init__(self, size: int, ids: Iterable[str] = ()) -> None:
+        self.size = size
+        self._order: deque[str] = deque()
+        self._ids: set[str] = set()
+        for event_id in ids:
+            self.add(event_id)
+
+    def __contains__(self, event_id: object) -> bool:
+        return event_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, event_id: str) -> None:
+        if event_id in self._ids:
+            return
+        self._order.append(event_id)
+        self._ids.add(event_id)
+        if len(self._order) > self.size:
+            self._ids.discard(self._order.popleft())
+
+    def update(self, ids: Iterable[str]) -> None:
+        for event_id in ids:
+            self.add(event_id)
+
+
+def _last_lines(path: Path, count: int, block_size: int = 1 << 16) -> list[bytes]:
+    # Read backwards from the end until ``count`` whole lines are in hand.
+    with path.open("rb") as handle:
+        end = handle.seek(0, os.SEEK_END)
+        data = b""
+        while end > 0 and data.count(b"\n") <= count:
+            start = max(0, end - block_size)
+            handle.seek(start)
+            data = handle.read(end - start) + data
+            end = start
+    return data.splitlines()[-count:] if count else []
+
+
+class MemorySink:
+    """Bounded in-process stream, for tests and single-process deployments.
+
+    ``publish`` waits while the queue is full; events among the last
+    ``dedupe_window`` delivered are skipped by ``event_id``.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        dedupe_window: int = DEFAULT_DEDUPE_WINDOW,
+    ) -> None:
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=maxsize)
+        self._seen = _RecentIds(dedupe_window)
+
+    async def publish(self, envelopes: Sequence[dict[str, Any]]) -> None:
+        for item in envelopes:
+            event_id = item["event"]["event_id"]
+            if event_id in self._seen:
+                continue
+            await self.queue.put(item)
+            self._seen.add(event_id)
+
+
+class FileSink:
+    """Append-only JSONL stream on local disk, fsynced once per batch.
+
+    The last ``dedupe_window`` event ids are read back from the end of the
+    file on start so redelivered events are not written twice.
+    """
+
+    def __init__(self, path: Path, dedupe_window: int = DEFAULT_DEDUPE_WINDOW) -> None:
+        self.path = path
+        self._seen = _RecentIds(dedupe_window)
+        if path.exists():
+            self._seen.update(
+                json.loads(line)["event"]["event_id"]
+                for line in _last_lines(path, dedupe_window)
+            )
+
+    def _append(self, lines: list[str]) -> None:
+        with self.path.open("a") as handle:
+            handle.writelines(lines)
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    async def publish(self, envelopes: Sequence[dict[str, Any]]) -> None:
+        fresh = [
+            item for item in envelopes if item["event"]["event_id"] not in self._seen
+        ]
+        if fresh:
+            await asyncio.to_thread(
+                self._append,
+                [json.dumps(item) + "\n" for item in fresh],
+            )
+            self._seen.update(item["event"]["event_id"] for item in fresh)
+
+
+@dataclass(slots=True)
+class DispatcherStats:
+    """Counters and lag for an ``OutboxDispatcher``.
+
+    Lag is the time from ``occurred_at`` to the batch being published.
+    ``publish_wait_seconds`` is time spent waiting on the sink, the
+    backpressure it applied.
+    """
+
+    dispatched: int = 0
+    batches: int = 0
+    failures: int = 0
+    dead_lettered: int = 0
+    last_lag_seconds: float = 0.0
+    max_lag_seconds: float = 0.0
+    publish_wait_seconds: float = 0.0
+
+
+class OutboxDispatcher:
+    """Drain ``outbox_event`` into an ``EventSink`` from an asyncio task."""
+
+    def __init__(
+        self,
+        sink: EventSink,
+        engine: AsyncEngine | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        poll_interval: float = 0.1,
+        retry_delay: float = 1.0,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> None:
+        self.sink = sink
+        self._engine = engine
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self.max_attempts = max_attempts
+        self.stats = DispatcherStats()
+
+    @property
+    def engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self._engine = get_async_engine()
+        return self._engine
+
+    def _claim(self, limit: int) -> Any:
+        return (
+            select(_outbox)
+            .where(
+                _outbox.c.dispatched_at.is_(None),
+                _outbox.c.dead_lettered_at.is_(None),
+            )
+            .order_by(_outbox.c.occurred_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+    async def dispatch_once(self) -> int:
+        """Publish one batch of pending events and return how many."""
+
+        rows: Sequence[RowMapping] = []
+        try:
+            async with self.engine.begin() as connection:
+                rows = (
+                    (await connection.execute(self._claim(self.batch_size)))
+                    .mappings()
+                    .all()
+                )
+                if not rows:
+                    return 0
+                now = await self._publish(connection, rows)
+        except Exception as exc:
+            if not rows:
+                raise
+            if len(rows) == 1:
+                await self._record_failure(rows, exc)
+                return 0
+            logger.warning(
+                "Outbox publish of %d events failed, retrying one by one: %s",
+                len(rows),
+                exc,
+            )
+            return await self._dispatch_each(rows)
+
+        self._record_batch(rows, now)
+        return len(rows)
+
+    async def _publish(
+        self,
+        connection: AsyncConnection,
+        rows: Sequence[RowMapping],
+    ) -> datetime:
+        started = time.perf_counter()
+        await self.sink.publish([envelope(row) for row in rows])
+        self.stats.publish_wait_seconds += time.perf_counter() - started
+        now = datetime.now(UTC)
+        await connection.execute(
+            update(_outbox)
+            .where(_outbox.c.id.in_([row["id"] for row in rows]))
+            .values(dispatched_at=now),
+        )
+        return now
+
+    async def _dispatch_each(self, rows: Sequence[RowMapping]) -> int:
+        # Isolate the failing events so the rest of the batch goes through.
+        published = 0
+        for claimed in rows:
+            row: RowMapping | None = None
+            try:
+                async with self.engine.begin() as connection:
+                    row = (
+                        (
+                            await connection.execute(
+                                self._claim(1).where(_outbox.c.id == claimed["id"]),
+                            )
+                        )
+                        .mappings()
+                        .first()
+                    )
+                    if row is None:
+                        continue
+                    now = await self._publish(connection, [row])
+            except Exception as exc:
+                if row is None:
+                    raise
+                await self._record_failure([row], exc)
+                continue
+            self._record_batch([row], now)
+            published += 1
+        return published
+
+    def _record_batch(self, rows: Sequence[RowMapping], now: datetime) -> None:
+        lag = (now - min(_aware(row["occurred_at"]) for row in rows)).total_seconds()
+        self.stats.dispatched += len(rows)
+        self.stats.batches += 1
+        self.stats.last_lag_seconds = lag
+        self.stats.max_lag_seconds = max(self.stats.max_lag_seconds, lag)
+
+    async def _record_failure(
+        self,
+        rows: Sequence[RowMapping],
+        exc: Exception,
+    ) -> None:
+        self.stats.failures += 1
+        logger.warning("Outbox publish of %d events failed: %s", len(rows), exc)
+        dead = [row["id"] for row in rows if row["attempts"] + 1 >= self.max_attempts]
+        async with self.engine.begin() as connection:
+            await connection.execute(
+                update(_outbox)
+                .where(_outbox.c.id.in_([row["id"] for row in rows]))
+                .values(
+                    attempts=_outbox.c.attempts + 1,
+                    last_error=str(exc)[:512],
+                ),
+            )
+            if dead:
+                await connection.execute(
+                    update(_outbox)
+                    .where(_outbox.c.id.in_(dead))
+                    .values(dead_lettered_at=datetime.now(UTC)),
+                )
+        if dead:
+            self.stats.dead_lettered += len(dead)
+            logger.error(
+                "Dead-lettered %d outbox events after %d attempts: %s",
+                len(dead),
+                self.max_attempts,
+                exc,
+            )
+
+    async def drain(self) -> int:
+        """Publish until nothing is pending; returns the events published."""
+
+        total = 0
+        while published := await self.dispatch_once():
+            total += published
+        return total
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Dispatch until ``stop`` is set, polling when the outbox is empty."""
+
+        while not stop.is_set():
+            failures = self.stats.failures
+            published = await self.dispatch_once()
+            if published == self.batch_size:
+                continue
+            delay = (
+                self.retry_delay
+                if self.stats.failures > failures
+                else self.poll_interval
+            )
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=delay)
+            except TimeoutError:
+                pass
+
+
+def outbox_backlog(session: Session, now: datetime | None = None) -> tuple[int, float]:
+    """``(pending events, age in seconds of the oldest)`` for lag alerts.
+
+    Dead-lettered events are not pending: nothing will publish them.
+    """
+
+    pending: int
+    oldest: datetime | None
+    pending, oldest = session.execute(
+        select(func.count(), func.min(_outbox.c.occurred_at)).where(
+            _outbox.c.dispatched_at.is_(None),
+            _outbox.c.dead_lettered_at.is_(None),
+        ),
+    ).one()
+    if oldest is None:
+        return 0, 0.0
+    return pending, ((now or datetime.now(UTC)) - _aware(oldest)).total_seconds()
@@ -0,0 +1,146 @@
+"""Keyset pagination for list queries.
+
+Pages are ordered by a timestamp column plus ``id`` and continue from an
+opaque cursor holding the last row's values, so every page costs the
+same instead of growing with ``OFFSET``. ``keyset_columns`` picks the
+timestamp each model already carries (``created_at``, ``submitted_at``,
+``granted_at``, ...).
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, literal, tuple_
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from ..models.types import GUID
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+KEYSET_TIMESTAMPS = (
+    "created_at",
+    "submitted_at",
+    "granted_at",
+    "calculated_at",
+    "voted_at",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Page:
+    """One page of results and the cursor for the next page."""
+
+    items: list[Any]
+    next_cursor: str | None
+
+
+def keyset_columns(entity: Any) -> tuple[Any, Any]:
+    """``(timestamp, id)`` sort columns for a mapped class or alias."""
+
+    for name in KEYSET_TIMESTAMPS:
+        column = getattr(entity, name, None)
+        if column is not None:
+            return column, entity.id
+    raise ValueError(f"{entity!r} has no timestamp column to paginate on")
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    encoded = [
+        value.isoformat() if isinstance(value, datetime) else str(value)
+        for value in values
+    ]
+    return base64.urlsafe_b64encode(json.dumps(encoded).encode()).decode()
+
+
+def decode_cursor(cursor: str, columns: Sequence[Any]) -> list[Any]:
+    """Cursor values converted back to the Python types of ``columns``."""
+
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(cursor))
+        if len(raw) != len(columns):
+            raise ValueError
+        values: list[Any] = []
+        for column, value in zip(columns, raw, strict=True):
+            if isinstance(column.type, DateTime):
+                values.append(datetime.fromisoformat(value))
+            elif isinstance(column.type, GUID):
+                values.append(uuid.UUID(value))
+            else:
+                values.append(value)
+        return values
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+
+
+def keyset_order(columns: Sequence[Any], descending: bool = True) -> list[Any]:
+    return [column.desc() if descending else column.asc() for column in columns]
+
+
+def keyset_filter(columns: Sequence[Any], cursor: str, descending: bool = True) -> Any:
+    """Rows strictly after ``cursor`` in ``keyset_order`` order."""
+
+    values = decode_cursor(cursor, columns)
+    row = tuple_(*columns)
+    bound = tuple_(
+        *(
+            literal(value, column.type)
+            for column, value in zip(columns, values, strict=True)
+        ),
+    )
+    return row < bound if descending else row > bound
+
+
+def to_page(items: Sequence[Any], limit: int, columns: Sequence[Any]) -> Page:
+    """Trim a ``limit + 1`` result to ``limit`` and cursor on the last item."""
+
+    if len(items) <= limit:
+        return Page(items=list(items), next_cursor=None)
+    last = items[limit - 1]
+    cursor = encode_cursor([getattr(last, column.key) for column in columns])
+    return Page(items=list(items[:limit]), next_cursor=cursor)
+
+
+def check_limit(limit: int, maximum: int = MAX_PAGE_SIZE) -> None:
+    if not 0 < limit <= maximum:
+        raise ValueError(f"limit must be between 1 and {maximum}")
+
+
+def keyset_page(
+    session: Session,
+    stmt: Select[Any],
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    columns: Sequence[Any] | None = None,
+    descending: bool = True,
+) -> Page:
+    """Run ``stmt`` one keyset page at a time.
+
+    ``columns`` defaults to ``keyset_columns`` of the statement's first
+    entity. ORM entity statements return instances; column statements
+    return rows.
+    """
+
+    check_limit(limit)
+    if columns is None:
+        columns = keyset_columns(stmt.column_descriptions[0]["entity"])
+    if cursor:
+        stmt = stmt.where(keyset_filter(columns, cursor, descending))
+    stmt = stmt.order_by(*keyset_order(columns, descending)).limit(limit + 1)
+    result = session.execute(stmt)
+    items = list(result.scalars()) if _selects_entity(stmt) else list(result)
+    return to_page(items, limit, columns)
+
+
+def _selects_entity(stmt: Select[Any]) -> bool:
+    descriptions = stmt.column_descriptions
+    return (
+        len(descriptions) == 1 and descriptions[0]["expr"] is descriptions[0]["entity"]
+    )
@@ -0,0 +1,589 @@
+"""Incrementally maintained rollups behind the dashboards.
+
+``cycle_progress_rollup`` holds assignment counts by status per cycle and
+department; ``nomination_rollup`` holds nomination counts by status and
+vote totals per period and category. Dashboards read those few rows
+instead of grouping ``evaluation``, ``nomination`` and ``vote`` on every
+page load. Votes per nomination need no rollup: ``Nomination.votes_count``
+is already maintained by ``cast_vote``.
+
+Rollups are plain tables on both dialects rather than PostgreSQL
+materialised views, so a write can adjust its own rows instead of
+refreshing the whole view:
+
+* An ``after_flush`` listener turns flushed ORM changes into ``+n``/``-n``
+  deltas applied with ``UPDATE ... SET col = col + :delta``. A row that
+  does not exist yet is computed from the base table instead.
+* Bulk Core writes (``assign_cycle``, ``sweep_overdue``) call
+  ``refresh_cycle_progress`` for the cycles and departments they touched.
+* ``run_rollup_refresher`` recomputes open cycles and periods on a short
+  schedule, which bounds the staleness left by anything else.
+
+Every read reports ``refreshed_at`` (oldest full recompute) and
+``updated_at`` (newest delta). ``check_rollups`` compares the rollups
+with grouped counts of the base tables and can repair any drift.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import uuid
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import (
+    Connection,
+    Engine,
+    Table,
+    delete,
+    event,
+    func,
+    insert,
+    inspect,
+    select,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..database import get_engine
+from ..models.evaluation import Evaluation, EvaluationCycle, EvaluationCycleStatus
+from ..models.recognition import (
+    Nomination,
+    NominationCategory,
+    NominationStatus,
+    Vote,
+)
+from ..models.rollup import CycleProgressRollup, NominationRollup
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_SECONDS = 60.0
+CYCLE_PROGRESS = "cycle_progress"
+NOMINATIONS = "nominations"
+OPEN_NOMINATION_STATUSES = (NominationStatus.PENDING, NominationStatus.VOTING)
+
+_evaluation = Evaluation.__table__
+_nomination = Nomination.__table__
+_vote = Vote.__table__
+
+Key = tuple[Any, Any]
+Counts = dict[str, int]
+
+
+@dataclass(frozen=True, slots=True)
+class _Rollup:
+    name: str
+    table: Table
+    keys: tuple[str, str]
+    columns: tuple[str, ...]
+
+    def match(self, key: Key) -> list[Any]:
+        return [
+            self.table.c[name] == value
+            for name, value in zip(self.keys, key, strict=True)
+        ]
+
+    def zeros(self) -> Counts:
+        return dict.fromkeys(self.columns, 0)
+
+
+# Status columns are named after the lower-cased enum member.
+_PROGRESS = _Rollup(
+    CYCLE_PROGRESS,
+    CycleProgressRollup.__table__,  # type: ignore[arg-type]
+    ("cycle_id", "department"),
+    ("total", "not_started", "in_progress", "submitted", "late"),
+)
+_NOMINATIONS = _Rollup(
+    NOMINATIONS,
+    NominationRollup.__table__,  # type: ignore[arg-type]
+    ("nomination_period", "category"),
+    ("nominations", "pending", "voting", "selected", "rejected", "votes"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RollupView:
+    """Rollup rows together with how current they are."""
+
+    rows: list[dict[str, Any]]
+    as_of: datetime
+    refreshed_at: datetime | None = None
+    updated_at: datetime | None = None
+
+    @property
+    def staleness_seconds(self) -> float | None:
+        """Seconds since the oldest row was recomputed from the base table."""
+
+        if self.refreshed_at is None:
+            return None
+        return (self.as_of - self.refreshed_at).total_seconds()
+
+
+@dataclass(frozen=True, slots=True)
+class RollupCheckReport:
+    """Rollup rows that disagree with the base tables.
+
+    ``drift`` maps ``(rollup, *key)`` to ``{column: (stored, actual)}``.
+    """
+
+    checked: int
+    drift: dict[tuple[Any, ...], dict[str, tuple[int, int]]] = field(
+        default_factory=dict,
+    )
+    repaired: bool = False
+
+    @property
+    def consistent(self) -> bool:
+        return not self.drift
+
+
+def _utc(moment: datetime | None) -> datetime | None:
+    if moment is None or moment.tzinfo:
+        return moment
+    return moment.replace(tzinfo=UTC)
+
+
+def _progress_counts(
+    connection: Connection,
+    cycle_ids: Iterable[uuid.UUID] | None = None,
+    departments: Iterable[str] | None = None,
+) -> dict[Key, Counts]:
+    statement = select(
+        _evaluation.c.cycle_id,
+        _evaluation.c.evaluee_department,
+        _evaluation.c.status,
+        func.count(),
+    ).group_by(
+        _evaluation.c.cycle_id,
+        _evaluation.c.evaluee_department,
+        _evaluation.c.status,
+    )
+    if cycle_ids is not None:
+        statement = statement.where(_evaluation.c.cycle_id.in_(list(cycle_ids)))
+    if departments is not None:
+        statement = statement.where(
+            _evaluation.c.evaluee_department.in_(list(departments)),
+        )
+
+    counts: dict[Key, Counts] = defaultdict(_PROGRESS.zeros)
+    for cycle_id, department, status, count in connection.execute(statement):
+        values = counts[(cycle_id, department)]
+        values["total"] += count
+        values[status.name.lower()] += count
+    return counts
+
+
+def _nomination_counts(
+    connection: Connection,
+    periods: Iterable[str] | None = None,
+    categories: Iterable[NominationCategory] | None = None,
+) -> dict[Key, Counts]:
+    period = _nomination.c.nomination_period
+    category = _nomination.c.category
+    filters = []
+    if periods is not None:
+        filters.append(period.in_(list(periods)))
+    if categories is not None:
+        filters.append(category.in_(list(categories)))
+
+    counts: dict[Key, Counts] = defaultdict(_NOMINATIONS.zeros)
+    for key_period, key_category, status, count in connection.execute(
+        select(period, category, _nomination.c.status, func.count())
+        .where(*filters)
+        .group_by(period, category, _nomination.c.status),
+    ):
+        values = counts[(key_period, key_category)]
+        values["nominations"] += count
+        values[status.name.lower()] += count
+    for key_period, key_category, count in connection.execute(
+        select(period, category, func.count(_vote.c.id))
+        .join(_vote, _vote.c.nomination_id == _nomination.c.id)
+        .where(*filters)
+        .group_by(period, category),
+    ):
+        counts[(key_period, key_category)]["votes"] += count
+    return counts
+
+
+def _store(
+    connection: Connection,
+    rollup: _Rollup,
+    counts: dict[Key, Counts],
+    scope: list[Any],
+    now: datetime,
+) -> int:
+    """Overwrite the rows in ``scope`` with ``counts``."""
+
+    table = rollup.table
+    stored = connection.execute(
+        select(*(table.c[name] for name in rollup.keys)).where(*scope),
+    )
+    for key in {tuple(row) for row in stored} - counts.keys():
+        connection.execute(delete(table).where(*rollup.match(key)))
+
+    for key, values in counts.items():
+        changes = {**values, "refreshed_at": now, "updated_at": now}
+        where = rollup.match(key)
+        if connection.execute(update(table).where(*where).values(**changes)).rowcount:
+            continue
+        try:
+            with connection.begin_nested():
+                connection.execute(
+                    insert(table).values(
+                        id=uuid.uuid4(),
+                        **dict(zip(rollup.keys, key, strict=True)),
+                        **changes,
+                    ),
+                )
+        except IntegrityError:
+            # A concurrent writer created the row first; overwrite it instead.
+            connection.execute(update(table).where(*where).values(**changes))
+    return len(counts)
+
+
+def refresh_cycle_progress(
+    connection: Connection,
+    cycle_id: uuid.UUID,
+    departments: Iterable[str] | None = None,
+    now: datetime | None = None,
+) -> int:
+    """Recompute a cycle's progress rows, optionally only some departments."""
+
+    departments = None if departments is None else sorted(set(departments))
+    scope = [_PROGRESS.table.c.cycle_id == cycle_id]
+    if departments is not None:
+        scope.append(_PROGRESS.table.c.department.in_(departments))
+    counts = _progress_counts(connection, [cycle_id], departments)
+    return _store(connection, _PROGRESS, counts, scope, now or datetime.now(UTC))
+
+
+def refresh_nomination_rollup(
+    connection: Connection,
+    period: str,
+    categories: Iterable[NominationCategory] | None = None,
+    now: datetime | None = None,
+) -> int:
+    """Recompute a period's nomination rows, optionally only some categories."""
+
+    categories = None if categories is None else sorted(set(categories))
+    scope = [_NOMINATIONS.table.c.nomination_period == period]
+    if categories is not None:
+        scope.append(_NOMINATIONS.table.c.category.in_(categories))
+    counts = _nomination_counts(connection, [period], categories)
+    return _store(connection, _NOMINATIONS, counts, scope, now or datetime.now(UTC))
+
+
+def refresh_rollups(
+    session: Session,
+    cycle_ids: Iterable[uuid.UUID] | None = None,
+    periods: Iterable[str] | None = None,
+    now: datetime | None = None,
+) -> int:
+    """Recompute rollups, by default for active cycles and open periods."""
+
+    now = now or datetime.now(UTC)
+    if cycle_ids is None:
+        cycle_ids = session.scalars(
+            select(EvaluationCycle.id).where(
+                EvaluationCycle.status == EvaluationCycleStatus.ACTIVE,
+            ),
+        ).all()
+    if periods is None:
+        periods = session.scalars(
+            select(Nomination.nomination_period)
+            .where(Nomination.status.in_(OPEN_NOMINATION_STATUSES))
+            .distinct(),
+        ).all()
+
+    connection = session.connection()
+    written = 0
+    for cycle_id in cycle_ids:
+        written += refresh_cycle_progress(connection, cycle_id, now=now)
+    for period in periods:
+        written += refresh_nomination_rollup(connection, period, now=now)
+    return written
+
+
+def _stamps(rows: list[dict[str, Any]], column: str) -> list[datetime]:
+    return [moment for row in rows if (moment := _utc(row[column])) is not None]
+
+
+def _view(rows: list[dict[str, Any]], now: datetime | None) -> RollupView:
+    now = now or datetime.now(UTC)
+    if not rows:
+        return RollupView(rows=[], as_of=now)
+    return RollupView(
+        rows=rows,
+        as_of=now,
+        refreshed_at=min(_stamps(rows, "refreshed_at")),
+        updated_at=max(_stamps(rows, "updated_at")),
+    )
+
+
+def _read(
+    session: Session,
+    rollup: _Rollup,
+    scope: list[Any],
+) -> list[dict[str, Any]]:
+    table = rollup.table
+    return [
+        dict(row)
+        for row in session.connection()
+        .execute(
+            select(
+                *(table.c[name] for name in rollup.keys[1:] + rollup.columns),
+                table.c.refreshed_at,
+                table.c.updated_at,
+            )
+            .where(*scope)
+            .order_by(table.c[rollup.keys[1]]),
+        )
+        .mappings()
+    ]
+
+
+def cycle_progress(
+    session: Session,
+    cycle_id: uuid.UUID,
+    now: datetime | None = None,
+) -> RollupView:
+    """Per-department progress of one cycle, computing it on first use."""
+
+    scope = [_PROGRESS.table.c.cycle_id == cycle_id]
+    rows = _read(session, _PROGRESS, scope)
+    if not rows and refresh_cycle_progress(session.connection(), cycle_id, now=now):
+        rows = _read(session, _PROGRESS, scope)
+    for row in rows:
+        total = row["total"]
+        row["completion_percentage"] = row["submitted"] / total * 100 if total else 0.0
+    return _view(rows, now)
+
+
+def nomination_summary(
+    session: Session,
+    period: str,
+    now: datetime | None = None,
+) -> RollupView:
+    """Nomination and vote counts per category, computing them on first use."""
+
+    scope = [_NOMINATIONS.table.c.nomination_period == period]
+    rows = _read(session, _NOMINATIONS, scope)
+    if not rows and refresh_nomination_rollup(session.connection(), period, now=now):
+        rows = _read(session, _NOMINATIONS, scope)
+    return _view(rows, now)
+
+
+def nomination_votes(
+    session: Session,
+    period: str,
+    category: NominationCategory,
+    now: datetime | None = None,
+) -> RollupView:
+    """Votes per nomination from the live ``votes_count`` counters."""
+
+    now = now or datetime.now(UTC)
+    rows = [
+        dict(row)
+        for row in session.execute(
+            select(
+                Nomination.id,
+                Nomination.nominee_name,
+                Nomination.nominee_department,
+                Nomination.status,
+                Nomination.votes_count,
+            )
+            .where(
+                Nomination.nomination_period == period,
+                Nomination.category == category,
+            )
+            .order_by(Nomination.votes_count.desc(), Nomination.nominee_name),
+        ).mappings()
+    ]
+    return RollupView(rows=rows, as_of=now, refreshed_at=now, updated_at=now)
+
+
+def check_rollups(
+    session: Session,
+    repair: bool = False,
+    now: datetime | None = None,
+) -> RollupCheckReport:
+    """Compare every rollup row with grouped counts of the base tables.
+
+    With ``repair`` the drifted keys are recomputed; keys missing from
+    the rollups are backfilled the same way.
+    """
+
+    connection = session.connection()
+    checked = 0
+    drift: dict[tuple[Any, ...], dict[str, tuple[int, int]]] = {}
+    for rollup, actual in (
+        (_PROGRESS, _progress_counts(connection)),
+        (_NOMINATIONS, _nomination_counts(connection)),
+    ):
+        table = rollup.table
+        stored = {
+            tuple(row[: len(rollup.keys)]): dict(
+                zip(rollup.columns, row[len(rollup.keys) :], strict=True),
+            )
+            for row in connection.execute(
+                select(*(table.c[name] for name in rollup.keys + rollup.columns)),
+            )
+        }
+        for key in stored.keys() | actual.keys():
+            checked += 1
+            before = stored.get(key, rollup.zeros())
+            after = actual.get(key, rollup.zeros())
+            differences = {
+                name: (before[name], after[name])
+                for name in rollup.columns
+                if before[name] != after[name]
+            }
+            if differences:
+                drift[(rollup.name, *key)] = differences
+
+    if not repair or not drift:
+        return RollupCheckReport(checked=checked, drift=drift)
+
+    now = now or datetime.now(UTC)
+    stale: dict[tuple[str, Any], set[Any]] = defaultdict(set)
+    for name, parent, child in drift:
+        stale[(name, parent)].add(child)
+    for (name, parent), children in stale.items():
+        if name == CYCLE_PROGRESS:
+            refresh_cycle_progress(connection, parent, children, now)
+        else:
+            refresh_nomination_rollup(connection, parent, children, now)
+    return RollupCheckReport(checked=checked, drift=drift, repaired=True)
+
+
+def run_rollup_refresher(
+    stop: threading.Event,
+    engine: Engine | None = None,
+    interval: float = DEFAULT_INTERVAL_SECONDS,
+) -> None:
+    """Refresh open cycles and periods every ``interval`` seconds until ``stop``."""
+
+    engine = engine or get_engine()
+    while not stop.is_set():
+        try:
+            with Session(engine) as session, session.begin():
+                written = refresh_rollups(session)
+        except Exception:
+            logger.exception("Rollup refresh failed")
+        else:
+            logger.debug("Refreshed %d rollup rows", written)
+        stop.wait(interval)
+
+
+def _states(
+    session: Session,
+    instance: Any,
+    names: tuple[str, ...],
+) -> tuple[tuple[Any, ...] | None, tuple[Any, ...] | None]:
+    """Tracked values before and after the flush; ``None`` if absent."""
+
+    histories = [inspect(instance).attrs[name].history for name in names]
+    before = after = None
+    if instance not in session.new:
+        before = tuple(
+            next(iter(history.deleted or history.unchanged), None)
+            for history in histories
+        )
+    if instance not in session.deleted:
+        after = tuple(
+            next(iter(history.added or history.unchanged), None)
+            for history in histories
+        )
+    return before, after
+
+
+def _track(
+    session: Session,
+    instance: Any,
+    names: tuple[str, str, str],
+    total: str,
+    deltas: dict[Key, Counter[str]],
+) -> None:
+    before, after = _states(session, instance, names)
+    if before == after:
+        return
+    for state, sign in ((before, -1), (after, 1)):
+        # Values expired before a delete are unknown; check_rollups repairs.
+        if state is None or None in state:
+            continue
+        *key, status = state
+        deltas[tuple(key)][total] += sign
+        deltas[tuple(key)][status.name.lower()] += sign
+
+
+def _apply(
+    connection: Connection,
+    rollup: _Rollup,
+    deltas: dict[Key, Counter[str]],
+    now: datetime,
+) -> dict[Any, set[Any]]:
+    """Apply ``deltas`` in place; returns the keys that have no row yet."""
+
+    table = rollup.table
+    missing: dict[Any, set[Any]] = defaultdict(set)
+    for key, delta in deltas.items():
+        changes = {
+            name: table.c[name] + amount for name, amount in delta.items() if amount
+        }
+        if not changes:
+            continue
+        updated = connection.execute(
+            update(table).where(*rollup.match(key)).values(updated_at=now, **changes),
+        ).rowcount
+        if not updated:
+            missing[key[0]].add(key[1])
+    return missing
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_flushed(session: Session, flush_context: Any) -> None:
+    progress: dict[Key, Counter[str]] = defaultdict(Counter)
+    nominations: dict[Key, Counter[str]] = defaultdict(Counter)
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, Evaluation):
+            _track(
+                session,
+                instance,
+                ("cycle_id", "evaluee_department", "status"),
+                "total",
+                progress,
+            )
+        elif isinstance(instance, Nomination):
+            _track(
+                session,
+                instance,
+                ("nomination_period", "category", "status"),
+                "nominations",
+                nominations,
+            )
+        elif isinstance(instance, Vote):
+            key = (instance.nomination_period, instance.category)
+            if instance in session.new:
+                nominations[key]["votes"] += 1
+            elif instance in session.deleted:
+                nominations[key]["votes"] -= 1
+    if not progress and not nominations:
+        return
+
+    connection = session.connection()
+    now = datetime.now(UTC)
+    for cycle_id, departments in _apply(connection, _PROGRESS, progress, now).items():
+        refresh_cycle_progress(connection, cycle_id, departments, now)
+    for period, categories in _apply(
+        connection,
+        _NOMINATIONS,
+        nominations,
+        now,
+    ).items():
+        refresh_nomination_rollup(connection, period, categories, now)
@@ -0,0 +1,143 @@
+"""Race-free vote recording and counter reconciliation for EOM nominations."""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import Row, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models.recognition import Nomination, NominationStatus, Vote
+
+
+class DuplicateVoteError(ValueError):
+    """The voter has already voted in this category and period."""
+
+
+@dataclass(frozen=True, slots=True)
+class VoteReconciliationReport:
+    """Nominations whose ``votes_count`` disagrees with their ``vote`` rows."""
+
+    checked: int
+    drift: dict[uuid.UUID, int] = field(default_factory=dict)
+    repaired: bool = False
+
+    @property
+    def consistent(self) -> bool:
+        return not self.drift
+
+
+def cast_vote(
+    session: Session,
+    nomination_id: uuid.UUID,
+    voter_id: uuid.UUID,
+    voter_role: str,
+    voted_at: datetime | None = None,
+) -> Vote:
+    """Record a vote and bump the nomination's counter atomically.
+
+    Category and period are taken from the nomination, so the
+    ``uq_vote_voter_period_category`` index rejects a second vote by the
+    same voter however the requests race; only that violation becomes
+    ``DuplicateVoteError`` and other integrity errors propagate. The counter
+    is incremented with ``SET votes_count = votes_count + 1`` guarded on
+    ``status = 'VOTING'``, and only after the insert succeeded, so the
+    nomination row lock is held for the shortest possible time; commit
+    promptly after calling this.
+    """
+
+    nomination: Row[Any, Any] | None = session.execute(
+        select(Nomination.category, Nomination.nomination_period).where(
+            Nomination.id == nomination_id,
+        ),
+    ).one_or_none()
+    if nomination is None:
+        raise ValueError(f"nomination {nomination_id} does not exist")
+
+    vote = Vote(
+        id=uuid.uuid4(),
+        nomination_id=nomination_id,
+        voter_id=voter_id,
+        voter_role=voter_role,
+        category=nomination.category,
+        nomination_period=nomination.nomination_period,
+        voted_at=voted_at or datetime.now(UTC),
+    )
+    try:
+        with session.begin_nested():
+            session.add(vote)
+            session.flush()
+            counted: Any = session.execute(
+                update(Nomination)
+                .where(
+                    Nomination.id == nomination_id,
+                    Nomination.status == NominationStatus.VOTING,
+                )
+                .values(votes_count=Nomination.votes_count + 1),
+            )
+            if counted.rowcount != 1:
+                raise ValueError(f"nomination {nomination_id} is not open for voting")
+    except IntegrityError as exc:
+        # Only the one-vote-per-category index means "already voted"; probe
+        # for the earlier vote rather than parsing driver-specific messages.
+        earlier = session.scalar(
+            select(Vote.id).where(
+                Vote.voter_id == voter_id,
+                Vote.nomination_period == nomination.nomination_period,
+                Vote.category == nomination.category,
+            ),
+        )
+        if earlier is None:
+            raise
+        raise DuplicateVoteError(
+            f"voter {voter_id} already voted for {nomination.category.value} "
+            f"in {nomination.nomination_period}",
+        ) from exc
+    return vote
+
+
+def reconcile_votes(
+    session: Session,
+    nomination_period: str | None = None,
+    repair: bool = False,
+) -> VoteReconciliationReport:
+    """Compare ``votes_count`` with the number of ``vote`` rows.
+
+    ``drift`` maps each disagreeing nomination to ``stored - actual``. With
+    ``repair`` those counters are recomputed in a single ``UPDATE`` with a
+    correlated count, so no value travels through Python between the read
+    and the write.
+    """
+
+    actual = (
+        select(func.count(Vote.id))
+        .where(Vote.nomination_id == Nomination.id)
+        .correlate(Nomination)
+        .scalar_subquery()
+    )
+    stmt = select(Nomination.id, Nomination.votes_count - actual)
+    if nomination_period is not None:
+        stmt = stmt.where(Nomination.nomination_period == nomination_period)
+
+    checked = 0
+    drift: dict[uuid.UUID, int] = {}
+    for nomination_id, difference in session.execute(stmt):
+        checked += 1
+        if difference:
+            drift[nomination_id] = difference
+
+    report = VoteReconciliationReport(checked=checked, drift=drift)
+    if not repair or report.consistent:
+        return report
+
+    session.execute(
+        update(Nomination)
+        .where(Nomination.id.in_(list(drift)))
+        .values(votes_count=actual)
+        .execution_options(synchronize_session="fetch"),
+    )
+    return VoteReconciliationReport(checked=checked, drift=drift, repaired=True)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Benchmark full-cycle aggregation against the background job budget.
+
+Seeds one evaluation cycle with the requested number of employees and
+ratings, runs ``aggregate_cycle`` and fails when the run exceeds the
+2-minute background job budget from ``docs/PERFORMANCE_BUDGET.md``.
+
+    python benchmarks/bench_aggregation.py --employees 2000 --ratings 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.database import Base
+from app.models import (
+    Evaluation,
+    EvaluationCycle,
+    EvaluationRating,
+    EvaluatorRole,
+    StaffType,
+)
+from app.services.aggregation import aggregate_cycle
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+BUDGET_SECONDS = 120.0
+ROLE_PATTERN = (
+    (EvaluatorRole.SELF, 0.05),
+    (EvaluatorRole.PEER, 0.10),
+    (EvaluatorRole.PEER, 0.10),
+    (EvaluatorRole.SUPERVISOR, 0.35),
+    (EvaluatorRole.CEO, 0.15),
+    (EvaluatorRole.PC_HEAD, 0.25),
+)
+
+
+def seed_cycle(
+    session: Session,
+    employees: int,
+    ratings: int,
+    seed: int,
+) -> uuid.UUID:
+    """Insert one cycle with ``ratings`` ratings spread over ``employees``."""
+
+    rng = random.Random(seed)  # noqa: S311
+    now = datetime.now(UTC)
+    cycle_id = uuid.uuid4()
+    session.execute(
+        insert(EvaluationCycle),
+        [
+            {
+                "id": cycle_id,
+                "cycle_name": "Benchmark cycle",
+                "cycle_period": now.strftime("%Y-%m"),
+                "start_date": now,
+                "end_date": now + timedelta(days=14),
+                "created_by": uuid.uuid4(),
+                "total_evaluations": ratings,
+                "completed_evaluations": ratings,
+            },
+        ],
+    )
+
+    evaluee_ids = [uuid.uuid4() for _ in range(employees)]
+    evaluations: list[dict[str, Any]] = []
+    rating_rows: list[dict[str, Any]] = []
+    for index in range(ratings):
+        evaluee_index = index % employees
+        role, weight = ROLE_PATTERN[(index // employees) % len(ROLE_PATTERN)]
+        evaluation_id = uuid.uuid4()
+        evaluator_id = uuid.uuid4()
+        evaluations.append(
+            {
+                "id": evaluation_id,
+                "cycle_id": cycle_id,
+                "evaluee_id": evaluee_ids[evaluee_index],
+                "evaluee_name": f"Employee {evaluee_index}",
+                "evaluee_department": f"Department {evaluee_index % 12}",
+                "evaluee_staff_type": StaffType.ACADEMIC,
+                "evaluator_id": evaluator_id,
+                "evaluator_name": f"Evaluator {index}",
+                "evaluator_role": role,
+                "weight": weight,
+                "due_date": now + timedelta(days=7),
+            },
+        )
+        scores = [round(rng.uniform(1, 10), 1) for _ in range(4)]
+        rating_rows.append(
+            {
+                "id": uuid.uuid4(),
+                "evaluation_id": evaluation_id,
+                "cycle_id": cycle_id,
+                "evaluator_id": evaluator_id,
+                "evaluator_role": role,
+                "evaluee_id": evaluee_ids[evaluee_index],
+                "weight": weight,
+                "collaboration": scores[0],
+                "innovation": scores[1],
+                "attendance": scores[2],
+                "professional_development": scores[3],
+                "average_score": sum(scores) / len(scores),
+            },
+        )
+
+    session.execute(insert(Evaluation), evaluations)
+    session.execute(insert(EvaluationRating), rating_rows)
+    session.commit()
+    return cycle_id
+
+
+def run(database_url: str, employees: int, ratings: int, seed: int) -> dict[str, Any]:
+    engine = create_engine(database_url, future=True)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    with Session(engine) as session:
+        seed_started = time.perf_counter()
+        cycle_id = seed_cycle(session, employees, ratings, seed)
+        seed_seconds = time.perf_counter() - seed_started
+
+        started = time.perf_counter()
+        report = aggregate_cycle(session, cycle_id)
+        session.commit()
+        first_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        aggregate_cycle(session, cycle_id)
+        session.commit()
+        rerun_seconds = time.perf_counter() - started
+
+    engine.dispose()
+    return {
+        "benchmark": "aggregate_cycle",
+        "dialect": engine.dialect.name,
+        "employees": employees,
+        "ratings": ratings,
+        "results": report.total,
+        "seed_seconds": round(seed_seconds, 3),
+        "aggregate_seconds": round(first_seconds, 3),
+        "reaggregate_seconds": round(rerun_seconds, 3),
+        "budget_seconds": BUDGET_SECONDS,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default="sqlite://")
+    parser.add_argument("--employees", type=int, default=2000)
+    parser.add_argument("--ratings", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    outcome = run(args.database_url, args.employees, args.ratings, args.seed)
+    print(json.dumps(outcome, indent=2))
+    slowest = max(outcome["aggregate_seconds"], outcome["reaggregate_seconds"])
+    return 0 if slowest <= BUDGET_SECONDS else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Compare CHAR(36) and 16-byte binary GUID storage on ``evaluation_rating``.
+
+For each storage mode a fresh SQLite file is created, ratings are bulk
+inserted, read back in full and looked up by ``evaluee_id`` through its
+index. Throughput and the resulting database file size are reported.
+
+    python benchmarks/bench_guid_storage.py --ratings 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.database import Base
+from app.models import EvaluationRating, EvaluatorRole
+from app.models.types import GUID_STORAGE_ENV
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+MODES = ("char", "binary")
+
+
+def build_rows(count: int, evaluees: int) -> list[dict[str, Any]]:
+    cycle_id = uuid.uuid4()
+    evaluee_ids = [uuid.uuid4() for _ in range(evaluees)]
+    return [
+        {
+            "id": uuid.uuid4(),
+            "evaluation_id": uuid.uuid4(),
+            "cycle_id": cycle_id,
+            "evaluator_id": uuid.uuid4(),
+            "evaluator_role": EvaluatorRole.PEER,
+            "evaluee_id": evaluee_ids[index % evaluees],
+            "weight": 0.1,
+            "collaboration": 8.0,
+            "innovation": 7.0,
+            "attendance": 9.0,
+            "professional_development": 8.0,
+            "average_score": 8.0,
+        }
+        for index in range(count)
+    ]
+
+
+def run_mode(mode: str, rows: list[dict[str, Any]], lookups: int) -> dict[str, Any]:
+    os.environ[GUID_STORAGE_ENV] = mode
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / f"guid_{mode}.db"
+        engine = create_engine(f"sqlite:///{path}", future=True)
+        Base.metadata.create_all(bind=engine, tables=[EvaluationRating.__table__])
+
+        with Session(engine) as session:
+            started = time.perf_counter()
+            session.execute(insert(EvaluationRating), rows)
+            session.commit()
+            insert_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            fetched = session.execute(
+                select(EvaluationRating.id, EvaluationRating.evaluee_id),
+            ).all()
+            select_seconds = time.perf_counter() - started
+
+            evaluee_ids = list({row["evaluee_id"] for row in rows})[:lookups]
+            started = time.perf_counter()
+            for evaluee_id in evaluee_ids:
+                session.execute(
+                    select(EvaluationRating.id).where(
+                        EvaluationRating.evaluee_id == evaluee_id,
+                    ),
+                ).all()
+            lookup_seconds = time.perf_counter() - started
+
+        engine.dispose()
+        size = path.stat().st_size
+
+    return {
+        "mode": mode,
+        "insert_rows_per_second": round(len(rows) / insert_seconds),
+        "select_rows_per_second": round(len(fetched) / select_seconds),
+        "indexed_lookups_per_second": round(len(evaluee_ids) / lookup_seconds),
+        "database_bytes": size,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ratings", type=int, default=50_000)
+    parser.add_argument("--evaluees", type=int, default=5_000)
+    parser.add_argument("--lookups", type=int, default=1_000)
+    args = parser.parse_args()
+
+    rows = build_rows(args.ratings, args.evaluees)
+    results = [run_mode(mode, rows, args.lookups) for mode in MODES]
+    print(
+        json.dumps(
+            {"benchmark": "guid_storage", "ratings": args.ratings, "modes": results},
+            indent=2,
+        ),
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Measure the cost of ``import app.models`` with ``python -X importtime``.
+
+Each run happens in a fresh interpreter so module caches do not leak
+between samples; the median of the cumulative import time is reported
+for the top-level ``app`` packages.
+
+    python benchmarks/bench_import_time.py --runs 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+TRACKED_MODULES = (
+    "app",
+    "app.database",
+    "app.models",
+    "sqlalchemy",
+    "sqlalchemy.dialects.sqlite",
+)
+
+
+def sample(module: str) -> dict[str, int]:
+    """Return cumulative import microseconds per tracked module for one run."""
+
+    env = {**os.environ, "PYTHONPATH": str(BACKEND_DIR)}
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        cwd=BACKEND_DIR,
+        env=env,
+        text=True,
+    )
+    timings: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[12:].split("|"))
+        if name in TRACKED_MODULES and cumulative.isdigit():
+            timings[name] = int(cumulative)
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="app.models")
+    parser.add_argument("--runs", type=int, default=15)
+    args = parser.parse_args()
+
+    samples = [sample(args.module) for _ in range(args.runs)]
+    # Time spent in our own modules and what they pull in beyond SQLAlchemy.
+    overhead = [run.get(args.module, 0) - run.get("sqlalchemy", 0) for run in samples]
+    report = {
+        "benchmark": "import_time",
+        "module": args.module,
+        "runs": args.runs,
+        "median_cumulative_us": {
+            name: int(statistics.median(run.get(name, 0) for run in samples))
+            for name in TRACKED_MODULES
+        },
+        "median_app_overhead_us": int(statistics.median(overhead)),
+        "min_app_overhead_us": min(overhead),
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
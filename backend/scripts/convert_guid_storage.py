@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Convert a SQLite database's stored GUIDs to the format ``GUID_STORAGE`` names.
+
+Engines refuse to open a SQLite database whose GUIDs disagree with
+``GUID_STORAGE``, so run this with the new value before switching. Every
+GUID column of the current schema is rewritten in one transaction. Running
+it again converts whatever an interrupted run left behind.
+
+    GUID_STORAGE=binary python backend/scripts/convert_guid_storage.py
+    GUID_STORAGE=char python backend/scripts/convert_guid_storage.py \
+        --database-url sqlite:///dev.db
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.database import get_database_url
+from app.models.types import (
+    GUID_STORAGE_BINARY,
+    GUID_STORAGE_CHAR,
+    binary_guid_storage,
+)
+from app.services.guid_storage import convert_guid_storage
+from sqlalchemy import create_engine
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="defaults to DATABASE_URL")
+    args = parser.parse_args()
+
+    binary = binary_guid_storage()
+    # A plain engine: build_engine would refuse the database being converted.
+    engine = create_engine(args.database_url or get_database_url(), future=True)
+    try:
+        converted = convert_guid_storage(engine, binary)
+    finally:
+        engine.dispose()
+    print(
+        json.dumps(
+            {
+                "storage": GUID_STORAGE_BINARY if binary else GUID_STORAGE_CHAR,
+                "converted_rows": converted,
+            },
+            indent=2,
+        ),
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
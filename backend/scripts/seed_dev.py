@@ -1,21 +1,50 @@
 #!/usr/bin/env python3
-"""Seed development data for RBAC roles, sample users, and enrollment lifecycle."""
+"""Seed development data for RBAC roles, sample users, and enrollment lifecycle.
+
+Beyond the fixed baseline below, ``--staff`` and ``--enrollments`` add
+generated users and applications from ``app.services.seeding`` (same
+``--seed``, same data). Requests run on an async client with at most
+``--concurrency`` in flight; each application's submit, approval and
+provision calls stay in order.
+
+    python backend/scripts/seed_dev.py --staff 2000 --enrollments 5000
+    python backend/scripts/seed_dev.py --stand-in --staff 2000
+    python backend/scripts/seed_dev.py --database-url sqlite:///dev.db
+
+``--stand-in`` answers every call in process instead of hitting
+``ESE_API_BASE_URL``; ``--database-url`` skips the API and bulk-inserts a
+full ``SeedPlan`` (cycles, ratings, nominations, votes and awards too).
+"""
 
 from __future__ import annotations
 
+import argparse
+import asyncio
+import itertools
 import json
 import logging
 import os
+import sys
+import time
+import uuid
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterable, Iterator
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional
+from pathlib import Path
+from typing import Any, TypeVar
 
-import requests
+import httpx
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(message)s",
+from app.models import EnrollmentStatus
+from app.services.seeding import (
+    SeedPlan,
+    build_staff,
+    generate_enrollments,
+    seed_database,
 )
+
 logger = logging.getLogger("seed_dev")
 
 
@@ -24,7 +53,7 @@ class RoleSeed:
     slug: str
     name: str
     description: str
-    permissions: List[str]
+    permissions: list[str]
 
 
 @dataclass(frozen=True)
@@ -33,7 +62,7 @@ class UserSeed:
     email: str
     given_name: str
     family_name: str
-    roles: List[str]
+    roles: list[str]
     temporary_password: str
 
 
@@ -46,7 +75,7 @@ class EnrollmentSeed:
     guardian_external_id: str
 
 
-ROLE_SEEDS: List[RoleSeed] = [
+ROLE_SEEDS: list[RoleSeed] = [
     RoleSeed(
         slug="system-admin",
         name="System Administrator",
@@ -96,7 +125,7 @@ ROLE_SEEDS: List[RoleSeed] = [
 ]
 
 
-USER_SEEDS: List[UserSeed] = [
+USER_SEEDS: list[UserSeed] = [
     UserSeed(
         external_id="admin-0001",
         email="dev-admin@example.edu",
@@ -146,18 +175,32 @@ class ApiError(RuntimeError):
 
 
 class ApiClient:
-    def __init__(self, base_url: str, token: Optional[str] = None) -> None:
-        self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
+    def __init__(
+        self,
+        base_url: str,
+        token: str | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        headers = {"Content-Type": "application/json"}
         if token:
-            self.session.headers["Authorization"] = f"Bearer {token}"
-
-    def _url(self, path: str) -> str:
-        return f"{self.base_url}{path}"
-
-    def post_json(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        response = self.session.post(self._url(path), json=payload, timeout=30)
+            headers["Authorization"] = f"Bearer {token}"
+        self.client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            headers=headers,
+            timeout=30,
+            transport=transport,
+        )
+        self.requests: Counter[str] = Counter()
+
+    async def __aenter__(self) -> ApiClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.client.aclose()
+
+    async def post_json(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
+        response = await self.client.post(path, json=payload)
+        self.requests[response.status_code] += 1
         if response.status_code in (200, 201):
             return response.json()
         if response.status_code == 409:
@@ -168,28 +211,94 @@ class ApiClient:
                 raise ApiError(f"Conflict response without JSON for {path}") from exc
         raise ApiError(self._format_error(response))
 
-    def put_json(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        response = self.session.put(self._url(path), json=payload, timeout=30)
+    async def put_json(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
+        response = await self.client.put(path, json=payload)
+        self.requests[response.status_code] += 1
         if response.status_code in (200, 201):
             return response.json()
         raise ApiError(self._format_error(response))
 
-    def get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        response = self.session.get(self._url(path), params=params, timeout=30)
+    async def get_json(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        response = await self.client.get(path, params=params)
+        self.requests[response.status_code] += 1
         if response.status_code == 200:
             return response.json()
         if response.status_code == 404:
             raise ApiError(f"Resource not found for {path}")
         raise ApiError(self._format_error(response))
 
-    def _format_error(self, response: requests.Response) -> str:
+    def _format_error(self, response: httpx.Response) -> str:
         detail: str
         try:
             payload = response.json()
             detail = json.dumps(payload)
         except ValueError:
             detail = response.text
-        return f"{response.status_code} {response.reason}: {detail}"
+        return f"{response.status_code} {response.reason_phrase}: {detail}"
+
+
+class StandInApi:
+    """In-process replacement for the platform API.
+
+    Accepts every seed call with ``201`` and a fresh ``id`` so the loader's
+    request volume and concurrency can be exercised without running the
+    services. ``peak_in_flight`` is the most requests it held at once.
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.calls: Counter[str] = Counter()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            path = request.url.path
+            if path.startswith("/api/enrollment/applications/"):
+                path = f"/api/enrollment/applications/{{id}}/{path.rsplit('/', 1)[1]}"
+            self.calls[path] += 1
+            return httpx.Response(201, json={"id": str(uuid.uuid4())})
+        finally:
+            self.in_flight -= 1
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+
+T = TypeVar("T")
+
+
+async def run_bounded(
+    items: Iterable[T],
+    worker: Callable[[T], Awaitable[object]],
+    concurrency: int,
+) -> int:
+    """Run ``worker`` over ``items`` with at most ``concurrency`` in flight.
+
+    Items are pulled lazily, so generated volumes never sit in memory as
+    pending tasks. The first failure cancels the remaining workers.
+    """
+
+    iterator: Iterator[T] = iter(items)
+    done = 0
+
+    async def drain() -> None:
+        nonlocal done
+        for item in iterator:
+            await worker(item)
+            done += 1
+
+    async with asyncio.TaskGroup() as group:
+        for _ in range(max(concurrency, 1)):
+            group.create_task(drain())
+    return done
 
 
 def mask_identifier(identifier: str) -> str:
@@ -198,8 +307,12 @@ def mask_identifier(identifier: str) -> str:
     return f"{identifier[:2]}***{identifier[-2:]}"
 
 
-def seed_roles(client: ApiClient, roles: Iterable[RoleSeed]) -> None:
-    for role in roles:
+async def seed_roles(
+    client: ApiClient,
+    roles: Iterable[RoleSeed],
+    concurrency: int = 1,
+) -> int:
+    async def seed_role(role: RoleSeed) -> None:
         payload = {
             "slug": role.slug,
             "name": role.name,
@@ -207,15 +320,21 @@ def seed_roles(client: ApiClient, roles: Iterable[RoleSeed]) -> None:
             "permissions": role.permissions,
         }
         try:
-            client.post_json("/api/core/roles", payload)
-            logger.info("Ensured role %s", role.slug)
+            await client.post_json("/api/core/roles", payload)
+            logger.debug("Ensured role %s", role.slug)
         except ApiError as exc:
             logger.error("Unable to seed role %s: %s", role.slug, exc)
             raise
 
+    return await run_bounded(roles, seed_role, concurrency)
+
 
-def seed_users(client: ApiClient, users: Iterable[UserSeed]) -> None:
-    for user in users:
+async def seed_users(
+    client: ApiClient,
+    users: Iterable[UserSeed],
+    concurrency: int = 1,
+) -> int:
+    async def seed_user(user: UserSeed) -> None:
         payload = {
             "external_id": user.external_id,
             "email": user.email,
@@ -225,16 +344,27 @@ def seed_users(client: ApiClient, users: Iterable[UserSeed]) -> None:
             "temporary_password": user.temporary_password,
         }
         try:
-            client.post_json("/api/core/users", payload)
-            logger.info("Ensured user %s", user.external_id)
+            await client.post_json("/api/core/users", payload)
+            logger.debug("Ensured user %s", user.external_id)
         except ApiError as exc:
             logger.error(
-                "Unable to seed user %s: %s", mask_identifier(user.external_id), exc
+                "Unable to seed user %s: %s",
+                mask_identifier(user.external_id),
+                exc,
             )
             raise
 
+    return await run_bounded(users, seed_user, concurrency)
+
+
+async def seed_enrollment(
+    client: ApiClient,
+    enrollment: EnrollmentSeed,
+    status: EnrollmentStatus = EnrollmentStatus.PROVISIONED,
+    student_code: str = "STU-0001",
+) -> None:
+    """Walk one application as far through the lifecycle as ``status``."""
 
-def seed_enrollment(client: ApiClient, enrollment: EnrollmentSeed) -> None:
     submit_payload = {
         "application_code": enrollment.application_code,
         "student": {
@@ -247,49 +377,183 @@ def seed_enrollment(client: ApiClient, enrollment: EnrollmentSeed) -> None:
             "source": "seed-dev",
         },
     }
-    submission = client.post_json("/api/enrollment/applications", submit_payload)
+    submission = await client.post_json("/api/enrollment/applications", submit_payload)
     application_id = submission.get("id")
     if not application_id:
         raise ApiError("Enrollment submission missing identifier")
-    logger.info("Enrollment submitted for application %s", enrollment.application_code)
+    logger.debug("Enrollment submitted for application %s", enrollment.application_code)
+    if status in (EnrollmentStatus.SUBMITTED, EnrollmentStatus.IN_REVIEW):
+        return
 
+    rejected = status is EnrollmentStatus.REJECTED
     approve_payload = {
-        "decision": "approved",
-        "notes": "Seed approval for development sandbox.",
+        "decision": "rejected" if rejected else "approved",
+        "notes": "Seed decision for development sandbox.",
     }
-    client.post_json(
-        f"/api/enrollment/applications/{application_id}/approval", approve_payload
+    await client.post_json(
+        f"/api/enrollment/applications/{application_id}/approval",
+        approve_payload,
     )
-    logger.info("Enrollment approved for application %s", enrollment.application_code)
+    logger.debug("Enrollment decided for application %s", enrollment.application_code)
+    if status is not EnrollmentStatus.PROVISIONED:
+        return
 
+    grade_level = enrollment.grade_level
     provision_payload = {
         "student_profile": {
-            "homeroom": "HR-A1",
-            "student_code": "STU-0001",
+            "homeroom": f"HR-{grade_level}",
+            "student_code": student_code,
         },
         "enrollments": [
-            {"course_code": "MATH-KG2", "status": "active"},
-            {"course_code": "LANG-KG2", "status": "active"},
+            {"course_code": f"MATH-{grade_level}", "status": "active"},
+            {"course_code": f"LANG-{grade_level}", "status": "active"},
         ],
     }
-    client.post_json(
-        f"/api/enrollment/applications/{application_id}/provision", provision_payload
+    await client.post_json(
+        f"/api/enrollment/applications/{application_id}/provision",
+        provision_payload,
+    )
+    logger.debug(
+        "Enrollment provisioned for application %s",
+        enrollment.application_code,
     )
-    logger.info("Enrollment provisioned for application %s", enrollment.application_code)
 
 
-def run() -> None:
-    base_url = os.getenv("ESE_API_BASE_URL", "http://localhost:8000")
-    token = os.getenv("ESE_ADMIN_TOKEN")
+def generated_users(plan: SeedPlan) -> Iterator[UserSeed]:
+    """``UserSeed`` rows for the plan's staff; leadership gets admin roles."""
+
+    staff, _ = build_staff(plan)
+    for index, member in enumerate(staff):
+        given_name, _, family_name = member.name.partition(" ")
+        yield UserSeed(
+            external_id=f"staff-{member.id.hex[:12]}",
+            email=f"staff-{index:05d}@example.edu",
+            given_name=given_name,
+            family_name=family_name,
+            roles=["system-admin"] if member.role == "admin" else ["teacher"],
+            temporary_password="ChangeMe!123",
+        )
+
+
+def generated_enrollments(
+    plan: SeedPlan,
+) -> Iterator[tuple[EnrollmentSeed, EnrollmentStatus, str]]:
+    for index, row in enumerate(generate_enrollments(plan)):
+        enrollment = EnrollmentSeed(
+            application_code=f"ENR-{plan.seed}-{index:06d}",
+            student_given_name=row["student_first_name"],
+            student_family_name=row["student_last_name"],
+            grade_level=row["metadata_"]["grade_level"],
+            guardian_external_id=USER_SEEDS[-1].external_id,
+        )
+        yield enrollment, row["status"], row["assigned_student_code"] or ""
+
+
+async def seed_api(
+    client: ApiClient,
+    plan: SeedPlan,
+    concurrency: int = 16,
+) -> Counter[str]:
+    """Seed the baseline plus the plan's generated users and applications.
+
+    Roles go first since users reference them, and users before
+    applications since those name a guardian.
+    """
+
+    seeded: Counter[str] = Counter()
+    seeded["roles"] = await seed_roles(client, ROLE_SEEDS, concurrency)
+    seeded["users"] = await seed_users(
+        client,
+        itertools.chain(USER_SEEDS, generated_users(plan) if plan.staff else ()),
+        concurrency,
+    )
 
-    logger.info("Seeding data against %s", base_url)
-    client = ApiClient(base_url=base_url, token=token)
+    async def seed_generated(
+        item: tuple[EnrollmentSeed, EnrollmentStatus, str],
+    ) -> None:
+        await seed_enrollment(client, *item)
 
-    seed_roles(client, ROLE_SEEDS)
-    seed_users(client, USER_SEEDS)
-    seed_enrollment(client, ENROLLMENT_SEED)
+    await seed_enrollment(client, ENROLLMENT_SEED)
+    seeded["enrollments"] = 1 + await run_bounded(
+        generated_enrollments(plan),
+        seed_generated,
+        concurrency,
+    )
+    return seeded
+
+
+def run(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--staff", type=int, default=None)
+    parser.add_argument("--cycles", type=int, default=None)
+    parser.add_argument("--enrollments", type=int, default=None)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--stand-in",
+        action="store_true",
+        help="answer API calls in process instead of calling ESE_API_BASE_URL",
+    )
+    parser.add_argument(
+        "--database-url",
+        help="bulk-insert a full seed plan into this database instead",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+    # httpx logs every request at INFO, far too much at generated volumes.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
 
-    logger.info("Seed routine completed successfully")
+    volumes = {
+        name: value
+        for name in ("staff", "cycles", "enrollments")
+        if (value := getattr(args, name)) is not None
+    }
+    started = time.perf_counter()
+    if args.database_url:
+        from app.database import Base
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+
+        engine = create_engine(args.database_url, future=True)
+        Base.metadata.create_all(bind=engine)
+        with Session(engine) as session:
+            report = seed_database(session, SeedPlan(seed=args.seed, **volumes))
+            session.commit()
+        engine.dispose()
+        logger.info("Seeded %s in %.1fs", dict(report.rows), report.seconds)
+        return
+
+    # Through the API only the baseline is seeded unless volumes are given.
+    plan = SeedPlan(
+        seed=args.seed,
+        staff=volumes.get("staff", 0),
+        enrollments=volumes.get("enrollments", 0),
+    )
+    base_url = os.getenv("ESE_API_BASE_URL", "http://localhost:8000")
+    token = os.getenv("ESE_ADMIN_TOKEN")
+    stand_in = StandInApi() if args.stand_in else None
+
+    async def main() -> Counter[str]:
+        async with ApiClient(
+            base_url=base_url,
+            token=token,
+            transport=stand_in.transport() if stand_in else None,
+        ) as client:
+            return await seed_api(client, plan, args.concurrency)
+
+    logger.info(
+        "Seeding data against %s",
+        "in-process stand-in" if stand_in else base_url,
+    )
+    seeded = asyncio.run(main())
+    logger.info(
+        "Seed routine completed successfully: %s in %.1fs",
+        dict(seeded),
+        time.perf_counter() - started,
+    )
 
 
 if __name__ == "__main__":
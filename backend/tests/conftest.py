@@ -0,0 +1,64 @@
+"""Shared fixtures for backend tests."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import app.models  # noqa: F401
+import pytest
+from app import Base
+from app.database import reset_engines
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.orm import Session
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Point the lazily built default engine at the test database.
+
+    Runs before test modules are imported so module-level ``engine`` lookups
+    resolve to ``TEST_DATABASE_URL`` (in-memory SQLite by default).
+    """
+
+    os.environ["DATABASE_URL"] = os.getenv("TEST_DATABASE_URL", "sqlite://")
+    os.environ.setdefault("DATABASE_POOL_PROFILE", "test")
+    reset_engines()
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    reset_engines()
+
+
+@pytest.fixture()
+def sqlite_engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite://", future=True)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def session(sqlite_engine: Engine) -> Iterator[Session]:
+    with Session(sqlite_engine) as session:
+        yield session
+
+
+@pytest.fixture()
+def count_queries(sqlite_engine: Engine) -> Callable[[Callable[[], Any]], int]:
+    """Return a helper counting the statements ``call`` sends to the engine."""
+
+    def count(call: Callable[[], Any]) -> int:
+        statements: list[str] = []
+
+        def record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+            statements.append(statement)
+
+        event.listen(sqlite_engine, "before_cursor_execute", record)
+        try:
+            call()
+        finally:
+            event.remove(sqlite_engine, "before_cursor_execute", record)
+        return len(statements)
+
+    return count
@@ -0,0 +1,143 @@
+"""Model factories shared across backend tests."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from app.models import (
+    EnrollmentApplication,
+    Evaluation,
+    EvaluationCycle,
+    EvaluationRating,
+    EvaluatorRole,
+    Nomination,
+    NominationCategory,
+    NominationStatus,
+    StaffType,
+)
+from sqlalchemy.orm import Session
+
+COMMON_CRITERIA = (
+    "collaboration",
+    "innovation",
+    "attendance",
+    "professional_development",
+)
+
+
+def make_cycle(session: Session, **overrides: Any) -> EvaluationCycle:
+    now = datetime.now(UTC)
+    values: dict[str, Any] = {
+        "cycle_name": "December 2024 Evaluation",
+        "cycle_period": "2024-12",
+        "start_date": now,
+        "end_date": now + timedelta(days=14),
+        "created_by": uuid.uuid4(),
+        "total_evaluations": 0,
+        "completed_evaluations": 0,
+    }
+    values.update(overrides)
+    cycle = EvaluationCycle(id=uuid.uuid4(), **values)
+    session.add(cycle)
+    session.flush()
+    return cycle
+
+
+def make_evaluation(
+    session: Session,
+    cycle: EvaluationCycle,
+    evaluee_id: uuid.UUID,
+    role: EvaluatorRole = EvaluatorRole.PEER,
+    **overrides: Any,
+) -> Evaluation:
+    values: dict[str, Any] = {
+        "evaluee_name": f"Employee {str(evaluee_id)[:8]}",
+        "evaluee_department": "Mathematics",
+        "evaluee_staff_type": StaffType.ACADEMIC,
+        "evaluator_id": uuid.uuid4(),
+        "evaluator_name": "Evaluator",
+        "evaluator_role": role,
+        "weight": 0.1,
+        "due_date": datetime.now(UTC) + timedelta(days=7),
+    }
+    values.update(overrides)
+    evaluation = Evaluation(
+        id=uuid.uuid4(),
+        cycle_id=cycle.id,
+        evaluee_id=evaluee_id,
+        **values,
+    )
+    session.add(evaluation)
+    session.flush()
+    return evaluation
+
+
+def make_rating(
+    session: Session,
+    evaluation: Evaluation,
+    score: float,
+    **overrides: Any,
+) -> EvaluationRating:
+    values: dict[str, Any] = dict.fromkeys(COMMON_CRITERIA, score)
+    values.update(
+        evaluator_id=evaluation.evaluator_id,
+        evaluator_role=evaluation.evaluator_role,
+        weight=evaluation.weight,
+        average_score=score,
+    )
+    values.update(overrides)
+    rating = EvaluationRating(
+        id=uuid.uuid4(),
+        evaluation_id=evaluation.id,
+        cycle_id=evaluation.cycle_id,
+        evaluee_id=evaluation.evaluee_id,
+        **values,
+    )
+    session.add(rating)
+    session.flush()
+    return rating
+
+
+def make_nomination(
+    session: Session,
+    category: NominationCategory = NominationCategory.TEAMWORK,
+    status: NominationStatus = NominationStatus.VOTING,
+    **overrides: Any,
+) -> Nomination:
+    values: dict[str, Any] = {
+        "nominee_id": uuid.uuid4(),
+        "nominee_name": "Nominee",
+        "nominee_department": "Mathematics",
+        "nominator_id": uuid.uuid4(),
+        "nominator_name": "Nominator",
+        "description": "Consistently goes beyond expectations.",
+        "nomination_period": "2026-10",
+        "votes_count": 0,
+    }
+    values.update(overrides)
+    nomination = Nomination(
+        id=uuid.uuid4(),
+        category=category,
+        status=status,
+        **values,
+    )
+    session.add(nomination)
+    session.flush()
+    return nomination
+
+
+def make_application(session: Session, **overrides: Any) -> EnrollmentApplication:
+    values: dict[str, Any] = {
+        "guardian_email": "guardian@example.com",
+        "guardian_phone": "+201234567890",
+        "student_first_name": "Salma",
+        "student_last_name": "Hassan",
+        "correlation_id": "req-1",
+    }
+    values.update(overrides)
+    application = EnrollmentApplication(id=uuid.uuid4(), **values)
+    session.add(application)
+    session.flush()
+    return application
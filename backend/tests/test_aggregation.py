@@ -0,0 +1,85 @@
+"""Tests for set-based cycle aggregation."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from app.models import EvaluationRating, EvaluationResult, EvaluatorRole
+from app.services.aggregation import aggregate_cycle
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from tests.factories import make_cycle, make_evaluation, make_rating
+
+
+def test_aggregate_cycle_builds_weighted_results(session: Session) -> None:
+    cycle = make_cycle(session)
+    evaluee_id = uuid.uuid4()
+    ratings = [
+        (EvaluatorRole.SELF, 0.05, 9.0),
+        (EvaluatorRole.PEER, 0.1, 6.0),
+        (EvaluatorRole.PEER, 0.1, 8.0),
+        (EvaluatorRole.SUPERVISOR, 0.35, 7.0),
+    ]
+    for role, weight, score in ratings:
+        evaluation = make_evaluation(session, cycle, evaluee_id, role, weight=weight)
+        make_rating(session, evaluation, score)
+    make_evaluation(session, cycle, evaluee_id, EvaluatorRole.CEO, weight=0.15)
+
+    report = aggregate_cycle(session, cycle.id)
+
+    assert (report.inserted, report.updated, report.skipped) == (1, 0, 0)
+    result = session.scalars(select(EvaluationResult)).one()
+    assert result.self_score == 9.0
+    assert result.peer_scores_avg == 7.0
+    assert result.supervisor_score == 7.0
+    assert result.ceo_score is None
+    expected_final = (0.45 + 0.6 + 0.8 + 2.45) / 0.6
+    assert result.final_score == pytest.approx(expected_final)
+    assert result.received_ratings == 4
+    assert result.total_expected_ratings == 5
+    assert result.completion_percentage == pytest.approx(80.0)
+    assert result.score_variance == pytest.approx(5 / 3)
+    assert result.has_high_variance == 0
+
+
+def test_aggregate_cycle_updates_existing_results(session: Session) -> None:
+    cycle = make_cycle(session)
+    evaluee_id = uuid.uuid4()
+    low = make_evaluation(session, cycle, evaluee_id, EvaluatorRole.PEER)
+    make_rating(session, low, 4.0)
+    aggregate_cycle(session, cycle.id)
+
+    high = make_evaluation(session, cycle, evaluee_id, EvaluatorRole.SUPERVISOR)
+    make_rating(session, high, 9.0)
+    report = aggregate_cycle(session, cycle.id)
+    session.expire_all()
+
+    assert (report.inserted, report.updated) == (0, 1)
+    result = session.scalars(select(EvaluationResult)).one()
+    assert result.received_ratings == 2
+    assert result.has_high_variance == 1
+    assert result.completion_percentage == pytest.approx(100.0)
+
+
+def test_aggregate_cycle_resets_results_without_ratings(session: Session) -> None:
+    cycle = make_cycle(session)
+    evaluee_id = uuid.uuid4()
+    for score in (4.0, 9.0):
+        evaluation = make_evaluation(session, cycle, evaluee_id, EvaluatorRole.PEER)
+        make_rating(session, evaluation, score)
+    aggregate_cycle(session, cycle.id)
+
+    session.execute(delete(EvaluationRating))
+    report = aggregate_cycle(session, cycle.id)
+    session.expire_all()
+
+    assert (report.inserted, report.updated) == (0, 1)
+    result = session.scalars(select(EvaluationResult)).one()
+    assert result.peer_scores_avg is None
+    assert result.final_score == 0.0
+    assert result.received_ratings == 0
+    assert result.score_variance is None
+    assert result.has_high_variance == 0
+    assert result.completion_percentage == 0.0
+    assert result.total_expected_ratings == 2
@@ -0,0 +1,131 @@
+"""Tests for bulk generation of evaluation assignments."""
+
+from __future__ import annotations
+
+import uuid
+from collections import Counter
+from datetime import UTC, datetime
+
+import pytest
+from app.models import Evaluation, EvaluationCycleStatus, EvaluatorRole, StaffType
+from app.services.assignments import (
+    Leadership,
+    StaffMember,
+    assign_cycle,
+    generate_assignments,
+)
+from app.services.rollups import cycle_progress
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from tests.factories import make_cycle
+
+
+def member(name: str, department: str, role: str = "staff") -> StaffMember:
+    return StaffMember(id=uuid.uuid4(), name=name, department=department, role=role)
+
+
+CEO = member("CEO", "Leadership", role="admin")
+PC_HEAD = member("P&C Head", "People and Culture", role="admin")
+PRINCIPAL = member("Principal", "Primary Principal", role="manager")
+ADMIN_MANAGER = member("Admin Manager", "Administration", role="manager")
+LEADERSHIP = Leadership(
+    ceo=CEO,
+    pc_head=PC_HEAD,
+    academic_supervisor=PRINCIPAL,
+    administrative_manager=ADMIN_MANAGER,
+)
+STAFF = [
+    CEO,
+    PC_HEAD,
+    PRINCIPAL,
+    ADMIN_MANAGER,
+    *(member(f"Math {index}", "Math Teacher") for index in range(4)),
+    member("Science", "Science Teacher"),
+    member("Nurse", "Nurse"),
+    member("Assistant A", "Assistant Admin"),
+    member("Assistant B", "Assistant Finance"),
+]
+
+
+def expected_rater_count(employee: StaffMember, all_staff: list[StaffMember]) -> int:
+    # getExpectedRaterCount from src/lib/evaluations.ts, minus the CEO and
+    # P&C head rating themselves in their leadership role.
+    count = 1
+    if employee.role == "staff":
+        if "Teacher" in employee.department:
+            count += 1
+        if "Assistant" in employee.department or "Nurse" in employee.department:
+            count += 1
+    count += 2
+    if employee.role == "staff":
+        peers = [
+            staff
+            for staff in all_staff
+            if staff.role == "staff"
+            and staff.id != employee.id
+            and staff.peer_group == employee.peer_group
+        ]
+        count += min(2, len(peers))
+    return count - (employee in (CEO, PC_HEAD))
+
+
+def test_assign_cycle_builds_expected_matrix(session: Session) -> None:
+    cycle = make_cycle(session)
+
+    report = assign_cycle(session, cycle, STAFF, LEADERSHIP)
+
+    rows = session.execute(
+        select(
+            Evaluation.evaluee_id,
+            Evaluation.evaluator_id,
+            Evaluation.evaluator_role,
+            Evaluation.evaluee_staff_type,
+            Evaluation.weight,
+        ).where(Evaluation.cycle_id == cycle.id),
+    ).all()
+    per_evaluee = Counter(row.evaluee_id for row in rows)
+    assert per_evaluee == {
+        staff.id: expected_rater_count(staff, STAFF) for staff in STAFF
+    }
+    assert report.evaluations == len(rows) == cycle.total_evaluations
+    assert cycle.status == EvaluationCycleStatus.ACTIVE
+
+    math = [staff for staff in STAFF if staff.department == "Math Teacher"]
+    peer_load = Counter(
+        row.evaluator_id for row in rows if row.evaluator_role == EvaluatorRole.PEER
+    )
+    assert all(peer_load[staff.id] == 2 for staff in math)
+    assert {
+        (row.evaluator_role, row.weight) for row in rows if row.evaluee_id == math[0].id
+    } == {
+        (EvaluatorRole.SELF, 0.05),
+        (EvaluatorRole.SUPERVISOR, 0.40),
+        (EvaluatorRole.PEER, 0.10),
+        (EvaluatorRole.CEO, 0.15),
+        (EvaluatorRole.PC_HEAD, 0.25),
+    }
+    assert {row.evaluee_staff_type for row in rows if row.evaluee_id == math[0].id} == {
+        StaffType.ACADEMIC,
+    }
+    progress = cycle_progress(session, cycle.id).rows
+    assert sum(row["total"] for row in progress) == report.evaluations
+    assert sum(row["not_started"] for row in progress) == report.evaluations
+
+    with pytest.raises(ValueError, match="already has"):
+        assign_cycle(session, cycle, STAFF, LEADERSHIP)
+    assert session.scalar(select(func.count()).select_from(Evaluation)) == len(rows)
+
+
+def test_peer_sampling_is_deterministic() -> None:
+    cycle_id = uuid.uuid4()
+    due = datetime.now(UTC)
+
+    def pairs(cycle: uuid.UUID) -> set[tuple[uuid.UUID, uuid.UUID]]:
+        return {
+            (row["evaluator_id"], row["evaluee_id"])
+            for row in generate_assignments(cycle, STAFF, LEADERSHIP, due)
+            if row["evaluator_role"] == EvaluatorRole.PEER
+        }
+
+    assert pairs(cycle_id) == pairs(cycle_id)
+    assert all(evaluator != evaluee for evaluator, evaluee in pairs(cycle_id))
@@ -0,0 +1,153 @@
+"""Tests for audit_log partitions and the buffered audit writer."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+from app import Base
+from app.models import AuditLog
+from app.services.audit import (
+    AuditWriter,
+    audit_trail,
+    ensure_audit_partitions,
+    list_partitions,
+    partition_name,
+)
+from app.services.audit_diff import replay, state_at
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+
+def test_ensure_audit_partitions_creates_months_once(session: Session) -> None:
+    connection = session.connection()
+
+    created = ensure_audit_partitions(connection, datetime(2026, 11, 20, tzinfo=UTC))
+    again = ensure_audit_partitions(connection, datetime(2026, 11, 1, tzinfo=UTC))
+
+    assert created == ["audit_log_2026_11", "audit_log_2026_12", "audit_log_2027_01"]
+    assert again == []
+    assert list_partitions(connection) == created
+
+
+def test_writer_batches_events_into_period_tables(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}", future=True)
+    Base.metadata.create_all(bind=engine)
+    entity_id = uuid.uuid4()
+    moments = [
+        datetime(2026, 9, 30, 23, 59, tzinfo=UTC),
+        datetime(2026, 10, 1, 0, 0, tzinfo=UTC),
+        datetime(2026, 10, 17, 9, 30, tzinfo=UTC),
+    ]
+
+    with AuditWriter(engine, batch_size=2, flush_interval=0.01) as writer:
+        for moment in reversed(moments):
+            writer.record(
+                actor_id=uuid.uuid4(),
+                actor_role="counselor",
+                entity_type="enrollment_application",
+                entity_id=entity_id,
+                action="updated",
+                summary="Enrollment application updated",
+                after={"status": "approved"},
+                correlation_id="req-1",
+                created_at=moment,
+            )
+        writer.flush()
+        stats = writer.stats
+
+    with Session(engine) as session:
+        session.add(
+            AuditLog(
+                actor_id=uuid.uuid4(),
+                actor_role="system",
+                entity_type="enrollment_application",
+                entity_id=entity_id,
+                action="created",
+                summary="Enrollment application created",
+                created_at=datetime(2026, 9, 1, tzinfo=UTC),
+            ),
+        )
+        session.flush()
+
+        trail = audit_trail(session, "enrollment_application", entity_id)
+        partitions = list_partitions(session.connection())
+        catch_all = session.scalar(select(func.count()).select_from(AuditLog))
+
+    engine.dispose()
+    assert stats.written == 3
+    assert stats.failed == 0
+    assert partitions == [partition_name(moments[0]), partition_name(moments[1])]
+    assert catch_all == 1
+    assert [row.action for row in trail] == ["created", "updated", "updated", "updated"]
+    assert trail[-1].after == {"status": "approved"}
+
+
+def test_audit_lookups_use_indexes(session: Session) -> None:
+    connection = session.connection()
+    ensure_audit_partitions(connection, datetime(2026, 10, 1, tzinfo=UTC), 0)
+
+    def plan(sql: str) -> str:
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")
+        return "\n".join(row[-1] for row in rows)
+
+    for table in ("audit_log", "audit_log_2026_10"):
+        trail = plan(
+            f"SELECT id FROM {table} WHERE entity_type = 'evaluation' "  # noqa: S608
+            "AND entity_id = 'x' ORDER BY created_at",
+        )
+        correlated = plan(
+            f"SELECT id FROM {table} WHERE correlation_id = 'req-1'",  # noqa: S608
+        )
+
+        assert f"ix_{table}_entity_created" in trail, trail
+        assert f"ix_{table}_correlation_id" in correlated, correlated
+
+
+def test_record_change_stores_patches_between_snapshots(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}", future=True)
+    Base.metadata.create_all(bind=engine)
+    entity_id = uuid.uuid4()
+    versions = [
+        {"status": "draft", "checklist": {"transcript": False}, "notes": None},
+        {"status": "submitted", "checklist": {"transcript": False}, "notes": None},
+        {"status": "submitted", "checklist": {"transcript": True}, "notes": "ok"},
+        {"status": "approved", "checklist": {"transcript": True}},
+        {"status": "approved", "checklist": {"transcript": True}, "tags": ["a/b"]},
+    ]
+
+    with AuditWriter(engine, snapshot_every=3) as writer:
+        for index, (before, after) in enumerate(
+            zip([None, *versions], versions, strict=False),
+        ):
+            writer.record_change(
+                actor_id=uuid.uuid4(),
+                actor_role="counselor",
+                entity_type="enrollment_application",
+                entity_id=entity_id,
+                action="updated",
+                summary="Enrollment application updated",
+                before=before,
+                after=after,
+                created_at=datetime(2026, 10, 1, index, tzinfo=UTC),
+            )
+        writer.flush()
+
+    with Session(engine) as session:
+        trail = audit_trail(session, "enrollment_application", entity_id)
+    engine.dispose()
+
+    assert [row.payload_format for row in trail] == [
+        "snapshot",
+        "patch",
+        "patch",
+        "snapshot",
+        "patch",
+    ]
+    assert trail[1].after == [
+        {"op": "replace", "path": "/status", "value": "submitted"},
+    ]
+    assert all(row.before is None for row in trail)
+    assert [state for _, state in replay(trail)] == versions
+    assert state_at(trail, datetime(2026, 10, 1, 2, 30, tzinfo=UTC)) == versions[2]
@@ -0,0 +1,97 @@
+"""Tests for cold-tier archival of audit_log partitions."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from app import Base
+from app.services.audit import AuditWriter, list_partitions
+from app.services.audit_archive import (
+    AuditArchive,
+    archive_audit_partitions,
+    entity_history,
+)
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+
+@pytest.mark.parametrize("codec", ["gzip", "zstd"])
+def test_archive_moves_old_partitions_to_indexed_files(
+    tmp_path: Path,
+    codec: str,
+) -> None:
+    if codec == "zstd":
+        pytest.importorskip("zstandard")
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}", future=True)
+    Base.metadata.create_all(bind=engine)
+    tracked = uuid.uuid4()
+    others = [uuid.uuid4() for _ in range(30)]
+
+    with AuditWriter(engine, snapshot_every=4) as writer:
+        for step, month in enumerate([1, 1, 2, 2, 9, 10]):
+            writer.record_change(
+                actor_id=uuid.uuid4(),
+                actor_role="counselor",
+                entity_type="enrollment_application",
+                entity_id=tracked,
+                action="updated",
+                summary="Enrollment application updated",
+                before={"step": step - 1} if step else None,
+                after={"step": step},
+                created_at=datetime(2025, month, 10, step, tzinfo=UTC),
+            )
+        for other in others:
+            writer.record(
+                actor_id=uuid.uuid4(),
+                actor_role="system",
+                entity_type="enrollment_application",
+                entity_id=other,
+                action="created",
+                summary="Enrollment application created",
+                after={"step": 0},
+                created_at=datetime(2025, 1, 20, tzinfo=UTC),
+            )
+        writer.flush()
+
+    with engine.begin() as connection:
+        manifests = archive_audit_partitions(
+            connection,
+            tmp_path / "archive",
+            older_than_months=12,
+            now=datetime(2026, 10, 15, tzinfo=UTC),
+            rows_per_frame=8,
+            codec=codec,
+        )
+        remaining = list_partitions(connection)
+
+    archive = AuditArchive(tmp_path / "archive")
+    with Session(engine) as session:
+        history = entity_history(session, "enrollment_application", tracked, archive)
+    engine.dispose()
+
+    assert [manifest.partition for manifest in manifests] == [
+        "audit_log_2025_01",
+        "audit_log_2025_02",
+        "audit_log_2025_09",
+    ]
+    assert {manifest.codec for manifest in manifests} == {codec}
+    assert manifests[0].rows == 32
+    assert manifests[0].frames == 4
+    assert remaining == ["audit_log_2025_10"]
+    assert sum(1 for _ in archive.rows()) == 35
+    assert [state for _, state in history] == [{"step": step} for step in range(6)]
+    assert [row["payload_format"] for row, _ in history] == [
+        "snapshot",
+        "patch",
+        "patch",
+        "patch",
+        "snapshot",
+        "patch",
+    ]
+    assert (
+        archive.entity_rows("enrollment_application", others[0])[0]["entity_id"]
+        == others[0]
+    )
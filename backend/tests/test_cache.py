@@ -0,0 +1,209 @@
+"""Tests for the released result and award read-through cache."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+from app.models import Award, AwardType, EvaluationResult, StaffType
+from app.services.cache import RecordCache, TTLCache, result_key
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+from tests.factories import make_cycle
+
+
+class DictCache:
+    def __init__(self) -> None:
+        self.entries: dict[str, Any] = {}
+
+    def get(self, key: str) -> Any | None:
+        return self.entries.get(key)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self.entries[key] = value
+
+    def delete(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self.entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        for key in [key for key in self.entries if key.startswith(prefix)]:
+            del self.entries[key]
+
+
+def make_result(session: Session, **overrides: Any) -> EvaluationResult:
+    values: dict[str, Any] = {
+        "evaluee_id": uuid.uuid4(),
+        "evaluee_name": "Employee",
+        "evaluee_department": "Mathematics",
+        "evaluee_staff_type": StaffType.ACADEMIC,
+        "final_score": 8.0,
+        "total_expected_ratings": 4,
+        "received_ratings": 4,
+        "completion_percentage": 100.0,
+    }
+    values.update(overrides)
+    result = EvaluationResult(id=uuid.uuid4(), **values)
+    session.add(result)
+    session.commit()
+    return result
+
+
+def make_award(**overrides: Any) -> dict[str, Any]:
+    values: dict[str, Any] = {
+        "id": uuid.uuid4(),
+        "recipient_id": uuid.uuid4(),
+        "recipient_name": "Employee",
+        "department": "Mathematics",
+        "award_type": AwardType.EMPLOYEE_OF_MONTH,
+        "award_period": "2024-12",
+        "description": "Outstanding month",
+    }
+    values.update(overrides)
+    return values
+
+
+def test_released_result_is_never_stale(session: Session) -> None:
+    cache = RecordCache()
+    cycle = make_cycle(session)
+    result = make_result(session, cycle_id=cycle.id)
+
+    def read() -> Any:
+        return cache.released_result(session, cycle.id, result.evaluee_id)
+
+    assert read() is None
+    assert read() is None
+    assert cache.local.stats.hits == 1
+
+    result.mark_released()
+    session.commit()
+    released = read()
+    assert released is not None
+    assert released["released_at"] is not None
+    assert read() is released
+
+    result.final_score = 9.5
+    session.commit()
+    assert read()["final_score"] == 9.5
+
+    session.execute(
+        update(EvaluationResult)
+        .where(EvaluationResult.id == result.id)
+        .values(final_score=7.0),
+    )
+    assert read()["final_score"] == 7.0
+    session.commit()
+    assert read()["final_score"] == 7.0
+
+    session.execute(
+        update(EvaluationResult)
+        .where(EvaluationResult.id == result.id)
+        .values(final_score=6.0),
+    )
+    session.rollback()
+    assert read()["final_score"] == 7.0
+
+
+def test_awards_refresh_when_granted(session: Session) -> None:
+    cache = RecordCache()
+
+    def read() -> tuple[Any, ...]:
+        return cache.awards(session, "2024-12", AwardType.EMPLOYEE_OF_MONTH)
+
+    assert read() == ()
+    session.add(Award(**make_award(recipient_name="First")))
+    session.commit()
+    assert [award["recipient_name"] for award in read()] == ["First"]
+
+    session.execute(insert(Award), [make_award(recipient_name="Second")])
+    session.commit()
+    assert [award["recipient_name"] for award in read()] == ["First", "Second"]
+
+    moved = session.query(Award).filter_by(recipient_name="First").one()
+    moved.award_period = "2025-01"
+    session.commit()
+    assert [award["recipient_name"] for award in read()] == ["Second"]
+    (first,) = cache.awards(session, "2025-01", AwardType.EMPLOYEE_OF_MONTH)
+    assert first["recipient_name"] == "First"
+
+
+def test_unreleased_lookups_expire_quickly(session: Session) -> None:
+    now = [0.0]
+    cache = RecordCache(TTLCache(clock=lambda: now[0]), negative_ttl=5)
+    cycle = make_cycle(session)
+    result = make_result(session, cycle_id=cycle.id)
+    session.commit()
+
+    def read() -> Any:
+        return cache.released_result(session, cycle.id, result.evaluee_id)
+
+    assert read() is None
+    # Released by another worker: nothing invalidates this process's tier.
+    table = EvaluationResult.__table__
+    session.connection().execute(
+        update(table)
+        .where(table.c.id == result.id)
+        .values(released_at=datetime.now(UTC)),
+    )
+    session.commit()
+    now[0] = 4
+    assert read() is None
+    now[0] = 6
+    released = read()
+    assert released is not None
+    now[0] = 200
+    assert read() is released
+
+    uncached = RecordCache(negative_ttl=0)
+    assert uncached.awards(session, "2024-12", AwardType.EMPLOYEE_OF_MONTH) == ()
+    assert len(uncached.local) == 0
+
+
+def test_ttl_lru_and_shared_tier(session: Session) -> None:
+    now = [0.0]
+    local = TTLCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    local.set("a", 1)
+    local.set("b", 2)
+    assert local.get("a") == 1
+    local.set("c", 3)
+    assert local.get("b") is None
+    now[0] = 11
+    assert local.get("a") is None
+    assert (local.stats.evictions, local.stats.expirations) == (1, 1)
+    assert len(local) == 1
+
+    shared = DictCache()
+    cycle = make_cycle(session)
+    result = make_result(session, cycle_id=cycle.id)
+    result.mark_released()
+    session.commit()
+    key = result_key(cycle.id, result.evaluee_id)
+
+    first = RecordCache(shared=shared)
+    first.released_result(session, cycle.id, result.evaluee_id)
+    assert key in shared.entries
+
+    second = RecordCache(shared=shared)
+    snapshot = second.released_result(session, cycle.id, result.evaluee_id)
+    assert snapshot is not None
+    assert second.shared_stats.hits == 1
+
+    result.final_score = 5.0
+    session.commit()
+    assert key not in shared.entries
+    snapshot = second.released_result(session, cycle.id, result.evaluee_id)
+    assert snapshot["final_score"] == 5.0
+
+
+def test_unflushed_write_is_not_shared(session: Session) -> None:
+    cache = RecordCache()
+    cycle = make_cycle(session)
+    result = make_result(session, cycle_id=cycle.id)
+    result.mark_released()
+
+    assert cache.released_result(session, cycle.id, result.evaluee_id) is not None
+    assert len(cache.local) == 0
+    session.rollback()
+    assert cache.released_result(session, cycle.id, result.evaluee_id) is None
@@ -0,0 +1,87 @@
+"""Tests for the overdue evaluation sweeper."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from app.models import Evaluation, EvaluationStatus, OutboxEvent
+from app.services.deadlines import LATE_EVENT, sweep_overdue
+from sqlalchemy import Engine, event, func, select
+from sqlalchemy.orm import Session
+from tests.factories import make_cycle, make_evaluation
+
+
+def test_sweep_marks_overdue_in_batches(sqlite_engine: Engine) -> None:
+    now = datetime.now(UTC)
+    overdue = now - timedelta(days=1)
+    with Session(sqlite_engine) as session:
+        first, second = make_cycle(session), make_cycle(session)
+        statuses = {
+            EvaluationStatus.NOT_STARTED: 4,
+            EvaluationStatus.IN_PROGRESS: 1,
+            EvaluationStatus.SUBMITTED: 1,
+        }
+        for status, count in statuses.items():
+            for _ in range(count):
+                make_evaluation(
+                    session,
+                    first,
+                    uuid.uuid4(),
+                    status=status,
+                    due_date=overdue,
+                )
+        make_evaluation(session, first, uuid.uuid4(), due_date=now + timedelta(days=1))
+        for _ in range(2):
+            make_evaluation(
+                session,
+                second,
+                uuid.uuid4(),
+                due_date=overdue - timedelta(days=1),
+            )
+        session.commit()
+        first_id, second_id = first.id, second.id
+
+    statements: list[tuple[str, Any]] = []
+
+    def capture(*args: Any) -> None:
+        statements.append((args[2], args[3]))
+
+    event.listen(sqlite_engine, "before_cursor_execute", capture)
+    try:
+        report = sweep_overdue(sqlite_engine, now=now, batch_size=3)
+    finally:
+        event.remove(sqlite_engine, "before_cursor_execute", capture)
+
+    assert report.marked_late == 7
+    assert report.batches == 3
+    assert report.by_cycle == {first_id: 5, second_id: 2}
+    updates = [item for item in statements if item[0].startswith("UPDATE evaluation ")]
+    assert len(updates) == 3
+    with sqlite_engine.connect() as connection:
+        plan = connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {updates[0][0]}",
+            updates[0][1],
+        )
+        assert "ix_evaluation_open_due_date" in "\n".join(row[-1] for row in plan)
+
+    with Session(sqlite_engine) as session:
+        late = dict(
+            session.execute(
+                select(Evaluation.cycle_id, func.count())
+                .where(Evaluation.status == EvaluationStatus.LATE)
+                .group_by(Evaluation.cycle_id),
+            ).all(),
+        )
+        assert late == {first_id: 5, second_id: 2}
+        events = session.scalars(
+            select(OutboxEvent).where(OutboxEvent.event_type == LATE_EVENT),
+        ).all()
+        assert sum(item.payload["count"] for item in events) == 7
+        # Oldest first: the second cycle's two rows share a batch with one
+        # of the first cycle's, then two more batches for the first cycle.
+        assert len(events) == 4
+        assert {item.aggregate_id for item in events} == {first_id, second_id}
+
+    assert sweep_overdue(sqlite_engine, now=now).marked_late == 0
@@ -0,0 +1,161 @@
+"""Tests for the precomputed nomination eligibility index."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from app.models import (
+    Award,
+    AwardType,
+    EligibilityTracking,
+    EvaluationResult,
+    NominationCategory,
+    NominationStatus,
+    StaffType,
+)
+from app.services.eligibility import (
+    DUPLICATE,
+    INELIGIBLE,
+    ROTATION_LOCK,
+    build_eligibility_index,
+    check_nomination,
+    department_eligibility,
+)
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from tests.factories import make_cycle, make_nomination
+
+PERIOD = "2026-10"
+
+
+def test_index_follows_tracking_and_nomination_changes(session: Session) -> None:
+    employee_id = uuid.uuid4()
+    tracking = EligibilityTracking(employee_id=employee_id, employee_name="Mona")
+    session.add(tracking)
+    nomination = make_nomination(
+        session,
+        category=NominationCategory.TEAMWORK,
+        nominee_id=employee_id,
+        nominee_name="Mona",
+        nomination_period=PERIOD,
+    )
+
+    def violations(category: NominationCategory) -> tuple[str, ...]:
+        return check_nomination(session, PERIOD, employee_id, category).violations
+
+    assert violations(NominationCategory.TEAMWORK) == (DUPLICATE,)
+    assert violations(NominationCategory.INNOVATION) == ()
+
+    tracking.set_ineligible("On leave")
+    session.flush()
+    decision = check_nomination(session, PERIOD, employee_id)
+    assert decision.violations == (INELIGIBLE,)
+    assert decision.reason == "On leave"
+
+    tracking.set_eligible()
+    nomination.mark_rejected()
+    session.flush()
+    assert violations(NominationCategory.TEAMWORK) == ()
+
+    tracking.update_after_award(AwardType.EMPLOYEE_OF_MONTH)
+    session.flush()
+    assert violations(NominationCategory.TEAMWORK) == (ROTATION_LOCK,)
+    later = datetime.now(UTC) + timedelta(days=91)
+    assert check_nomination(session, PERIOD, employee_id, now=later).eligible
+
+
+def test_award_without_tracking_starts_rotation_lock(session: Session) -> None:
+    employee_id = uuid.uuid4()
+    assert check_nomination(session, PERIOD, employee_id).eligible
+
+    session.add(
+        Award(
+            recipient_id=employee_id,
+            recipient_name="Omar",
+            department="Science",
+            award_type=AwardType.EMPLOYEE_OF_MONTH,
+            award_period="2026-09",
+            description="Outstanding month",
+        ),
+    )
+    session.flush()
+    decision = check_nomination(session, PERIOD, employee_id)
+    assert decision.violations == (ROTATION_LOCK,)
+    assert decision.department == "Science"
+
+
+def test_earlier_nomination_starts_rotation_lock(session: Session) -> None:
+    employee_id = uuid.uuid4()
+    assert check_nomination(session, PERIOD, employee_id).eligible
+
+    submitted = datetime.now(UTC) - timedelta(days=30)
+    make_nomination(
+        session,
+        status=NominationStatus.REJECTED,
+        nominee_id=employee_id,
+        nominee_name="Laila",
+        nominee_department="Arts",
+        nomination_period="2026-09",
+        submitted_at=submitted,
+    )
+    decision = check_nomination(session, PERIOD, employee_id)
+    assert decision.violations == (ROTATION_LOCK,)
+    assert decision.locked_until == submitted + timedelta(days=90)
+    assert decision.department == "Arts"
+    # The nomination's own period is left to the duplicate check.
+    assert check_nomination(session, "2026-09", employee_id).eligible
+    later = submitted + timedelta(days=91)
+    assert check_nomination(session, PERIOD, employee_id, now=later).eligible
+
+
+def test_department_eligibility_is_one_query(session: Session) -> None:
+    cycle = make_cycle(session, cycle_period=PERIOD)
+
+    def result(department: str, **overrides: Any) -> EvaluationResult:
+        values: dict[str, Any] = {
+            "cycle_id": cycle.id,
+            "evaluee_id": uuid.uuid4(),
+            "evaluee_name": "Employee",
+            "evaluee_department": department,
+            "evaluee_staff_type": StaffType.ACADEMIC,
+            "final_score": 8.0,
+            "total_expected_ratings": 4,
+            "received_ratings": 4,
+            "completion_percentage": 100.0,
+        }
+        values.update(overrides)
+        row = EvaluationResult(id=uuid.uuid4(), **values)
+        session.add(row)
+        return row
+
+    eligible = result("Mathematics")
+    flagged = result("Mathematics")
+    result("Science")
+    session.add(
+        EligibilityTracking(
+            employee_id=flagged.evaluee_id,
+            employee_name="Flagged",
+            ineligible=1,
+            ineligibility_reason="Probation",
+        ),
+    )
+    session.flush()
+    assert build_eligibility_index(session, PERIOD) == 3
+
+    statements: list[str] = []
+
+    def count(*args: Any) -> None:
+        statements.append(args[2])
+
+    event.listen(session.get_bind(), "before_cursor_execute", count)
+    try:
+        decisions = department_eligibility(session, PERIOD, "Mathematics")
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count)
+
+    assert len(statements) == 1
+    assert decisions.keys() == {eligible.evaluee_id, flagged.evaluee_id}
+    assert decisions[eligible.evaluee_id].eligible
+    assert decisions[flagged.evaluee_id].violations == (INELIGIBLE,)
@@ -0,0 +1,286 @@
+"""Enrollment state machine, batch transitions and optimistic locking."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from app import Base
+from app.models import (
+    EnrollmentApplication,
+    EnrollmentStatus,
+    InvalidTransitionError,
+    OutboxEvent,
+)
+from app.services.audit import AuditWriter, audit_trail
+from app.services.enrollment_lifecycle import (
+    CONFLICT_INVALID_STATE,
+    CONFLICT_NOT_FOUND,
+    CONFLICT_STALE,
+    StaleApplicationError,
+    transition_application,
+    transition_applications,
+)
+from sqlalchemy import Engine, create_engine, event, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+from tests.factories import make_application
+
+
+def test_batch_approval_reports_every_row_in_one_update(
+    sqlite_engine: Engine,
+    session: Session,
+    count_queries: Callable[[Callable[[], Any]], int],
+) -> None:
+    pending = [make_application(session) for _ in range(5)]
+    rejected = make_application(session, status=EnrollmentStatus.REJECTED)
+    edited = make_application(session)
+    edited.notes = "Guardian called"
+    session.flush()
+    missing = uuid.uuid4()
+    session.commit()
+    actor_id = uuid.uuid4()
+    updates: list[str] = []
+
+    def record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        if statement.startswith("UPDATE enrollment_application"):
+            updates.append(statement)
+
+    requested = {application.id: 1 for application in pending}
+    requested.update({rejected.id: None, edited.id: 1, missing: None})
+    event.listen(sqlite_engine, "before_cursor_execute", record)
+    try:
+        report = transition_applications(
+            session,
+            EnrollmentStatus.APPROVED,
+            requested,
+            actor_id=actor_id,
+            audit=AuditWriter(sqlite_engine),
+        )
+    finally:
+        event.remove(sqlite_engine, "before_cursor_execute", record)
+
+    assert len(updates) == 1
+    assert report.applied == {application.id: 2 for application in pending}
+    assert not report.ok
+    assert report.conflicts[rejected.id].reason == CONFLICT_INVALID_STATE
+    assert report.conflicts[rejected.id].status is EnrollmentStatus.REJECTED
+    assert report.conflicts[edited.id].reason == CONFLICT_STALE
+    assert report.conflicts[edited.id].version == 2
+    assert report.conflicts[missing].reason == CONFLICT_NOT_FOUND
+
+    # Loaded instances are expired and refresh with the new state.
+    assert pending[0].status is EnrollmentStatus.APPROVED
+    assert pending[0].version == 2
+    assert pending[0].approved_at is not None
+    assert edited.status is EnrollmentStatus.SUBMITTED
+    events = session.scalars(
+        select(OutboxEvent).order_by(OutboxEvent.aggregate_id),
+    ).all()
+    assert sorted(event.aggregate_id for event in events) == sorted(
+        application.id for application in pending
+    )
+    assert {event.event_type for event in events} == {"enrollment.approved"}
+    assert events[0].payload["approved_by"] == str(actor_id)
+
+    # Provisioning sets each student code in one statement as well.
+    codes = {application.id: f"S-{index}" for index, application in enumerate(pending)}
+    statements = count_queries(
+        lambda: transition_applications(
+            session,
+            EnrollmentStatus.PROVISIONED,
+            list(codes),
+            actor_id=actor_id,
+            student_codes=codes,
+            audit=AuditWriter(sqlite_engine),
+        ),
+    )
+    assert statements == 3
+    assert {application.assigned_student_code for application in pending} == set(
+        codes.values(),
+    )
+
+
+def test_single_transitions_guard_state_and_version(
+    sqlite_engine: Engine,
+    session: Session,
+) -> None:
+    application = make_application(session)
+    session.commit()
+    actor_id = uuid.uuid4()
+    audit = AuditWriter(sqlite_engine)
+
+    with pytest.raises(InvalidTransitionError):
+        application.mark_provisioned("S-1", datetime.now(UTC))
+    with pytest.raises(InvalidTransitionError):
+        transition_application(
+            session,
+            application.id,
+            EnrollmentStatus.PROVISIONED,
+            actor_id=actor_id,
+            student_codes={application.id: "S-1"},
+            audit=audit,
+        )
+    version = transition_application(
+        session,
+        application.id,
+        EnrollmentStatus.IN_REVIEW,
+        expected_version=1,
+        actor_id=actor_id,
+        audit=audit,
+    )
+    assert version == 2
+    with pytest.raises(StaleApplicationError):
+        transition_application(
+            session,
+            application.id,
+            EnrollmentStatus.APPROVED,
+            expected_version=1,
+            actor_id=actor_id,
+            audit=audit,
+        )
+    with pytest.raises(ValueError, match="does not exist"):
+        transition_application(
+            session,
+            uuid.uuid4(),
+            EnrollmentStatus.APPROVED,
+            actor_id=actor_id,
+            audit=audit,
+        )
+    session.commit()
+
+    # Two registrars editing the same row through the ORM: the second loses.
+    with Session(sqlite_engine) as first, Session(sqlite_engine) as second:
+        mine = first.get(EnrollmentApplication, application.id)
+        theirs = second.get(EnrollmentApplication, application.id)
+        mine.mark_approved(datetime.now(UTC), actor_id)
+        first.commit()
+        theirs.mark_rejected(datetime.now(UTC))
+        with pytest.raises(StaleDataError):
+            second.flush()
+
+    session.expire_all()
+    assert application.status is EnrollmentStatus.APPROVED
+    assert application.version == 3
+
+
+def test_batch_rejection_keeps_the_review_time(
+    sqlite_engine: Engine,
+    session: Session,
+) -> None:
+    reviewed_at = datetime(2026, 9, 1, 9, 30, tzinfo=UTC)
+    reviewed = make_application(
+        session,
+        status=EnrollmentStatus.IN_REVIEW,
+        reviewed_at=reviewed_at,
+    )
+    unreviewed = make_application(session)
+    session.commit()
+    when = datetime(2026, 9, 14, 12, 0, tzinfo=UTC)
+
+    report = transition_applications(
+        session,
+        EnrollmentStatus.REJECTED,
+        [reviewed.id, unreviewed.id],
+        actor_id=uuid.uuid4(),
+        when=when,
+        audit=AuditWriter(sqlite_engine),
+    )
+    session.commit()
+
+    assert report.ok
+    assert reviewed.status is EnrollmentStatus.REJECTED
+    assert reviewed.reviewed_at.replace(tzinfo=UTC) == reviewed_at
+    assert unreviewed.reviewed_at.replace(tzinfo=UTC) == when
+
+
+def test_audit_is_written_only_when_the_transaction_commits(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'lifecycle.db'}", future=True)
+    Base.metadata.create_all(bind=engine)
+    actor_id = uuid.uuid4()
+
+    with AuditWriter(engine) as writer, Session(engine) as session:
+        kept = make_application(session)
+        dropped = make_application(session)
+        session.commit()
+
+        transition_applications(
+            session,
+            EnrollmentStatus.REJECTED,
+            [dropped.id],
+            actor_id=actor_id,
+            audit=writer,
+        )
+        session.rollback()
+        with session.begin_nested():
+            transition_applications(
+                session,
+                EnrollmentStatus.IN_REVIEW,
+                [kept.id],
+                actor_id=actor_id,
+                audit=writer,
+            )
+        savepoint = session.begin_nested()
+        transition_applications(
+            session,
+            EnrollmentStatus.APPROVED,
+            [kept.id],
+            actor_id=actor_id,
+            audit=writer,
+        )
+        savepoint.rollback()
+        writer.flush()
+        assert audit_trail(session, "enrollment_application", kept.id) == []
+
+        session.commit()
+        writer.flush()
+        trail = audit_trail(session, "enrollment_application", kept.id)
+        assert [row.action for row in trail] == ["enrollment.in_review"]
+        assert trail[0].correlation_id == "req-1"
+        assert audit_trail(session, "enrollment_application", dropped.id) == []
+        assert session.scalar(select(func.count()).select_from(OutboxEvent)) == 0
+    engine.dispose()
+
+
+def test_batch_approval_carries_new_notes(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'notes.db'}", future=True)
+    Base.metadata.create_all(bind=engine)
+    actor_id = uuid.uuid4()
+
+    with AuditWriter(engine) as writer, Session(engine) as session:
+        annotated = make_application(session, notes="Missing transcript")
+        plain = make_application(session, notes="Sibling enrolled")
+        session.commit()
+
+        transition_applications(
+            session,
+            EnrollmentStatus.APPROVED,
+            [annotated.id],
+            actor_id=actor_id,
+            notes="Transcript received",
+            audit=writer,
+        )
+        transition_applications(
+            session,
+            EnrollmentStatus.APPROVED,
+            [plain.id],
+            actor_id=actor_id,
+            audit=writer,
+        )
+        session.commit()
+        writer.flush()
+
+        payloads = {
+            event.aggregate_id: event.payload
+            for event in session.scalars(select(OutboxEvent))
+        }
+        assert payloads[annotated.id]["notes"] == "Transcript received"
+        assert payloads[plain.id]["notes"] == "Sibling enrolled"
+        assert annotated.notes == "Transcript received"
+        (entry,) = audit_trail(session, "enrollment_application", annotated.id)
+        assert entry.after["notes"] == "Transcript received"
+    engine.dispose()
@@ -0,0 +1,122 @@
+"""Tests for registrar search over enrollment applications."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from app.models import EnrollmentApplication, EnrollmentStatus
+from app.services.enrollment_search import (
+    rebuild_search_index,
+    search_applications,
+)
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from tests.factories import make_application
+
+START = datetime(2026, 9, 1, tzinfo=UTC)
+FAMILIES = [
+    ("Salma", "Hassan", "Salma.Parent@Example.com", "+20 (123) 456-7890"),
+    ("Omar", "Hassanein", "omar.parent@example.com", "+201112223334"),
+    ("Lina", "Ali", "lina.parent@example.org", "+44 20 5555 0101"),
+]
+
+
+@pytest.fixture()
+def applications(session: Session) -> list[EnrollmentApplication]:
+    created = []
+    for day in range(9):
+        first, last, email, phone = FAMILIES[day % 3]
+        created.append(
+            make_application(
+                session,
+                student_first_name=first,
+                student_last_name=last,
+                guardian_email=email,
+                guardian_phone=phone,
+                submitted_at=START + timedelta(days=day),
+                status=(
+                    EnrollmentStatus.APPROVED if day % 2 else EnrollmentStatus.SUBMITTED
+                ),
+            ),
+        )
+    session.commit()
+    return created
+
+
+def names(session: Session, query: str, **options: object) -> list[str]:
+    page = search_applications(session, query, **options)  # type: ignore[arg-type]
+    return [f"{item.student_first_name} {item.submitted_at.day}" for item in page.items]
+
+
+@pytest.mark.usefixtures("applications")
+def test_search_matches_normalised_fields(session: Session) -> None:
+    assert names(session, "HASSAN", limit=3) == ["Omar 8", "Salma 7", "Omar 5"]
+    assert names(session, "salma hass") == ["Salma 7", "Salma 4", "Salma 1"]
+    assert names(session, "SALMA.parent@") == ["Salma 7", "Salma 4", "Salma 1"]
+    assert names(session, "123 456") == ["Salma 7", "Salma 4", "Salma 1"]
+    assert names(session, "(20) 5555") == ["Lina 9", "Lina 6", "Lina 3"]
+    assert names(session, "al") == ["Lina 9", "Lina 6", "Lina 3"]
+    assert names(session, "zzz") == []
+    assert names(session, "hassan", statuses=[EnrollmentStatus.APPROVED]) == [
+        "Omar 8",
+        "Salma 4",
+        "Omar 2",
+    ]
+
+
+@pytest.mark.usefixtures("applications")
+def test_keyset_pages_cover_every_match_once(session: Session) -> None:
+    seen = []
+    cursor = None
+    while True:
+        page = search_applications(session, "parent", limit=4, cursor=cursor)
+        seen.extend(item.submitted_at.day for item in page.items)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    assert seen == list(range(9, 0, -1))
+    with pytest.raises(ValueError, match="cursor"):
+        search_applications(session, "parent", cursor="not-a-cursor")
+
+
+def test_index_follows_updates_and_deletes(
+    session: Session,
+    applications: list[EnrollmentApplication],
+) -> None:
+    applications[0].student_last_name = "Mansour"
+    session.delete(applications[1])
+    session.commit()
+
+    assert names(session, "mansour") == ["Salma 1"]
+    assert names(session, "hassanein") == ["Omar 8", "Omar 5"]
+
+    rebuild_search_index(session.connection())
+    assert names(session, "mansour") == ["Salma 1"]
+
+
+def test_search_uses_indexes(session: Session) -> None:
+    statements: list[tuple[str, Any]] = []
+
+    def capture(*args: Any) -> None:
+        statements.append((args[2], args[3]))
+
+    def plan(query: str) -> str:
+        event.listen(session.get_bind(), "before_cursor_execute", capture)
+        try:
+            search_applications(session, query)
+        finally:
+            event.remove(session.get_bind(), "before_cursor_execute", capture)
+        statement, parameters = statements.pop()
+        rows = session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}",
+            parameters,
+        )
+        return "\n".join(row[-1] for row in rows)
+
+    assert "ix_enrollment_application_email_lower" in plan("lina@")
+    assert "ix_enrollment_application_last_name_lower" in plan("al")
+    assert "VIRTUAL TABLE INDEX" in plan("hassan")
+    assert "ix_enrollment_application_submitted" in plan("")
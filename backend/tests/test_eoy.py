@@ -0,0 +1,187 @@
+"""Tests for batch EOY candidate scoring against the per-object methods."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from app import Base
+from app.models import Award, AwardType, EOYCandidate, EvaluationResult, StaffType
+from app.services.eoy import score_year
+from hypothesis import HealthCheck, given, settings
+from hypothesis import strategies as st
+from sqlalchemy import Engine, create_engine, insert, select
+from sqlalchemy.orm import Session
+from tests.factories import make_cycle
+
+YEAR = 2026
+
+leadership_votes = st.one_of(
+    st.none(),
+    st.just(0.0),
+    st.floats(min_value=0.0, max_value=10.0, allow_nan=False),
+)
+candidate_inputs = st.fixed_dictionaries(
+    {
+        "eom_wins_count": st.integers(min_value=0, max_value=15),
+        "avg_mre_score": st.one_of(
+            st.sampled_from([8.5, 8.499999999999998]),
+            st.floats(min_value=1.0, max_value=10.0, allow_nan=False),
+        ),
+        "attendance_rate": st.one_of(
+            st.just(95.0),
+            st.floats(min_value=0.0, max_value=100.0, allow_nan=False),
+        ),
+        "tenure_months": st.integers(min_value=0, max_value=240),
+        "has_disciplinary_actions": st.sampled_from([0, 1]),
+        "ceo_vote_score": leadership_votes,
+        "pc_head_vote_score": leadership_votes,
+    },
+)
+
+
+@pytest.fixture(scope="module")
+def engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite://", future=True)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def _candidate(values: dict[str, Any], **overrides: Any) -> dict[str, Any]:
+    return {
+        "id": uuid.uuid4(),
+        "year": YEAR,
+        "employee_id": uuid.uuid4(),
+        "employee_name": "Candidate",
+        "department": "Mathematics",
+        **values,
+        **overrides,
+    }
+
+
+@settings(
+    max_examples=75,
+    deadline=None,
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
+@given(st.lists(candidate_inputs, max_size=25))
+def test_score_year_matches_per_object_methods(
+    engine: Engine,
+    inputs: list[dict[str, Any]],
+) -> None:
+    rows = [_candidate(values) for values in inputs]
+    with Session(engine) as session:
+        if rows:
+            session.execute(insert(EOYCandidate), rows)
+        report = score_year(session, YEAR, refresh_inputs=False)
+        stored = {
+            row.id: row
+            for row in session.execute(
+                select(
+                    EOYCandidate.id,
+                    EOYCandidate.meets_minimum_criteria,
+                    EOYCandidate.eoy_score,
+                    EOYCandidate.rank,
+                ).where(EOYCandidate.year == YEAR),
+            )
+        }
+        session.rollback()
+
+    expected_scores: dict[uuid.UUID, float] = {}
+    for row in rows:
+        reference = EOYCandidate(**row)
+        eligible = reference.check_eligibility()
+        score = reference.calculate_eoy_score()
+        candidate = stored[row["id"]]
+        assert candidate.meets_minimum_criteria == reference.meets_minimum_criteria
+        assert candidate.eoy_score == score
+        if eligible:
+            expected_scores[row["id"]] = score
+        else:
+            assert candidate.rank is None
+
+    assert report.scored == len(rows)
+    assert report.eligible == len(expected_scores)
+    assert set(report.ranked) == set(expected_scores)
+    for candidate_id, score in expected_scores.items():
+        better = sum(1 for other in expected_scores.values() if other > score)
+        assert stored[candidate_id].rank == better + 1
+
+
+def test_score_year_refreshes_wins_and_mre_from_sources(session: Session) -> None:
+    candidate = EOYCandidate(
+        **_candidate(
+            {
+                "eom_wins_count": 0,
+                "avg_mre_score": 1.0,
+                "attendance_rate": 97.5,
+                "tenure_months": 36,
+                "ceo_vote_score": 9.0,
+                "pc_head_vote_score": 8.0,
+            },
+        ),
+    )
+    session.add(candidate)
+    for period in ("2026-02", "2026-07", "2025-12"):
+        session.add(
+            Award(
+                recipient_id=candidate.employee_id,
+                recipient_name="Candidate",
+                department="Mathematics",
+                award_type=AwardType.EMPLOYEE_OF_MONTH,
+                award_period=period,
+                description="Employee of the Month",
+            ),
+        )
+    released_at = datetime.now(UTC)
+    # Released results count; a draft and a reset result (every rating
+    # withdrawn) do not.
+    for period, final_score, received, released in (
+        ("2026-03", 9.0, 1, released_at),
+        ("2026-09", 8.6, 1, released_at),
+        ("2026-10", 2.0, 1, None),
+        ("2026-11", 0.0, 0, released_at),
+    ):
+        cycle = make_cycle(session, cycle_period=period)
+        session.add(
+            EvaluationResult(
+                cycle_id=cycle.id,
+                evaluee_id=candidate.employee_id,
+                evaluee_name="Candidate",
+                evaluee_department="Mathematics",
+                evaluee_staff_type=StaffType.ACADEMIC,
+                final_score=final_score,
+                total_expected_ratings=1,
+                received_ratings=received,
+                completion_percentage=100.0 * received,
+                calculated_at=datetime.now(UTC),
+                released_at=released,
+            ),
+        )
+    session.flush()
+
+    report = score_year(session, YEAR)
+    session.refresh(candidate)
+
+    assert candidate.eom_wins_count == 2
+    assert candidate.avg_mre_score == pytest.approx(8.8)
+    assert candidate.meets_minimum_criteria == 1
+    assert candidate.rank == 1
+    assert report.ranked == [candidate.id]
+    reference = EOYCandidate(
+        **{
+            column: getattr(candidate, column)
+            for column in (
+                "eom_wins_count",
+                "avg_mre_score",
+                "attendance_rate",
+                "ceo_vote_score",
+                "pc_head_vote_score",
+            )
+        },
+    )
+    assert candidate.eoy_score == reference.calculate_eoy_score()
@@ -0,0 +1,104 @@
+"""Tests for streaming CSV and NDJSON exports."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+from app import Base
+from app.models import EvaluationResult, StaffType
+from app.services.audit import AuditWriter
+from app.services.exports import (
+    audit_log_statement,
+    cycle_results_statement,
+    export_csv,
+    export_ndjson,
+    iter_csv,
+)
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+from tests.factories import make_cycle
+
+
+def test_cycle_results_export_in_chunks(session: Session) -> None:
+    cycle = make_cycle(session)
+    other = make_cycle(session, cycle_period="2025-01")
+    session.execute(
+        insert(EvaluationResult),
+        [
+            {
+                "id": uuid.uuid4(),
+                "cycle_id": cycle.id if index < 5 else other.id,
+                "evaluee_id": uuid.uuid4(),
+                "evaluee_name": f"Employee {index}",
+                "evaluee_department": "Mathematics",
+                "evaluee_staff_type": StaffType.ACADEMIC,
+                "final_score": 8.0 + index / 10,
+                "total_expected_ratings": 4,
+                "received_ratings": 4,
+                "completion_percentage": 100.0,
+                "aggregated_strengths": "Clear, patient\nand well prepared",
+                "ai_insights": {"trend": "up"} if index == 0 else None,
+            }
+            for index in range(7)
+        ],
+    )
+    stmt = cycle_results_statement(cycle.id)
+
+    chunks = list(iter_csv(session, stmt, chunk_size=2))
+    ndjson = io.StringIO()
+    written = export_ndjson(session, stmt, ndjson, chunk_size=2)
+
+    rows = {
+        row["evaluee_name"]: row for row in csv.DictReader(io.StringIO("".join(chunks)))
+    }
+    records = {
+        record["evaluee_name"]: record
+        for record in map(json.loads, ndjson.getvalue().splitlines())
+    }
+    assert len(chunks) == 3
+    assert written == 5
+    assert len(rows) == 5
+    assert records.keys() == rows.keys()
+    assert {row["cycle_id"] for row in rows.values()} == {str(cycle.id)}
+    first = rows["Employee 0"]
+    assert first["evaluee_staff_type"] == "academic"
+    assert first["aggregated_strengths"] == "Clear, patient\nand well prepared"
+    assert json.loads(first["ai_insights"]) == {"trend": "up"}
+    assert rows["Employee 1"]["ai_insights"] == ""
+    assert records["Employee 0"]["ai_insights"] == {"trend": "up"}
+    assert records["Employee 0"]["evaluee_staff_type"] == "academic"
+
+
+def test_audit_dump_spans_partitions(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}", future=True)
+    Base.metadata.create_all(bind=engine)
+    with AuditWriter(engine) as writer:
+        for month in (8, 9, 10):
+            writer.record(
+                actor_id=uuid.uuid4(),
+                actor_role="registrar",
+                entity_type="enrollment_application",
+                entity_id=uuid.uuid4(),
+                action="updated",
+                summary="Enrollment application updated",
+                created_at=datetime(2026, month, 15, tzinfo=UTC),
+            )
+        writer.flush()
+
+    destination = io.StringIO()
+    with engine.connect() as connection:
+        written = export_csv(
+            connection,
+            audit_log_statement(connection, start=datetime(2026, 9, 1, tzinfo=UTC)),
+            destination,
+        )
+    engine.dispose()
+
+    rows = list(csv.DictReader(io.StringIO(destination.getvalue())))
+    assert written == 2
+    assert sorted(row["created_at"][:7] for row in rows) == ["2026-09", "2026-10"]
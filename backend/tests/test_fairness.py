@@ -0,0 +1,147 @@
+"""Tests for the fairness metrics engine."""
+
+from __future__ import annotations
+
+import uuid
+
+from app.models import Award, AwardType, EvaluationResult, FairnessMetric, StaffType
+from app.services.fairness import (
+    ALERT,
+    AWARD_DISTRIBUTION,
+    CRITICAL,
+    HIGH_VARIANCE_SHARE,
+    INFO,
+    METRIC_TYPES,
+    NOMINATION_DISTRIBUTION,
+    RATER_VARIANCE,
+    WARNING,
+    compute_fairness,
+    months_back,
+)
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from tests.factories import make_cycle, make_evaluation, make_nomination, make_rating
+
+PERIOD = "2026-10"
+
+
+def _award(session: Session, department: str, period: str) -> None:
+    session.add(
+        Award(
+            recipient_id=uuid.uuid4(),
+            recipient_name="Winner",
+            department=department,
+            award_type=AwardType.EMPLOYEE_OF_MONTH,
+            award_period=period,
+            description="Outstanding month",
+        ),
+    )
+
+
+def _metrics(session: Session) -> dict[tuple[str, str], FairnessMetric]:
+    return {
+        (metric.metric_type, metric.period): metric
+        for metric in session.scalars(select(FairnessMetric))
+    }
+
+
+def test_months_back_crosses_year_boundary() -> None:
+    assert months_back("2026-01", 3) == ["2025-11", "2025-12", "2026-01"]
+
+
+def test_computes_every_metric_with_alert_levels(session: Session) -> None:
+    for department, period in [
+        ("Mathematics", "2026-08"),
+        ("Mathematics", "2026-09"),
+        ("Mathematics", "2026-10"),
+        ("Science", "2026-10"),
+        ("Arabic", "2026-10"),
+    ]:
+        _award(session, department, period)
+    for department in ("Mathematics", "Science", "Arabic", "English", "Art"):
+        make_nomination(session, nominee_department=department)
+
+    cycle = make_cycle(session, cycle_period=PERIOD)
+    split, steady = uuid.uuid4(), uuid.uuid4()
+    for score in (2.0, 9.0, 9.5):
+        make_rating(session, make_evaluation(session, cycle, split), score)
+    for score in (8.0, 8.5, 8.0):
+        make_rating(session, make_evaluation(session, cycle, steady), score)
+
+    def result(flagged: int) -> None:
+        session.add(
+            EvaluationResult(
+                cycle_id=cycle.id,
+                evaluee_id=uuid.uuid4(),
+                evaluee_name="Employee",
+                evaluee_department="Mathematics",
+                evaluee_staff_type=StaffType.ACADEMIC,
+                final_score=8.0,
+                total_expected_ratings=3,
+                received_ratings=3,
+                completion_percentage=100.0,
+                has_high_variance=flagged,
+            ),
+        )
+
+    result(1)
+    for _ in range(4):
+        result(0)
+    session.flush()
+
+    report = compute_fairness(session)
+    metrics = _metrics(session)
+    assert report.computed[AWARD_DISTRIBUTION] == [
+        "2026-08",
+        "2026-09",
+        "2026-10",
+    ]
+
+    awards = metrics[(AWARD_DISTRIBUTION, PERIOD)]
+    assert awards.metric_data["window"] == ["2026-08", "2026-09", "2026-10"]
+    assert awards.metric_data["counts"]["Mathematics"] == 3
+    assert awards.metric_data["top_share"] == 0.6
+    assert awards.alert_level == ALERT
+    # Fewer than five wins is too small a sample to alert on.
+    assert metrics[(AWARD_DISTRIBUTION, "2026-09")].alert_level == INFO
+
+    assert metrics[(NOMINATION_DISTRIBUTION, PERIOD)].alert_level == INFO
+
+    variance = metrics[(RATER_VARIANCE, PERIOD)]
+    assert variance.metric_data["evaluees"] == 2
+    assert variance.metric_data["high"] == 1
+    assert variance.metric_data["high_evaluee_ids"] == [str(split)]
+    assert variance.alert_level == CRITICAL
+
+    share = metrics[(HIGH_VARIANCE_SHARE, PERIOD)]
+    assert share.metric_data == {"results": 5, "high_variance": 1, "share": 0.2}
+    assert share.alert_level == WARNING
+    assert report.alerts == 3
+
+
+def test_incremental_recomputes_only_changed_periods(session: Session) -> None:
+    for period in ("2026-05", "2026-10"):
+        make_nomination(session, nomination_period=period)
+    session.flush()
+    first = compute_fairness(session)
+    assert first.written == 2 * len(METRIC_TYPES)
+    assert compute_fairness(session, incremental=True).written == 0
+
+    metric = _metrics(session)[(NOMINATION_DISTRIBUTION, PERIOD)]
+    metric.mark_resolved(uuid.uuid4())
+    for _ in range(5):
+        make_nomination(session, nominee_department="Science")
+
+    report = compute_fairness(session, incremental=True)
+    assert report.computed == {NOMINATION_DISTRIBUTION: [PERIOD]}
+    assert metric.alert_level == CRITICAL
+    assert metric.resolved == 0
+    assert metric.metric_data["counts"] == {"Mathematics": 1, "Science": 5}
+    assert len(_metrics(session)) == 2 * len(METRIC_TYPES)
+
+    _award(session, "Science", "2026-09")
+    session.flush()
+    report = compute_fairness(session, incremental=True)
+    # September is new, and the award also lands in October's window.
+    assert report.computed[AWARD_DISTRIBUTION] == ["2026-09", PERIOD]
+    assert report.computed[NOMINATION_DISTRIBUTION] == ["2026-09"]
@@ -0,0 +1,71 @@
+"""Converting stored GUIDs between text and BLOB on SQLite."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from app import Base
+from app.database import build_engine
+from app.models import EnrollmentApplication
+from app.services.audit import period_table
+from app.services.enrollment_search import search_applications
+from app.services.guid_storage import GuidStorageError, convert_guid_storage
+from sqlalchemy import create_engine, insert, select, text
+from sqlalchemy.orm import Session
+from tests.factories import make_application
+
+
+def test_conversion_covers_every_table_and_unlocks_the_engine(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    url = f"sqlite:///{tmp_path / 'guids.db'}"
+    plain = create_engine(url, future=True)
+    Base.metadata.create_all(bind=plain)
+    archived = period_table("audit_log_2026_01")
+    archived.create(plain)
+    with Session(plain) as session:
+        application_id = make_application(session, student_first_name="Yara").id
+        session.execute(
+            insert(archived),
+            [
+                {
+                    "id": application_id,
+                    "actor_id": application_id,
+                    "actor_role": "registrar",
+                    "entity_type": "enrollment_application",
+                    "entity_id": application_id,
+                    "action": "enrollment.submitted",
+                    "summary": "Submitted",
+                },
+            ],
+        )
+        session.commit()
+
+    monkeypatch.setenv("GUID_STORAGE", "binary")
+    refused = build_engine(url)
+    with pytest.raises(GuidStorageError, match="stores GUIDs as char"):
+        refused.connect()
+
+    converted = convert_guid_storage(plain, binary=True)
+    assert converted["enrollment_application"] == 1
+    assert converted["audit_log_2026_01"] == 1
+    assert convert_guid_storage(plain, binary=True)["enrollment_application"] == 0
+    with plain.connect() as connection:
+        stored = text("SELECT typeof(id) FROM enrollment_application")
+        assert connection.scalar(stored) == "blob"
+
+    # The refused engine checks again and now opens; search still matches.
+    with Session(refused) as session:
+        assert session.get(EnrollmentApplication, application_id) is not None
+        page = search_applications(session, "Yara")
+        assert [item.id for item in page.items] == [application_id]
+        assert session.scalar(select(archived.c.id)) == application_id
+
+    monkeypatch.setenv("GUID_STORAGE", "char")
+    convert_guid_storage(plain, binary=False)
+    with Session(build_engine(url)) as session:
+        assert session.get(EnrollmentApplication, application_id) is not None
+    refused.dispose()
+    plain.dispose()
@@ -0,0 +1,128 @@
+"""Tests for incremental result maintenance and reconciliation."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from app.models import (
+    Evaluation,
+    EvaluationCycle,
+    EvaluationRating,
+    EvaluationScoreStats,
+    EvaluatorRole,
+)
+from app.services.incremental import reconcile_cycle, record_rating
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from tests.factories import COMMON_CRITERIA, make_cycle, make_evaluation
+
+
+def _rating(evaluation: Evaluation, score: float) -> EvaluationRating:
+    return EvaluationRating(
+        id=uuid.uuid4(),
+        evaluation_id=evaluation.id,
+        cycle_id=evaluation.cycle_id,
+        evaluee_id=evaluation.evaluee_id,
+        evaluator_id=evaluation.evaluator_id,
+        evaluator_role=evaluation.evaluator_role,
+        weight=evaluation.weight,
+        average_score=score,
+        **dict.fromkeys(COMMON_CRITERIA, score),
+    )
+
+
+def test_record_rating_matches_full_rebuild(session: Session) -> None:
+    cycle = make_cycle(session)
+    evaluee_id = uuid.uuid4()
+    submissions = [
+        (EvaluatorRole.SELF, 0.05, 9.0),
+        (EvaluatorRole.PEER, 0.1, 5.0),
+        (EvaluatorRole.PEER, 0.1, 6.5),
+        (EvaluatorRole.SUPERVISOR, 0.35, 8.5),
+    ]
+    evaluations = [
+        make_evaluation(session, cycle, evaluee_id, role, weight=weight)
+        for role, weight, _ in submissions
+    ]
+
+    result = None
+    for evaluation, (_, _, score) in zip(evaluations, submissions, strict=True):
+        result = record_rating(session, _rating(evaluation, score))
+    session.flush()
+    session.refresh(cycle)
+
+    assert result is not None
+    assert result.received_ratings == 4
+    assert result.peer_scores_avg == pytest.approx(5.75)
+    assert result.has_high_variance == 1
+    assert result.completion_percentage == pytest.approx(100.0)
+    assert cycle.completed_evaluations == 4
+    assert reconcile_cycle(session, cycle.id).consistent
+
+
+def test_first_rating_merges_with_a_concurrent_stats_row(session: Session) -> None:
+    cycle = make_cycle(session)
+    evaluee_id = uuid.uuid4()
+    first = make_evaluation(session, cycle, evaluee_id, EvaluatorRole.PEER)
+    second = make_evaluation(session, cycle, evaluee_id, EvaluatorRole.PEER)
+    # Another submission has bumped the stats but not yet written the result.
+    session.add(_rating(first, 4.0))
+    session.add(
+        EvaluationScoreStats(
+            cycle_id=cycle.id,
+            evaluee_id=evaluee_id,
+            evaluator_role=EvaluatorRole.PEER,
+            rating_count=1,
+            score_sum=4.0,
+            score_sum_sq=16.0,
+            weighted_score_sum=4.0 * first.weight,
+            weight_sum=first.weight,
+            score_min=4.0,
+            score_max=4.0,
+        ),
+    )
+    session.flush()
+
+    result = record_rating(session, _rating(second, 6.0))
+
+    assert result.received_ratings == 2
+    assert result.peer_scores_avg == pytest.approx(5.0)
+    assert session.query(EvaluationScoreStats).count() == 1
+
+
+def test_reconcile_cycle_detects_and_repairs_drift(session: Session) -> None:
+    cycle = make_cycle(session)
+    evaluation = make_evaluation(session, cycle, uuid.uuid4(), EvaluatorRole.CEO)
+    record_rating(session, _rating(evaluation, 7.0))
+    session.flush()
+    session.execute(
+        update(EvaluationCycle)
+        .where(EvaluationCycle.id == cycle.id)
+        .values(completed_evaluations=5),
+    )
+
+    report = reconcile_cycle(session, cycle.id, repair=True)
+
+    assert not report.consistent
+    assert report.repaired
+    assert report.completed_evaluations_drift == 4
+    assert reconcile_cycle(session, cycle.id).consistent
+
+
+def test_update_completion_count_is_atomic_for_persistent_cycles(
+    session: Session,
+) -> None:
+    cycle = make_cycle(session)
+    session.execute(
+        update(EvaluationCycle)
+        .where(EvaluationCycle.id == cycle.id)
+        .values(completed_evaluations=10),
+    )
+
+    cycle.update_completion_count()
+    cycle.update_completion_count(2)
+    session.flush()
+    session.refresh(cycle)
+
+    assert cycle.completed_evaluations == 13
@@ -0,0 +1,122 @@
+"""Tests for bulk rating ingestion."""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any
+
+import pytest
+from app.models import EvaluationRating, EvaluatorRole, StaffType
+from app.services.ingestion import ingest_ratings
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from tests.factories import COMMON_CRITERIA, make_cycle, make_evaluation
+
+ACADEMIC_SCORES = {
+    "teaching_effectiveness": 9,
+    "student_engagement": 8,
+    "curriculum_implementation": 7,
+    "classroom_management": 8,
+}
+
+
+def _record(evaluation_id: uuid.UUID, **overrides: Any) -> dict[str, Any]:
+    record: dict[str, Any] = {
+        "evaluation_id": str(evaluation_id),
+        **ACADEMIC_SCORES,
+        **dict.fromkeys(COMMON_CRITERIA, 8),
+    }
+    record.update(overrides)
+    return record
+
+
+def test_ingest_ratings_validates_and_writes_in_batches(session: Session) -> None:
+    cycle = make_cycle(session)
+    academic = [
+        make_evaluation(session, cycle, uuid.uuid4(), EvaluatorRole.PEER)
+        for _ in range(5)
+    ]
+    administrative = make_evaluation(
+        session,
+        cycle,
+        uuid.uuid4(),
+        EvaluatorRole.SUPERVISOR,
+        evaluee_staff_type=StaffType.ADMINISTRATIVE,
+        weight=0.35,
+    )
+    records = [_record(evaluation.id) for evaluation in academic]
+    records.append(
+        {
+            "evaluation_id": administrative.id,
+            "evaluator_role": "supervisor",
+            "task_management": 6,
+            "policy_adherence": 7,
+            "interdepartmental_communication": 8,
+            "service_quality": 9,
+            **dict.fromkeys(COMMON_CRITERIA, 10),
+            "comments": "Reliable",
+        },
+    )
+
+    report = ingest_ratings(session, iter(records), batch_size=4)
+
+    assert (report.accepted, report.rejected, report.batches) == (6, 0, 2)
+    assert report.cycle_ids == {cycle.id}
+    rating = session.scalars(
+        select(EvaluationRating).where(
+            EvaluationRating.evaluation_id == administrative.id,
+        ),
+    ).one()
+    assert rating.average_score == pytest.approx(8.75)
+    assert rating.weight == pytest.approx(0.35)
+    assert rating.teaching_effectiveness is None
+    assert rating.comments == "Reliable"
+
+
+def test_ingest_ratings_reports_invalid_records(session: Session) -> None:
+    cycle = make_cycle(session)
+    evaluation = make_evaluation(session, cycle, uuid.uuid4())
+    records = [
+        _record(evaluation.id, innovation=11),
+        _record(evaluation.id, teaching_effectiveness=None),
+        _record(evaluation.id, task_management=5),
+        _record(evaluation.id, evaluee_id=str(uuid.uuid4())),
+        _record(uuid.uuid4()),
+        {"evaluation_id": "not-a-uuid"},
+        _record(evaluation.id),
+    ]
+
+    report = ingest_ratings(session, records)
+
+    assert (report.accepted, report.rejected) == (1, 6)
+    assert [error.index for error in report.errors] == [5, 0, 1, 2, 3, 4]
+    assert "innovation must be between 1 and 10" in report.errors[1].message
+    assert "does not apply to academic staff" in report.errors[3].message
+    assert session.scalar(select(func.count()).select_from(EvaluationRating)) == 1
+
+
+def test_ingest_ratings_skips_repeated_and_stored_ratings(session: Session) -> None:
+    cycle = make_cycle(session)
+    stored, fresh, twice = (
+        make_evaluation(session, cycle, uuid.uuid4()) for _ in range(3)
+    )
+    ingest_ratings(session, [_record(stored.id)])
+    records = [
+        _record(stored.id),
+        _record(fresh.id, comments="first"),
+        _record(twice.id, comments="first"),
+        _record(twice.id, comments="second"),
+        _record(fresh.id, comments="second"),
+    ]
+
+    report = ingest_ratings(session, records, batch_size=4)
+
+    assert (report.accepted, report.rejected) == (2, 3)
+    assert [error.index for error in report.errors] == [0, 3, 4]
+    assert all("is already rated" in error.message for error in report.errors)
+    comments = session.scalars(
+        select(EvaluationRating.comments).where(
+            EvaluationRating.evaluation_id.in_([fresh.id, twice.id]),
+        ),
+    ).all()
+    assert comments == ["first", "first"]
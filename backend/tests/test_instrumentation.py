@@ -0,0 +1,86 @@
+"""Tests for the SQL query instrumentation."""
+
+from __future__ import annotations
+
+import uuid
+
+from app.instrumentation import (
+    MemoryExporter,
+    correlation_scope,
+    get_query_instrumentation,
+    instrument_engine,
+    normalise_statement,
+)
+from app.models import Evaluation, EvaluationCycle
+from sqlalchemy import Engine, event, select
+from sqlalchemy.orm import Session
+from tests.factories import make_cycle, make_evaluation
+
+
+def test_statements_are_normalised_and_tagged(sqlite_engine: Engine) -> None:
+    exporter = MemoryExporter()
+    instrumentation = instrument_engine(
+        sqlite_engine,
+        exporters=[exporter],
+        slow_query_ms=0,
+    )
+    assert get_query_instrumentation(sqlite_engine) is instrumentation
+    executed: list[str] = []
+    event.listen(
+        sqlite_engine,
+        "after_cursor_execute",
+        lambda conn, cursor, statement, *_: executed.append(statement),
+    )
+
+    with Session(sqlite_engine) as session:
+        cycle = make_cycle(session)
+        exporter.clear()
+        with correlation_scope("req-42 */ DROP"):
+            for ids in ([cycle.id], [cycle.id, uuid.uuid4(), uuid.uuid4()]):
+                session.scalars(
+                    select(EvaluationCycle.id).where(EvaluationCycle.id.in_(ids)),
+                ).all()
+
+    shapes = {query.statement for query in exporter.queries}
+    assert len(shapes) == 1
+    (shape,) = shapes
+    assert "IN (?)" in shape
+    assert instrumentation.snapshot()[shape]["count"] == 2
+    assert all(query.correlation_id == "req-42DROP" for query in exporter.queries)
+    assert executed[-1].endswith("/* correlation_id='req-42DROP' */")
+    # Every statement crossed the zero threshold; a shape is explained once.
+    first, second = exporter.slow_queries
+    assert first.plan and any("evaluation_cycle" in line for line in first.plan)
+    assert second.statement == shape and second.plan is None
+    assert normalise_statement(
+        "INSERT INTO t (a, b) VALUES (?, 'x'), (?, 'y'), (?, 3)",
+    ) == ("INSERT INTO t (a, b) VALUES (?)")
+    instrumentation.detach(sqlite_engine)
+
+
+def test_repeated_lazy_loads_report_n_plus_one(sqlite_engine: Engine) -> None:
+    with Session(sqlite_engine) as session:
+        for _ in range(4):
+            make_evaluation(session, make_cycle(session), uuid.uuid4())
+        session.commit()
+    exporter = MemoryExporter()
+    instrumentation = instrument_engine(
+        sqlite_engine,
+        exporters=[exporter],
+        n_plus_one_threshold=3,
+    )
+
+    with Session(sqlite_engine) as session:
+        evaluations = session.scalars(select(Evaluation)).all()
+        assert len({evaluation.cycle.id for evaluation in evaluations}) == 4
+
+    (finding,) = exporter.n_plus_one
+    assert finding.executions == 3
+    assert finding.statement.startswith("SELECT evaluation_cycle.id")
+
+    # A fresh session starts counting again.
+    with Session(sqlite_engine) as session:
+        evaluation = session.scalars(select(Evaluation).limit(1)).one()
+        assert evaluation.cycle is not None
+    assert len(exporter.n_plus_one) == 1
+    instrumentation.detach(sqlite_engine)
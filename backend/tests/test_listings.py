@@ -0,0 +1,113 @@
+"""Query-count tests for the listing paths and their loading profiles."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from app.models import (
+    Award,
+    AwardType,
+    Evaluation,
+    EvaluationCycle,
+    EvaluationResult,
+)
+from app.services.aggregation import aggregate_cycle
+from app.services.listings import (
+    list_awards,
+    list_nominations,
+    list_ratings,
+    list_results,
+    list_votes,
+    with_profile,
+)
+from app.services.voting import cast_vote
+from sqlalchemy import Engine, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+from tests.factories import make_cycle, make_evaluation, make_nomination, make_rating
+
+PERIOD = "2026-10"
+Counter = Callable[[Callable[[], Any]], int]
+
+
+def _grow(session: Session, cycle: EvaluationCycle, rows: int) -> None:
+    for index in range(rows):
+        evaluation = make_evaluation(session, cycle, uuid.uuid4())
+        make_rating(session, evaluation, 6 + index % 4)
+        nomination = make_nomination(session, nomination_period=PERIOD)
+        cast_vote(session, nomination.id, uuid.uuid4(), "staff")
+        session.add(
+            Award(
+                id=uuid.uuid4(),
+                recipient_id=nomination.nominee_id,
+                recipient_name=nomination.nominee_name,
+                department=nomination.nominee_department,
+                award_type=AwardType.EMPLOYEE_OF_MONTH,
+                category=nomination.category,
+                award_period=PERIOD,
+                description="Employee of the month",
+                nomination_id=nomination.id,
+            ),
+        )
+    aggregate_cycle(session, cycle.id)
+    session.commit()
+
+
+def _listings(engine: Engine, cycle_id: uuid.UUID) -> Callable[[], list[int]]:
+    """Every listing plus the relationships its page template reads."""
+
+    def run() -> list[int]:
+        with Session(engine) as session:
+            ratings = list_ratings(session, cycle_id, limit=100).items
+            assert {rating.evaluation.id for rating in ratings}
+            assert {rating.cycle.cycle_name for rating in ratings}
+            results = list_results(session, cycle_id, limit=100).items
+            assert {result.cycle.cycle_period for result in results}
+            nominations = list_nominations(session, PERIOD, limit=100).items
+            votes = list_votes(session, PERIOD, limit=100).items
+            assert {vote.nomination.nominee_name for vote in votes}
+            awards = list_awards(session, PERIOD, limit=100).items
+            assert {award.nomination.status for award in awards}
+            return [len(ratings), len(results), len(nominations), len(awards)]
+
+    return run
+
+
+def test_listings_run_constant_queries(
+    sqlite_engine: Engine,
+    count_queries: Counter,
+) -> None:
+    with Session(sqlite_engine) as session:
+        cycle = make_cycle(session)
+        cycle_id = cycle.id
+        _grow(session, cycle, 3)
+    listings = _listings(sqlite_engine, cycle_id)
+    small = count_queries(listings)
+
+    with Session(sqlite_engine) as session:
+        _grow(session, session.get_one(EvaluationCycle, cycle_id), 30)
+    assert listings() == [33, 33, 33, 33]
+    assert count_queries(listings) == small
+    # One statement per listing plus one selectin per shared relationship.
+    assert small == 5 + 3
+
+
+def test_profiles_raise_on_unplanned_lazy_loads(sqlite_engine: Engine) -> None:
+    with Session(sqlite_engine) as session:
+        cycle = make_cycle(session)
+        make_evaluation(session, cycle, uuid.uuid4())
+        session.commit()
+
+        session.expunge_all()
+        evaluation = session.scalars(
+            with_profile(select(Evaluation), "evaluation.bare"),
+        ).one()
+        with pytest.raises(InvalidRequestError):
+            evaluation.cycle  # noqa: B018
+        with pytest.raises(ValueError, match="loads Evaluation"):
+            with_profile(select(EvaluationResult), "evaluation.with_cycle")
+        with pytest.raises(ValueError, match="Unknown loading profile"):
+            with_profile(select(Evaluation), "evaluation.everything")
@@ -0,0 +1,215 @@
+"""Tests for the transactional outbox and its dispatcher."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from app import Base
+from app.models import EnrollmentApplication, OutboxEvent
+from app.services.outbox import FileSink, MemorySink, OutboxDispatcher, outbox_backlog
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import Session
+
+
+def make_application(**overrides: Any) -> EnrollmentApplication:
+    fields = {
+        "guardian_email": "guardian@example.com",
+        "guardian_phone": "+201234567890",
+        "student_first_name": "Salma",
+        "student_last_name": "Hassan",
+        "correlation_id": "req-1",
+    }
+    return EnrollmentApplication(**(fields | overrides))
+
+
+def test_events_commit_and_roll_back_with_the_state_change(session: Session) -> None:
+    approver = uuid.uuid4()
+    approved = make_application()
+    session.add(approved)
+    session.commit()
+
+    approved.mark_approved(datetime(2026, 10, 17, 9, tzinfo=UTC), approved_by=approver)
+    session.commit()
+
+    discarded = make_application()
+    session.add(discarded)
+    discarded.mark_approved()
+    session.flush()
+    session.rollback()
+
+    events = session.scalars(select(OutboxEvent)).all()
+    assert len(events) == 1
+    assert events[0].event_type == "enrollment.approved"
+    assert events[0].aggregate_id == approved.id
+    assert events[0].actor_id == approver
+    assert events[0].correlation_id == "req-1"
+    assert events[0].payload["approved_by"] == str(approver)
+    assert outbox_backlog(session, datetime(2026, 10, 17, 9, 0, 3, tzinfo=UTC)) == (
+        1,
+        3.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_publishes_batches_once(tmp_path: Path) -> None:
+    url = f"sqlite:///{tmp_path / 'outbox.db'}"
+    engine = create_engine(url, future=True)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        for index in range(5):
+            application = make_application(assigned_student_code=f"STU-{index}")
+            session.add(application)
+            application.mark_approved()
+            application.mark_provisioned(f"STU-{index}")
+        session.commit()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'outbox.db'}")
+    sink = MemorySink()
+    dispatcher = OutboxDispatcher(sink, async_engine, batch_size=4)
+    published = await dispatcher.drain()
+
+    envelopes = [sink.queue.get_nowait() for _ in range(sink.queue.qsize())]
+    await sink.publish(envelopes)
+    await async_engine.dispose()
+    with Session(engine) as session:
+        backlog = outbox_backlog(session)
+    engine.dispose()
+
+    assert published == 10
+    assert dispatcher.stats.batches == 3
+    assert backlog == (0, 0.0)
+    assert sink.queue.empty()
+    assert [item["event_type"] for item in envelopes[:2]] == [
+        "enrollment.approved",
+        "enrollment.provisioned",
+    ]
+    assert envelopes[0]["metadata"] == {
+        "schema_version": "v1",
+        "replay": False,
+        "attempt": 1,
+    }
+    assert envelopes[1]["event"]["student_code"] == "STU-0"
+    assert len({item["event"]["event_id"] for item in envelopes}) == 10
+
+
+class FlakySink:
+    def __init__(self, target: FileSink) -> None:
+        self.target = target
+        self.calls = 0
+
+    async def publish(self, envelopes: Sequence[dict[str, Any]]) -> None:
+        self.calls += 1
+        await self.target.publish(envelopes)
+        if self.calls == 1:
+            raise ConnectionError("stream unavailable")
+
+
+@pytest.mark.asyncio
+async def test_failed_publish_is_retried_without_duplicates(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'outbox.db'}", future=True)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        application = make_application()
+        session.add(application)
+        application.mark_approved()
+        session.commit()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'outbox.db'}")
+    stream = tmp_path / "events.jsonl"
+    sink = FlakySink(FileSink(stream))
+    dispatcher = OutboxDispatcher(sink, async_engine)
+
+    assert await dispatcher.dispatch_once() == 0
+    assert (
+        await OutboxDispatcher(FlakySink(FileSink(stream)), async_engine).drain() == 0
+    )
+    assert await dispatcher.drain() == 1
+    await async_engine.dispose()
+    with Session(engine) as session:
+        event = session.scalars(select(OutboxEvent)).one()
+    engine.dispose()
+
+    lines = stream.read_text().splitlines()
+    assert dispatcher.stats.failures == 1
+    assert event.attempts == 2
+    assert event.last_error == "stream unavailable"
+    assert event.dispatched_at is not None
+    assert len(lines) == 1
+    assert json.loads(lines[0])["event"]["event_id"] == str(event.id)
+
+
+class PoisonSink:
+    def __init__(self, poison: str) -> None:
+        self.poison = poison
+        self.delivered: list[str] = []
+
+    async def publish(self, envelopes: Sequence[dict[str, Any]]) -> None:
+        ids = [item["event"]["event_id"] for item in envelopes]
+        if self.poison in ids:
+            raise ValueError("payload rejected")
+        self.delivered.extend(ids)
+
+
+@pytest.mark.asyncio
+async def test_poison_event_is_isolated_and_dead_lettered(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'outbox.db'}", future=True)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        for _ in range(3):
+            application = make_application()
+            session.add(application)
+            application.mark_approved()
+        session.commit()
+        ids = [str(event.id) for event in session.scalars(select(OutboxEvent))]
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'outbox.db'}")
+    sink = PoisonSink(ids[0])
+    dispatcher = OutboxDispatcher(sink, async_engine, max_attempts=2)
+
+    assert await dispatcher.dispatch_once() == 2
+    assert await dispatcher.dispatch_once() == 0
+    assert await dispatcher.dispatch_once() == 0
+    await async_engine.dispose()
+    with Session(engine) as session:
+        poison = session.get(OutboxEvent, uuid.UUID(ids[0]))
+        backlog = outbox_backlog(session)
+    engine.dispose()
+
+    assert sorted(sink.delivered) == sorted(ids[1:])
+    assert dispatcher.stats.dead_lettered == 1
+    assert poison.attempts == 2
+    assert poison.dead_lettered_at is not None
+    assert poison.dispatched_at is None
+    assert backlog == (0, 0.0)
+
+
+def _envelope(event_id: str) -> dict[str, Any]:
+    return {"event_type": "test", "event": {"event_id": event_id}}
+
+
+@pytest.mark.asyncio
+async def test_sinks_remember_a_bounded_window_of_event_ids(tmp_path: Path) -> None:
+    memory = MemorySink(dedupe_window=2)
+    await memory.publish([_envelope(event_id) for event_id in "abc"])
+    await memory.publish([_envelope("a"), _envelope("c")])
+    assert memory.queue.qsize() == 4
+
+    stream = tmp_path / "events.jsonl"
+    await FileSink(stream).publish([_envelope(event_id) for event_id in "abcd"])
+    reopened = FileSink(stream, dedupe_window=2)
+    await reopened.publish([_envelope("d"), _envelope("b")])
+    lines = stream.read_text().splitlines()
+    assert [json.loads(line)["event"]["event_id"] for line in lines] == [
+        "a",
+        "b",
+        "c",
+        "d",
+        "b",
+    ]
@@ -0,0 +1,72 @@
+"""Tests for keyset pagination."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from app.models import Nomination, NominationCategory
+from app.services.pagination import keyset_columns, keyset_page
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from tests.factories import make_nomination
+
+START = datetime(2026, 10, 1, tzinfo=UTC)
+
+
+def test_keyset_pages_visit_every_row_once_despite_ties(session: Session) -> None:
+    # Three nominations share each timestamp, so paging must break ties on id.
+    created = [
+        make_nomination(session, submitted_at=START + timedelta(hours=index // 3))
+        for index in range(10)
+    ]
+    make_nomination(session, category=NominationCategory.INNOVATION)
+    stmt = select(Nomination).where(Nomination.category == NominationCategory.TEAMWORK)
+
+    for descending in (True, False):
+        seen = []
+        cursor = None
+        while True:
+            page = keyset_page(
+                session,
+                stmt,
+                limit=4,
+                cursor=cursor,
+                descending=descending,
+            )
+            seen.extend(page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+        expected = sorted(
+            created,
+            key=lambda nomination: (nomination.submitted_at, str(nomination.id)),
+            reverse=descending,
+        )
+        assert [item.id for item in seen] == [item.id for item in expected]
+
+
+def test_keyset_page_returns_rows_for_column_statements(session: Session) -> None:
+    for index in range(3):
+        make_nomination(session, submitted_at=START + timedelta(days=index))
+
+    page = keyset_page(
+        session,
+        select(Nomination.id, Nomination.submitted_at),
+        limit=2,
+        columns=keyset_columns(Nomination),
+    )
+    rest = keyset_page(
+        session,
+        select(Nomination.id, Nomination.submitted_at),
+        cursor=page.next_cursor,
+        columns=keyset_columns(Nomination),
+    )
+
+    assert [row.submitted_at.day for row in page.items] == [3, 2]
+    assert [row.submitted_at.day for row in rest.items] == [1]
+    assert rest.next_cursor is None
+    with pytest.raises(ValueError, match="cursor"):
+        keyset_page(session, select(Nomination), cursor="bm9wZQ==")
+    with pytest.raises(ValueError, match="limit"):
+        keyset_page(session, select(Nomination), limit=0)
@@ -0,0 +1,156 @@
+"""Query-plan regression tests for the composite and partial indexes.
+
+Runs against in-memory SQLite by default and against PostgreSQL when
+``TEST_DATABASE_URL`` points at one. Statements are rendered with literal
+values because both planners only match partial indexes against constants.
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+from collections.abc import Iterator
+from datetime import UTC, datetime
+
+import pytest
+from app import Base
+from app.models import (
+    Evaluation,
+    EvaluationRating,
+    EvaluationResult,
+    EvaluationStatus,
+    Nomination,
+    NominationCategory,
+    NominationStatus,
+    Vote,
+)
+from sqlalchemy import Connection, Select, create_engine, func, select, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from tests.factories import make_nomination
+
+CYCLE_ID = uuid.UUID("00000000-0000-4000-8000-000000000001")
+EMPLOYEE_ID = uuid.UUID("00000000-0000-4000-8000-000000000002")
+
+QUERY_SHAPES: list[tuple[str, Select[tuple[object, ...]]]] = [
+    (
+        "ix_evaluation_rating_cycle_evaluee_role",
+        select(EvaluationRating.evaluator_role, func.count())
+        .where(
+            EvaluationRating.cycle_id == CYCLE_ID,
+            EvaluationRating.evaluee_id == EMPLOYEE_ID,
+        )
+        .group_by(EvaluationRating.evaluator_role),
+    ),
+    (
+        "ix_evaluation_cycle_evaluator_status",
+        select(Evaluation.id).where(
+            Evaluation.cycle_id == CYCLE_ID,
+            Evaluation.evaluator_id == EMPLOYEE_ID,
+            Evaluation.status == EvaluationStatus.NOT_STARTED,
+        ),
+    ),
+    (
+        "ix_evaluation_open_due_date",
+        select(Evaluation.id).where(
+            Evaluation.status.in_(
+                [EvaluationStatus.NOT_STARTED, EvaluationStatus.IN_PROGRESS],
+            ),
+            Evaluation.due_date < datetime(2026, 1, 1, tzinfo=UTC),
+        ),
+    ),
+    (
+        "uq_evaluation_result_cycle_evaluee",
+        select(EvaluationResult.id).where(
+            EvaluationResult.cycle_id == CYCLE_ID,
+            EvaluationResult.evaluee_id == EMPLOYEE_ID,
+        ),
+    ),
+    (
+        "ix_nomination_period_category_status",
+        select(Nomination.id).where(
+            Nomination.nomination_period == "2026-10",
+            Nomination.category == NominationCategory.TEAMWORK,
+            Nomination.status == NominationStatus.PENDING,
+        ),
+    ),
+    (
+        "ix_nomination_voting_leaderboard",
+        select(Nomination.id)
+        .where(
+            Nomination.nomination_period == "2026-10",
+            Nomination.category == NominationCategory.TEAMWORK,
+            Nomination.status == NominationStatus.VOTING,
+        )
+        .order_by(Nomination.votes_count.desc()),
+    ),
+    (
+        "uq_vote_voter_period_category",
+        select(Vote.id).where(
+            Vote.voter_id == EMPLOYEE_ID,
+            Vote.nomination_period == "2026-10",
+            Vote.category == NominationCategory.TEAMWORK,
+        ),
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def connection() -> Iterator[Connection]:
+    engine = create_engine(os.environ["DATABASE_URL"], future=True)
+    Base.metadata.create_all(bind=engine)
+    with engine.connect() as connection:
+        if engine.dialect.name == "postgresql":
+            # Empty tables are cheapest to scan sequentially; make the
+            # planner show which index it would pick once they are not.
+            connection.execute(text("SET enable_seqscan = off"))
+        yield connection
+    if engine.dialect.name != "sqlite":
+        Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+def explain(connection: Connection, statement: Select[tuple[object, ...]]) -> str:
+    sql = statement.compile(
+        dialect=connection.dialect,
+        compile_kwargs={"literal_binds": True},
+    )
+    if connection.dialect.name == "postgresql":
+        rows = connection.exec_driver_sql(f"EXPLAIN {sql}").scalars()
+    else:
+        rows = (
+            row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")
+        )
+    return "\n".join(rows)
+
+
+@pytest.mark.parametrize(
+    ("index_name", "statement"),
+    QUERY_SHAPES,
+    ids=[name for name, _ in QUERY_SHAPES],
+)
+def test_hot_queries_use_their_index(
+    connection: Connection,
+    index_name: str,
+    statement: Select[tuple[object, ...]],
+) -> None:
+    plan = explain(connection, statement)
+
+    assert index_name in plan, plan
+
+
+def test_one_vote_per_voter_category_and_period(session: Session) -> None:
+    nomination = make_nomination(session)
+    for _ in range(2):
+        session.add(
+            Vote(
+                nomination_id=nomination.id,
+                voter_id=EMPLOYEE_ID,
+                voter_role="staff",
+                category=nomination.category,
+                nomination_period=nomination.nomination_period,
+            ),
+        )
+
+    with pytest.raises(IntegrityError):
+        session.flush()
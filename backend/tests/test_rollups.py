@@ -0,0 +1,139 @@
+"""Tests for the dashboard rollups."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from app.models import (
+    CycleProgressRollup,
+    EvaluationStatus,
+    NominationCategory,
+    NominationRollup,
+    NominationStatus,
+)
+from app.services.deadlines import sweep_overdue
+from app.services.rollups import (
+    CYCLE_PROGRESS,
+    NOMINATIONS,
+    check_rollups,
+    cycle_progress,
+    nomination_summary,
+    nomination_votes,
+)
+from app.services.voting import cast_vote
+from sqlalchemy import Engine, delete, select, update
+from sqlalchemy.orm import Session
+from tests.factories import make_cycle, make_evaluation, make_nomination
+
+PERIOD = "2026-10"
+
+
+def _progress(session: Session, cycle_id: uuid.UUID) -> dict[str, dict[str, int]]:
+    return {
+        row["department"]: {
+            name: row[name] for name in ("total", "not_started", "submitted", "late")
+        }
+        for row in cycle_progress(session, cycle_id).rows
+    }
+
+
+def test_evaluation_writes_apply_deltas(sqlite_engine: Engine) -> None:
+    now = datetime.now(UTC)
+    with Session(sqlite_engine) as session:
+        cycle = make_cycle(session)
+        first = make_evaluation(session, cycle, uuid.uuid4())
+        make_evaluation(session, cycle, uuid.uuid4(), evaluee_department="Science")
+        assert _progress(session, cycle.id) == {
+            "Mathematics": {"total": 1, "not_started": 1, "submitted": 0, "late": 0},
+            "Science": {"total": 1, "not_started": 1, "submitted": 0, "late": 0},
+        }
+        refreshed = session.scalar(
+            select(CycleProgressRollup.refreshed_at).where(
+                CycleProgressRollup.department == "Mathematics",
+            ),
+        )
+
+        first.mark_submitted()
+        make_evaluation(session, cycle, uuid.uuid4(), due_date=now - timedelta(days=1))
+        view = cycle_progress(session, cycle.id)
+        mathematics = view.rows[0]
+        assert mathematics["department"] == "Mathematics"
+        assert (mathematics["total"], mathematics["submitted"]) == (2, 1)
+        assert mathematics["completion_percentage"] == 50.0
+        # Deltas keep the row current without a full recompute.
+        assert mathematics["refreshed_at"] == refreshed
+        assert view.updated_at is not None and view.updated_at >= view.refreshed_at
+        assert view.staleness_seconds is not None and view.staleness_seconds >= 0
+
+        session.delete(first)
+        session.commit()
+        cycle_id = cycle.id
+
+    sweep_overdue(sqlite_engine, now=now)
+    with Session(sqlite_engine) as session:
+        assert _progress(session, cycle_id)["Mathematics"] == {
+            "total": 1,
+            "not_started": 0,
+            "submitted": 0,
+            "late": 1,
+        }
+        assert check_rollups(session).consistent
+
+
+def test_nomination_and_vote_rollups(session: Session) -> None:
+    nomination = make_nomination(session, nomination_period=PERIOD)
+    make_nomination(
+        session,
+        category=NominationCategory.INNOVATION,
+        status=NominationStatus.PENDING,
+        nomination_period=PERIOD,
+    )
+    cast_vote(session, nomination.id, uuid.uuid4(), "staff")
+    cast_vote(session, nomination.id, uuid.uuid4(), "staff")
+    nomination.mark_selected()
+    session.flush()
+
+    rows = {row["category"]: row for row in nomination_summary(session, PERIOD).rows}
+    assert rows[NominationCategory.TEAMWORK]["selected"] == 1
+    assert rows[NominationCategory.TEAMWORK]["voting"] == 0
+    assert rows[NominationCategory.TEAMWORK]["votes"] == 2
+    assert rows[NominationCategory.INNOVATION]["pending"] == 1
+
+    votes = nomination_votes(session, PERIOD, NominationCategory.TEAMWORK)
+    assert [(row["id"], row["votes_count"]) for row in votes.rows] == [
+        (nomination.id, 2),
+    ]
+    assert check_rollups(session).consistent
+
+
+def test_check_rollups_reports_and_repairs_drift(session: Session) -> None:
+    cycle = make_cycle(session)
+    make_evaluation(session, cycle, uuid.uuid4())
+    make_nomination(session, nomination_period=PERIOD)
+    session.execute(
+        update(CycleProgressRollup).values(total=5, not_started=5),
+    )
+    session.execute(
+        update(NominationRollup).values(votes=3),
+    )
+    other = make_cycle(session)
+    make_evaluation(session, other, uuid.uuid4(), status=EvaluationStatus.SUBMITTED)
+    session.execute(
+        delete(CycleProgressRollup).where(CycleProgressRollup.cycle_id == other.id),
+    )
+
+    report = check_rollups(session, repair=True)
+    assert report.repaired
+    assert report.drift[(CYCLE_PROGRESS, cycle.id, "Mathematics")] == {
+        "total": (5, 1),
+        "not_started": (5, 1),
+    }
+    assert report.drift[(CYCLE_PROGRESS, other.id, "Mathematics")] == {
+        "total": (0, 1),
+        "submitted": (0, 1),
+    }
+    assert report.drift[(NOMINATIONS, PERIOD, NominationCategory.TEAMWORK)] == {
+        "votes": (3, 0),
+    }
+    assert check_rollups(session).consistent
@@ -0,0 +1,113 @@
+"""Tests for the bulk seed loader and the concurrent API seeder."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+from app import Base
+from app.models import (
+    Award,
+    EnrollmentApplication,
+    Evaluation,
+    EvaluationCycle,
+    EvaluationResult,
+    EvaluationStatus,
+)
+from app.services.rollups import check_rollups
+from app.services.seeding import SeedPlan, build_staff, seed_database
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+PLAN = SeedPlan(seed=7, staff=40, cycles=2, voters=10, enrollments=25)
+
+
+def _load_seed_dev() -> ModuleType:
+    path = Path(__file__).resolve().parents[1] / "scripts" / "seed_dev.py"
+    spec = importlib.util.spec_from_file_location("seed_dev", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # Dataclasses resolve annotations through sys.modules.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _snapshot(plan: SeedPlan) -> tuple[list[tuple[object, ...]], list[object]]:
+    engine = create_engine("sqlite://", future=True)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        seed_database(session, plan)
+        results = session.execute(
+            select(EvaluationResult.evaluee_id, EvaluationResult.final_score).order_by(
+                EvaluationResult.evaluee_id,
+                EvaluationResult.final_score,
+            ),
+        ).all()
+        applications = session.scalars(
+            select(EnrollmentApplication.id).order_by(EnrollmentApplication.id),
+        ).all()
+    engine.dispose()
+    return [tuple(row) for row in results], list(applications)
+
+
+def test_seed_database_writes_plan_volumes(session: Session) -> None:
+    report = seed_database(session, PLAN)
+
+    assert report.rows["evaluation_cycle"] == 2
+    assert report.rows["enrollment_application"] == 25
+    assert report.rows["evaluation_result"] == 2 * PLAN.staff
+    assert session.scalar(select(func.count()).select_from(Award)) == (
+        report.rows["award"]
+    )
+    assert report.rows["award"] > 0
+    # Only the latest cycle stays open; the earlier one closed with late
+    # evaluations for everything left unsubmitted.
+    cycles = session.scalars(
+        select(EvaluationCycle).order_by(EvaluationCycle.cycle_period),
+    ).all()
+    assert [cycle.cycle_period for cycle in cycles] == PLAN.periods
+    assert [cycle.status.name for cycle in cycles] == ["CLOSED", "ACTIVE"]
+    released = select(func.count()).where(
+        EvaluationResult.cycle_id == cycles[0].id,
+        EvaluationResult.released_at.is_not(None),
+    )
+    assert session.scalar(released) == PLAN.staff
+    late = select(Evaluation.cycle_id, func.count()).where(
+        Evaluation.status == EvaluationStatus.LATE,
+    )
+    assert dict(session.execute(late.group_by(Evaluation.cycle_id)).all()).keys() == {
+        cycles[0].id,
+    }
+    assert check_rollups(session).consistent
+
+
+def test_seed_database_is_deterministic() -> None:
+    first = _snapshot(PLAN)
+    assert _snapshot(PLAN) == first
+    assert _snapshot(SeedPlan(seed=8, staff=40, cycles=2, enrollments=25)) != first
+
+
+def test_api_seeder_bounds_concurrency() -> None:
+    seed_dev = _load_seed_dev()
+    stand_in = seed_dev.StandInApi(latency=0.001)
+    plan = SeedPlan(seed=3, staff=30, enrollments=40)
+
+    async def run() -> dict[str, int]:
+        async with seed_dev.ApiClient(
+            "http://stand-in",
+            transport=stand_in.transport(),
+        ) as client:
+            return dict(await seed_dev.seed_api(client, plan, concurrency=8))
+
+    seeded = asyncio.run(run())
+
+    assert seeded == {"roles": 4, "users": 4 + 30, "enrollments": 41}
+    assert stand_in.calls["/api/core/users"] == 34
+    assert stand_in.calls["/api/enrollment/applications"] == 41
+    assert 1 < stand_in.peak_in_flight <= 8
+    users = [user.external_id for user in seed_dev.generated_users(plan)]
+    assert users == [f"staff-{member.id.hex[:12]}" for member in build_staff(plan)[0]]
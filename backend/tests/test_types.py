@@ -0,0 +1,60 @@
+"""Tests for the portable GUID column type."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from app.models.types import GUID
+from sqlalchemy import Column, MetaData, Table, create_engine, insert, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+
+
+def _round_trip(guid: GUID, value: object) -> tuple[uuid.UUID, str]:
+    engine = create_engine("sqlite://")
+    table = Table("item", MetaData(), Column("id", guid, primary_key=True))
+    table.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(table), [{"id": value}])
+        loaded = connection.execute(select(table.c.id)).scalar_one()
+        storage = connection.execute(text("SELECT typeof(id) FROM item")).scalar_one()
+    engine.dispose()
+    return loaded, storage
+
+
+@pytest.mark.parametrize(
+    ("binary", "storage"),
+    [(False, "text"), (True, "blob")],
+)
+def test_guid_round_trips_in_both_storage_modes(binary: bool, storage: str) -> None:
+    value = uuid.uuid4()
+
+    assert _round_trip(GUID(binary=binary), value) == (value, storage)
+    assert _round_trip(GUID(binary=binary), str(value)) == (value, storage)
+
+
+def test_guid_storage_follows_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GUID_STORAGE", "binary")
+    impl = GUID().load_dialect_impl(sqlite.dialect())
+    assert impl.length == 16
+
+    monkeypatch.setenv("GUID_STORAGE", "hex")
+    with pytest.raises(ValueError, match="Unsupported GUID_STORAGE"):
+        GUID().load_dialect_impl(sqlite.dialect())
+
+
+def test_binary_guid_reads_unconverted_character_rows() -> None:
+    value = uuid.uuid4()
+    process = GUID(binary=True).result_processor(sqlite.dialect(), None)
+
+    assert process(value.bytes) == value
+    assert process(str(value)) == value
+    assert process(None) is None
+
+
+def test_postgres_uses_native_uuid() -> None:
+    dialect = postgresql.dialect()
+    value = uuid.uuid4()
+
+    assert isinstance(GUID(binary=True).load_dialect_impl(dialect), postgresql.UUID)
+    assert GUID().bind_processor(dialect)(str(value)) == value
@@ -0,0 +1,101 @@
+"""Tests for concurrent-safe vote recording and counter reconciliation."""
+
+from __future__ import annotations
+
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from app import Base
+from app.models import Nomination, NominationStatus, Vote
+from app.services.voting import DuplicateVoteError, cast_vote, reconcile_votes
+from sqlalchemy import create_engine, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from tests.factories import make_nomination
+
+
+def test_cast_vote_counts_once_per_voter(session: Session) -> None:
+    nomination = make_nomination(session)
+    voter_id = uuid.uuid4()
+
+    vote = cast_vote(session, nomination.id, voter_id, "staff")
+    with pytest.raises(DuplicateVoteError):
+        cast_vote(session, nomination.id, voter_id, "staff")
+    session.refresh(nomination)
+
+    assert vote.category is nomination.category
+    assert nomination.votes_count == 1
+    assert session.scalar(select(func.count()).select_from(Vote)) == 1
+
+
+def test_cast_vote_passes_other_integrity_errors_through(session: Session) -> None:
+    nomination = make_nomination(session)
+
+    with pytest.raises(IntegrityError):
+        cast_vote(session, nomination.id, uuid.uuid4(), None)
+
+    assert session.scalar(select(func.count()).select_from(Vote)) == 0
+
+
+def test_cast_vote_requires_open_nomination(session: Session) -> None:
+    nomination = make_nomination(session, status=NominationStatus.PENDING)
+
+    with pytest.raises(ValueError, match="not open for voting"):
+        cast_vote(session, nomination.id, uuid.uuid4(), "staff")
+
+    assert session.scalar(select(func.count()).select_from(Vote)) == 0
+
+
+def test_reconcile_votes_repairs_drift(session: Session) -> None:
+    nomination = make_nomination(session)
+    for _ in range(3):
+        cast_vote(session, nomination.id, uuid.uuid4(), "staff")
+    session.execute(
+        update(Nomination).where(Nomination.id == nomination.id).values(votes_count=7),
+    )
+
+    report = reconcile_votes(session, "2026-10", repair=True)
+    session.refresh(nomination)
+
+    assert report.drift == {nomination.id: 4}
+    assert report.repaired
+    assert nomination.votes_count == 3
+    assert reconcile_votes(session).consistent
+
+
+def test_concurrent_voters_lose_no_votes(tmp_path: Path) -> None:
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'votes.db'}",
+        connect_args={"timeout": 30},
+        pool_size=16,
+        future=True,
+    )
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        nomination_id = make_nomination(session).id
+        session.commit()
+
+    voter_ids = [uuid.uuid4() for _ in range(100)]
+
+    def vote(voter_id: uuid.UUID) -> bool:
+        with Session(engine) as session:
+            try:
+                cast_vote(session, nomination_id, voter_id, "staff")
+            except DuplicateVoteError:
+                return False
+            session.commit()
+            return True
+
+    # Every voter tries twice; exactly one attempt each may count.
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        accepted = sum(pool.map(vote, voter_ids + voter_ids))
+
+    with Session(engine) as session:
+        nomination = session.get(Nomination, nomination_id)
+        assert nomination is not None
+        assert accepted == len(voter_ids)
+        assert nomination.votes_count == len(voter_ids)
+        assert reconcile_votes(session).consistent
+    engine.dispose()